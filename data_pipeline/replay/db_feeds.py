@@ -8,12 +8,20 @@ SCOPE: Read-only streaming from database.
 - Emit in timestamp order
 - Same interface as live feeds
 
+Each feed reads through a named (server-side) cursor in fetchmany()
+batches, so only batch_size rows per feed are in memory and there is one
+round trip per batch. Feeds can share one connection; DatabaseReplaySource
+opens that connection for all four feeds of a symbol and merges them by
+timestamp.
+
 PRINCIPLE: Data correctness > completeness > performance
 """
 
-import psycopg2
+import itertools
 import json
-from typing import Optional
+from abc import ABC, abstractmethod
+import psycopg2
+from typing import Any, Iterator, List, Optional, Sequence
 from masterframe.data_ingestion import (
     OrderbookSnapshot,
     AggressiveTrade,
@@ -21,258 +29,214 @@ from masterframe.data_ingestion import (
     Kline,
 )
 from masterframe.replay import Event
+from masterframe.replay.feed_adapters import merge_feeds
+
+# Rows fetched per server round trip (per feed)
+DEFAULT_BATCH_SIZE = 5000
 
+# Unique server-side cursor names within a connection
+_cursor_ids = itertools.count()
 
-class DatabaseOrderbookFeed:
+
+class _DatabaseFeed(ABC):
     """
-    Replay feed for orderbook events from database.
-    
-    RULE: Stream from cursor - no preloading.
+    Replay feed over one table, streamed from a server-side cursor.
+
+    RULE: Stream from cursor - no preloading beyond one batch.
     RULE: Emit in timestamp order.
     RULE: Same interface as live feed adapter.
+
+    Subclasses define the table, selected columns, event type and how a
+    batch of rows is parsed.
     """
-    
+
+    _TABLE = ''
+    _COLUMNS = ''
+    _EVENT_TYPE = ''
+
     def __init__(
         self,
         connection_string: str,
         symbol: str,
         start_time: Optional[float] = None,
-        end_time: Optional[float] = None
+        end_time: Optional[float] = None,
+        connection=None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
     ):
         """
-        Initialize database orderbook feed.
-        
+        Initialize database feed.
+
         Args:
-            connection_string: PostgreSQL connection string
+            connection_string: PostgreSQL connection string (unused if connection given)
             symbol: Trading pair
             start_time: Optional start timestamp
             end_time: Optional end timestamp
+            connection: Optional shared connection (not closed by this feed)
+            batch_size: Rows fetched per round trip
         """
-        self.conn = psycopg2.connect(connection_string)
+        self._owns_connection = connection is None
+        self.conn = psycopg2.connect(connection_string) if connection is None else connection
         self.symbol = symbol
         self.start_time = start_time
         self.end_time = end_time
-        
+        self.batch_size = batch_size
+
         self.cursor = None
+        self._buffer: List[Any] = []
+        self._index = 0
+        self._exhausted = False
         self._current = None
         self._initialize_cursor()
-    
+
     def _initialize_cursor(self) -> None:
-        """Initialize streaming cursor."""
-        sql = """
-            SELECT timestamp, bids, asks
-            FROM orderbook_events
+        """Open the server-side cursor and fetch the first batch."""
+        sql = f"""
+            SELECT {self._COLUMNS}
+            FROM {self._TABLE}
             WHERE symbol = %s
         """
-        
+
         params = [self.symbol]
-        
+
         if self.start_time is not None:
             sql += " AND timestamp >= %s"
             params.append(self.start_time)
-        
+
         if self.end_time is not None:
             sql += " AND timestamp < %s"
             params.append(self.end_time)
-        
+
         sql += " ORDER BY timestamp"
-        
-        self.cursor = self.conn.cursor()
+
+        self.cursor = self.conn.cursor(name=f"replay_{self._TABLE}_{next(_cursor_ids)}")
+        self.cursor.itersize = self.batch_size
         self.cursor.execute(sql, params)
-        
+
         # Fetch first row
         self._advance()
-    
+
     def _advance(self) -> None:
-        """Advance to next row."""
-        row = self.cursor.fetchone()
-        
-        if row is None:
-            self._current = None
-        else:
-            # Parse row into OrderbookSnapshot
-            timestamp, bids_json, asks_json = row
-            
-            bids_parsed = tuple(tuple(level) for level in json.loads(bids_json))
-            asks_parsed = tuple(tuple(level) for level in json.loads(asks_json))
-            
-            mid_price = (bids_parsed[0][0] + asks_parsed[0][0]) / 2.0
-            
-            self._current = OrderbookSnapshot(
-                timestamp=timestamp,
-                bids=bids_parsed,
-                asks=asks_parsed,
-                mid_price=mid_price
-            )
-    
+        """Advance to next row, fetching the next batch when needed."""
+        if self._index >= len(self._buffer):
+            self._buffer = self._fetch_batch()
+            self._index = 0
+            if not self._buffer:
+                self._current = None
+                return
+
+        self._current = self._buffer[self._index]
+        self._index += 1
+
+    def _fetch_batch(self) -> List[Any]:
+        if self._exhausted:
+            return []
+        rows = self.cursor.fetchmany(self.batch_size)
+        if not rows:
+            self._exhausted = True
+            return []
+        return self._parse_rows(rows)
+
+    @abstractmethod
+    def _parse_rows(self, rows: Sequence[tuple]) -> List[Any]:
+        """Parse a batch of rows into event data objects."""
+        pass
+
     def has_more(self) -> bool:
         """Check if more events available."""
         return self._current is not None
-    
+
     def peek_next_timestamp(self) -> Optional[float]:
         """Get next timestamp without consuming."""
         if self._current is None:
             return None
         return self._current.timestamp
-    
+
     def emit_next(self) -> Optional[Event]:
         """Emit next event and advance."""
         if self._current is None:
             return None
-        
+
         event = Event(
             timestamp=self._current.timestamp,
-            event_type='orderbook',
+            event_type=self._EVENT_TYPE,
             data=self._current
         )
-        
+
         self._advance()
         return event
-    
+
     def close(self) -> None:
         """Close database resources."""
         if self.cursor:
             self.cursor.close()
-        if self.conn:
+        if self.conn and self._owns_connection:
             self.conn.close()
 
 
-class DatabaseTradeFeed:
+def _decode_json_column(values: Sequence[Any]) -> List[Any]:
+    """Decode a column of JSON texts with one parse (jsonb values pass through)."""
+    if all(isinstance(v, str) for v in values):
+        return json.loads('[' + ','.join(values) + ']')
+    return [json.loads(v) if isinstance(v, (str, bytes)) else v for v in values]
+
+
+class DatabaseOrderbookFeed(_DatabaseFeed):
+    """Replay feed for orderbook events from database."""
+
+    _TABLE = 'orderbook_events'
+    _COLUMNS = 'timestamp, bids, asks'
+    _EVENT_TYPE = 'orderbook'
+
+    def _parse_rows(self, rows: Sequence[tuple]) -> List[OrderbookSnapshot]:
+        # One JSON parse per column per batch instead of two per row
+        all_bids = _decode_json_column([row[1] for row in rows])
+        all_asks = _decode_json_column([row[2] for row in rows])
+
+        snapshots = []
+        for (timestamp, _, _), bids, asks in zip(rows, all_bids, all_asks):
+            bids_parsed = tuple(tuple(level) for level in bids)
+            asks_parsed = tuple(tuple(level) for level in asks)
+
+            mid_price = (bids_parsed[0][0] + asks_parsed[0][0]) / 2.0
+
+            snapshots.append(OrderbookSnapshot(
+                timestamp=timestamp,
+                bids=bids_parsed,
+                asks=asks_parsed,
+                mid_price=mid_price
+            ))
+        return snapshots
+
+
+class DatabaseTradeFeed(_DatabaseFeed):
     """Replay feed for trade events from database."""
-    
-    def __init__(
-        self,
-        connection_string: str,
-        symbol: str,
-        start_time: Optional[float] = None,
-        end_time: Optional[float] = None
-    ):
-        self.conn = psycopg2.connect(connection_string)
-        self.symbol = symbol
-        self.start_time = start_time
-        self.end_time = end_time
-        
-        self.cursor = None
-        self._current = None
-        self._initialize_cursor()
-    
-    def _initialize_cursor(self) -> None:
-        sql = """
-            SELECT timestamp, price, quantity, is_buyer_maker
-            FROM trade_events
-            WHERE symbol = %s
-        """
-        
-        params = [self.symbol]
-        
-        if self.start_time is not None:
-            sql += " AND timestamp >= %s"
-            params.append(self.start_time)
-        
-        if self.end_time is not None:
-            sql += " AND timestamp < %s"
-            params.append(self.end_time)
-        
-        sql += " ORDER BY timestamp"
-        
-        self.cursor = self.conn.cursor()
-        self.cursor.execute(sql, params)
-        self._advance()
-    
-    def _advance(self) -> None:
-        row = self.cursor.fetchone()
-        
-        if row is None:
-            self._current = None
-        else:
-            timestamp, price, quantity, is_buyer_maker = row
-            
-            self._current = AggressiveTrade(
+
+    _TABLE = 'trade_events'
+    _COLUMNS = 'timestamp, price, quantity, is_buyer_maker'
+    _EVENT_TYPE = 'trade'
+
+    def _parse_rows(self, rows: Sequence[tuple]) -> List[AggressiveTrade]:
+        return [
+            AggressiveTrade(
                 timestamp=timestamp,
                 price=price,
                 quantity=quantity,
                 is_buyer_aggressor=not is_buyer_maker  # aggressor is opposite of maker
             )
-    
-    def has_more(self) -> bool:
-        return self._current is not None
-    
-    def peek_next_timestamp(self) -> Optional[float]:
-        if self._current is None:
-            return None
-        return self._current.timestamp
-    
-    def emit_next(self) -> Optional[Event]:
-        if self._current is None:
-            return None
-        
-        event = Event(
-            timestamp=self._current.timestamp,
-            event_type='trade',
-            data=self._current
-        )
-        
-        self._advance()
-        return event
-    
-    def close(self) -> None:
-        if self.cursor:
-            self.cursor.close()
-        if self.conn:
-            self.conn.close()
+            for timestamp, price, quantity, is_buyer_maker in rows
+        ]
 
 
-class DatabaseLiquidationFeed:
+class DatabaseLiquidationFeed(_DatabaseFeed):
     """Replay feed for liquidation events from database."""
-    
-    def __init__(
-        self,
-        connection_string: str,
-        symbol: str,
-        start_time: Optional[float] = None,
-        end_time: Optional[float] = None
-    ):
-        self.conn = psycopg2.connect(connection_string)
-        self.symbol = symbol
-        self.start_time = start_time
-        self.end_time = end_time
-        
-        self.cursor = None
-        self._current = None
-        self._initialize_cursor()
-    
-    def _initialize_cursor(self) -> None:
-        sql = """
-            SELECT timestamp, side, price, quantity
-            FROM liquidation_events
-            WHERE symbol = %s
-        """
-        
-        params = [self.symbol]
-        
-        if self.start_time is not None:
-            sql += " AND timestamp >= %s"
-            params.append(self.start_time)
-        
-        if self.end_time is not None:
-            sql += " AND timestamp < %s"
-            params.append(self.end_time)
-        
-        sql += " ORDER BY timestamp"
-        
-        self.cursor = self.conn.cursor()
-        self.cursor.execute(sql, params)
-        self._advance()
-    
-    def _advance(self) -> None:
-        row = self.cursor.fetchone()
-        
-        if row is None:
-            self._current = None
-        else:
-            timestamp, side, price, quantity = row
-            
-            self._current = LiquidationEvent(
+
+    _TABLE = 'liquidation_events'
+    _COLUMNS = 'timestamp, side, price, quantity'
+    _EVENT_TYPE = 'liquidation'
+
+    def _parse_rows(self, rows: Sequence[tuple]) -> List[LiquidationEvent]:
+        return [
+            LiquidationEvent(
                 timestamp=timestamp,
                 symbol=self.symbol,
                 side=side,
@@ -280,118 +244,78 @@ class DatabaseLiquidationFeed:
                 price=price,
                 value_usd=price * quantity
             )
-    
-    def has_more(self) -> bool:
-        return self._current is not None
-    
-    def peek_next_timestamp(self) -> Optional[float]:
-        if self._current is None:
-            return None
-        return self._current.timestamp
-    
-    def emit_next(self) -> Optional[Event]:
-        if self._current is None:
-            return None
-        
-        event = Event(
-            timestamp=self._current.timestamp,
-            event_type='liquidation',
-            data=self._current
-        )
-        
-        self._advance()
-        return event
-    
-    def close(self) -> None:
-        if self.cursor:
-            self.cursor.close()
-        if self.conn:
-            self.conn.close()
+            for timestamp, side, price, quantity in rows
+        ]
 
 
-class DatabaseCandleFeed:
+class DatabaseCandleFeed(_DatabaseFeed):
     """Replay feed for candle events from database."""
-    
+
+    _TABLE = 'candle_events'
+    _COLUMNS = 'timestamp, open, high, low, close, volume, is_closed'
+    _EVENT_TYPE = 'kline'
+
+    def _parse_rows(self, rows: Sequence[tuple]) -> List[Kline]:
+        return [
+            Kline(
+                timestamp=timestamp,
+                open=open_price,
+                high=high,
+                low=low,
+                close=close,
+                volume=volume,
+                interval='1m'  # Default to 1m, could be parameterized
+            )
+            for timestamp, open_price, high, low, close, volume, is_closed in rows
+        ]
+
+
+class DatabaseReplaySource:
+    """
+    All database feeds of one symbol over a single shared connection.
+
+    RULE: One read-only connection, one server-side cursor per feed.
+    RULE: Events merged across feeds in timestamp order (ties: feed order).
+    """
+
+    FEED_CLASSES = (
+        DatabaseOrderbookFeed,
+        DatabaseTradeFeed,
+        DatabaseLiquidationFeed,
+        DatabaseCandleFeed,
+    )
+
     def __init__(
         self,
         connection_string: str,
         symbol: str,
         start_time: Optional[float] = None,
-        end_time: Optional[float] = None
+        end_time: Optional[float] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
     ):
         self.conn = psycopg2.connect(connection_string)
+        self.conn.set_session(readonly=True)
         self.symbol = symbol
-        self.start_time = start_time
-        self.end_time = end_time
-        
-        self.cursor = None
-        self._current = None
-        self._initialize_cursor()
-    
-    def _initialize_cursor(self) -> None:
-        sql = """
-            SELECT timestamp, open, high, low, close, volume, is_closed
-            FROM candle_events
-            WHERE symbol = %s
-        """
-        
-        params = [self.symbol]
-        
-        if self.start_time is not None:
-            sql += " AND timestamp >= %s"
-            params.append(self.start_time)
-        
-        if self.end_time is not None:
-            sql += " AND timestamp < %s"
-            params.append(self.end_time)
-        
-        sql += " ORDER BY timestamp"
-        
-        self.cursor = self.conn.cursor()
-        self.cursor.execute(sql, params)
-        self._advance()
-    
-    def _advance(self) -> None:
-        row = self.cursor.fetchone()
-        
-        if row is None:
-            self._current = None
-        else:
-            timestamp, open_price, high, low, close, volume, is_closed = row
-            
-            self._current = Kline(
-                timestamp=timestamp,
-                open=open_price,
-                high=high,
-                low=low,
-                close=close,
-                volume=volume,
-                interval='1m'  # Default to 1m, could be parameterized
+        self.feeds = [
+            feed_class(
+                connection_string, symbol, start_time, end_time,
+                connection=self.conn, batch_size=batch_size,
             )
-    
-    def has_more(self) -> bool:
-        return self._current is not None
-    
-    def peek_next_timestamp(self) -> Optional[float]:
-        if self._current is None:
-            return None
-        return self._current.timestamp
-    
-    def emit_next(self) -> Optional[Event]:
-        if self._current is None:
-            return None
-        
-        event = Event(
-            timestamp=self._current.timestamp,
-            event_type='kline',
-            data=self._current
-        )
-        
-        self._advance()
-        return event
-    
+            for feed_class in self.FEED_CLASSES
+        ]
+
+    def events(self) -> Iterator[Event]:
+        """Stream all events in timestamp order."""
+        return merge_feeds(self.feeds)
+
+    def run(self, event_loop) -> int:
+        """Stream all events through event_loop; return events processed."""
+        before = event_loop.get_events_processed()
+        event_loop.run_stream(self.events())
+        return event_loop.get_events_processed() - before
+
     def close(self) -> None:
-        if self.cursor:
-            self.cursor.close()
-        if self.conn:
-            self.conn.close()
+        """Close all cursors and the shared connection."""
+        for feed in self.feeds:
+            feed.close()
+        self.conn.close()
@@ -0,0 +1,450 @@
+"""
+Columnar Replay Cache
+
+Local on-disk cache of recorded market data for repeated replays.
+
+SCOPE: Export once, replay many times.
+- Export a time range of trades/orderbooks/liquidations/candles
+  (e.g. from the database feeds) into columnar partitions
+- Serve them as memory-mapped column batches (no per-row decode)
+- Same Event/data objects as the database feeds
+
+LAYOUT:
+    <root>/<kind>/<symbol>/<YYYY-MM-DD>/<column>.npy + _meta.json
+
+One .npy file per column, rows sorted by timestamp, one partition per
+symbol and UTC day. Reads use np.load(mmap_mode='r'), so batches are
+zero-copy slices of the page cache. Predicates are pushed down: symbol and
+day select partitions, and [start_time, end_time) is located in a
+partition's timestamp column by binary search.
+
+Orderbooks are stored as fixed-depth (rows, levels, 2) arrays padded with
+NaN, plus the per-row number of levels.
+
+PRINCIPLE: Data correctness > completeness > performance
+"""
+
+import json
+import os
+import shutil
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence
+
+import numpy as np
+
+from masterframe.data_ingestion import (
+    OrderbookSnapshot,
+    AggressiveTrade,
+    LiquidationEvent,
+    Kline,
+)
+from masterframe.replay import Event
+
+# Rows per batch served from a partition
+DEFAULT_BATCH_SIZE = 65536
+
+_META_FILE = '_meta.json'
+
+# kind -> event type emitted (same as the database feeds)
+EVENT_TYPES = {
+    'orderbook': 'orderbook',
+    'trade': 'trade',
+    'liquidation': 'liquidation',
+    'kline': 'kline',
+}
+
+# Replay order of kinds (ties in timestamp: earlier kind first)
+KINDS = ('orderbook', 'trade', 'liquidation', 'kline')
+
+
+# ==============================================================================
+# Column conversion
+# ==============================================================================
+
+def _levels_array(books: Sequence[Sequence[Sequence[float]]]) -> tuple:
+    """(rows, depth, 2) NaN-padded array and per-row level counts."""
+    counts = np.array([len(levels) for levels in books], dtype=np.int32)
+    depth = int(counts.max()) if len(counts) else 0
+    array = np.full((len(books), depth, 2), np.nan)
+    for i, levels in enumerate(books):
+        if levels:
+            array[i, :len(levels)] = levels
+    return array, counts
+
+
+def _to_columns(kind: str, records: Sequence[Any]) -> Dict[str, np.ndarray]:
+    """Columns of a list of data objects of one kind."""
+    timestamps = np.array([r.timestamp for r in records], dtype=np.float64)
+    if kind == 'orderbook':
+        bids, bid_levels = _levels_array([r.bids for r in records])
+        asks, ask_levels = _levels_array([r.asks for r in records])
+        return {
+            'timestamp': timestamps,
+            'mid_price': np.array([r.mid_price for r in records], dtype=np.float64),
+            'bids': bids,
+            'bid_levels': bid_levels,
+            'asks': asks,
+            'ask_levels': ask_levels,
+        }
+    if kind == 'trade':
+        return {
+            'timestamp': timestamps,
+            'price': np.array([r.price for r in records], dtype=np.float64),
+            'quantity': np.array([r.quantity for r in records], dtype=np.float64),
+            'is_buyer_aggressor': np.array([r.is_buyer_aggressor for r in records], dtype=bool),
+        }
+    if kind == 'liquidation':
+        return {
+            'timestamp': timestamps,
+            'side': np.array([r.side for r in records], dtype=str),
+            'quantity': np.array([r.quantity for r in records], dtype=np.float64),
+            'price': np.array([r.price for r in records], dtype=np.float64),
+            'value_usd': np.array(
+                [np.nan if r.value_usd is None else r.value_usd for r in records], dtype=np.float64),
+        }
+    if kind == 'kline':
+        return {
+            'timestamp': timestamps,
+            'open': np.array([r.open for r in records], dtype=np.float64),
+            'high': np.array([r.high for r in records], dtype=np.float64),
+            'low': np.array([r.low for r in records], dtype=np.float64),
+            'close': np.array([r.close for r in records], dtype=np.float64),
+            'volume': np.array([r.volume for r in records], dtype=np.float64),
+            'interval': np.array([r.interval for r in records], dtype=str),
+        }
+    raise ValueError(f"Unknown replay cache kind: {kind}")
+
+
+def _book(levels: np.ndarray, count: int) -> tuple:
+    return tuple(tuple(level) for level in levels[:count].tolist())
+
+
+def _to_records(kind: str, symbol: str, batch: Dict[str, np.ndarray]) -> List[Any]:
+    """Data objects of a column batch (inverse of _to_columns)."""
+    timestamps = batch['timestamp'].tolist()
+    if kind == 'orderbook':
+        bids, asks = batch['bids'], batch['asks']
+        return [
+            OrderbookSnapshot(timestamp=ts, bids=_book(bids[i], nb), asks=_book(asks[i], na), mid_price=mid)
+            for i, (ts, mid, nb, na) in enumerate(zip(
+                timestamps, batch['mid_price'].tolist(),
+                batch['bid_levels'].tolist(), batch['ask_levels'].tolist()))
+        ]
+    if kind == 'trade':
+        return [
+            AggressiveTrade(timestamp=ts, price=price, quantity=qty, is_buyer_aggressor=aggressor)
+            for ts, price, qty, aggressor in zip(
+                timestamps, batch['price'].tolist(), batch['quantity'].tolist(),
+                batch['is_buyer_aggressor'].tolist())
+        ]
+    if kind == 'liquidation':
+        return [
+            LiquidationEvent(timestamp=ts, symbol=symbol, side=side, quantity=qty, price=price,
+                             value_usd=None if value != value else value)
+            for ts, side, qty, price, value in zip(
+                timestamps, batch['side'].tolist(), batch['quantity'].tolist(),
+                batch['price'].tolist(), batch['value_usd'].tolist())
+        ]
+    if kind == 'kline':
+        return [
+            Kline(timestamp=ts, open=o, high=h, low=l, close=c, volume=v, interval=interval)
+            for ts, o, h, l, c, v, interval in zip(
+                timestamps, batch['open'].tolist(), batch['high'].tolist(), batch['low'].tolist(),
+                batch['close'].tolist(), batch['volume'].tolist(), batch['interval'].tolist())
+        ]
+    raise ValueError(f"Unknown replay cache kind: {kind}")
+
+
+def _day(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).strftime('%Y-%m-%d')
+
+
+def _concat(parts: List[Dict[str, np.ndarray]]) -> Dict[str, np.ndarray]:
+    """Concatenate column dicts (orderbook level arrays padded to a common depth)."""
+    columns = {}
+    for name in parts[0]:
+        arrays = [part[name] for part in parts]
+        if arrays[0].ndim == 3:
+            depth = max(a.shape[1] for a in arrays)
+            arrays = [
+                np.concatenate([a, np.full((a.shape[0], depth - a.shape[1], 2), np.nan)], axis=1)
+                if a.shape[1] < depth else a
+                for a in arrays
+            ]
+        columns[name] = np.concatenate(arrays)
+    return columns
+
+
+# ==============================================================================
+# Cache
+# ==============================================================================
+
+class ReplayCache:
+    """
+    Partitioned columnar cache of replay data.
+
+    RULE: Rows within a partition are sorted by timestamp (stable).
+    RULE: Reads never modify data; batches are read-only views.
+    """
+
+    def __init__(self, root: Path):
+        """
+        Initialize cache.
+
+        Args:
+            root: Cache directory (created on first export)
+        """
+        self.root = Path(root)
+
+    # ------------------------------------------------------------------ export
+
+    def export(
+        self,
+        kind: str,
+        symbol: str,
+        records: Iterable[Any],
+        start_time: Optional[float] = None,
+        end_time: Optional[float] = None,
+    ) -> int:
+        """
+        Store data objects of one kind and symbol.
+
+        Existing rows of the touched days inside [start_time, end_time) are
+        replaced; rows outside the range are kept. Either bound may be
+        omitted (open range). Without any bound, the touched days are
+        replaced entirely.
+
+        Args:
+            kind: 'orderbook', 'trade', 'liquidation' or 'kline'
+            symbol: Trading pair
+            records: Data objects (e.g. Event.data from a replay feed)
+            start_time: Start of the exported range (inclusive)
+            end_time: End of the exported range (exclusive)
+
+        Returns:
+            Number of rows written
+        """
+        if kind not in EVENT_TYPES:
+            raise ValueError(f"Unknown replay cache kind: {kind}")
+
+        by_day: Dict[str, List[Any]] = {}
+        for record in records:
+            by_day.setdefault(_day(record.timestamp), []).append(record)
+
+        written = 0
+        for day, day_records in sorted(by_day.items()):
+            parts = [_to_columns(kind, day_records)]
+            existing = self._read_partition(kind, symbol, day)
+            if existing is not None and (start_time is not None or end_time is not None):
+                ts = existing['timestamp']
+                keep = np.zeros(len(ts), dtype=bool)
+                if start_time is not None:
+                    keep |= ts < start_time
+                if end_time is not None:
+                    keep |= ts >= end_time
+                if keep.any():
+                    # Boolean indexing copies: nothing below refers to the memmaps
+                    parts.insert(0, {name: np.asarray(col)[keep] for name, col in existing.items()})
+            existing = None  # Release the memmaps before the partition is replaced
+            columns = _concat(parts) if len(parts) > 1 else parts[0]
+            order = np.argsort(columns['timestamp'], kind='stable')
+            self._write_partition(kind, symbol, day, {name: col[order] for name, col in columns.items()})
+            written += len(day_records)
+        return written
+
+    def export_feeds(
+        self,
+        symbol: str,
+        feeds: Dict[str, Any],
+        start_time: Optional[float] = None,
+        end_time: Optional[float] = None,
+    ) -> Dict[str, int]:
+        """
+        Drain replay feeds (kind -> feed with has_more/emit_next) into the cache.
+
+        Returns:
+            Rows written per kind
+        """
+        def drain(feed):
+            while feed.has_more():
+                yield feed.emit_next().data
+
+        return {
+            kind: self.export(kind, symbol, drain(feed), start_time, end_time)
+            for kind, feed in feeds.items()
+        }
+
+    def _partition_dir(self, kind: str, symbol: str, day: str) -> Path:
+        return self.root / kind / symbol / day
+
+    def _write_partition(self, kind: str, symbol: str, day: str, columns: Dict[str, np.ndarray]) -> None:
+        """
+        Write a partition to <day>.tmp, then swap it in with os.replace.
+
+        The old partition is moved aside before it is deleted, so the day
+        directory always holds either the old or the new complete partition.
+        """
+        path = self._partition_dir(kind, symbol, day)
+        tmp = path.with_name(path.name + '.tmp')
+        old = path.with_name(path.name + '.old')
+        for leftover in (tmp, old):
+            if leftover.exists():
+                shutil.rmtree(leftover)
+        tmp.mkdir(parents=True)
+        for name, column in columns.items():
+            np.save(tmp / f"{name}.npy", column, allow_pickle=False)
+        timestamps = columns['timestamp']
+        with open(tmp / _META_FILE, 'w') as f:
+            json.dump({
+                'rows': int(len(timestamps)),
+                'min_timestamp': float(timestamps[0]),
+                'max_timestamp': float(timestamps[-1]),
+                'columns': list(columns),
+            }, f)
+        if path.exists():
+            os.replace(path, old)
+        os.replace(tmp, path)
+        if old.exists():
+            shutil.rmtree(old, ignore_errors=True)
+
+    # ------------------------------------------------------------------ read
+
+    def _read_partition(self, kind: str, symbol: str, day: str) -> Optional[Dict[str, np.ndarray]]:
+        path = self._partition_dir(kind, symbol, day)
+        meta_path = path / _META_FILE
+        if not meta_path.exists():
+            return None
+        with open(meta_path) as f:
+            meta = json.load(f)
+        return {
+            name: np.load(path / f"{name}.npy", mmap_mode='r', allow_pickle=False)
+            for name in meta['columns']
+        }
+
+    def _partitions(self, kind: str, symbol: str, start_time: Optional[float],
+                    end_time: Optional[float]) -> List[str]:
+        """Days of kind/symbol that may hold rows in [start_time, end_time)."""
+        base = self.root / kind / symbol
+        if not base.exists():
+            return []
+        first = _day(start_time) if start_time is not None else None
+        last = _day(end_time) if end_time is not None else None
+        return [
+            p.name for p in sorted(base.iterdir())
+            if p.is_dir() and not p.name.endswith(('.tmp', '.old'))
+            and (first is None or p.name >= first)
+            and (last is None or p.name <= last)
+        ]
+
+    def scan(
+        self,
+        kind: str,
+        symbol: str,
+        start_time: Optional[float] = None,
+        end_time: Optional[float] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> Iterator[Dict[str, np.ndarray]]:
+        """
+        Column batches of kind/symbol with timestamp in [start_time, end_time).
+
+        Batches are read-only memory-mapped slices, in timestamp order.
+        """
+        for day in self._partitions(kind, symbol, start_time, end_time):
+            columns = self._read_partition(kind, symbol, day)
+            if columns is None:
+                continue
+            ts = columns['timestamp']
+            lo = int(np.searchsorted(ts, start_time, 'left')) if start_time is not None else 0
+            hi = int(np.searchsorted(ts, end_time, 'left')) if end_time is not None else len(ts)
+            for i in range(lo, hi, batch_size):
+                j = min(hi, i + batch_size)
+                yield {name: column[i:j] for name, column in columns.items()}
+
+    def has(self, kind: str, symbol: str) -> bool:
+        """True if any partition of kind/symbol exists."""
+        return bool(self._partitions(kind, symbol, None, None))
+
+    def feed(
+        self,
+        kind: str,
+        symbol: str,
+        start_time: Optional[float] = None,
+        end_time: Optional[float] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> 'CachedFeed':
+        """Replay feed over cached rows (same events as the database feed)."""
+        return CachedFeed(
+            self.scan(kind, symbol, start_time, end_time, batch_size),
+            lambda batch: _to_records(kind, symbol, batch),
+            EVENT_TYPES[kind],
+        )
+
+    def feeds(
+        self,
+        symbol: str,
+        start_time: Optional[float] = None,
+        end_time: Optional[float] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> List['CachedFeed']:
+        """Feeds of all kinds, in DatabaseReplaySource order (for merge_feeds)."""
+        return [self.feed(kind, symbol, start_time, end_time, batch_size) for kind in KINDS]
+
+
+class CachedFeed:
+    """
+    Replay feed over cache batches.
+
+    RULE: Same interface and events as the database feeds.
+    RULE: Only one batch of data objects materialized at a time.
+    """
+
+    def __init__(self, batches: Iterator[Dict[str, np.ndarray]],
+                 build: Callable[[Dict[str, np.ndarray]], List[Any]], event_type: str):
+        self._batches = batches
+        self._build = build
+        self._event_type = event_type
+        self._buffer: List[Any] = []
+        self._index = 0
+        self._current = None
+        self._advance()
+
+    def _advance(self) -> None:
+        while self._index >= len(self._buffer):
+            batch = next(self._batches, None)
+            if batch is None:
+                self._current = None
+                return
+            self._buffer = self._build(batch)
+            self._index = 0
+        self._current = self._buffer[self._index]
+        self._index += 1
+
+    def has_more(self) -> bool:
+        """Check if more events available."""
+        return self._current is not None
+
+    def peek_next_timestamp(self) -> Optional[float]:
+        """Get next timestamp without consuming."""
+        if self._current is None:
+            return None
+        return self._current.timestamp
+
+    def emit_next(self) -> Optional[Event]:
+        """Emit next event and advance."""
+        if self._current is None:
+            return None
+
+        event = Event(
+            timestamp=self._current.timestamp,
+            event_type=self._event_type,
+            data=self._current
+        )
+
+        self._advance()
+        return event
+
+    def close(self) -> None:
+        """Release the partition maps."""
+        self._batches = iter(())
+        self._buffer = []
@@ -15,7 +15,7 @@ Make historical replay behave IDENTICALLY to live trading.
 """
 
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, Iterable, Optional
 import heapq
 
 
@@ -158,6 +158,44 @@ class EventLoop:
             
             self._events_processed += 1
     
+    def run_stream(self, events: Iterable[Event]) -> None:
+        """
+        Run event loop over a time-ordered event stream, then the queue.
+        
+        Stream events are processed as they are pulled (e.g. from
+        merge_feeds over database cursors) instead of being scheduled up
+        front, so memory does not grow with the replay length. Scheduled
+        events due at or before a stream event are processed before it.
+        
+        RULE: Stream must be in timestamp order.
+        RULE: Same clock and handler semantics as run().
+        
+        Args:
+            events: Events in non-decreasing timestamp order
+        """
+        self._running = True
+        
+        for event in events:
+            while self._running and self._event_queue and self._event_queue[0].timestamp <= event.timestamp:
+                self._process(heapq.heappop(self._event_queue))
+            if not self._running:
+                return
+            self._process(event)
+            if not self._running:
+                return
+        
+        self.run()
+    
+    def _process(self, event: Event) -> None:
+        """Advance clock to event and execute its handler."""
+        self.clock.advance_to(event.timestamp)
+        
+        handler = self._event_handlers.get(event.event_type)
+        if handler:
+            handler(event)
+        
+        self._events_processed += 1
+    
     def stop(self) -> None:
         """Stop event loop after current event."""
         self._running = False
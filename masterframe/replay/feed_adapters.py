@@ -13,8 +13,9 @@ GOAL:
 Make historical replay behave IDENTICALLY to live trading.
 """
 
+import heapq
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Iterator, List, Optional
 from masterframe.data_ingestion import (
     OrderbookEvent, TradeEvent,
     LiquidationEvent, CandleEvent
@@ -205,6 +206,42 @@ def get_next_event(adapters: List[BaseFeedAdapter]) -> Optional[Event]:
     return next_adapter.emit_next()
 
 
+def merge_feeds(adapters: List[BaseFeedAdapter]) -> Iterator[Event]:
+    """
+    Stream events across all feeds in time order (k-way heap merge).
+
+    Same order as repeated get_next_event(): earliest timestamp first, ties
+    go to the earlier adapter in the list. Each step costs O(log k) instead
+    of a scan over all k feeds.
+
+    Works with any feed exposing has_more / peek_next_timestamp / emit_next.
+
+    Args:
+        adapters: List of feed adapters
+
+    Yields:
+        Events in chronological order until all feeds are exhausted
+    """
+    heap = [
+        (adapter.peek_next_timestamp(), index)
+        for index, adapter in enumerate(adapters)
+        if adapter.has_more()
+    ]
+    heapq.heapify(heap)
+
+    while heap:
+        _, index = heap[0]
+        adapter = adapters[index]
+        event = adapter.emit_next()
+
+        if adapter.has_more():
+            heapq.heapreplace(heap, (adapter.peek_next_timestamp(), index))
+        else:
+            heapq.heappop(heap)
+
+        yield event
+
+
 def schedule_all_events(adapters: List[BaseFeedAdapter], event_loop) -> int:
     """
     Schedule all events from adapters into event loop.
@@ -220,11 +257,7 @@ def schedule_all_events(adapters: List[BaseFeedAdapter], event_loop) -> int:
     """
     count = 0
     
-    while True:
-        event = get_next_event(adapters)
-        if event is None:
-            break
-        
+    for event in merge_feeds(adapters):
         event_loop.schedule_event(event)
         count += 1
     
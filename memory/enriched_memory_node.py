@@ -8,19 +8,76 @@ Extends basic node with dense factual evidence across 4 dimensions:
 - Stress proximity history
 
 NO signals, NO predictions, NO strategy logic.
+
+Memory layout: stores hold thousands of nodes (active, dormant and archived),
+so the node is slotted (no per-instance __dict__) and its bounded timestamp
+histories are float64 arrays rather than deques of float objects.
 """
 
+from array import array
 from dataclasses import dataclass, field
-from typing import List, Literal, Optional, Tuple, Dict
-from collections import deque
+from typing import Iterable, Iterator, List, Literal, Optional, Tuple, Dict
 import statistics
 
 
-@dataclass
+class TimestampSeries:
+    """
+    Bounded float history (oldest first), stored as a float64 array.
+
+    Drop-in for the deque(maxlen=...) previously held per node: append,
+    len, truthiness, iteration and indexing behave the same. Appending to a
+    full series drops the oldest value.
+    """
+
+    __slots__ = ('maxlen', '_values')
+
+    def __init__(self, values: Iterable[float] = (), maxlen: Optional[int] = None):
+        """
+        Args:
+            values: Initial values, oldest first (only the last maxlen are kept)
+            maxlen: Maximum retained values (None = unbounded)
+        """
+        self.maxlen = maxlen
+        self._values = array('d', values)
+        if maxlen is not None and len(self._values) > maxlen:
+            del self._values[:len(self._values) - maxlen]
+
+    def append(self, value: float) -> None:
+        """Append a value, dropping the oldest when full."""
+        values = self._values
+        if self.maxlen is not None and len(values) >= self.maxlen:
+            del values[0]
+        values.append(value)
+
+    def clear(self) -> None:
+        """Drop all values."""
+        del self._values[:]
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __iter__(self) -> Iterator[float]:
+        return iter(self._values)
+
+    def __getitem__(self, index):
+        return self._values[index]
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, TimestampSeries):
+            return self._values == other._values
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"TimestampSeries({self._values.tolist()}, maxlen={self.maxlen})"
+
+
+@dataclass(slots=True)
 class EnrichedLiquidityMemoryNode:
     """
     Information-dense factual record of historically significant price level.
     All fields are directly observable facts from market data.
+
+    Slotted: only the fields declared here can be set on a node.
     """
     
     # IDENTITY
@@ -58,7 +115,7 @@ class EnrichedLiquidityMemoryNode:
     aggressive_fill_volume: float = 0.0
     
     # DIMENSION 3: TEMPORAL STABILITY
-    interaction_timestamps: deque = field(default_factory=lambda: deque(maxlen=50))
+    interaction_timestamps: TimestampSeries = field(default_factory=lambda: TimestampSeries(maxlen=50))
     interaction_gap_median: float = 0.0
     interaction_gap_stddev: float = 0.0
     strength_history: List[float] = field(default_factory=list)
@@ -67,7 +124,7 @@ class EnrichedLiquidityMemoryNode:
     liquidations_within_band: int = 0
     long_liquidations: int = 0
     short_liquidations: int = 0
-    liquidation_timestamps: deque = field(default_factory=lambda: deque(maxlen=20))
+    liquidation_timestamps: TimestampSeries = field(default_factory=lambda: TimestampSeries(maxlen=20))
     max_liquidation_cascade_size: int = 0
     
     # METADATA
@@ -87,6 +144,15 @@ class EnrichedLiquidityMemoryNode:
     last_observed_bid_size: float = 0.0
     last_observed_ask_size: float = 0.0
     last_orderbook_update_ts: Optional[float] = None
+
+    # MARK PRICE STATE (set by ContinuityMemoryStore.update_mark_price)
+    last_mark_price: Optional[float] = None
+    last_index_price: Optional[float] = None
+    last_mark_price_ts: Optional[float] = None
+    mark_price_update_count: int = 0
+
+    # Integer identity (memory.m2_node_key), set for price-bucket nodes
+    node_key: Optional[Tuple[int, int, int, int]] = None
     
     def __post_init__(self):
         """Validate invariants."""
@@ -14,6 +14,8 @@ from memory.m2_historical_evidence import (
 )
 from memory.m2_topology import MemoryTopology, TopologyCluster
 from memory.m2_pressure import MemoryPressureAnalyzer, PressureMap
+from memory.m2_price_index import PriceIndex
+from memory.m2_node_key import NodeKey, NodeKeyCodec
 
 # M4 View imports (for type hints and integration)
 from memory.m4_evidence_composition import EvidenceCompositionView, get_evidence_composition
@@ -44,6 +46,17 @@ class ContinuityMemoryStore:
         self._dormant_evidence: Dict[str, HistoricalEvidence] = {}
         self._archived_nodes: Dict[str, EnrichedLiquidityMemoryNode] = {}
 
+        # Per-symbol price-sorted indexes (kept in sync with the dicts above)
+        self._active_index = PriceIndex()
+        self._dormant_index = PriceIndex()
+
+        # Integer-keyed identity for price-bucket nodes (any state until pruned)
+        self.node_keys = NodeKeyCodec()
+        self._nodes_by_key: Dict[NodeKey, EnrichedLiquidityMemoryNode] = {}
+
+        # Per-symbol mutation version (bumped on any change to that symbol's nodes)
+        self._symbol_versions: Dict[str, int] = {}
+
         self._total_nodes_created = 0
         self._total_interactions = 0
         self._last_state_update_ts: Optional[float] = None
@@ -81,6 +94,7 @@ class ContinuityMemoryStore:
             node = self._active_nodes[node_id]
             node.strength = min(1.0, node.strength + 0.1)
             self._total_interactions += 1
+            self._touch(node.symbol)
             return node
 
         # Check dormant nodes (REVIVAL)
@@ -110,10 +124,61 @@ class ContinuityMemoryStore:
         )
 
         self._active_nodes[node_id] = node
+        self._active_index.add(node)
+        self._touch(symbol)
         self._total_nodes_created += 1
         self._total_interactions += 1
         return node
     
+    def get_or_create_node(
+        self,
+        node_key: NodeKey,
+        price_band: float,
+        side: str,
+        timestamp: float,
+        creation_reason: str,
+        initial_strength: float = 0.5,
+        initial_confidence: float = 0.5,
+        volume: float = 0.0
+    ) -> Tuple[EnrichedLiquidityMemoryNode, bool]:
+        """
+        Get the node for a price-bucket key, creating it if absent.
+
+        Existing nodes are returned untouched, whatever their state (active,
+        dormant or archived). New nodes get node_id/symbol/price_center from
+        the key (see NodeKeyCodec).
+
+        Args:
+            node_key: Key from self.node_keys.key(symbol, side, price)
+
+        Returns:
+            (node, created)
+        """
+        node = self._nodes_by_key.get(node_key)
+        if node is not None:
+            return node, False
+
+        # Miss: the bucket may still exist under its string ID
+        node_id = self.node_keys.node_id(node_key)
+        node = self.get_node(node_id)
+        created = node is None
+        if created:
+            node = self.add_or_update_node(
+                node_id=node_id,
+                symbol=self.node_keys.symbol(node_key),
+                price_center=self.node_keys.bucket_price(node_key),
+                price_band=price_band,
+                side=side,
+                timestamp=timestamp,
+                creation_reason=creation_reason,
+                initial_strength=initial_strength,
+                initial_confidence=initial_confidence,
+                volume=volume
+            )
+        node.node_key = node_key
+        self._nodes_by_key[node_key] = node
+        return node, created
+
     def update_memory_states(self, current_ts: float):
         """
         Update all node states based on thresholds.
@@ -158,6 +223,9 @@ class ContinuityMemoryStore:
     
     def decay_nodes(self, current_ts: float):
         """Apply state-aware decay."""
+        for symbol in set(self._active_index.symbols()) | set(self._dormant_index.symbols()):
+            self._touch(symbol)
+
         # Decay active nodes (normal rate)
         for node in self._active_nodes.values():
             node.apply_decay(current_ts)
@@ -169,12 +237,16 @@ class ContinuityMemoryStore:
     def update_with_trade(self, node_id: str, timestamp: float, volume: float, is_buyer_maker: bool):
         """Update active node with trade evidence."""
         if node_id in self._active_nodes:
-            self._active_nodes[node_id].record_trade_execution(timestamp, volume, is_buyer_maker)
+            node = self._active_nodes[node_id]
+            node.record_trade_execution(timestamp, volume, is_buyer_maker)
+            self._touch(node.symbol)
     
     def update_with_liquidation(self, node_id: str, timestamp: float, side: str):
         """Update active node with liquidation evidence."""
         if node_id in self._active_nodes:
-            self._active_nodes[node_id].record_liquidation(timestamp, side)
+            node = self._active_nodes[node_id]
+            node.record_liquidation(timestamp, side)
+            self._touch(node.symbol)
     
     def ingest_liquidation(
         self,
@@ -209,41 +281,41 @@ class ContinuityMemoryStore:
         PRICE_BAND_DEFAULT = 100.0  # Default band width
         OVERLAP_TOLERANCE = 0.5  # 50% overlap threshold
         
-        # Search for overlapping nodes (symbol-partitioned)
-        active_candidates = self.get_active_nodes(symbol=symbol)
-        
-        for candidate in active_candidates:
-            # Check spatial overlap
-            if candidate.overlaps(price):
-                # Reinforce existing node
-                was_inactive = not candidate.active
-                candidate.record_liquidation(timestamp, side)
-                candidate.strength = min(1.0, candidate.strength + 0.15)
+        # Search for overlapping nodes (symbol-partitioned, strongest first)
+        candidate = self._strongest_overlapping(symbol, price)
 
-                # Reactivate node if it was dormant
-                if was_inactive and candidate.strength >= 0.01:
-                    candidate.active = True
-                    candidate._start_presence_interval(timestamp)
+        if candidate is not None:
+            self._touch(symbol)
 
-                self._total_interactions += 1
-                
-                # Log node reinforcement event
-                if self._event_logger:
-                    try:
-                        self._event_logger.log_m2_node_event(
-                            timestamp=timestamp,
-                            event_type='REINFORCED',
-                            node_id=candidate.id,
-                            symbol=symbol,
-                            price=price,
-                            side=side,
-                            volume=volume,
-                            strength_after=candidate.strength
-                        )
-                    except:
-                        pass
-                
-                return candidate
+            # Reinforce existing node
+            was_inactive = not candidate.active
+            candidate.record_liquidation(timestamp, side)
+            candidate.strength = min(1.0, candidate.strength + 0.15)
+
+            # Reactivate node if it was dormant
+            if was_inactive and candidate.strength >= 0.01:
+                candidate.active = True
+                candidate._start_presence_interval(timestamp)
+
+            self._total_interactions += 1
+            
+            # Log node reinforcement event
+            if self._event_logger:
+                try:
+                    self._event_logger.log_m2_node_event(
+                        timestamp=timestamp,
+                        event_type='REINFORCED',
+                        node_id=candidate.id,
+                        symbol=symbol,
+                        price=price,
+                        side=side,
+                        volume=volume,
+                        strength_after=candidate.strength
+                    )
+                except:
+                    pass
+            
+            return candidate
         
         # No overlap found - Create new node
         node_id = f"{symbol}_{int(price)}_{int(timestamp)}"
@@ -317,15 +389,16 @@ class ContinuityMemoryStore:
         Returns:
             Updated node if match found, None otherwise
         """
-        # Search for overlapping active nodes (symbol-partitioned)
-        active_candidates = self.get_active_nodes(symbol=symbol)
-        
-        for candidate in active_candidates:
-            if candidate.overlaps(price):
-                # Update node with trade evidence
-                candidate.record_trade_execution(timestamp, volume, is_buyer_maker)
-                self._total_interactions += 1
-                return candidate
+        # Search for overlapping active nodes (symbol-partitioned, strongest first)
+        candidate = self._strongest_overlapping(symbol, price)
+
+        if candidate is not None:
+            self._touch(symbol)
+
+            # Update node with trade evidence
+            candidate.record_trade_execution(timestamp, volume, is_buyer_maker)
+            self._total_interactions += 1
+            return candidate
         
         # No match found - Trade is ignored (constitutionally correct)
         return None
@@ -349,7 +422,9 @@ class ContinuityMemoryStore:
             timestamp: Update timestamp
         """
         # Update all active nodes for this symbol
-        symbol_nodes = self.get_active_nodes(symbol=symbol)
+        symbol_nodes = self._active_index.nodes_for_symbol(symbol)
+        if symbol_nodes:
+            self._touch(symbol)
 
         for node in symbol_nodes:
             node.last_mark_price = mark_price
@@ -395,8 +470,16 @@ class ContinuityMemoryStore:
     ) -> List[EnrichedLiquidityMemoryNode]:
         """Query active nodes only. Filter by symbol if provided."""
         results = []
-        
-        for node in self._active_nodes.values():
+
+        if symbol is not None:
+            if current_price is not None and radius is not None:
+                candidates = self._active_index.within_radius(symbol, current_price, radius)
+            else:
+                candidates = self._active_index.nodes_for_symbol(symbol)
+        else:
+            candidates = self._active_nodes.values()
+
+        for node in candidates:
             if symbol is not None and node.symbol != symbol:
                 continue
                 
@@ -420,8 +503,16 @@ class ContinuityMemoryStore:
     ) -> List[EnrichedLiquidityMemoryNode]:
         """Query dormant nodes (historical context). Filter by symbol if provided."""
         results = []
-        
-        for node in self._dormant_nodes.values():
+
+        if symbol is not None:
+            if current_price is not None and radius is not None:
+                candidates = self._dormant_index.within_radius(symbol, current_price, radius)
+            else:
+                candidates = self._dormant_index.nodes_for_symbol(symbol)
+        else:
+            candidates = self._dormant_nodes.values()
+
+        for node in candidates:
             if symbol is not None and node.symbol != symbol:
                 continue
 
@@ -492,11 +583,20 @@ class ContinuityMemoryStore:
             best_bid_price: Best bid price level (or None)
             best_ask_price: Best ask price level (or None)
         """
-        # Update active nodes that overlap with best bid/ask (symbol-filtered)
-        for node in self._active_nodes.values():
-            if node.symbol != symbol:
-                continue
-
+        # Collect active nodes that overlap with best bid/ask (symbol-filtered)
+        candidates = []
+        if best_bid_price is not None:
+            candidates = self._active_index.overlapping(symbol, best_bid_price)
+        if best_ask_price is not None:
+            ask_candidates = self._active_index.overlapping(symbol, best_ask_price)
+            if candidates:
+                seen = {node.id for node in candidates}
+                candidates.extend(n for n in ask_candidates if n.id not in seen)
+                candidates.sort(key=lambda n: self._active_index.insertion_rank(n.id))
+            else:
+                candidates = ask_candidates
+
+        for node in candidates:
             # Determine which prices overlap with this node
             overlaps_bid = best_bid_price is not None and node.overlaps(best_bid_price)
             overlaps_ask = best_ask_price is not None and node.overlaps(best_ask_price)
@@ -516,6 +616,7 @@ class ContinuityMemoryStore:
             # Update node with both values in single call
             if effective_bid > 0 or effective_ask > 0:
                 node.update_orderbook_state(timestamp, effective_bid, effective_ask)
+                self._touch(symbol)
 
     def get_active_nodes_for_symbol(self, symbol: str) -> List[EnrichedLiquidityMemoryNode]:
         """Get all active nodes for a specific symbol.
@@ -526,7 +627,7 @@ class ContinuityMemoryStore:
         Returns:
             List of active nodes for the symbol
         """
-        return [node for node in self._active_nodes.values() if node.symbol == symbol]
+        return list(self._active_index.nodes_for_symbol(symbol))
 
     def get_nodes_near_price(
         self,
@@ -544,22 +645,20 @@ class ContinuityMemoryStore:
         Returns:
             List of nodes that overlap with or are near the price
         """
-        nearby_nodes = []
+        # Overlap or within max_distance (if specified), via the price index
+        return self._active_index.overlapping(symbol, price, max_distance)
 
-        for node in self._active_nodes.values():
-            if node.symbol != symbol:
-                continue
-
-            # Check if price overlaps with node band
-            if node.overlaps(price):
-                nearby_nodes.append(node)
-            # Check if within max_distance (if specified)
-            elif max_distance is not None:
-                distance = abs(price - node.price_center)
-                if distance <= max_distance:
-                    nearby_nodes.append(node)
-
-        return nearby_nodes
+    def _strongest_overlapping(
+        self,
+        symbol: str,
+        price: float
+    ) -> Optional[EnrichedLiquidityMemoryNode]:
+        """Strongest active node whose band contains price (earliest inserted on ties)."""
+        best = None
+        for node in self._active_index.overlapping(symbol, price):
+            if best is None or node.strength > best.strength:
+                best = node
+        return best
 
     def record_liquidation_at_node(
         self,
@@ -581,6 +680,7 @@ class ContinuityMemoryStore:
             # Boost strength on liquidation
             node.strength = min(1.0, node.strength + 0.15)
             self._total_interactions += 1
+            self._touch(node.symbol)
         # Check dormant nodes (could trigger revival)
         elif node_id in self._dormant_nodes:
             # Revival handled by add_or_update_node if needed
@@ -609,6 +709,7 @@ class ContinuityMemoryStore:
             volume_boost = min(0.10, volume / 10000.0)  # Cap at 0.10
             node.strength = min(1.0, node.strength + volume_boost)
             self._total_interactions += 1
+            self._touch(node.symbol)
         # Check dormant nodes (could trigger revival)
         elif node_id in self._dormant_nodes:
             # Revival handled by add_or_update_node if needed
@@ -634,6 +735,8 @@ class ContinuityMemoryStore:
     def _transition_to_dormant(self, node_id: str):
         """Transition node from ACTIVE to DORMANT."""
         node = self._active_nodes.pop(node_id)
+        self._active_index.remove(node)
+        self._touch(node.symbol)
 
         # Extract and preserve historical evidence
         evidence = extract_historical_evidence(node)
@@ -643,10 +746,13 @@ class ContinuityMemoryStore:
         node.decay_rate = MemoryStateThresholds.DORMANT_DECAY_RATE
 
         self._dormant_nodes[node_id] = node
+        self._dormant_index.add(node)
     
     def _transition_to_archived(self, node_id: str):
         """Transition node from DORMANT to ARCHIVED."""
         node = self._dormant_nodes.pop(node_id)
+        self._dormant_index.remove(node)
+        self._touch(node.symbol)
         
         # Keep evidence for potential future analysis
         # (does not enable auto-revival)
@@ -666,6 +772,8 @@ class ContinuityMemoryStore:
         Historical evidence contributes to new strength.
         """
         node = self._dormant_nodes.pop(node_id)
+        self._dormant_index.remove(node)
+        self._touch(node.symbol)
         historical = self._dormant_evidence.get(node_id)
         
         # Compute revival strength from historical + new evidence
@@ -681,10 +789,19 @@ class ContinuityMemoryStore:
         node.last_interaction_ts = timestamp
         
         self._active_nodes[node_id] = node
+        self._active_index.add(node)
         self._total_interactions += 1
         
         return node
     
+    def get_symbol_version(self, symbol: str) -> int:
+        """Return mutation version for symbol (changes iff any of its nodes changed)."""
+        return self._symbol_versions.get(symbol, 0)
+
+    def _touch(self, symbol: str):
+        """Record a mutation of symbol's nodes."""
+        self._symbol_versions[symbol] = self._symbol_versions.get(symbol, 0) + 1
+
     def get_metrics(self) -> dict:
         """Get store metrics including state distribution."""
         return {
@@ -738,7 +855,10 @@ class ContinuityMemoryStore:
 
         # Actually prune
         for node_id in to_prune:
-            del self._archived_nodes[node_id]
+            node = self._archived_nodes.pop(node_id)
+            self._touch(node.symbol)
+            if node.node_key is not None:
+                self._nodes_by_key.pop(node.node_key, None)
             # Also clean up dormant evidence if any
             self._dormant_evidence.pop(node_id, None)
             self._archived_nodes_pruned += 1
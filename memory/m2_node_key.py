@@ -0,0 +1,114 @@
+"""
+M2 Node Keys
+
+Integer identity for price-bucket nodes created by the observation layer
+(liquidation and large-trade nodes).
+
+A key is a small int tuple (symbol_id, side_code, precision, tick):
+- symbol_id / side_code: interned per codec
+- precision: decimal places of the 0.1% price bucket, cached per symbol
+  (only recomputed with log10 when price leaves the cached decade)
+- tick: bucket price in units of 10**-precision
+
+Keys are canonical in the bucket price (trailing decimal zeros are folded
+into a lower precision), so two keys are equal exactly when the string IDs
+f"{symbol}_{side}_{round(price, precision)}" are equal. The string ID is only
+materialized by node_id(), when a node is created or exported.
+
+NO interpretation. Pure identity bookkeeping.
+"""
+
+import math
+from typing import Dict, List, Tuple
+
+# (symbol_id, side_code, precision, tick)
+NodeKey = Tuple[int, int, int, int]
+
+_INF = float('inf')
+
+# Relative margin kept inside each cached decade, so a cached precision is
+# never used where log10 rounding could disagree with it
+_DECADE_MARGIN = 1e-9
+
+# Distance from a half-tick below which the scaled price is re-rounded
+# exactly (round(price, precision)), so ties resolve like the string IDs
+_TIE_EPS = 1e-6
+
+
+class NodeKeyCodec:
+    """Interns symbols/sides and maps (symbol, side, price) to node keys."""
+
+    def __init__(self):
+        # symbol -> [symbol_id, decade_low, decade_high, precision, scale]
+        self._symbols: Dict[str, list] = {}
+        self._symbol_names: List[str] = []
+        self._side_codes: Dict[str, int] = {}
+        self._side_names: List[str] = []
+        self._pow10: List[int] = [10 ** p for p in range(20)]
+
+    @staticmethod
+    def bucket_precision(price: float) -> int:
+        """Decimal places of the 0.1% price bucket (reference formula)."""
+        return max(1, int(-math.log10(price * 0.001)))
+
+    def key(self, symbol: str, side: str, price: float) -> NodeKey:
+        """Key of the 0.1% price bucket containing price (price > 0)."""
+        entry = self._symbols.get(symbol)
+        if entry is None:
+            entry = self._register_symbol(symbol)
+        if not entry[1] < price < entry[2]:
+            self._cache_decade(entry, price)
+
+        precision = entry[3]
+        scaled = price * entry[4]
+        tick = round(scaled)
+        if abs(abs(scaled - tick) - 0.5) < _TIE_EPS:
+            # Near a half tick: round the exact binary price like round() does
+            tick = round(round(price, precision) * entry[4])
+        while precision > 1 and tick % 10 == 0:
+            tick //= 10
+            precision -= 1
+
+        side_code = self._side_codes.get(side)
+        if side_code is None:
+            side_code = self._register_side(side)
+        return (entry[0], side_code, precision, tick)
+
+    def bucket_price(self, key: NodeKey) -> float:
+        """Bucket price of key (equal to round(price, precision))."""
+        return key[3] / self._pow10[key[2]]
+
+    def symbol(self, key: NodeKey) -> str:
+        return self._symbol_names[key[0]]
+
+    def side(self, key: NodeKey) -> str:
+        return self._side_names[key[1]]
+
+    def node_id(self, key: NodeKey) -> str:
+        """String node ID: {symbol}_{side}_{bucket_price}."""
+        return f"{self._symbol_names[key[0]]}_{self._side_names[key[1]]}_{self.bucket_price(key)}"
+
+    def _register_symbol(self, symbol: str) -> list:
+        entry = [len(self._symbol_names), _INF, -_INF, 1, 10]
+        self._symbols[symbol] = entry
+        self._symbol_names.append(symbol)
+        return entry
+
+    def _register_side(self, side: str) -> int:
+        code = len(self._side_names)
+        self._side_codes[side] = code
+        self._side_names.append(side)
+        return code
+
+    def _cache_decade(self, entry: list, price: float) -> None:
+        # precision p >= 2 holds for 10**(2-p) < price <= 10**(3-p);
+        # p == 1 for every price above 10
+        precision = self.bucket_precision(price)
+        if precision >= len(self._pow10):
+            self._pow10.extend(10 ** p for p in range(len(self._pow10), precision + 1))
+        low = 10.0 ** (2 - precision) * (1 + _DECADE_MARGIN)
+        high = 10.0 ** (3 - precision) * (1 - _DECADE_MARGIN) if precision > 1 else _INF
+        entry[1] = low
+        entry[2] = high
+        entry[3] = precision
+        entry[4] = self._pow10[precision]
@@ -0,0 +1,188 @@
+"""
+M2 Price Index
+
+Per-symbol, price-sorted index over a node collection of the continuity store.
+
+Nodes are kept sorted by price_center. Point-overlap queries bisect into the
+window [price - max_half_band, price + max_half_band] and then apply the exact
+node.overlaps() check, so results are identical to a full scan while costing
+O(log n + k) instead of O(total nodes).
+
+Result order matches insertion order into the owning collection (the order a
+scan over the store dict would produce).
+
+NO interpretation. Pure spatial bookkeeping.
+"""
+
+from bisect import bisect_left, bisect_right
+from typing import Dict, Iterable, List, Optional
+
+from memory.enriched_memory_node import EnrichedLiquidityMemoryNode
+
+# Relative slack applied to candidate windows so that float rounding in
+# node.overlaps() can never exclude a node the window should have included.
+_WINDOW_SLACK = 1e-9
+
+
+class _SymbolPartition:
+    """Sorted node arrays for a single symbol."""
+
+    __slots__ = ('nodes', 'centers', 'sorted_nodes', 'max_half_band', 'max_half_band_stale')
+
+    def __init__(self):
+        # node_id -> node, insertion ordered
+        self.nodes: Dict[str, EnrichedLiquidityMemoryNode] = {}
+        # Parallel arrays sorted by price_center
+        self.centers: List[float] = []
+        self.sorted_nodes: List[EnrichedLiquidityMemoryNode] = []
+        self.max_half_band = 0.0
+        self.max_half_band_stale = False
+
+    def half_band_window(self) -> float:
+        """Largest half band in the partition (recomputed lazily after removals)."""
+        if self.max_half_band_stale:
+            self.max_half_band = max(
+                (n.price_band / 2 for n in self.nodes.values()),
+                default=0.0
+            )
+            self.max_half_band_stale = False
+        return self.max_half_band
+
+    def slice(self, low: float, high: float) -> List[EnrichedLiquidityMemoryNode]:
+        """Nodes with price_center in [low, high]."""
+        lo = bisect_left(self.centers, low)
+        hi = bisect_right(self.centers, high)
+        return self.sorted_nodes[lo:hi]
+
+
+class PriceIndex:
+    """
+    Symbol-partitioned, price-sorted index of memory nodes.
+
+    Owned by ContinuityMemoryStore, which must call add()/remove() whenever a
+    node enters or leaves the indexed collection.
+    """
+
+    def __init__(self):
+        self._partitions: Dict[str, _SymbolPartition] = {}
+        self._seq: Dict[str, int] = {}
+        self._next_seq = 0
+
+    def __len__(self) -> int:
+        return len(self._seq)
+
+    def __contains__(self, node_id: str) -> bool:
+        return node_id in self._seq
+
+    def add(self, node: EnrichedLiquidityMemoryNode) -> None:
+        """Insert node (node must not already be indexed)."""
+        partition = self._partitions.get(node.symbol)
+        if partition is None:
+            partition = _SymbolPartition()
+            self._partitions[node.symbol] = partition
+
+        center = node.price_center
+        idx = bisect_right(partition.centers, center)
+        partition.centers.insert(idx, center)
+        partition.sorted_nodes.insert(idx, node)
+        partition.nodes[node.id] = node
+
+        half_band = node.price_band / 2
+        if half_band > partition.max_half_band:
+            partition.max_half_band = half_band
+
+        self._seq[node.id] = self._next_seq
+        self._next_seq += 1
+
+    def remove(self, node: EnrichedLiquidityMemoryNode) -> None:
+        """Remove node if indexed."""
+        if self._seq.pop(node.id, None) is None:
+            return
+
+        partition = self._partitions[node.symbol]
+        del partition.nodes[node.id]
+
+        centers = partition.centers
+        idx = bisect_left(centers, node.price_center)
+        while idx < len(centers) and centers[idx] == node.price_center:
+            if partition.sorted_nodes[idx] is node:
+                del centers[idx]
+                del partition.sorted_nodes[idx]
+                break
+            idx += 1
+
+        if not partition.nodes:
+            del self._partitions[node.symbol]
+        elif node.price_band / 2 >= partition.max_half_band:
+            partition.max_half_band_stale = True
+
+    def symbols(self) -> Iterable[str]:
+        """Symbols with at least one indexed node."""
+        return self._partitions.keys()
+
+    def nodes_for_symbol(self, symbol: str) -> Iterable[EnrichedLiquidityMemoryNode]:
+        """All indexed nodes for symbol, in insertion order."""
+        partition = self._partitions.get(symbol)
+        if partition is None:
+            return ()
+        return partition.nodes.values()
+
+    def overlapping(
+        self,
+        symbol: str,
+        price: float,
+        max_distance: Optional[float] = None
+    ) -> List[EnrichedLiquidityMemoryNode]:
+        """
+        Nodes whose band contains price, or whose center is within max_distance.
+
+        Returns nodes in insertion order.
+        """
+        partition = self._partitions.get(symbol)
+        if partition is None:
+            return []
+
+        window = partition.half_band_window()
+        if max_distance is not None and max_distance > window:
+            window = max_distance
+        window += (abs(price) + window) * _WINDOW_SLACK
+
+        matches = []
+        for node in partition.slice(price - window, price + window):
+            if node.overlaps(price):
+                matches.append(node)
+            elif max_distance is not None and abs(price - node.price_center) <= max_distance:
+                matches.append(node)
+
+        return self._in_insertion_order(matches)
+
+    def within_radius(
+        self,
+        symbol: str,
+        price: float,
+        radius: float
+    ) -> List[EnrichedLiquidityMemoryNode]:
+        """Nodes with |price_center - price| <= radius, in insertion order."""
+        partition = self._partitions.get(symbol)
+        if partition is None:
+            return []
+
+        window = radius + (abs(price) + abs(radius)) * _WINDOW_SLACK
+        matches = [
+            node for node in partition.slice(price - window, price + window)
+            if abs(node.price_center - price) <= radius
+        ]
+        return self._in_insertion_order(matches)
+
+    def _in_insertion_order(
+        self,
+        nodes: List[EnrichedLiquidityMemoryNode]
+    ) -> List[EnrichedLiquidityMemoryNode]:
+        if len(nodes) > 1:
+            seq = self._seq
+            nodes.sort(key=lambda n: seq[n.id])
+        return nodes
+
+    def insertion_rank(self, node_id: str) -> int:
+        """Monotonic insertion sequence number (lower = inserted earlier)."""
+        return self._seq[node_id]
@@ -11,7 +11,7 @@ from typing import Deque, List, Tuple, Optional
 from memory.m3_evidence_token import EvidenceToken
 
 
-@dataclass
+@dataclass(slots=True)
 class SequenceBuffer:
     """
     Rolling window of recent evidence tokens with timestamps.
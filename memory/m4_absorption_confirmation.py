@@ -55,6 +55,8 @@ from collections import deque
 import time
 import math
 
+from memory.m4_rolling_window import RollingRank, RollingSeries, RollingTradeWindow
+
 
 class AbsorptionPhase(Enum):
     """
@@ -405,23 +407,30 @@ class AbsorptionConfirmationTracker:
     CONTROL_CONSISTENCY_THRESHOLD = 0.6  # 60% of windows must show control
 
     def __init__(self):
-        # Per-coin trade buffers: deque of (timestamp, price, volume, is_sell)
-        self._trades: Dict[str, deque] = {}
+        # Window buffers keep running aggregates (prefix sums, price min/max,
+        # sorted sizes) so per-cycle metrics do not rescan the buffers
+
+        # Per-coin trade buffers: (timestamp, price, volume, is_sell)
+        # (also backs the whale threshold trade size distribution)
+        self._trades: Dict[str, RollingTradeWindow] = {}
 
         # Per-coin orderbook state: (timestamp, bid_size, ask_size, mid_price, spread)
-        self._orderbook_history: Dict[str, deque] = {}
+        self._orderbook_history: Dict[str, RollingSeries] = {}
 
-        # Per-coin absorption events: deque of (timestamp, consumed, price_move)
-        self._absorption_events: Dict[str, deque] = {}
+        # Per-coin first observed spread (bps), reference for spread variance
+        self._spread_bps_ref: Dict[str, float] = {}
 
-        # Per-coin refill events: deque of (timestamp, added_size)
-        self._refill_events: Dict[str, deque] = {}
+        # Per-coin absorption events: (timestamp, consumed, price_move)
+        self._absorption_events: Dict[str, RollingSeries] = {}
+
+        # Per-coin refill events: (timestamp, added_size)
+        self._refill_events: Dict[str, RollingSeries] = {}
 
         # Per-coin absorption ratio history for percentile calculation
-        self._absorption_ratio_history: Dict[str, deque] = {}
+        self._absorption_ratio_history: Dict[str, RollingRank] = {}
 
         # Per-coin volume history for percentile calculation
-        self._volume_history: Dict[str, deque] = {}
+        self._volume_history: Dict[str, RollingRank] = {}
 
         # Max buffer size (120 seconds at high frequency)
         self._max_events = 2000
@@ -435,7 +444,7 @@ class AbsorptionConfirmationTracker:
 
         # Per-coin liquidation tracking: (timestamp, side, volume)
         # side: 'long' or 'short'
-        self._liquidations: Dict[str, deque] = {}
+        self._liquidations: Dict[str, RollingSeries] = {}
 
         # Per-coin bid level tracking for persistence: {price_level: first_seen_ts}
         self._bid_levels: Dict[str, Dict[float, float]] = {}
@@ -446,9 +455,6 @@ class AbsorptionConfirmationTracker:
         # Per-coin control shift history: deque of (timestamp, confirmed)
         self._control_shift_history: Dict[str, deque] = {}
 
-        # Per-coin trade size history for whale threshold calculation
-        self._trade_sizes: Dict[str, deque] = {}
-
         # H5-A: Per-coin whale sell volume history for reload detection
         # Tracks (timestamp, whale_sell_volume) to detect increases
         self._whale_sell_history: Dict[str, deque] = {}
@@ -465,14 +471,9 @@ class AbsorptionConfirmationTracker:
         ts = timestamp or time.time()
 
         if coin not in self._trades:
-            self._trades[coin] = deque(maxlen=self._max_events)
+            self._trades[coin] = RollingTradeWindow(self._max_events)
 
-        self._trades[coin].append((ts, price, volume, is_sell))
-
-        # Track trade sizes for whale threshold calculation
-        if coin not in self._trade_sizes:
-            self._trade_sizes[coin] = deque(maxlen=self._max_events)
-        self._trade_sizes[coin].append(volume)
+        self._trades[coin].record(ts, price, volume, is_sell)
 
     def record_liquidation(
         self,
@@ -493,9 +494,14 @@ class AbsorptionConfirmationTracker:
         ts = timestamp or time.time()
 
         if coin not in self._liquidations:
-            self._liquidations[coin] = deque(maxlen=self._max_events)
+            # Summed fields: long volume, short volume
+            self._liquidations[coin] = RollingSeries(self._max_events, width=2)
 
-        self._liquidations[coin].append((ts, side, volume))
+        self._liquidations[coin].append(
+            ts,
+            (ts, side, volume),
+            (volume if side == 'long' else 0.0, volume if side == 'short' else 0.0)
+        )
 
     def record_bid_level(
         self,
@@ -557,9 +563,22 @@ class AbsorptionConfirmationTracker:
         ts = timestamp or time.time()
 
         if coin not in self._orderbook_history:
-            self._orderbook_history[coin] = deque(maxlen=self._max_events)
+            # Summed fields: valid spread count, spread_bps - ref, (spread_bps - ref)^2
+            self._orderbook_history[coin] = RollingSeries(self._max_events, width=3)
+
+        if mid_price > 0 and spread > 0:
+            spread_bps = (spread / mid_price) * 10000
+            # Shift by the first observed spread so variance from running
+            # sums does not suffer cancellation
+            ref = self._spread_bps_ref.setdefault(coin, spread_bps)
+            shifted = spread_bps - ref
+            values = (1, shifted, shifted * shifted)
+        else:
+            values = (0, 0.0, 0.0)
 
-        self._orderbook_history[coin].append((ts, bid_size, ask_size, mid_price, spread))
+        self._orderbook_history[coin].append(
+            ts, (ts, bid_size, ask_size, mid_price, spread), values
+        )
 
     def record_absorption(
         self,
@@ -572,9 +591,12 @@ class AbsorptionConfirmationTracker:
         ts = timestamp or time.time()
 
         if coin not in self._absorption_events:
-            self._absorption_events[coin] = deque(maxlen=self._max_events)
+            # Summed fields: consumed size, price movement
+            self._absorption_events[coin] = RollingSeries(self._max_events, width=2)
 
-        self._absorption_events[coin].append((ts, consumed_size, price_movement_pct))
+        self._absorption_events[coin].append(
+            ts, (ts, consumed_size, price_movement_pct), (consumed_size, price_movement_pct)
+        )
 
     def record_refill(
         self,
@@ -586,9 +608,22 @@ class AbsorptionConfirmationTracker:
         ts = timestamp or time.time()
 
         if coin not in self._refill_events:
-            self._refill_events[coin] = deque(maxlen=self._max_events)
+            # Summed fields: added size
+            self._refill_events[coin] = RollingSeries(self._max_events, width=1)
+
+        self._refill_events[coin].append(ts, (ts, added_size), (added_size,))
 
-        self._refill_events[coin].append((ts, added_size))
+    def _trade_window(
+        self,
+        coin: str,
+        cutoff: float
+    ) -> Tuple[Optional[RollingTradeWindow], int, int]:
+        """(trades, lo, hi) for trades with ts > cutoff (lo == hi if none)."""
+        trades = self._trades.get(coin)
+        if trades is None:
+            return None, 0, 0
+        lo, hi = trades.window(cutoff)
+        return trades, lo, hi
 
     def _compute_regime_context(
         self,
@@ -600,29 +635,15 @@ class AbsorptionConfirmationTracker:
 
         Uses 30-second lookback for regime estimation.
         """
-        trades = self._trades.get(coin, [])
-        orderbook = self._orderbook_history.get(coin, [])
-
         # 30-second lookback for regime
         regime_cutoff = current_time - 30.0
 
-        recent_trades = [
-            (ts, price, vol, is_sell)
-            for ts, price, vol, is_sell in trades
-            if ts > regime_cutoff
-        ]
-
-        recent_orderbook = [
-            (ts, bid, ask, mid, spread)
-            for ts, bid, ask, mid, spread in orderbook
-            if ts > regime_cutoff
-        ]
+        trades, lo, hi = self._trade_window(coin, regime_cutoff)
+        trade_count = hi - lo
 
         # Volatility: rolling price range
-        if recent_trades:
-            prices = [price for _, price, _, _ in recent_trades]
-            high = max(prices)
-            low = min(prices)
+        if trade_count:
+            low, high = trades.price_range(lo, hi)
             mid = (high + low) / 2 if high != low else high
             rolling_range_bps = ((high - low) / mid * 10000) if mid > 0 else 0.0
 
@@ -633,33 +654,27 @@ class AbsorptionConfirmationTracker:
             atr_proxy = 0.0
 
         # Liquidity: trade sizes and volume
-        if recent_trades:
-            volumes = sorted([vol for _, _, vol, _ in recent_trades])
-            median_idx = len(volumes) // 2
-            median_trade_size = volumes[median_idx] if volumes else 0.0
-            total_volume_30s = sum(volumes)
-            trade_rate = len(recent_trades) / 30.0
+        if trade_count:
+            median_trade_size = trades.window_median_size(lo)
+            total_volume_30s = trades.buy_volume(lo, hi) + trades.sell_volume(lo, hi)
+            trade_rate = trade_count / 30.0
         else:
             median_trade_size = 0.0
             total_volume_30s = 0.0
             trade_rate = 0.0
 
         # Spread context
-        if recent_orderbook:
-            spreads_bps = []
-            for ts, bid, ask, mid, spread in recent_orderbook:
-                if mid > 0 and spread > 0:
-                    spread_bps = (spread / mid) * 10000
-                    spreads_bps.append(spread_bps)
-
-            if spreads_bps:
-                avg_spread_bps = sum(spreads_bps) / len(spreads_bps)
-                mean = avg_spread_bps
-                variance = sum((s - mean) ** 2 for s in spreads_bps) / len(spreads_bps)
-                spread_volatility = math.sqrt(variance)
-            else:
-                avg_spread_bps = 0.0
-                spread_volatility = 0.0
+        orderbook = self._orderbook_history.get(coin)
+        spread_count = 0
+        if orderbook is not None:
+            ob_lo, ob_hi = orderbook.window(regime_cutoff)
+            spread_count = int(orderbook.sum(0, ob_lo, ob_hi))
+
+        if spread_count:
+            shifted_mean = orderbook.sum(1, ob_lo, ob_hi) / spread_count
+            avg_spread_bps = self._spread_bps_ref[coin] + shifted_mean
+            variance = orderbook.sum(2, ob_lo, ob_hi) / spread_count - shifted_mean ** 2
+            spread_volatility = math.sqrt(max(variance, 0.0))
         else:
             avg_spread_bps = 0.0
             spread_volatility = 0.0
@@ -685,14 +700,13 @@ class AbsorptionConfirmationTracker:
             adaptive_window_sec=adaptive_window
         )
 
-    def _compute_percentile(self, value: float, history: deque) -> float:
+    def _compute_percentile(self, value: float, history: RollingRank) -> float:
         """Compute percentile of value within history."""
         if not history or len(history) < 5:
             return 50.0  # Default to median if insufficient history
 
-        sorted_history = sorted(history)
-        count_below = sum(1 for h in sorted_history if h < value)
-        return (count_below / len(sorted_history)) * 100
+        count_below = history.count_below(value)
+        return (count_below / len(history)) * 100
 
     def _compute_absorption_ratio(
         self,
@@ -706,22 +720,26 @@ class AbsorptionConfirmationTracker:
         Returns:
             (absorption_ratio, percentile_vs_history)
         """
-        events = self._absorption_events.get(coin, [])
+        events = self._absorption_events.get(coin)
         window = regime.adaptive_window_sec
         cutoff = current_time - window
 
-        recent = [(ts, consumed, move) for ts, consumed, move in events if ts > cutoff]
+        if events is None:
+            return 0.0, 0.0
+
+        lo, hi = events.window(cutoff)
+        event_count = hi - lo
 
-        if not recent:
+        if not event_count:
             return 0.0, 0.0
 
-        total_consumed = sum(consumed for _, consumed, _ in recent)
-        total_movement = sum(move for _, _, move in recent)
+        total_consumed = events.sum(0, lo, hi)
+        total_movement = events.sum(1, lo, hi)
 
         # SPREAD-ADJUSTED: Add half spread to movement (noise floor)
         # Movement less than spread is noise, not real price change
         spread_adjustment = regime.avg_spread_bps / 2 / 10000  # Convert to pct
-        adjusted_movement = total_movement + spread_adjustment * len(recent)
+        adjusted_movement = total_movement + spread_adjustment * event_count
 
         # VOLATILITY-NORMALIZED: Divide by rolling volatility
         # This makes ratio comparable across regimes
@@ -738,7 +756,7 @@ class AbsorptionConfirmationTracker:
 
         # Track history for percentile
         if coin not in self._absorption_ratio_history:
-            self._absorption_ratio_history[coin] = deque(maxlen=self._percentile_history_size)
+            self._absorption_ratio_history[coin] = RollingRank(self._percentile_history_size)
         self._absorption_ratio_history[coin].append(ratio)
 
         percentile = self._compute_percentile(ratio, self._absorption_ratio_history[coin])
@@ -757,17 +775,19 @@ class AbsorptionConfirmationTracker:
         Returns:
             (replenishment_rate, replenishment_vs_consumed_ratio)
         """
-        refill_events = self._refill_events.get(coin, [])
-        absorption_events = self._absorption_events.get(coin, [])
+        refill_events = self._refill_events.get(coin)
+        absorption_events = self._absorption_events.get(coin)
 
         window = regime.adaptive_window_sec
         cutoff = current_time - window
 
-        recent_refills = [(ts, added) for ts, added in refill_events if ts > cutoff]
-        recent_absorption = [(ts, consumed, _) for ts, consumed, _ in absorption_events if ts > cutoff]
+        total_added = 0.0
+        if refill_events is not None:
+            total_added = refill_events.sum(0, *refill_events.window(cutoff))
 
-        total_added = sum(added for _, added in recent_refills)
-        total_consumed = sum(consumed for _, consumed, _ in recent_absorption)
+        total_consumed = 0.0
+        if absorption_events is not None:
+            total_consumed = absorption_events.sum(0, *absorption_events.window(cutoff))
 
         rate = total_added / window if window > 0 else 0.0
 
@@ -790,33 +810,29 @@ class AbsorptionConfirmationTracker:
         Returns:
             (sell_volume, sell_volume_percentile, downside_range_bps, range_vs_volatility)
         """
-        trades = self._trades.get(coin, [])
         window = regime.adaptive_window_sec
         cutoff = current_time - window
 
-        recent = [(ts, price, vol, is_sell) for ts, price, vol, is_sell in trades if ts > cutoff]
+        trades, lo, hi = self._trade_window(coin, cutoff)
 
-        if not recent:
+        if lo == hi:
             return 0.0, 0.0, 0.0, 0.0
 
         # Sum sell volume
-        sell_volume = sum(vol for _, _, vol, is_sell in recent if is_sell)
+        sell_volume = trades.sell_volume(lo, hi)
 
         # Track volume history for percentile
         if coin not in self._volume_history:
-            self._volume_history[coin] = deque(maxlen=self._percentile_history_size)
+            self._volume_history[coin] = RollingRank(self._percentile_history_size)
         self._volume_history[coin].append(sell_volume)
 
         volume_percentile = self._compute_percentile(sell_volume, self._volume_history[coin])
 
         # Compute price range on sell trades only
-        sell_prices = [price for _, price, _, is_sell in recent if is_sell]
-
-        if len(sell_prices) < 2:
+        if trades.sell_count(lo, hi) < 2:
             return sell_volume, volume_percentile, 0.0, 0.0
 
-        high = max(sell_prices)
-        low = min(sell_prices)
+        low, high = trades.sell_price_range(lo, hi)
         mid = (high + low) / 2
 
         if mid == 0:
@@ -847,32 +863,29 @@ class AbsorptionConfirmationTracker:
         Returns:
             (cumulative_delta, delta_slope, delta_slope_normalized)
         """
-        trades = self._trades.get(coin, [])
         window = regime.adaptive_window_sec
         cutoff = current_time - window
 
-        recent = [(ts, price, vol, is_sell) for ts, price, vol, is_sell in trades if ts > cutoff]
+        trades, lo, hi = self._trade_window(coin, cutoff)
 
-        if not recent:
+        if lo == hi:
             return 0.0, 0.0, 0.0
 
         # Cumulative delta
-        buy_volume = sum(vol for _, _, vol, is_sell in recent if not is_sell)
-        sell_volume = sum(vol for _, _, vol, is_sell in recent if is_sell)
+        buy_volume = trades.buy_volume(lo, hi)
+        sell_volume = trades.sell_volume(lo, hi)
         delta = buy_volume - sell_volume
         total_volume = buy_volume + sell_volume
 
         # Delta slope (compare first half to second half)
         mid_time = cutoff + window / 2
+        mid = trades.first_after(lo, hi, mid_time)
 
-        first_half = [(ts, vol, is_sell) for ts, _, vol, is_sell in recent if ts <= mid_time]
-        second_half = [(ts, vol, is_sell) for ts, _, vol, is_sell in recent if ts > mid_time]
-
-        if not first_half or not second_half:
+        if mid == lo or mid == hi:
             return delta, 0.0, 0.0
 
-        delta_1 = sum(vol if not is_sell else -vol for _, vol, is_sell in first_half)
-        delta_2 = sum(vol if not is_sell else -vol for _, vol, is_sell in second_half)
+        delta_1 = trades.buy_volume(lo, mid) - trades.sell_volume(lo, mid)
+        delta_2 = trades.buy_volume(mid, hi) - trades.sell_volume(mid, hi)
 
         slope = delta_2 - delta_1
 
@@ -900,23 +913,21 @@ class AbsorptionConfirmationTracker:
         Returns:
             (buy_aggression_ratio, aggression_delta, bid_lifting)
         """
-        trades = self._trades.get(coin, [])
         window = regime.adaptive_window_sec
         cutoff = current_time - window
         mid_time = cutoff + window / 2
 
-        recent = [(ts, price, vol, is_sell) for ts, price, vol, is_sell in trades if ts > cutoff]
+        trades, lo, hi = self._trade_window(coin, cutoff)
 
-        if not recent:
+        if lo == hi:
             return 0.0, 0.0, False
 
         # Split into halves
-        first_half = [(ts, vol, is_sell) for ts, _, vol, is_sell in recent if ts <= mid_time]
-        second_half = [(ts, vol, is_sell) for ts, _, vol, is_sell in recent if ts > mid_time]
+        mid = trades.first_after(lo, hi, mid_time)
 
         # Calculate buy aggression ratio (buy-initiated / total)
-        total_volume = sum(vol for _, _, vol, _ in recent)
-        buy_volume = sum(vol for _, _, vol, is_sell in recent if not is_sell)
+        buy_volume = trades.buy_volume(lo, hi)
+        total_volume = buy_volume + trades.sell_volume(lo, hi)
 
         if total_volume > 0:
             buy_aggression_ratio = buy_volume / total_volume
@@ -924,10 +935,10 @@ class AbsorptionConfirmationTracker:
             buy_aggression_ratio = 0.5  # Neutral
 
         # Calculate aggression delta (change from first to second half)
-        first_total = sum(vol for _, vol, _ in first_half) if first_half else 0
-        first_buy = sum(vol for _, vol, is_sell in first_half if not is_sell) if first_half else 0
-        second_total = sum(vol for _, vol, _ in second_half) if second_half else 0
-        second_buy = sum(vol for _, vol, is_sell in second_half if not is_sell) if second_half else 0
+        first_buy = trades.buy_volume(lo, mid)
+        first_total = first_buy + trades.sell_volume(lo, mid)
+        second_buy = trades.buy_volume(mid, hi)
+        second_total = second_buy + trades.sell_volume(mid, hi)
 
         first_ratio = first_buy / first_total if first_total > 0 else 0.5
         second_ratio = second_buy / second_total if second_total > 0 else 0.5
@@ -951,23 +962,21 @@ class AbsorptionConfirmationTracker:
         Returns:
             (buy_volume_first, buy_volume_second, acceleration, volume_accelerating)
         """
-        trades = self._trades.get(coin, [])
         window = regime.adaptive_window_sec
         cutoff = current_time - window
         mid_time = cutoff + window / 2
 
-        recent = [(ts, price, vol, is_sell) for ts, price, vol, is_sell in trades if ts > cutoff]
+        trades, lo, hi = self._trade_window(coin, cutoff)
 
-        if not recent:
+        if lo == hi:
             return 0.0, 0.0, 0.0, False
 
         # Split into halves
-        first_half = [(ts, vol, is_sell) for ts, _, vol, is_sell in recent if ts <= mid_time]
-        second_half = [(ts, vol, is_sell) for ts, _, vol, is_sell in recent if ts > mid_time]
+        mid = trades.first_after(lo, hi, mid_time)
 
         # Buy volume in each half
-        buy_first = sum(vol for _, vol, is_sell in first_half if not is_sell)
-        buy_second = sum(vol for _, vol, is_sell in second_half if not is_sell)
+        buy_first = trades.buy_volume(lo, mid)
+        buy_second = trades.buy_volume(mid, hi)
 
         # Acceleration = (second - first) / first
         if buy_first > 0:
@@ -992,25 +1001,23 @@ class AbsorptionConfirmationTracker:
         Returns:
             (low_first, low_second, higher_low_formed, floor_strength)
         """
-        trades = self._trades.get(coin, [])
         window = regime.adaptive_window_sec
         cutoff = current_time - window
         mid_time = cutoff + window / 2
 
-        recent = [(ts, price, vol, is_sell) for ts, price, vol, is_sell in trades if ts > cutoff]
+        trades, lo, hi = self._trade_window(coin, cutoff)
 
-        if not recent:
+        if lo == hi:
             return 0.0, 0.0, False, 0.0
 
         # Split into halves
-        first_half_prices = [price for ts, price, _, _ in recent if ts <= mid_time]
-        second_half_prices = [price for ts, price, _, _ in recent if ts > mid_time]
+        mid = trades.first_after(lo, hi, mid_time)
 
-        if not first_half_prices or not second_half_prices:
+        if mid == lo or mid == hi:
             return 0.0, 0.0, False, 0.0
 
-        low_first = min(first_half_prices)
-        low_second = min(second_half_prices)
+        low_first = trades.price_range(lo, mid)[0]
+        low_second = trades.price_range(mid, hi)[0]
 
         # Higher low formed if second low > first low
         higher_low_formed = low_second > low_first
@@ -1043,32 +1050,30 @@ class AbsorptionConfirmationTracker:
         Returns:
             (imbalance_first, imbalance_second, imbalance_delta, imbalance_flipped)
         """
-        trades = self._trades.get(coin, [])
         window = regime.adaptive_window_sec
         cutoff = current_time - window
         mid_time = cutoff + window / 2
 
-        recent = [(ts, price, vol, is_sell) for ts, price, vol, is_sell in trades if ts > cutoff]
+        trades, lo, hi = self._trade_window(coin, cutoff)
 
-        if not recent:
+        if lo == hi:
             return 0.0, 0.0, 0.0, False
 
         # Split into halves
-        first_half = [(ts, vol, is_sell) for ts, _, vol, is_sell in recent if ts <= mid_time]
-        second_half = [(ts, vol, is_sell) for ts, _, vol, is_sell in recent if ts > mid_time]
+        mid = trades.first_after(lo, hi, mid_time)
 
-        def compute_imbalance(trades_list):
-            if not trades_list:
+        def compute_imbalance(start, end):
+            if start == end:
                 return 0.0
-            buy = sum(vol for _, vol, is_sell in trades_list if not is_sell)
-            sell = sum(vol for _, vol, is_sell in trades_list if is_sell)
+            buy = trades.buy_volume(start, end)
+            sell = trades.sell_volume(start, end)
             total = buy + sell
             if total > 0:
                 return (buy - sell) / total
             return 0.0
 
-        imbalance_first = compute_imbalance(first_half)
-        imbalance_second = compute_imbalance(second_half)
+        imbalance_first = compute_imbalance(lo, mid)
+        imbalance_second = compute_imbalance(mid, hi)
         imbalance_delta = imbalance_second - imbalance_first
 
         # Imbalance flipped = was sell-heavy, now buy-heavy (or significant positive swing)
@@ -1094,25 +1099,13 @@ class AbsorptionConfirmationTracker:
 
         Uses 60-second window to detect directional movement.
         """
-        trades = self._trades.get(coin, [])
-        liquidations = self._liquidations.get(coin, [])
-
         # 60-second lookback for trend
         trend_cutoff = current_time - self.TREND_WINDOW_SEC
 
-        recent_trades = [
-            (ts, price, vol, is_sell)
-            for ts, price, vol, is_sell in trades
-            if ts > trend_cutoff
-        ]
-
-        recent_liqs = [
-            (ts, side, vol)
-            for ts, side, vol in liquidations
-            if ts > trend_cutoff
-        ]
+        trades, lo, hi = self._trade_window(coin, trend_cutoff)
+        trade_count = hi - lo
 
-        if len(recent_trades) < 10:
+        if trade_count < 10:
             # Not enough data for trend detection
             return TrendRegimeContext(
                 direction=TrendDirection.NEUTRAL,
@@ -1129,25 +1122,21 @@ class AbsorptionConfirmationTracker:
             )
 
         # Price structure analysis
-        prices = [price for _, price, _, _ in recent_trades]
-        first_price = prices[0]
-        last_price = prices[-1]
+        first_price = trades.price_at(lo)
+        last_price = trades.price_at(hi - 1)
         price_change_pct = (last_price - first_price) / first_price if first_price > 0 else 0.0
 
         # Count higher highs and lower lows (using 10-trade segments)
-        segment_size = max(len(prices) // 6, 2)
-        segments = [prices[i:i + segment_size] for i in range(0, len(prices), segment_size)]
+        segment_size = max(trade_count // 6, 2)
 
         higher_highs = 0
         lower_lows = 0
         consecutive = 0
         last_direction = 0
 
-        for i in range(1, len(segments)):
-            prev_high = max(segments[i - 1])
-            curr_high = max(segments[i])
-            prev_low = min(segments[i - 1])
-            curr_low = min(segments[i])
+        prev_low, prev_high = trades.price_range(lo, min(lo + segment_size, hi))
+        for start in range(lo + segment_size, hi, segment_size):
+            curr_low, curr_high = trades.price_range(start, min(start + segment_size, hi))
 
             if curr_high > prev_high:
                 higher_highs += 1
@@ -1165,6 +1154,8 @@ class AbsorptionConfirmationTracker:
                     consecutive = 1
                 last_direction = -1
 
+            prev_low, prev_high = curr_low, curr_high
+
         # Trend strength: how clear is the direction?
         total_signals = higher_highs + lower_lows
         if total_signals > 0:
@@ -1187,15 +1178,19 @@ class AbsorptionConfirmationTracker:
                 direction = TrendDirection.WEAK_DOWN
 
         # Liquidation context
-        long_liq = sum(vol for _, side, vol in recent_liqs if side == 'long')
-        short_liq = sum(vol for _, side, vol in recent_liqs if side == 'short')
+        liquidations = self._liquidations.get(coin)
+        if liquidations is not None:
+            liq_lo, liq_hi = liquidations.window(trend_cutoff)
+            long_liq = liquidations.sum(0, liq_lo, liq_hi)
+            short_liq = liquidations.sum(1, liq_lo, liq_hi)
+        else:
+            long_liq = 0.0
+            short_liq = 0.0
         total_liq = long_liq + short_liq
         liq_imbalance = (long_liq - short_liq) / total_liq if total_liq > 0 else 0.0
 
         # Cumulative delta over 60s
-        buy_vol = sum(vol for _, _, vol, is_sell in recent_trades if not is_sell)
-        sell_vol = sum(vol for _, _, vol, is_sell in recent_trades if is_sell)
-        delta_60s = buy_vol - sell_vol
+        delta_60s = trades.buy_volume(lo, hi) - trades.sell_volume(lo, hi)
 
         # Is delta direction aligned with price direction?
         delta_direction_aligned = (
@@ -1259,15 +1254,12 @@ class AbsorptionConfirmationTracker:
         1 whale exhausting = meaningful
         100 retail prints = noise
         """
-        trades = self._trades.get(coin, [])
-        trade_sizes = self._trade_sizes.get(coin, [])
-
         window = regime.adaptive_window_sec
         cutoff = current_time - window
 
-        recent = [(ts, price, vol, is_sell) for ts, price, vol, is_sell in trades if ts > cutoff]
+        trades, lo, hi = self._trade_window(coin, cutoff)
 
-        if not recent or len(trade_sizes) < 10:
+        if lo == hi or len(trades) < 10:
             return WhaleFlowMetrics(
                 whale_threshold=0.0,
                 whale_volume=0.0,
@@ -1282,43 +1274,49 @@ class AbsorptionConfirmationTracker:
             )
 
         # Calculate whale threshold (90th percentile of recent trade sizes)
-        sorted_sizes = sorted(trade_sizes)
-        whale_idx = int(len(sorted_sizes) * self.WHALE_PERCENTILE / 100)
-        whale_threshold = sorted_sizes[min(whale_idx, len(sorted_sizes) - 1)]
-
-        # Separate whale and retail trades
-        whale_trades = [(ts, price, vol, is_sell) for ts, price, vol, is_sell in recent if vol >= whale_threshold]
-        retail_trades = [(ts, price, vol, is_sell) for ts, price, vol, is_sell in recent if vol < whale_threshold]
-
-        whale_volume = sum(vol for _, _, vol, _ in whale_trades)
-        retail_volume = sum(vol for _, _, vol, _ in retail_trades)
+        whale_idx = int(len(trades) * self.WHALE_PERCENTILE / 100)
+        whale_threshold = trades.size_at_rank(whale_idx)
+
+        # Separate whale and retail trades (single pass over the window)
+        whale_volume = 0.0
+        retail_volume = 0.0
+        whale_buy = 0.0
+        whale_sell = 0.0
+        first_whale_sell = None
+        last_whale_sell = None
+        for index, (_, _, vol, is_sell) in enumerate(trades.rows(lo, hi), lo):
+            if vol >= whale_threshold:
+                whale_volume += vol
+                if is_sell:
+                    whale_sell += vol
+                    if first_whale_sell is None:
+                        first_whale_sell = index
+                    last_whale_sell = index
+                else:
+                    whale_buy += vol
+            else:
+                retail_volume += vol
         total_volume = whale_volume + retail_volume
 
         whale_ratio = whale_volume / total_volume if total_volume > 0 else 0.0
 
         # Whale-weighted metrics
-        whale_buy = sum(vol for _, _, vol, is_sell in whale_trades if not is_sell)
-        whale_sell = sum(vol for _, _, vol, is_sell in whale_trades if is_sell)
         whale_weighted_delta = whale_buy - whale_sell
 
         # Whale exhaustion ratio: how much of whale selling was absorbed?
         # (Approximated by looking at price impact of whale sells)
-        if whale_sell > 0:
+        if whale_sell > 0 and first_whale_sell is not None:
             # Look at price movement during whale sell window
-            whale_sell_times = [ts for ts, _, _, is_sell in whale_trades if is_sell]
-            if whale_sell_times:
-                min_whale_ts = min(whale_sell_times)
-                max_whale_ts = max(whale_sell_times)
-
-                prices_during = [price for ts, price, _, _ in recent if min_whale_ts <= ts <= max_whale_ts]
-                if len(prices_during) >= 2:
-                    price_drop_pct = abs(min(prices_during) - max(prices_during)) / max(prices_during)
-                    # Low price drop during high whale sell = absorption
-                    # Expected drop would be proportional to volume
-                    expected_drop = whale_sell / total_volume if total_volume > 0 else 0.1
-                    whale_exhaustion_ratio = max(0, 1 - (price_drop_pct / max(expected_drop, 0.001)))
-                else:
-                    whale_exhaustion_ratio = 0.0
+            during_lo = trades.first_at(lo, hi, trades.key_at(first_whale_sell))
+            during_hi = trades.first_after(lo, hi, trades.key_at(last_whale_sell))
+
+            if during_hi - during_lo >= 2:
+                low, high = trades.price_range(during_lo, during_hi)
+                price_drop_pct = abs(low - high) / high
+                # Low price drop during high whale sell = absorption
+                # Expected drop would be proportional to volume
+                expected_drop = whale_sell / total_volume if total_volume > 0 else 0.1
+                whale_exhaustion_ratio = max(0, 1 - (price_drop_pct / max(expected_drop, 0.001)))
             else:
                 whale_exhaustion_ratio = 0.0
         else:
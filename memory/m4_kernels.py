@@ -0,0 +1,338 @@
+"""
+M4 Primitive Kernels
+
+Interchangeable implementations of the array-driven M4 primitives computed
+per symbol on every snapshot:
+
+- PythonM4Kernels: the canonical pure-Python primitives (reference)
+- NumpyM4Kernels: vectorized equivalents over array inputs
+
+Both expose the same call signatures and return the same primitive
+dataclasses, with plain Python scalars. Sequences may be lists, tuples,
+memoryviews (M1 ring columns, wrapped zero-copy) or ndarrays.
+
+Parity: sums use np.add.accumulate (left-to-right, like sum()) rather than
+np.sum (pairwise), so NumPy results are bit-for-bit identical to the
+reference, including validation errors.
+
+CRITICAL: Pure functions only. No interpretation. No thresholds.
+"""
+
+from typing import Dict, Optional, Sequence, Tuple, Type
+
+import numpy as np
+
+from memory.m4_liquidation_clustering import LiquidationDensity, compute_liquidation_density
+from memory.m4_trade_flow import (
+    DirectionalContinuity,
+    TradeBurst,
+    compute_directional_continuity,
+    compute_trade_burst
+)
+from memory.m4_traversal_kinematics import TraversalCompactness, compute_traversal_compactness
+from memory.m4_traversal_voids import TraversalVoidSpan, compute_traversal_void_span
+from memory.m4_zone_geometry import (
+    DisplacementOriginAnchor,
+    ZonePenetrationDepth,
+    compute_zone_penetration_depth,
+    identify_displacement_origin_anchor
+)
+
+
+def _seq_sum(values: np.ndarray) -> float:
+    # Left-to-right float sum, identical to builtin sum() over the same values
+    return float(np.add.accumulate(values)[-1])
+
+
+class PythonM4Kernels:
+    """Reference kernels: the canonical pure-Python primitives."""
+
+    name = 'python'
+
+    compute_traversal_compactness = staticmethod(compute_traversal_compactness)
+    compute_zone_penetration_depth = staticmethod(compute_zone_penetration_depth)
+    identify_displacement_origin_anchor = staticmethod(identify_displacement_origin_anchor)
+    compute_directional_continuity = staticmethod(compute_directional_continuity)
+    compute_trade_burst = staticmethod(compute_trade_burst)
+
+    @staticmethod
+    def compute_traversal_void_span(
+        *,
+        observation_start_ts: float,
+        observation_end_ts: float,
+        traversal_timestamps: Sequence[float]
+    ) -> TraversalVoidSpan:
+        return compute_traversal_void_span(
+            observation_start_ts=observation_start_ts,
+            observation_end_ts=observation_end_ts,
+            traversal_timestamps=tuple(traversal_timestamps)
+        )
+
+    @staticmethod
+    def compute_liquidation_density(
+        *,
+        liquidation_prices: Sequence[float],
+        liquidation_volumes: Sequence[float],
+        price_center: float,
+        price_window: float
+    ) -> LiquidationDensity:
+        return compute_liquidation_density(
+            liquidations=[
+                {'price': price, 'volume': volume}
+                for price, volume in zip(liquidation_prices, liquidation_volumes)
+            ],
+            price_center=price_center,
+            price_window=price_window
+        )
+
+    @staticmethod
+    def mean(values: Sequence[float]) -> float:
+        return sum(values) / len(values)
+
+    @staticmethod
+    def low_high(values: Sequence[float]) -> Tuple[float, float]:
+        return min(values), max(values)
+
+
+class NumpyM4Kernels:
+    """Vectorized kernels, bit-for-bit identical to PythonM4Kernels."""
+
+    name = 'numpy'
+
+    @staticmethod
+    def compute_traversal_compactness(
+        *,
+        traversal_id: str,
+        ordered_prices: Sequence[float]
+    ) -> TraversalCompactness:
+        prices = np.asarray(ordered_prices, dtype=np.float64)
+        if len(prices) < 2:
+            raise ValueError(f"ordered_prices must contain >= 2 values, got {len(prices)}")
+
+        net_displacement = abs(float(prices[-1]) - float(prices[0]))
+        total_path_length = _seq_sum(np.abs(np.diff(prices)))
+
+        if total_path_length == 0:
+            compactness_ratio = 1.0
+        else:
+            compactness_ratio = net_displacement / total_path_length
+
+        return TraversalCompactness(
+            traversal_id=traversal_id,
+            net_displacement=net_displacement,
+            total_path_length=total_path_length,
+            compactness_ratio=compactness_ratio
+        )
+
+    @staticmethod
+    def compute_zone_penetration_depth(
+        *,
+        zone_id: str,
+        zone_low: float,
+        zone_high: float,
+        traversal_prices: Sequence[float]
+    ) -> Optional[ZonePenetrationDepth]:
+        if zone_low >= zone_high:
+            raise ValueError(f"zone_low ({zone_low}) must be < zone_high ({zone_high})")
+
+        prices = np.asarray(traversal_prices, dtype=np.float64)
+        inside = prices[(prices >= zone_low) & (prices <= zone_high)]
+        if len(inside) == 0:
+            return None
+
+        depth = float(np.minimum(inside - zone_low, zone_high - inside).max())
+        return ZonePenetrationDepth(
+            zone_id=zone_id,
+            penetration_depth=max(0.0, depth)
+        )
+
+    @staticmethod
+    def identify_displacement_origin_anchor(
+        *,
+        traversal_id: str,
+        pre_traversal_prices: Sequence[float],
+        pre_traversal_timestamps: Sequence[float]
+    ) -> DisplacementOriginAnchor:
+        prices = np.asarray(pre_traversal_prices, dtype=np.float64)
+        timestamps = np.asarray(pre_traversal_timestamps, dtype=np.float64)
+        if len(prices) == 0:
+            raise ValueError("pre_traversal_prices must be non-empty")
+        if len(prices) != len(timestamps):
+            raise ValueError(
+                f"Sequence lengths must match: prices={len(prices)}, "
+                f"timestamps={len(timestamps)}"
+            )
+
+        if len(timestamps) > 1:
+            anchor_dwell_time = float(timestamps[-1]) - float(timestamps[0])
+        else:
+            anchor_dwell_time = 0.0
+
+        return DisplacementOriginAnchor(
+            traversal_id=traversal_id,
+            anchor_low=float(prices.min()),
+            anchor_high=float(prices.max()),
+            anchor_dwell_time=anchor_dwell_time
+        )
+
+    @staticmethod
+    def compute_traversal_void_span(
+        *,
+        observation_start_ts: float,
+        observation_end_ts: float,
+        traversal_timestamps: Sequence[float]
+    ) -> TraversalVoidSpan:
+        if observation_end_ts <= observation_start_ts:
+            raise ValueError(
+                f"observation_end_ts ({observation_end_ts}) must be > "
+                f"observation_start_ts ({observation_start_ts})"
+            )
+
+        timestamps = np.asarray(traversal_timestamps, dtype=np.float64)
+        outside = (timestamps < observation_start_ts) | (timestamps > observation_end_ts)
+        if outside.any():
+            ts = float(timestamps[int(outside.argmax())])
+            raise ValueError(
+                f"Traversal timestamp ({ts}) outside observation window "
+                f"({observation_start_ts}, {observation_end_ts})"
+            )
+
+        if len(timestamps) == 0:
+            void_intervals = ((observation_start_ts, observation_end_ts),)
+        else:
+            ordered = np.sort(timestamps)
+            gaps = np.flatnonzero(ordered[1:] > ordered[:-1])
+            first = float(ordered[0])
+            last = float(ordered[-1])
+
+            intervals = []
+            if first > observation_start_ts:
+                intervals.append((observation_start_ts, first))
+            intervals.extend(zip(ordered[gaps].tolist(), ordered[gaps + 1].tolist()))
+            if last < observation_end_ts:
+                intervals.append((last, observation_end_ts))
+            void_intervals = tuple(intervals)
+
+        if len(void_intervals) == 0:
+            max_void_duration = 0.0
+        else:
+            max_void_duration = max(end - start for start, end in void_intervals)
+
+        return TraversalVoidSpan(
+            max_void_duration=max_void_duration,
+            void_intervals=void_intervals
+        )
+
+    @staticmethod
+    def compute_directional_continuity(
+        *,
+        trade_sides: Sequence[str]
+    ) -> DirectionalContinuity:
+        if len(trade_sides) == 0:
+            raise ValueError("trade_sides must be non-empty")
+
+        total_trades = len(trade_sides)
+        buy_trades = int(np.count_nonzero(np.asarray(trade_sides) == 'BUY'))
+        sell_trades = total_trades - buy_trades
+
+        return DirectionalContinuity(
+            total_trades=total_trades,
+            buy_trades=buy_trades,
+            sell_trades=sell_trades,
+            continuity_value=max(buy_trades, sell_trades) / total_trades
+        )
+
+    @staticmethod
+    def compute_trade_burst(
+        *,
+        trade_timestamps: Sequence[float],
+        burst_window_sec: float = 1.0
+    ) -> TradeBurst:
+        timestamps = np.asarray(trade_timestamps, dtype=np.float64)
+        if len(timestamps) == 0:
+            raise ValueError("trade_timestamps must be non-empty")
+        if burst_window_sec <= 0:
+            raise ValueError(f"burst_window_sec must be > 0, got {burst_window_sec}")
+
+        if (timestamps[1:] < timestamps[:-1]).any():
+            # Window scan stops at the first later trade; only sorted input
+            # reduces to a binary search
+            return compute_trade_burst(
+                trade_timestamps=timestamps.tolist(),
+                burst_window_sec=burst_window_sec
+            )
+
+        # Trades in [ts_i, ts_i + window] for every start i; first max wins
+        ends = np.searchsorted(timestamps, timestamps + burst_window_sec, side='right')
+        counts = ends - np.arange(len(timestamps))
+        start_idx = int(counts.argmax())
+        max_count = int(counts[start_idx])
+
+        burst_start_ts = float(timestamps[start_idx])
+        burst_end_ts = float(timestamps[ends[start_idx] - 1])
+        burst_duration = burst_end_ts - burst_start_ts
+
+        if burst_duration > 0:
+            trades_per_second = max_count / burst_duration
+        else:
+            trades_per_second = float(max_count)
+
+        return TradeBurst(
+            burst_start_ts=burst_start_ts,
+            burst_end_ts=burst_end_ts,
+            burst_duration=burst_duration,
+            trade_count=max_count,
+            trades_per_second=trades_per_second
+        )
+
+    @staticmethod
+    def compute_liquidation_density(
+        *,
+        liquidation_prices: Sequence[float],
+        liquidation_volumes: Sequence[float],
+        price_center: float,
+        price_window: float
+    ) -> LiquidationDensity:
+        if price_window <= 0:
+            raise ValueError(f"price_window must be > 0, got {price_window}")
+
+        price_low = price_center - (price_window / 2.0)
+        price_high = price_center + (price_window / 2.0)
+
+        prices = np.asarray(liquidation_prices, dtype=np.float64)
+        volumes = np.asarray(liquidation_volumes, dtype=np.float64)
+        in_window = (prices >= price_low) & (prices <= price_high)
+        liquidation_count = int(np.count_nonzero(in_window))
+        total_volume = _seq_sum(volumes[in_window]) if liquidation_count else 0
+
+        return LiquidationDensity(
+            price_center=price_center,
+            price_window=price_window,
+            liquidation_count=liquidation_count,
+            total_volume=total_volume,
+            density_score=liquidation_count / price_window
+        )
+
+    @staticmethod
+    def mean(values: Sequence[float]) -> float:
+        array = np.asarray(values, dtype=np.float64)
+        return _seq_sum(array) / len(array)
+
+    @staticmethod
+    def low_high(values: Sequence[float]) -> Tuple[float, float]:
+        array = np.asarray(values, dtype=np.float64)
+        return float(array.min()), float(array.max())
+
+
+M4_KERNELS: Dict[str, Type] = {
+    PythonM4Kernels.name: PythonM4Kernels,
+    NumpyM4Kernels.name: NumpyM4Kernels,
+}
+
+
+def get_m4_kernels(name: str) -> Type:
+    """Return the kernel set registered under name ('python' or 'numpy')."""
+    try:
+        return M4_KERNELS[name.lower()]
+    except KeyError:
+        raise ValueError(f"Unknown M4 kernel set: {name!r} (expected one of {sorted(M4_KERNELS)})")
@@ -0,0 +1,316 @@
+"""
+M4 Rolling Window Aggregates
+
+Bounded, time-ordered event buffers with incremental aggregates, backing the
+AbsorptionConfirmationTracker window metrics.
+
+- RollingSeries: exact per-field prefix sums -> window sums/counts in O(log n)
+- RollingTradeWindow: trade series plus range min/max over prices (segment
+  trees) and order statistics over trade sizes
+- RollingRank: bounded value history with a sorted companion for
+  percentile ranks in O(log n)
+
+Windows are selected by timestamp (ts > cutoff). Entries are keyed by the
+running maximum timestamp so keys stay sorted; an event arriving out of order
+is windowed together with the event recorded before it.
+
+NO interpretation. Pure bookkeeping.
+"""
+
+from bisect import bisect_left, bisect_right, insort
+from collections import deque
+from itertools import islice
+from typing import Any, Iterator, List, Optional, Tuple
+
+_INF = float('inf')
+
+# Prefix sums are kept as integers in units of 2**-80 so window sums are exact
+# (correctly rounded on the way out) and equal windows compare equal
+_SCALE = 2 ** 80
+_FSCALE = float(_SCALE)
+
+
+class RollingSeries:
+    """
+    Bounded event series with prefix sums over numeric fields.
+
+    Indexes returned by window()/first_after()/first_at() are positions in
+    the internal lists and stay valid until the next append().
+    """
+
+    def __init__(self, maxlen: int, width: int):
+        """
+        Args:
+            maxlen: Maximum live entries (oldest evicted first, like deque maxlen)
+            width: Number of summed fields per entry
+        """
+        self._maxlen = maxlen
+        self._keys: List[float] = []
+        self._rows: List[tuple] = []
+        # _prefix[f][i] = sum of field f over list entries [0, i), fixed point
+        self._prefix: List[List[int]] = [[0] for _ in range(width)]
+        # List index of the oldest live entry
+        self._head = 0
+        # Entries dropped from the lists by compaction (sequence = offset + index)
+        self._offset = 0
+        self._last_key = -_INF
+
+    def __len__(self) -> int:
+        return len(self._keys) - self._head
+
+    def __iter__(self) -> Iterator[tuple]:
+        return islice(self._rows, self._head, None)
+
+    def append(self, ts: float, row: tuple, values: Tuple[float, ...]) -> None:
+        """Append an event.
+
+        Args:
+            ts: Event timestamp
+            row: Raw event tuple (returned by iteration)
+            values: One value per summed field
+        """
+        key = ts if ts > self._last_key else self._last_key
+        self._last_key = key
+        self._keys.append(key)
+        self._rows.append(row)
+        for column, value in zip(self._prefix, values):
+            column.append(column[-1] + int(value * _FSCALE))
+        self._on_append(len(self._keys) - 1)
+
+        if len(self._keys) - self._head > self._maxlen:
+            self._on_evict(self._head)
+            self._head += 1
+            if self._head >= self._maxlen:
+                self._compact()
+
+    def _on_append(self, index: int) -> None:
+        """Hook for subclasses, called after an entry is appended."""
+
+    def _on_evict(self, index: int) -> None:
+        """Hook for subclasses, called before the oldest entry is dropped."""
+
+    def _compact(self) -> None:
+        # Drop evicted entries and rebase prefix sums (keeps the integers small)
+        head = self._head
+        del self._keys[:head]
+        del self._rows[:head]
+        for f, column in enumerate(self._prefix):
+            base = column[head]
+            self._prefix[f] = [value - base for value in islice(column, head, None)]
+        self._offset += head
+        self._head = 0
+
+    def window(self, cutoff: float) -> Tuple[int, int]:
+        """(lo, hi) list indexes of entries with ts > cutoff."""
+        return bisect_right(self._keys, cutoff, self._head), len(self._keys)
+
+    def first_after(self, lo: int, hi: int, ts: float) -> int:
+        """Index in [lo, hi] of the first entry with key > ts."""
+        return bisect_right(self._keys, ts, lo, hi)
+
+    def first_at(self, lo: int, hi: int, ts: float) -> int:
+        """Index in [lo, hi] of the first entry with key >= ts."""
+        return bisect_left(self._keys, ts, lo, hi)
+
+    def sum(self, field: int, lo: int, hi: int) -> float:
+        """Sum of field over entries [lo, hi)."""
+        column = self._prefix[field]
+        return (column[hi] - column[lo]) / _SCALE
+
+    def key_at(self, index: int) -> float:
+        return self._keys[index]
+
+    def row_at(self, index: int) -> tuple:
+        return self._rows[index]
+
+    def rows(self, lo: int, hi: int) -> List[tuple]:
+        """Raw rows for entries [lo, hi)."""
+        return self._rows[lo:hi]
+
+
+class _RangeMinMax:
+    """Ring-indexed segment tree answering min/max over position ranges."""
+
+    __slots__ = ('size', '_min', '_max')
+
+    def __init__(self, capacity: int):
+        size = 1
+        while size < capacity:
+            size *= 2
+        self.size = size
+        self._min = [_INF] * (2 * size)
+        self._max = [-_INF] * (2 * size)
+
+    def set(self, pos: int, low: float, high: float) -> None:
+        mins = self._min
+        maxs = self._max
+        i = pos + self.size
+        mins[i] = low
+        maxs[i] = high
+        i >>= 1
+        while i:
+            left = 2 * i
+            a, b = mins[left], mins[left + 1]
+            mins[i] = a if a < b else b
+            a, b = maxs[left], maxs[left + 1]
+            maxs[i] = a if a > b else b
+            i >>= 1
+
+    def _query(self, lo: int, hi: int) -> Tuple[float, float]:
+        mins = self._min
+        maxs = self._max
+        low = _INF
+        high = -_INF
+        lo += self.size
+        hi += self.size
+        while lo < hi:
+            if lo & 1:
+                if mins[lo] < low:
+                    low = mins[lo]
+                if maxs[lo] > high:
+                    high = maxs[lo]
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                if mins[hi] < low:
+                    low = mins[hi]
+                if maxs[hi] > high:
+                    high = maxs[hi]
+            lo >>= 1
+            hi >>= 1
+        return low, high
+
+    def query(self, lo_seq: int, hi_seq: int) -> Tuple[float, float]:
+        """(min, max) over sequence numbers [lo_seq, hi_seq) (inf/-inf if empty)."""
+        if hi_seq <= lo_seq:
+            return _INF, -_INF
+        lo = lo_seq % self.size
+        hi = hi_seq % self.size
+        if lo < hi:
+            return self._query(lo, hi)
+        low, high = self._query(lo, self.size)
+        if hi:
+            low2, high2 = self._query(0, hi)
+            low = low if low < low2 else low2
+            high = high if high > high2 else high2
+        return low, high
+
+
+class RollingTradeWindow(RollingSeries):
+    """
+    Trade series: rows are (ts, price, volume, is_sell).
+
+    Summed fields: BUY_VOLUME, SELL_VOLUME, SELL_COUNT.
+    """
+
+    BUY_VOLUME = 0
+    SELL_VOLUME = 1
+    SELL_COUNT = 2
+
+    def __init__(self, maxlen: int):
+        super().__init__(maxlen, width=3)
+        self._prices = _RangeMinMax(maxlen + 1)
+        self._sell_prices = _RangeMinMax(maxlen + 1)
+        # All live trade sizes, sorted
+        self._sizes: List[float] = []
+        # Sizes of live trades with sequence >= _window_start, sorted
+        self._window_sizes: List[float] = []
+        self._window_start = 0
+
+    def record(self, ts: float, price: float, volume: float, is_sell: bool) -> None:
+        """Append a trade."""
+        if is_sell:
+            self.append(ts, (ts, price, volume, is_sell), (0.0, volume, 1))
+        else:
+            self.append(ts, (ts, price, volume, is_sell), (volume, 0.0, 0))
+
+    def _on_append(self, index: int) -> None:
+        _, price, volume, is_sell = self._rows[index]
+        pos = (self._offset + index) % self._prices.size
+        self._prices.set(pos, price, price)
+        if is_sell:
+            self._sell_prices.set(pos, price, price)
+        else:
+            self._sell_prices.set(pos, _INF, -_INF)
+        insort(self._sizes, volume)
+        insort(self._window_sizes, volume)
+
+    def _on_evict(self, index: int) -> None:
+        volume = self._rows[index][2]
+        del self._sizes[bisect_left(self._sizes, volume)]
+        seq = self._offset + index
+        if seq >= self._window_start:
+            del self._window_sizes[bisect_left(self._window_sizes, volume)]
+            self._window_start = seq + 1
+
+    def buy_volume(self, lo: int, hi: int) -> float:
+        return self.sum(self.BUY_VOLUME, lo, hi)
+
+    def sell_volume(self, lo: int, hi: int) -> float:
+        return self.sum(self.SELL_VOLUME, lo, hi)
+
+    def sell_count(self, lo: int, hi: int) -> int:
+        return int(self.sum(self.SELL_COUNT, lo, hi))
+
+    def price_at(self, index: int) -> float:
+        return self._rows[index][1]
+
+    def price_range(self, lo: int, hi: int) -> Tuple[float, float]:
+        """(low, high) trade price over entries [lo, hi) (inf/-inf if empty)."""
+        return self._prices.query(self._offset + lo, self._offset + hi)
+
+    def sell_price_range(self, lo: int, hi: int) -> Tuple[float, float]:
+        """(low, high) sell trade price over entries [lo, hi) (inf/-inf if none)."""
+        return self._sell_prices.query(self._offset + lo, self._offset + hi)
+
+    def size_at_rank(self, rank: int) -> float:
+        """rank-th smallest live trade size (0-based, clamped)."""
+        return self._sizes[min(rank, len(self._sizes) - 1)]
+
+    def window_median_size(self, lo: int) -> Optional[float]:
+        """Median (upper) trade size over entries [lo, end), or None if empty.
+
+        Moves the sorted window to start at lo: O(k log n) for the k entries
+        entering/leaving since the previous call, O(log n) when unchanged.
+        """
+        start = self._offset + lo
+        head_seq = self._offset + self._head
+        current = max(self._window_start, head_seq)
+        if start > current:
+            for index in range(current - self._offset, lo):
+                volume = self._rows[index][2]
+                del self._window_sizes[bisect_left(self._window_sizes, volume)]
+        elif start < current:
+            for index in range(lo, current - self._offset):
+                insort(self._window_sizes, self._rows[index][2])
+        self._window_start = start
+
+        if not self._window_sizes:
+            return None
+        return self._window_sizes[len(self._window_sizes) // 2]
+
+
+class RollingRank:
+    """Bounded value history with O(log n) rank queries."""
+
+    __slots__ = ('_values', '_sorted')
+
+    def __init__(self, maxlen: int):
+        self._values: deque = deque(maxlen=maxlen)
+        self._sorted: List[float] = []
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._values)
+
+    def append(self, value: float) -> None:
+        if len(self._values) == self._values.maxlen:
+            del self._sorted[bisect_left(self._sorted, self._values[0])]
+        self._values.append(value)
+        insort(self._sorted, value)
+
+    def count_below(self, value: float) -> int:
+        """Number of stored values strictly less than value."""
+        return bisect_left(self._sorted, value)
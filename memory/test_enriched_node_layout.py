@@ -0,0 +1,108 @@
+"""
+Tests for the compact EnrichedLiquidityMemoryNode layout.
+
+Verifies the array-backed timestamp series behave like the bounded deques
+they replaced, that nodes carry no per-instance __dict__, and that store
+updates only touch declared fields.
+"""
+
+import random
+import tracemalloc
+from collections import deque
+
+import pytest
+
+from memory.enriched_memory_node import EnrichedLiquidityMemoryNode, TimestampSeries
+from memory.m2_continuity_store import ContinuityMemoryStore
+
+
+def _node(i: int = 0) -> EnrichedLiquidityMemoryNode:
+    return EnrichedLiquidityMemoryNode(
+        id=f"BTCUSDT_{i}",
+        symbol="BTCUSDT",
+        price_center=50000.0 + i,
+        price_band=50.0,
+        side="both",
+        first_seen_ts=1000.0,
+        last_interaction_ts=1000.0,
+        strength=0.5,
+        confidence=0.5,
+        active=True,
+        decay_rate=0.0001,
+        creation_reason="test",
+    )
+
+
+def test_timestamp_series_matches_bounded_deque():
+    """Append, len, truthiness, iteration and indexing match deque(maxlen)."""
+    rng = random.Random(2)
+    series = TimestampSeries(maxlen=5)
+    reference = deque(maxlen=5)
+    assert not series
+
+    for _ in range(20):
+        value = rng.uniform(0, 100)
+        series.append(value)
+        reference.append(value)
+        assert len(series) == len(reference)
+        assert list(series) == list(reference)
+        assert series[0] == reference[0]
+        assert series[-1] == reference[-1]
+
+    assert TimestampSeries(range(10), maxlen=3) == TimestampSeries([7, 8, 9])
+
+
+def test_node_timestamps_stay_bounded():
+    """Interaction/liquidation histories keep their previous capacities."""
+    node = _node()
+    for k in range(60):
+        node.record_liquidation(1000.0 + k, "BUY")
+
+    assert len(node.interaction_timestamps) == 50
+    assert len(node.liquidation_timestamps) == 20
+    assert node.interaction_timestamps[-1] == 1059.0
+    assert node.max_liquidation_cascade_size == 20
+    assert node.interaction_gap_median == 1.0
+
+
+def test_node_is_slotted():
+    """Nodes have no __dict__; undeclared attributes are rejected."""
+    node = _node()
+    assert not hasattr(node, "__dict__")
+    with pytest.raises(AttributeError):
+        node.undeclared_field = 1
+
+
+def test_mark_price_update_sets_declared_fields():
+    """Store mark price updates land on declared node fields."""
+    store = ContinuityMemoryStore()
+    store.add_or_update_node(
+        node_id="n1", symbol="BTCUSDT", price_center=50000.0, price_band=50.0,
+        side="both", timestamp=1000.0, creation_reason="test",
+    )
+    store.update_mark_price_state("BTCUSDT", 50010.0, 50005.0, 1001.0)
+
+    node = store.get_node("n1")
+    assert node.last_mark_price == 50010.0
+    assert node.last_index_price == 50005.0
+    assert node.last_mark_price_ts == 1001.0
+    assert node.mark_price_update_count == 1
+
+
+def test_bytes_per_node():
+    """Retained heap per evidence-carrying node stays compact."""
+    node_count = 2000
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    nodes = []
+    for i in range(node_count):
+        node = _node(i)
+        for k in range(5):
+            node.record_trade_execution(1000.0 + k, 1.5, k % 2 == 0)
+        nodes.append(node)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    per_node = (current - baseline) / node_count
+    # dict-backed dataclass with deques measured ~4.7 KB here
+    assert per_node < 3000
@@ -0,0 +1,124 @@
+"""
+Tests for M2 Node Keys
+
+Verifies integer node keys map to exactly the string IDs of the reference
+price-bucket formula, and the store's single-lookup get-or-create.
+"""
+
+import math
+import random
+
+from memory.m2_continuity_store import ContinuityMemoryStore
+from memory.m2_node_key import NodeKeyCodec
+
+
+def _reference_bucket(price):
+    precision = max(1, int(-math.log10(price * 0.001)))
+    return round(price, precision)
+
+
+def _prices(rng, count):
+    for _ in range(count):
+        kind = rng.random()
+        if kind < 0.4:
+            yield 10 ** rng.uniform(-6, 6)
+        elif kind < 0.7:
+            # Exchange-style decimals, often one digit past the bucket (ties)
+            yield round(10 ** rng.uniform(-4, 5), rng.randint(0, 8))
+        else:
+            # Around decade boundaries, where the bucket precision changes
+            exponent = rng.randint(-5, 5)
+            yield 10.0 ** exponent * (1 + rng.uniform(-1e-8, 1e-8))
+
+
+def test_keys_match_reference_ids():
+    """node_id/bucket_price equal the reference; equal IDs <=> equal keys."""
+    rng = random.Random(4)
+    codec = NodeKeyCodec()
+    keys_by_id = {}
+
+    for price in _prices(rng, 20000):
+        if price <= 0:
+            continue
+        symbol = rng.choice(["BTCUSDT", "ETHUSDT"])
+        side = rng.choice(["BUY", "SELL"])
+        bucket = _reference_bucket(price)
+        key = codec.key(symbol, side, price)
+
+        assert codec.bucket_price(key) == bucket
+        assert codec.node_id(key) == f"{symbol}_{side}_{bucket}"
+        assert keys_by_id.setdefault(codec.node_id(key), key) == key
+
+
+def test_decade_boundary_buckets_share_key():
+    """Buckets equal across a precision change resolve to one key."""
+    codec = NodeKeyCodec()
+    above = codec.key("X", "BUY", 10.0000001)  # precision 1
+    below = codec.key("X", "BUY", 9.9999999)  # precision 2
+    assert codec.node_id(above) == codec.node_id(below) == "X_BUY_10.0"
+    assert above == below
+
+
+def _store_with_bucket(price=50000.0):
+    store = ContinuityMemoryStore()
+    key = store.node_keys.key("BTCUSDT", "SELL", price)
+    node, created = store.get_or_create_node(
+        key, price_band=price * 0.001, side="both", timestamp=1000.0,
+        creation_reason="liquidation",
+    )
+    return store, key, node, created
+
+
+def test_get_or_create_node():
+    """First call creates the bucket node; later calls return it unchanged."""
+    store, key, node, created = _store_with_bucket()
+    assert created
+    assert node.id == "BTCUSDT_SELL_50000.0"
+    assert node.price_center == 50000.0
+    assert node.node_key == key
+    assert store.get_node(node.id) is node
+
+    same_key = store.node_keys.key("BTCUSDT", "SELL", 50000.04)
+    again, created = store.get_or_create_node(
+        same_key, price_band=50.0, side="both", timestamp=1001.0,
+        creation_reason="liquidation",
+    )
+    assert not created
+    assert again is node
+    assert node.last_interaction_ts == 1000.0
+    assert store.get_metrics()['total_nodes_created'] == 1
+
+
+def test_get_or_create_finds_node_created_by_string_id():
+    """A bucket node created through add_or_update_node is reused."""
+    store = ContinuityMemoryStore()
+    existing = store.add_or_update_node(
+        node_id="BTCUSDT_BUY_50000.0", symbol="BTCUSDT", price_center=50000.0,
+        price_band=50.0, side="BUY", timestamp=1000.0, creation_reason="large_trade",
+    )
+    key = store.node_keys.key("BTCUSDT", "BUY", 50000.0)
+    node, created = store.get_or_create_node(
+        key, price_band=50.0, side="BUY", timestamp=1001.0, creation_reason="large_trade",
+    )
+    assert not created
+    assert node is existing
+
+
+def test_pruned_bucket_is_recreated():
+    """Pruning an archived bucket node frees its key."""
+    store, key, node, _ = _store_with_bucket()
+    store._transition_to_dormant(node.id)
+    store._transition_to_archived(node.id)
+    assert store.get_or_create_node(
+        key, price_band=50.0, side="both", timestamp=1001.0, creation_reason="liquidation",
+    ) == (node, False)
+
+    store._last_state_update_ts = 1000.0 + 7200.0
+    assert store.prune_archived_nodes() == 1
+
+    fresh, created = store.get_or_create_node(
+        key, price_band=50.0, side="both", timestamp=8300.0, creation_reason="liquidation",
+    )
+    assert created
+    assert fresh is not node
+    assert store.get_node(fresh.id) is fresh
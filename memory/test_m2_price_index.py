@@ -0,0 +1,221 @@
+"""
+Tests for M2 Price Index
+
+Verifies that ContinuityMemoryStore spatial queries backed by the per-symbol
+price index return exactly what a full scan of the node dicts returns, across
+ACTIVE → DORMANT → ARCHIVED transitions, revival and pruning.
+"""
+
+import random
+
+from memory.m2_continuity_store import ContinuityMemoryStore
+from memory.m2_memory_state import MemoryStateThresholds
+from memory.m2_price_index import PriceIndex
+from memory.enriched_memory_node import EnrichedLiquidityMemoryNode
+
+
+SYMBOLS = ["BTCUSDT", "ETHUSDT", "SOLUSDT"]
+BASE_PRICES = {"BTCUSDT": 50000.0, "ETHUSDT": 3000.0, "SOLUSDT": 100.0}
+
+
+def _scan_overlapping(store, symbol, price, max_distance=None):
+    """Reference implementation: linear scan over active nodes."""
+    result = []
+    for node in store._active_nodes.values():
+        if node.symbol != symbol:
+            continue
+        if node.overlaps(price):
+            result.append(node)
+        elif max_distance is not None and abs(price - node.price_center) <= max_distance:
+            result.append(node)
+    return result
+
+
+def _ids(nodes):
+    return [n.id for n in nodes]
+
+
+def _make_node(node_id, symbol, center, band):
+    return EnrichedLiquidityMemoryNode(
+        id=node_id,
+        symbol=symbol,
+        price_center=center,
+        price_band=band,
+        side="both",
+        first_seen_ts=0.0,
+        last_interaction_ts=0.0,
+        strength=0.5,
+        confidence=0.5,
+        active=True,
+        decay_rate=0.0,
+        creation_reason="test"
+    )
+
+
+def _populate(store, rng, count, ts=1000.0):
+    for i in range(count):
+        symbol = rng.choice(SYMBOLS)
+        base = BASE_PRICES[symbol]
+        center = round(base * (1 + rng.uniform(-0.02, 0.02)), 2)
+        store.add_or_update_node(
+            node_id=f"{symbol}_{i}",
+            symbol=symbol,
+            price_center=center,
+            price_band=center * 0.001 * rng.choice([1, 2, 5]),
+            side=rng.choice(["bid", "ask", "both"]),
+            timestamp=ts,
+            creation_reason="test",
+            initial_strength=rng.uniform(0.05, 0.9)
+        )
+
+
+def _assert_parity(store, rng, queries=200):
+    for _ in range(queries):
+        symbol = rng.choice(SYMBOLS)
+        price = BASE_PRICES[symbol] * (1 + rng.uniform(-0.025, 0.025))
+        assert _ids(store.get_nodes_near_price(symbol, price)) == _ids(_scan_overlapping(store, symbol, price))
+
+        max_distance = BASE_PRICES[symbol] * 0.003
+        assert _ids(store.get_nodes_near_price(symbol, price, max_distance)) == \
+            _ids(_scan_overlapping(store, symbol, price, max_distance))
+
+    for symbol in SYMBOLS:
+        expected = [n for n in store._active_nodes.values() if n.symbol == symbol]
+        assert _ids(store.get_active_nodes_for_symbol(symbol)) == _ids(expected)
+
+        expected_dormant = [n for n in store._dormant_nodes.values() if n.symbol == symbol]
+        assert _ids(store.get_dormant_nodes(symbol=symbol)) == _ids(expected_dormant)
+
+
+def test_index_add_remove_keeps_sorted_arrays():
+    """Sorted arrays and partitions stay consistent through add/remove."""
+    index = PriceIndex()
+    nodes = [_make_node(f"n{i}", "BTCUSDT", 100.0 + (i % 5), 0.5) for i in range(20)]
+    for node in nodes:
+        index.add(node)
+
+    for node in nodes[::2]:
+        index.remove(node)
+
+    assert len(index) == 10
+    remaining = list(index.nodes_for_symbol("BTCUSDT"))
+    assert _ids(remaining) == _ids(nodes[1::2])
+
+    partition = index._partitions["BTCUSDT"]
+    assert partition.centers == sorted(partition.centers)
+    assert sorted(_ids(partition.sorted_nodes)) == sorted(_ids(remaining))
+
+    for node in nodes[1::2]:
+        index.remove(node)
+    assert len(index) == 0
+    assert "BTCUSDT" not in index._partitions
+
+
+def test_index_half_band_window_shrinks_after_removal():
+    """Removing the widest node must not leave a stale query window."""
+    index = PriceIndex()
+    wide = _make_node("wide", "BTCUSDT", 100.0, 50.0)
+    narrow = _make_node("narrow", "BTCUSDT", 200.0, 1.0)
+    index.add(wide)
+    index.add(narrow)
+    assert index._partitions["BTCUSDT"].half_band_window() == 25.0
+
+    index.remove(wide)
+    assert index._partitions["BTCUSDT"].half_band_window() == 0.5
+    assert _ids(index.overlapping("BTCUSDT", 200.4)) == ["narrow"]
+    assert index.overlapping("BTCUSDT", 101.0) == []
+
+
+def test_overlap_boundaries_match_node_overlaps():
+    """Band edges are inclusive, exactly as node.overlaps()."""
+    store = ContinuityMemoryStore()
+    store.add_or_update_node(
+        node_id="edge", symbol="SOLUSDT", price_center=100.1, price_band=0.1001,
+        side="both", timestamp=1000.0, creation_reason="test"
+    )
+    node = store.get_node("edge")
+    lower = node.price_center - node.price_band / 2
+    upper = node.price_center + node.price_band / 2
+
+    for price in (lower, upper):
+        assert _ids(store.get_nodes_near_price("SOLUSDT", price)) == (["edge"] if node.overlaps(price) else [])
+
+
+def test_parity_with_scan_through_lifecycle():
+    """Index queries match full scans across transitions, revival and pruning."""
+    rng = random.Random(7)
+    store = ContinuityMemoryStore(max_archived_nodes=50)
+    _populate(store, rng, 600)
+    _assert_parity(store, rng)
+
+    # ACTIVE → DORMANT for weak nodes
+    store.update_memory_states(1001.0)
+    assert len(store._dormant_nodes) > 0
+    _assert_parity(store, rng)
+
+    # Revive a subset of dormant nodes
+    for node_id in list(store._dormant_nodes.keys())[::3]:
+        node = store._dormant_nodes[node_id]
+        store.add_or_update_node(
+            node_id=node_id, symbol=node.symbol, price_center=node.price_center,
+            price_band=node.price_band, side=node.side, timestamp=1002.0,
+            creation_reason="test", volume=5000.0
+        )
+    _assert_parity(store, rng)
+
+    # DORMANT → ARCHIVED and archive pruning
+    for node in store._dormant_nodes.values():
+        node.strength = 0.001
+    store.update_memory_states(1003.0)
+    assert len(store._archived_nodes) <= 50
+    _assert_parity(store, rng)
+
+    # Everything times out
+    store.update_memory_states(1003.0 + MemoryStateThresholds.DORMANT_TIMEOUT_SEC + 1)
+    store.update_memory_states(
+        1003.0 + MemoryStateThresholds.DORMANT_TIMEOUT_SEC + MemoryStateThresholds.ARCHIVE_TIMEOUT_SEC + 2
+    )
+    assert len(store._active_index) == len(store._active_nodes)
+    assert len(store._dormant_index) == len(store._dormant_nodes)
+    _assert_parity(store, rng)
+
+
+def test_ingest_trade_picks_strongest_overlapping_node():
+    """ingest_trade updates the strongest overlapping node, earliest on ties."""
+    store = ContinuityMemoryStore()
+    for node_id, strength in (("a", 0.4), ("b", 0.8), ("c", 0.8)):
+        store.add_or_update_node(
+            node_id=node_id, symbol="ETHUSDT", price_center=3000.0, price_band=6.0,
+            side="both", timestamp=1000.0, creation_reason="test", initial_strength=strength
+        )
+    store.add_or_update_node(
+        node_id="far", symbol="ETHUSDT", price_center=3100.0, price_band=6.0,
+        side="both", timestamp=1000.0, creation_reason="test", initial_strength=1.0
+    )
+
+    node = store.ingest_trade("ETHUSDT", 3001.0, "BUY", 10.0, False, 1001.0)
+    assert node.id == "b"
+    assert store.ingest_trade("ETHUSDT", 3050.0, "BUY", 10.0, False, 1001.0) is None
+
+
+def test_orderbook_update_touches_only_overlapping_nodes():
+    """update_orderbook_state reaches nodes at best bid/ask without a full scan."""
+    store = ContinuityMemoryStore()
+    store.add_or_update_node(
+        node_id="bid", symbol="BTCUSDT", price_center=49990.0, price_band=50.0,
+        side="bid", timestamp=1000.0, creation_reason="test"
+    )
+    store.add_or_update_node(
+        node_id="ask", symbol="BTCUSDT", price_center=50010.0, price_band=50.0,
+        side="ask", timestamp=1000.0, creation_reason="test"
+    )
+    store.add_or_update_node(
+        node_id="away", symbol="BTCUSDT", price_center=51000.0, price_band=50.0,
+        side="both", timestamp=1000.0, creation_reason="test"
+    )
+
+    store.update_orderbook_state("BTCUSDT", 1001.0, 5.0, 7.0, 49995.0, 50005.0)
+
+    assert store.get_node("bid").last_observed_bid_size == 5.0
+    assert store.get_node("ask").last_observed_ask_size == 7.0
+    assert store.get_node("away").last_orderbook_update_ts is None
@@ -0,0 +1,126 @@
+"""
+Tests for M4 Primitive Kernels
+
+Verifies the vectorized kernels return exactly what the reference
+pure-Python primitives return, including validation errors.
+"""
+
+import random
+from array import array
+
+import pytest
+
+from memory.m4_kernels import NumpyM4Kernels, PythonM4Kernels, get_m4_kernels
+
+
+def _walk(rng, n, start=100.0):
+    prices = []
+    price = start
+    for _ in range(n):
+        price = round(price + rng.choice([-0.05, 0.0, 0.05, 0.1]), 2)
+        prices.append(price)
+    return prices
+
+
+def _times(rng, n, start=1700000000.0):
+    times = []
+    ts = start
+    for _ in range(n):
+        ts += rng.choice([0.0, 0.001, 0.05, 0.4, 1.3])
+        times.append(ts)
+    return times
+
+
+def _both(name, **kwargs):
+    reference = getattr(PythonM4Kernels, name)(**kwargs)
+    vectorized = getattr(NumpyM4Kernels, name)(**kwargs)
+    assert vectorized == reference
+    assert repr(vectorized) == repr(reference)
+    return reference
+
+
+def test_array_kernels_match_reference():
+    """Randomized walks give identical primitives (bit-for-bit)."""
+    rng = random.Random(42)
+    for n in (1, 2, 3, 10, 120, 500):
+        prices = _walk(rng, n)
+        times = _times(rng, n)
+        # M1 ring columns are memoryviews over array('d')
+        price_view = memoryview(array('d', prices))
+
+        assert NumpyM4Kernels.mean(price_view) == PythonM4Kernels.mean(prices)
+        assert NumpyM4Kernels.low_high(price_view) == PythonM4Kernels.low_high(prices)
+
+        if n >= 2:
+            _both('compute_traversal_compactness', traversal_id='t', ordered_prices=price_view)
+        for band in (0.01, 0.2, 5.0):
+            _both(
+                'compute_zone_penetration_depth', zone_id='z',
+                zone_low=prices[-1] - band, zone_high=prices[-1] + band,
+                traversal_prices=price_view
+            )
+        _both(
+            'identify_displacement_origin_anchor', traversal_id='d',
+            pre_traversal_prices=prices, pre_traversal_timestamps=times
+        )
+        if times[-1] > times[0]:
+            _both(
+                'compute_traversal_void_span', observation_start_ts=times[0] - 1.0,
+                observation_end_ts=times[-1], traversal_timestamps=times
+            )
+        _both('compute_trade_burst', trade_timestamps=times, burst_window_sec=1.0)
+        _both(
+            'compute_directional_continuity',
+            trade_sides=[rng.choice(['BUY', 'SELL']) for _ in range(n)]
+        )
+        _both(
+            'compute_liquidation_density', liquidation_prices=prices,
+            liquidation_volumes=[rng.expovariate(1.0) for _ in range(n)],
+            price_center=prices[-1], price_window=prices[-1] * 0.001
+        )
+
+
+def test_unsorted_trade_burst_matches_reference():
+    """Out-of-order timestamps follow the reference window scan."""
+    timestamps = [5.0, 1.0, 1.2, 7.0, 1.5, 2.0, 2.1, 0.5]
+    for window in (0.5, 1.0, 3.0):
+        _both('compute_trade_burst', trade_timestamps=timestamps, burst_window_sec=window)
+
+
+def test_empty_liquidation_window_matches_reference():
+    """No liquidation in window: zero count and integer zero volume."""
+    result = _both(
+        'compute_liquidation_density', liquidation_prices=[10.0, 20.0],
+        liquidation_volumes=[1.0, 2.0], price_center=100.0, price_window=1.0
+    )
+    assert result.liquidation_count == 0
+
+
+@pytest.mark.parametrize('name, kwargs', [
+    ('compute_traversal_compactness', {'traversal_id': 't', 'ordered_prices': [1.0]}),
+    ('compute_zone_penetration_depth', {'zone_id': 'z', 'zone_low': 2.0, 'zone_high': 1.0,
+                                        'traversal_prices': [1.5]}),
+    ('identify_displacement_origin_anchor', {'traversal_id': 'd', 'pre_traversal_prices': [1.0],
+                                             'pre_traversal_timestamps': [1.0, 2.0]}),
+    ('compute_traversal_void_span', {'observation_start_ts': 0.0, 'observation_end_ts': 10.0,
+                                     'traversal_timestamps': [1.0, 11.0, -1.0]}),
+    ('compute_trade_burst', {'trade_timestamps': [], 'burst_window_sec': 1.0}),
+    ('compute_directional_continuity', {'trade_sides': []}),
+    ('compute_liquidation_density', {'liquidation_prices': [], 'liquidation_volumes': [],
+                                     'price_center': 1.0, 'price_window': 0.0}),
+])
+def test_validation_errors_match_reference(name, kwargs):
+    """Invalid inputs raise the same ValueError from both kernel sets."""
+    with pytest.raises(ValueError) as reference:
+        getattr(PythonM4Kernels, name)(**kwargs)
+    with pytest.raises(ValueError) as vectorized:
+        getattr(NumpyM4Kernels, name)(**kwargs)
+    assert str(vectorized.value) == str(reference.value)
+
+
+def test_get_m4_kernels():
+    """Kernel sets are selected by name."""
+    assert get_m4_kernels('numpy') is NumpyM4Kernels
+    assert get_m4_kernels('Python') is PythonM4Kernels
+    with pytest.raises(ValueError):
+        get_m4_kernels('cuda')
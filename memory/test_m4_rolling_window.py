@@ -0,0 +1,102 @@
+"""
+Tests for M4 Rolling Window Aggregates
+
+Verifies window sums, price ranges and order statistics against direct
+computation over the same events, through eviction and compaction.
+"""
+
+import random
+from collections import deque
+
+from memory.m4_rolling_window import RollingRank, RollingSeries, RollingTradeWindow
+
+
+def _recent(rows, cutoff):
+    return [row for row in rows if row[0] > cutoff]
+
+
+def test_trade_window_matches_direct_computation():
+    """Sums, price ranges and sizes match a scan of a maxlen deque."""
+    rng = random.Random(3)
+    maxlen = 50
+    window = RollingTradeWindow(maxlen)
+    reference = deque(maxlen=maxlen)
+    ts = 0.0
+
+    for step in range(600):
+        ts += rng.choice([0.01, 0.1, 0.5])
+        row = (ts, round(rng.uniform(90, 110), 2), round(rng.expovariate(1.0), 3), rng.random() < 0.4)
+        window.record(*row)
+        reference.append(row)
+
+        assert len(window) == len(reference)
+        assert list(window) == list(reference)
+
+        cutoff = ts - rng.choice([1.0, 5.0, 20.0])
+        recent = _recent(reference, cutoff)
+        lo, hi = window.window(cutoff)
+        assert hi - lo == len(recent)
+        if not recent:
+            continue
+
+        buy = sum(vol for _, _, vol, is_sell in recent if not is_sell)
+        sell = sum(vol for _, _, vol, is_sell in recent if is_sell)
+        assert abs(window.buy_volume(lo, hi) - buy) < 1e-9
+        assert abs(window.sell_volume(lo, hi) - sell) < 1e-9
+        assert window.sell_count(lo, hi) == sum(1 for row in recent if row[3])
+
+        prices = [price for _, price, _, _ in recent]
+        assert window.price_range(lo, hi) == (min(prices), max(prices))
+        sell_prices = [price for _, price, _, is_sell in recent if is_sell]
+        if sell_prices:
+            assert window.sell_price_range(lo, hi) == (min(sell_prices), max(sell_prices))
+
+        mid_time = cutoff + (ts - cutoff) / 2
+        mid = window.first_after(lo, hi, mid_time)
+        first = [price for t, price, _, _ in recent if t <= mid_time]
+        assert mid - lo == len(first)
+        if first:
+            assert window.price_range(lo, mid)[0] == min(first)
+
+        volumes = sorted(vol for _, _, vol, _ in recent)
+        assert window.window_median_size(lo) == volumes[len(volumes) // 2]
+
+        sizes = sorted(vol for _, _, vol, _ in reference)
+        rank = int(len(sizes) * 0.9)
+        assert window.size_at_rank(rank) == sizes[min(rank, len(sizes) - 1)]
+
+
+def test_equal_windows_give_equal_sums():
+    """Exact prefix sums: same volumes in different windows compare equal."""
+    window = RollingTradeWindow(100)
+    for i in range(40):
+        window.record(float(i), 100.0, 0.1 if i % 2 else 0.7, True)
+
+    lo_a, _ = window.window(1.5)
+    lo_b, _ = window.window(21.5)
+    assert window.sell_volume(lo_a, lo_a + 4) == window.sell_volume(lo_b, lo_b + 4)
+
+
+def test_series_keys_stay_sorted_for_out_of_order_events():
+    """Late events are windowed with the event recorded before them."""
+    series = RollingSeries(10, width=1)
+    for ts in (1.0, 2.0, 1.5, 3.0):
+        series.append(ts, (ts,), (1.0,))
+
+    lo, hi = series.window(1.9)
+    assert [row[0] for row in series.rows(lo, hi)] == [2.0, 1.5, 3.0]
+    assert series.sum(0, lo, hi) == 3.0
+
+
+def test_rolling_rank_counts_below():
+    """count_below matches a scan of the bounded history."""
+    rng = random.Random(5)
+    rank = RollingRank(20)
+    reference = deque(maxlen=20)
+    for _ in range(200):
+        value = rng.choice([0.0, 1.0, rng.random()])
+        rank.append(value)
+        reference.append(value)
+        probe = rng.choice([0.0, 0.5, 1.0, value])
+        assert rank.count_below(probe) == sum(1 for v in reference if v < probe)
+        assert len(rank) == len(reference)
@@ -5,6 +5,6 @@ Exposes ONLY the Governance Gate.
 """
 
 from .governance import ObservationSystem
-from .types import ObservationSnapshot
+from .types import ObservationSnapshot, PublishedSnapshot
 
-__all__ = ['ObservationSystem', 'ObservationSnapshot']
+__all__ = ['ObservationSystem', 'ObservationSnapshot', 'PublishedSnapshot']
@@ -1,13 +1,19 @@
 import os
+import threading
 import time
+from collections import deque
+from dataclasses import replace
 from typing import Dict, List, Any, Optional, Set, TYPE_CHECKING
-from .types import ObservationSnapshot, SystemCounters, ObservationStatus, SystemHaltedException, M4PrimitiveBundle
+from .types import ObservationSnapshot, PublishedSnapshot, SystemCounters, ObservationStatus, SystemHaltedException, M4PrimitiveBundle
 from .internal.m1_ingestion import M1IngestionEngine
 from .internal.m3_temporal import M3TemporalEngine
 
 # Diagnostic flag for M2 node tracing
 _DIAG_M2 = os.environ.get('DIAG_M2', '').lower() in ('1', 'true', 'yes')
 
+# M4 array kernel set: 'numpy' (vectorized) or 'python' (reference)
+_M4_KERNELS = os.environ.get('M4_KERNELS', 'numpy')
+
 # Tier B-6: Cascade observation primitives
 from memory.m4_cascade_proximity import LiquidationCascadeProximity, compute_liquidation_cascade_proximity
 from memory.m4_cascade_state import CascadeStateObservation, compute_cascade_state, CascadePhase
@@ -94,6 +100,9 @@ from memory.m4_trade_flow import (
     compute_trade_burst
 )
 
+# Array kernel sets (vectorized / reference) for the primitives above
+from memory.m4_kernels import get_m4_kernels
+
 # Detection thresholds (structural boundaries, not interpretation)
 _OB_SIZE_CHANGE_THRESHOLD = 0.1  # Minimum size delta to record (contract units)
 _OB_PRICE_STABILITY_PCT = 1.0     # Maximum price movement for absorption (percentage)
@@ -108,7 +117,13 @@ class ObservationSystem:
     The sealed Observation System.
     """
 
-    def __init__(self, allowed_symbols: Optional[List[str]] = None):
+    def __init__(self, allowed_symbols: Optional[List[str]] = None, m4_kernels: Optional[str] = None):
+        """
+        Args:
+            allowed_symbols: Symbols to accept (None = all, tracked dynamically)
+            m4_kernels: M4 array kernel set ('numpy' or 'python'),
+                defaults to the M4_KERNELS environment variable
+        """
         # None means allow ALL symbols dynamically
         self._allowed_symbols: Optional[Set[str]] = set(allowed_symbols) if allowed_symbols else None
         self._system_time = 0.0
@@ -136,12 +151,35 @@ class ObservationSystem:
         self._hl_liquidation_values: Dict[str, List[float]] = {}      # symbol -> values
         self._hl_liquidation_max_symbols = 500  # Memory guard
         self._hl_liquidation_pruned = 0
+        # Guards the HL liquidation tracking: written by ingest (loop), read by
+        # the snapshot worker and pruned by the cleanup task
+        self._hl_liquidation_lock = threading.RLock()
 
         # M2 diagnostic counters
         self._m2_diag_liquidations = 0
         self._m2_diag_trades = 0
         self._m2_diag_nodes_created = 0
         self._m2_diag_last_report = 0
+
+        # M4 primitive reuse (per-symbol dirty tracking on M1/M2 input versions)
+        self._market_primitive_cache: Dict[str, tuple] = {}  # symbol -> (versions, time_key, primitives)
+        self._bundle_cache: Dict[str, tuple] = {}  # symbol -> (primitives, clock_primitives, bundle)
+        self._primitive_cache_hits = 0
+        self._primitive_cache_misses = 0
+
+        # Array-driven M4 primitives (compactness, zones, voids, bursts, ...)
+        self._kernels = get_m4_kernels(m4_kernels or _M4_KERNELS)
+
+        # State lock: advance_time/query may run on a snapshot worker thread.
+        # Ingest never blocks on it; events arriving while it is held are
+        # deferred and applied, in order, by the next lock holder.
+        self._state_lock = threading.Lock()
+        self._deferred_ingest: deque = deque()
+        self._deferred_ingest_count = 0
+
+        # Published snapshot slot: replaced (single reference assignment) on
+        # every computed snapshot; read without the state lock or recomputation
+        self._published: Optional[PublishedSnapshot] = None
         
     def set_hyperliquid_source(self, hl_collector: 'HyperliquidCollector') -> None:
         """
@@ -165,30 +203,31 @@ class ObservationSystem:
             timestamp: Event timestamp
             value: USD value liquidated
         """
-        # Memory guard: check limit before adding new symbol
-        if symbol not in self._hl_liquidation_timestamps:
-            if len(self._hl_liquidation_timestamps) >= self._hl_liquidation_max_symbols:
-                self.prune_hl_liquidation_tracking()
-                # If still at limit, skip this symbol
+        with self._hl_liquidation_lock:
+            # Memory guard: check limit before adding new symbol
+            if symbol not in self._hl_liquidation_timestamps:
                 if len(self._hl_liquidation_timestamps) >= self._hl_liquidation_max_symbols:
-                    return
-            self._hl_liquidation_timestamps[symbol] = []
-            self._hl_liquidation_values[symbol] = []
-
-        self._hl_liquidation_timestamps[symbol].append(timestamp)
-        self._hl_liquidation_values[symbol].append(value)
-
-        # Prune old entries (keep last 120 seconds)
-        cutoff = timestamp - 120.0
-        while (self._hl_liquidation_timestamps[symbol] and
-               self._hl_liquidation_timestamps[symbol][0] < cutoff):
-            self._hl_liquidation_timestamps[symbol].pop(0)
-            self._hl_liquidation_values[symbol].pop(0)
+                    self.prune_hl_liquidation_tracking()
+                    # If still at limit, skip this symbol
+                    if len(self._hl_liquidation_timestamps) >= self._hl_liquidation_max_symbols:
+                        return
+                self._hl_liquidation_timestamps[symbol] = []
+                self._hl_liquidation_values[symbol] = []
+
+            self._hl_liquidation_timestamps[symbol].append(timestamp)
+            self._hl_liquidation_values[symbol].append(value)
+
+            # Prune old entries (keep last 120 seconds)
+            cutoff = timestamp - 120.0
+            while (self._hl_liquidation_timestamps[symbol] and
+                   self._hl_liquidation_timestamps[symbol][0] < cutoff):
+                self._hl_liquidation_timestamps[symbol].pop(0)
+                self._hl_liquidation_values[symbol].pop(0)
 
-        # Memory guard: remove empty symbol entries
-        if not self._hl_liquidation_timestamps[symbol]:
-            del self._hl_liquidation_timestamps[symbol]
-            del self._hl_liquidation_values[symbol]
+            # Memory guard: remove empty symbol entries
+            if not self._hl_liquidation_timestamps[symbol]:
+                del self._hl_liquidation_timestamps[symbol]
+                del self._hl_liquidation_values[symbol]
 
     def prune_hl_liquidation_tracking(self, max_age_sec: float = 120.0) -> int:
         """
@@ -202,24 +241,25 @@ class ObservationSystem:
         Returns:
             Number of symbols pruned.
         """
-        now = time.time()
-        cutoff = now - max_age_sec
-        to_remove = []
-
-        for symbol in list(self._hl_liquidation_timestamps.keys()):
-            timestamps = self._hl_liquidation_timestamps[symbol]
-            # Prune old entries
-            while timestamps and timestamps[0] < cutoff:
-                timestamps.pop(0)
-                self._hl_liquidation_values[symbol].pop(0)
-            # Mark empty symbols for removal
-            if not timestamps:
-                to_remove.append(symbol)
-
-        for symbol in to_remove:
-            del self._hl_liquidation_timestamps[symbol]
-            del self._hl_liquidation_values[symbol]
-            self._hl_liquidation_pruned += 1
+        with self._hl_liquidation_lock:
+            now = time.time()
+            cutoff = now - max_age_sec
+            to_remove = []
+
+            for symbol in list(self._hl_liquidation_timestamps.keys()):
+                timestamps = self._hl_liquidation_timestamps[symbol]
+                # Prune old entries
+                while timestamps and timestamps[0] < cutoff:
+                    timestamps.pop(0)
+                    self._hl_liquidation_values[symbol].pop(0)
+                # Mark empty symbols for removal
+                if not timestamps:
+                    to_remove.append(symbol)
+
+            for symbol in to_remove:
+                del self._hl_liquidation_timestamps[symbol]
+                del self._hl_liquidation_values[symbol]
+                self._hl_liquidation_pruned += 1
 
         return len(to_remove)
 
@@ -251,7 +291,35 @@ class ObservationSystem:
     def ingest_observation(self, timestamp: float, symbol: str, event_type: str, payload: Dict) -> None:
         """
         Push external fact into memory.
+
+        Never blocks: while a snapshot is being computed on another thread the
+        event is deferred until the state lock is next taken.
         """
+        if not self._state_lock.acquire(blocking=False):
+            self._deferred_ingest.append((timestamp, symbol, event_type, payload))
+            self._deferred_ingest_count += 1
+            return
+        try:
+            self._drain_deferred_ingest()
+            self._apply_observation(timestamp, symbol, event_type, payload)
+        finally:
+            self._state_lock.release()
+
+    def _drain_deferred_ingest(self) -> None:
+        """Apply deferred events in arrival order (state lock held)."""
+        deferred = self._deferred_ingest
+        while deferred:
+            self._apply_observation(*deferred.popleft())
+
+    def get_deferred_ingest_metrics(self) -> dict:
+        """Get counts of events deferred while a snapshot held the state lock."""
+        return {
+            'deferred_total': self._deferred_ingest_count,
+            'deferred_pending': len(self._deferred_ingest),
+        }
+
+    def _apply_observation(self, timestamp: float, symbol: str, event_type: str, payload: Dict) -> None:
+        """Ingest one event (state lock held)."""
         if self._status == ObservationStatus.FAILED:
             return # Dead system accepts no input
 
@@ -334,10 +402,22 @@ class ObservationSystem:
             # Internal crash -> FAILED state
              self._trigger_failure(f"Internal Processing Error: {e}")
 
-    def advance_time(self, new_timestamp: float) -> None:
+    def advance_time(self, new_timestamp: float, publish_snapshot: bool = False) -> None:
         """
         Force memory system to recognize time passage.
+
+        Args:
+            new_timestamp: New system time
+            publish_snapshot: Also compute the snapshot as of new_timestamp
+                and publish it (see 'latest_snapshot' query)
         """
+        with self._state_lock:
+            self._drain_deferred_ingest()
+            self._advance_time(new_timestamp)
+            if publish_snapshot and self._status != ObservationStatus.FAILED:
+                self._publish_snapshot(self._get_snapshot())
+
+    def _advance_time(self, new_timestamp: float) -> None:
         if self._status == ObservationStatus.FAILED:
             return
 
@@ -374,6 +454,13 @@ class ObservationSystem:
     def query(self, query_spec: Dict) -> Any:
         """
         Execute a governed read request.
+
+        Query types:
+            'snapshot': Compute a snapshot (M4 primitives); not published
+            'latest_snapshot': PublishedSnapshot of the last
+                advance_time(publish_snapshot=True), or None; never computes
+            'snapshot_since': Last published PublishedSnapshot if its version
+                is newer than query_spec['version'], else None; never computes
         """
         if self._status == ObservationStatus.FAILED:
              raise SystemHaltedException(f"SYSTEM HALTED: {self._failure_reason}")
@@ -381,10 +468,26 @@ class ObservationSystem:
         q_type = query_spec.get('type')
         
         if q_type == 'snapshot':
-            return self._get_snapshot()
+            with self._state_lock:
+                self._drain_deferred_ingest()
+                return self._get_snapshot()
+
+        if q_type == 'latest_snapshot':
+            return self._published
+
+        if q_type == 'snapshot_since':
+            published = self._published
+            if published is not None and published.version > query_spec.get('version', 0):
+                return published
+            return None
             
         raise ValueError(f"Unknown query type: {q_type}")
 
+    def _publish_snapshot(self, snapshot: ObservationSnapshot) -> None:
+        """Publish snapshot to the read slot under the next version."""
+        version = self._published.version + 1 if self._published else 1
+        self._published = PublishedSnapshot(version=version, snapshot=snapshot)
+
     def _trigger_failure(self, reason: str):
         """Enter FAILED state. Irreversible."""
         self._status = ObservationStatus.FAILED
@@ -412,42 +515,32 @@ class ObservationSystem:
         # Handle both Binance (price) and HL (liquidation_price) liquidation events
         price = normalized_event.get('price') or normalized_event.get('liquidation_price', 0)
         if not price or price <= 0:
-            return  # Skip if no valid price
+            return  # Skip events without a price
         side = normalized_event['side']
         timestamp = normalized_event['timestamp']
         # Handle both Binance (quote_qty) and HL (value) volume fields
         volume = normalized_event.get('quote_qty') or normalized_event.get('value', 0.0)
 
-        # Generate node ID: {symbol}_{side}_{price_bucket}
-        # Price bucket: round to 0.1% precision
-        import math
-        price_precision = max(1, int(-math.log10(price * 0.001)))
-        price_bucket = round(price, price_precision)
-        node_id = f"{symbol}_{side}_{price_bucket}"
-
-        # Check if node exists
-        existing_node = self._m2_store.get_node(node_id)
+        # Node identity: 0.1% price bucket per {symbol, side}
+        # (string ID {symbol}_{side}_{price_bucket} is only built on creation)
+        node_key = self._m2_store.node_keys.key(symbol, side, price)
+        node, created = self._m2_store.get_or_create_node(
+            node_key,
+            price_band=price * 0.001,  # 10 bps (0.1%)
+            side="both",  # Liquidations can trigger in either direction
+            timestamp=timestamp,
+            creation_reason="liquidation",
+            initial_strength=0.5,
+            volume=volume
+        )
 
         self._m2_diag_liquidations += 1
 
-        if existing_node:
-            # Update existing node
-            self._m2_store.record_liquidation_at_node(node_id, timestamp, side)
-        else:
-            # Create new node
-            price_band = price * 0.001  # 10 bps (0.1%)
-            self._m2_store.add_or_update_node(
-                node_id=node_id,
-                symbol=symbol,
-                price_center=price_bucket,
-                price_band=price_band,
-                side="both",  # Liquidations can trigger in either direction
-                timestamp=timestamp,
-                creation_reason="liquidation",
-                initial_strength=0.5,
-                volume=volume
-            )
+        if created:
             self._m2_diag_nodes_created += 1
+        else:
+            # Update existing node
+            self._m2_store.record_liquidation_at_node(node.id, timestamp, side)
 
     def _associate_trade_with_nodes(self, normalized_event: Dict) -> None:
         """Associate trade with nearby M2 nodes.
@@ -480,27 +573,18 @@ class ObservationSystem:
                     is_buyer_maker=is_taker_sell  # is_taker_sell = is_buyer_maker (same semantic)
                 )
         elif volume >= 1000.0:  # Large trade threshold: $1000
-            # Create new node from large trade
-            import math
-            price_precision = max(1, int(-math.log10(price * 0.001)))
-            price_bucket = round(price, price_precision)
-            orderbook_face = "bid_face" if is_taker_sell else "ask_face"
-            node_id = f"{symbol}_{side}_{price_bucket}"
-
-            # Only create if doesn't exist
-            if not self._m2_store.get_node(node_id):
-                price_band = price * 0.001  # 10 bps
-                self._m2_store.add_or_update_node(
-                    node_id=node_id,
-                    symbol=symbol,
-                    price_center=price_bucket,
-                    price_band=price_band,
-                    side=side,
-                    timestamp=timestamp,
-                    creation_reason="large_trade",
-                    initial_strength=0.3,
-                    volume=volume
-                )
+            # Create new node from large trade (only if its bucket doesn't exist)
+            node_key = self._m2_store.node_keys.key(symbol, side, price)
+            _, created = self._m2_store.get_or_create_node(
+                node_key,
+                price_band=price * 0.001,  # 10 bps
+                side=side,
+                timestamp=timestamp,
+                creation_reason="large_trade",
+                initial_strength=0.3,
+                volume=volume
+            )
+            if created:
                 self._m2_diag_nodes_created += 1
 
         # DIAG: Periodic M2 stats
@@ -543,6 +627,12 @@ class ObservationSystem:
         This is the ONLY place M4 primitives are computed for external exposure.
         Called exactly once per symbol per snapshot.
 
+        Primitives driven only by M1/M2 inputs are reused while the symbol's
+        M1 and M2 input versions are unchanged (see _get_market_primitives).
+        Node-pattern and cascade primitives depend on the clock and are
+        evaluated every snapshot. If nothing changed, the previous bundle
+        object is returned as-is.
+
         Returns bundle with fields set to None if:
         - Insufficient data for computation
         - No structural condition detected
@@ -550,6 +640,115 @@ class ObservationSystem:
 
         Authority: ANNEX_M4_PRIMITIVE_FLOW.md
         """
+        market = self._get_market_primitives(symbol)
+
+        order_block_primitive, supply_demand_zone_primitive = self._compute_node_pattern_primitives(
+            symbol, market['last_trade_price']
+        )
+        cascade_primitives = self._compute_cascade_primitives(symbol)
+        clock_primitives = (order_block_primitive, supply_demand_zone_primitive) + cascade_primitives
+
+        cached = self._bundle_cache.get(symbol)
+        if cached is not None and cached[0] is market and cached[1] == clock_primitives:
+            return cached[2]
+
+        (
+            cascade_proximity_primitive,
+            cascade_state_primitive,
+            leverage_concentration_primitive,
+            open_interest_bias_primitive
+        ) = cascade_primitives
+
+        bundle = M4PrimitiveBundle(
+            symbol=symbol,
+            zone_penetration=market['zone_penetration'],
+            displacement_origin_anchor=market['displacement_origin_anchor'],
+            price_traversal_velocity=market['price_traversal_velocity'],
+            traversal_compactness=market['traversal_compactness'],
+            central_tendency_deviation=market['central_tendency_deviation'],
+            structural_absence_duration=market['structural_absence_duration'],
+            traversal_void_span=market['traversal_void_span'],
+            event_non_occurrence_counter=market['event_non_occurrence_counter'],
+            structural_persistence_duration=market['structural_persistence_duration'],
+            resting_size=market['resting_size'],
+            order_consumption=market['order_consumption'],
+            absorption_event=market['absorption_event'],
+            refill_event=market['refill_event'],
+            price_acceptance_ratio=market['price_acceptance_ratio'],
+            liquidation_density=market['liquidation_density'],
+            directional_continuity=market['directional_continuity'],
+            trade_burst=market['trade_burst'],
+            order_block=order_block_primitive,
+            supply_demand_zone=supply_demand_zone_primitive,
+            # Tier B-6 - Cascade observation primitives
+            liquidation_cascade_proximity=cascade_proximity_primitive,
+            cascade_state=cascade_state_primitive,
+            leverage_concentration_ratio=leverage_concentration_primitive,
+            open_interest_directional_bias=open_interest_bias_primitive
+        )
+        self._bundle_cache[symbol] = (market, clock_primitives, bundle)
+        return bundle
+
+    def _get_market_primitives(self, symbol: str) -> Dict[str, Any]:
+        """Return M1/M2-driven primitives for symbol, recomputing only when inputs changed.
+
+        Cache key is (M1 symbol version, M2 symbol version). On reuse across a
+        second boundary, the time-stamped primitive IDs are re-issued so the
+        result is identical to a computation from scratch.
+        """
+        key = (self._m1.get_symbol_version(symbol), self._m2_store.get_symbol_version(symbol))
+        time_key = int(self._system_time)
+
+        cached = self._market_primitive_cache.get(symbol)
+        if cached is not None and cached[0] == key:
+            self._primitive_cache_hits += 1
+            market = cached[2]
+            if cached[1] != time_key:
+                market = self._restamp_market_primitives(symbol, market, time_key)
+                self._market_primitive_cache[symbol] = (key, time_key, market)
+            return market
+
+        self._primitive_cache_misses += 1
+        market = self._compute_market_primitives(symbol)
+        self._market_primitive_cache[symbol] = (key, time_key, market)
+        return market
+
+    def _restamp_market_primitives(self, symbol: str, market: Dict[str, Any], time_key: int) -> Dict[str, Any]:
+        """Re-issue snapshot-time IDs on reused primitives (values unchanged)."""
+        market = dict(market)
+        if market['price_traversal_velocity'] is not None:
+            market['price_traversal_velocity'] = replace(
+                market['price_traversal_velocity'], traversal_id=f"{symbol}_{time_key}"
+            )
+        if market['traversal_compactness'] is not None:
+            market['traversal_compactness'] = replace(
+                market['traversal_compactness'], traversal_id=f"{symbol}_{time_key}"
+            )
+        if market['zone_penetration'] is not None:
+            market['zone_penetration'] = replace(
+                market['zone_penetration'], zone_id=f"{symbol}_zone_{time_key}"
+            )
+        if market['displacement_origin_anchor'] is not None:
+            market['displacement_origin_anchor'] = replace(
+                market['displacement_origin_anchor'], traversal_id=f"{symbol}_displacement_{time_key}"
+            )
+        return market
+
+    def get_primitive_cache_metrics(self) -> dict:
+        """Get M4 primitive reuse metrics."""
+        total = self._primitive_cache_hits + self._primitive_cache_misses
+        return {
+            'hits': self._primitive_cache_hits,
+            'misses': self._primitive_cache_misses,
+            'hit_rate': self._primitive_cache_hits / total if total > 0 else 0.0,
+            'symbols_cached': len(self._market_primitive_cache),
+        }
+
+    def _compute_market_primitives(self, symbol: str) -> Dict[str, Any]:
+        """Compute primitives that depend only on M1 buffers and M2 node state."""
+        # Trade buffer snapshot (fetched below, shared by all trade-driven primitives)
+        trades = []
+
         # Initialize all primitives to None
         resting_size_primitive = None
         consumption_primitive = None
@@ -668,16 +867,16 @@ class ObservationSystem:
         central_tendency_primitive = None
 
         try:
-            # Get trade data from M1
-            trades = list(self._m1.raw_trades.get(symbol, []))
+            # Get trade data from M1 (ring buffer; column views are zero-copy)
+            trades = self._m1.raw_trades.get(symbol, [])
 
             # DEBUG: Log trade count (disabled - too verbose)
             # print(f"DEBUG Governance: Computing primitives for {symbol}, trades={len(trades)}, min_required={_MIN_TRADES_FOR_KINEMATICS}")
 
             if len(trades) >= _MIN_TRADES_FOR_KINEMATICS:
-                # Extract price sequence
-                prices = [t['price'] for t in trades]
-                timestamps = [t['timestamp'] for t in trades]
+                # Price/timestamp sequences, oldest first
+                prices = trades.column('price')
+                timestamps = trades.column('timestamp')
 
                 # Compute traversal velocity (first to last)
                 first_price = prices[0]
@@ -696,7 +895,7 @@ class ObservationSystem:
 
                 # Compute traversal compactness
                 if len(prices) >= 2:
-                    traversal_compactness_primitive = compute_traversal_compactness(
+                    traversal_compactness_primitive = self._kernels.compute_traversal_compactness(
                         traversal_id=f"{symbol}_{int(self._system_time)}",
                         ordered_prices=prices
                     )
@@ -707,7 +906,7 @@ class ObservationSystem:
                 zone_low = current_price - zone_width
                 zone_high = current_price + zone_width
 
-                zone_penetration_primitive = compute_zone_penetration_depth(
+                zone_penetration_primitive = self._kernels.compute_zone_penetration_depth(
                     zone_id=f"{symbol}_zone_{int(self._system_time)}",
                     zone_low=zone_low,
                     zone_high=zone_high,
@@ -716,7 +915,7 @@ class ObservationSystem:
 
                 # Compute central tendency deviation
                 if len(prices) >= 3:
-                    mean_price = sum(prices) / len(prices)
+                    mean_price = self._kernels.mean(prices)
                     central_tendency_primitive = compute_central_tendency_deviation(
                         price=current_price,
                         central_tendency=mean_price
@@ -727,87 +926,6 @@ class ObservationSystem:
             # Return None primitives and continue
             pass
 
-        # Detect patterns from M2 nodes
-        order_block_primitive = None
-        supply_demand_zone_primitive = None
-
-        try:
-            from memory.m4_node_patterns import (
-                detect_order_block,
-                detect_supply_demand_zone,
-                find_node_clusters
-            )
-
-            # Get M2 nodes for this symbol
-            active_nodes = self._m2_store.get_active_nodes_for_symbol(symbol)
-
-            # DIAG: Log M2 node counts
-            if _DIAG_M2 and self._cycle_count % 10 == 1:
-                total_nodes = len(self._m2_store._active_nodes)
-                print(f"[M2-DIAG] {symbol}: {len(active_nodes)} active nodes (total store: {total_nodes})", flush=True)
-
-            if active_nodes:
-                # Detect order blocks from individual nodes
-                # Find strongest order block candidate
-                order_blocks = []
-                for node in active_nodes:
-                    ob = detect_order_block(node, self._system_time)
-                    if ob:
-                        order_blocks.append(ob)
-
-                # Return strongest order block (highest interaction density)
-                if order_blocks:
-                    order_block_primitive = max(
-                        order_blocks,
-                        key=lambda ob: ob.interactions_per_hour
-                    )
-
-                # Detect supply/demand zones from node clusters
-                if len(active_nodes) >= 3:
-                    # Get current price for displacement detection
-                    current_price = None
-                    if trades:
-                        current_price = trades[-1]['price']
-
-                    if current_price:
-                        # Find clusters
-                        clusters = find_node_clusters(active_nodes, max_gap_pct=0.2)
-
-                        # DIAG: Log cluster info
-                        if _DIAG_M2 and self._cycle_count % 10 == 1:
-                            cluster_sizes = [len(c) for c in clusters]
-                            print(f"[M2-DIAG] {symbol}: {len(clusters)} clusters, sizes={cluster_sizes}", flush=True)
-
-                        # Detect zones from clusters
-                        zones = []
-                        for cluster in clusters:
-                            zone = detect_supply_demand_zone(
-                                cluster,
-                                current_price,
-                                self._system_time
-                            )
-                            if zone:
-                                zones.append(zone)
-
-                        # DIAG: Log zone detection
-                        if _DIAG_M2 and zones and self._cycle_count % 10 == 1:
-                            for z in zones:
-                                print(f"[M2-DIAG] {symbol}: ZONE {z.zone_type} @ {z.zone_center:.2f} "
-                                      f"(disp={z.displacement_detected}, retest={z.retest_detected})", flush=True)
-
-                        # Return strongest zone (highest total volume)
-                        if zones:
-                            supply_demand_zone_primitive = max(
-                                zones,
-                                key=lambda z: z.total_volume
-                            )
-                elif _DIAG_M2 and self._cycle_count % 10 == 1:
-                    print(f"[M2-DIAG] {symbol}: {len(active_nodes)} nodes (need >=3 for zone)", flush=True)
-
-        except Exception as e:
-            # Pattern detection failures should not crash snapshot
-            pass
-
         # Initialize additional primitives to None
         displacement_origin_primitive = None
         traversal_void_primitive = None
@@ -820,15 +938,11 @@ class ObservationSystem:
         event_non_occurrence_primitive = None
 
         try:
-            # Get trade data from M1 (may already be fetched above)
-            if 'trades' not in locals():
-                trades = list(self._m1.raw_trades.get(symbol, []))
-
             if len(trades) >= _MIN_TRADES_FOR_KINEMATICS:
                 # Extract sequences
-                prices = [t['price'] for t in trades]
-                timestamps = [t['timestamp'] for t in trades]
-                trade_sides = [t.get('side', 'UNKNOWN') for t in trades]
+                prices = trades.column('price')
+                timestamps = trades.column('timestamp')
+                trade_sides = trades.labels('side')
 
                 # Displacement origin anchor: use first half as pre-traversal
                 if len(prices) >= 4:
@@ -836,7 +950,7 @@ class ObservationSystem:
                     pre_traversal_prices = prices[:mid_idx]
                     pre_traversal_timestamps = timestamps[:mid_idx]
 
-                    displacement_origin_primitive = identify_displacement_origin_anchor(
+                    displacement_origin_primitive = self._kernels.identify_displacement_origin_anchor(
                         traversal_id=f"{symbol}_displacement_{int(self._system_time)}",
                         pre_traversal_prices=pre_traversal_prices,
                         pre_traversal_timestamps=pre_traversal_timestamps
@@ -848,18 +962,17 @@ class ObservationSystem:
                     observation_end = timestamps[-1]
 
                     if observation_end > observation_start:
-                        traversal_void_primitive = compute_traversal_void_span(
+                        traversal_void_primitive = self._kernels.compute_traversal_void_span(
                             observation_start_ts=observation_start,
                             observation_end_ts=observation_end,
-                            traversal_timestamps=tuple(timestamps)
+                            traversal_timestamps=timestamps
                         )
 
                 # Price acceptance ratio: compute OHLC from trades
                 if len(prices) >= 2:
                     candle_open = prices[0]
                     candle_close = prices[-1]
-                    candle_high = max(prices)
-                    candle_low = min(prices)
+                    candle_low, candle_high = self._kernels.low_high(prices)
 
                     price_acceptance_primitive = compute_price_acceptance_ratio(
                         candle_open=candle_open,
@@ -873,34 +986,29 @@ class ObservationSystem:
                     # Filter out UNKNOWN sides
                     valid_sides = [s for s in trade_sides if s in ('BUY', 'SELL')]
                     if len(valid_sides) >= 2:
-                        directional_continuity_primitive = compute_directional_continuity(
+                        directional_continuity_primitive = self._kernels.compute_directional_continuity(
                             trade_sides=valid_sides
                         )
 
                 # Trade burst: find maximum trade density window
                 if len(timestamps) >= 2:
-                    trade_burst_primitive = compute_trade_burst(
+                    trade_burst_primitive = self._kernels.compute_trade_burst(
                         trade_timestamps=timestamps,
                         burst_window_sec=1.0
                     )
 
             # Liquidation density: analyze liquidation clustering
-            liquidations = list(self._m1.raw_liquidations.get(symbol, []))
+            liquidations = self._m1.raw_liquidations.get(symbol, [])
             if len(liquidations) >= 2 and len(trades) >= 1:
                 # Use current price as center
-                current_price = trades[-1]['price'] if trades else None
+                current_price = trades.column('price')[-1] if trades else None
                 if current_price:
                     # Use 1% price window for liquidation clustering
                     price_window = current_price * 0.01
 
-                    # Format liquidations for compute function
-                    liq_list = [
-                        {'price': liq['price'], 'volume': liq.get('quantity', 0.0)}
-                        for liq in liquidations
-                    ]
-
-                    liquidation_density_primitive = compute_liquidation_density(
-                        liquidations=liq_list,
+                    liquidation_density_primitive = self._kernels.compute_liquidation_density(
+                        liquidation_prices=liquidations.column('price'),
+                        liquidation_volumes=liquidations.column('quantity'),
                         price_center=current_price,
                         price_window=price_window
                     )
@@ -950,7 +1058,7 @@ class ObservationSystem:
                 # Observed: symbols with ≥1 trade in M1 buffer
                 observed_symbol_ids = tuple(
                     sym for sym in self._symbols
-                    if len(list(self._m1.raw_trades.get(sym, []))) > 0
+                    if len(self._m1.raw_trades.get(sym, [])) > 0
                 )
 
                 event_non_occurrence_primitive = compute_event_non_occurrence_counter(
@@ -962,6 +1070,112 @@ class ObservationSystem:
             # Additional primitive computation failures should not crash snapshot
             pass
 
+        return {
+            'resting_size': resting_size_primitive,
+            'order_consumption': consumption_primitive,
+            'absorption_event': absorption_primitive,
+            'refill_event': refill_primitive,
+            'zone_penetration': zone_penetration_primitive,
+            'price_traversal_velocity': traversal_velocity_primitive,
+            'traversal_compactness': traversal_compactness_primitive,
+            'central_tendency_deviation': central_tendency_primitive,
+            'displacement_origin_anchor': displacement_origin_primitive,
+            'traversal_void_span': traversal_void_primitive,
+            'price_acceptance_ratio': price_acceptance_primitive,
+            'liquidation_density': liquidation_density_primitive,
+            'directional_continuity': directional_continuity_primitive,
+            'trade_burst': trade_burst_primitive,
+            'structural_absence_duration': structural_absence_primitive,
+            'structural_persistence_duration': structural_persistence_primitive,
+            'event_non_occurrence_counter': event_non_occurrence_primitive,
+            'last_trade_price': trades.column('price')[-1] if trades else None,
+        }
+
+    def _compute_node_pattern_primitives(self, symbol: str, last_trade_price: Optional[float]) -> tuple:
+        """Detect order block / supply-demand zone patterns from M2 nodes (clock-dependent)."""
+        # Detect patterns from M2 nodes
+        order_block_primitive = None
+        supply_demand_zone_primitive = None
+
+        try:
+            from memory.m4_node_patterns import (
+                detect_order_block,
+                detect_supply_demand_zone,
+                find_node_clusters
+            )
+
+            # Get M2 nodes for this symbol
+            active_nodes = self._m2_store.get_active_nodes_for_symbol(symbol)
+
+            # DIAG: Log M2 node counts
+            if _DIAG_M2 and self._cycle_count % 10 == 1:
+                total_nodes = len(self._m2_store._active_nodes)
+                print(f"[M2-DIAG] {symbol}: {len(active_nodes)} active nodes (total store: {total_nodes})", flush=True)
+
+            if active_nodes:
+                # Detect order blocks from individual nodes
+                # Find strongest order block candidate
+                order_blocks = []
+                for node in active_nodes:
+                    ob = detect_order_block(node, self._system_time)
+                    if ob:
+                        order_blocks.append(ob)
+
+                # Return strongest order block (highest interaction density)
+                if order_blocks:
+                    order_block_primitive = max(
+                        order_blocks,
+                        key=lambda ob: ob.interactions_per_hour
+                    )
+
+                # Detect supply/demand zones from node clusters
+                if len(active_nodes) >= 3:
+                    # Get current price for displacement detection
+                    current_price = last_trade_price
+
+                    if current_price:
+                        # Find clusters
+                        clusters = find_node_clusters(active_nodes, max_gap_pct=0.2)
+
+                        # DIAG: Log cluster info
+                        if _DIAG_M2 and self._cycle_count % 10 == 1:
+                            cluster_sizes = [len(c) for c in clusters]
+                            print(f"[M2-DIAG] {symbol}: {len(clusters)} clusters, sizes={cluster_sizes}", flush=True)
+
+                        # Detect zones from clusters
+                        zones = []
+                        for cluster in clusters:
+                            zone = detect_supply_demand_zone(
+                                cluster,
+                                current_price,
+                                self._system_time
+                            )
+                            if zone:
+                                zones.append(zone)
+
+                        # DIAG: Log zone detection
+                        if _DIAG_M2 and zones and self._cycle_count % 10 == 1:
+                            for z in zones:
+                                print(f"[M2-DIAG] {symbol}: ZONE {z.zone_type} @ {z.zone_center:.2f} "
+                                      f"(disp={z.displacement_detected}, retest={z.retest_detected})", flush=True)
+
+                        # Return strongest zone (highest total volume)
+                        if zones:
+                            supply_demand_zone_primitive = max(
+                                zones,
+                                key=lambda z: z.total_volume
+                            )
+                elif _DIAG_M2 and self._cycle_count % 10 == 1:
+                    print(f"[M2-DIAG] {symbol}: {len(active_nodes)} nodes (need >=3 for zone)", flush=True)
+
+        except Exception as e:
+            # Pattern detection failures should not crash snapshot
+            pass
+
+        return order_block_primitive, supply_demand_zone_primitive
+
+    def _compute_cascade_primitives(self, symbol: str) -> tuple:
+        """Compute Tier B-6 cascade primitives from Hyperliquid state (clock-dependent)."""
         # Tier B-6: Cascade observation primitives (from Hyperliquid)
         cascade_proximity_primitive = None
         cascade_state_primitive = None
@@ -996,8 +1210,9 @@ class ObservationSystem:
                     )
 
                     # Compute cascade state from liquidation events
-                    liq_timestamps = self._hl_liquidation_timestamps.get(symbol, [])
-                    liq_values = self._hl_liquidation_values.get(symbol, [])
+                    with self._hl_liquidation_lock:
+                        liq_timestamps = list(self._hl_liquidation_timestamps.get(symbol, []))
+                        liq_values = list(self._hl_liquidation_values.get(symbol, []))
 
                     cascade_state_primitive = compute_cascade_state(
                         symbol=symbol,
@@ -1052,31 +1267,9 @@ class ObservationSystem:
             # Cascade primitive computation failures should not crash snapshot
             pass
 
-        # Return bundle with computed primitives
-        return M4PrimitiveBundle(
-            symbol=symbol,
-            zone_penetration=zone_penetration_primitive,
-            displacement_origin_anchor=displacement_origin_primitive,
-            price_traversal_velocity=traversal_velocity_primitive,
-            traversal_compactness=traversal_compactness_primitive,
-            central_tendency_deviation=central_tendency_primitive,
-            structural_absence_duration=structural_absence_primitive,
-            traversal_void_span=traversal_void_primitive,
-            event_non_occurrence_counter=event_non_occurrence_primitive,
-            structural_persistence_duration=structural_persistence_primitive,
-            resting_size=resting_size_primitive,
-            order_consumption=consumption_primitive,
-            absorption_event=absorption_primitive,
-            refill_event=refill_primitive,
-            price_acceptance_ratio=price_acceptance_primitive,
-            liquidation_density=liquidation_density_primitive,
-            directional_continuity=directional_continuity_primitive,
-            trade_burst=trade_burst_primitive,
-            order_block=order_block_primitive,
-            supply_demand_zone=supply_demand_zone_primitive,
-            # Tier B-6 - Cascade observation primitives
-            liquidation_cascade_proximity=cascade_proximity_primitive,
-            cascade_state=cascade_state_primitive,
-            leverage_concentration_ratio=leverage_concentration_primitive,
-            open_interest_directional_bias=open_interest_bias_primitive
+        return (
+            cascade_proximity_primitive,
+            cascade_state_primitive,
+            leverage_concentration_primitive,
+            open_interest_bias_primitive
         )
@@ -3,7 +3,8 @@ M1 Ingestion Layer (Internal)
 
 Responsible for:
 1. Normalizing raw external payloads into canonical events.
-2. Maintaining fixed-size raw buffers for inspection.
+2. Maintaining fixed-size raw buffers for inspection (columnar rings for
+   trades/liquidations/depth, see m1_ring_buffer).
 3. Managing Ingestion counters.
 """
 
@@ -11,6 +12,12 @@ from typing import Dict, List, Any, Deque, Optional
 from collections import deque, defaultdict
 import json
 
+from observation.internal.m1_ring_buffer import (
+    DepthRingBuffer,
+    LiquidationRingBuffer,
+    TradeRingBuffer
+)
+
 class M1IngestionEngine:
     """
     Pure data ingestion and normalization engine.
@@ -18,10 +25,12 @@ class M1IngestionEngine:
     """
     
     def __init__(self, trade_buffer_size: int = 500, liquidation_buffer_size: int = 200, depth_buffer_size: int = 100):
-        # Raw Buffers (Per Symbol)
-        self.raw_trades: Dict[str, Deque] = defaultdict(lambda: deque(maxlen=trade_buffer_size))
-        self.raw_liquidations: Dict[str, Deque] = defaultdict(lambda: deque(maxlen=liquidation_buffer_size))
-        self.raw_depth: Dict[str, Deque] = defaultdict(lambda: deque(maxlen=depth_buffer_size))
+        # Raw Buffers (Per Symbol): columnar rings, column() gives zero-copy field views
+        self.raw_trades: Dict[str, TradeRingBuffer] = defaultdict(lambda: TradeRingBuffer(trade_buffer_size))
+        self.raw_liquidations: Dict[str, LiquidationRingBuffer] = defaultdict(
+            lambda: LiquidationRingBuffer(liquidation_buffer_size)
+        )
+        self.raw_depth: Dict[str, DepthRingBuffer] = defaultdict(lambda: DepthRingBuffer(depth_buffer_size))
 
         # Latest depth snapshot per symbol (for order book primitives)
         self.latest_depth: Dict[str, Optional[Dict]] = {}
@@ -41,6 +50,9 @@ class M1IngestionEngine:
         # Latest Hyperliquid oracle prices (for proximity calculations)
         self.latest_hl_prices: Dict[str, Dict] = {}  # symbol -> {oracle_price, mark_price, timestamp}
 
+        # Per-symbol input version (bumped whenever trade/liquidation/depth state changes)
+        self.symbol_versions: Dict[str, int] = defaultdict(int)
+
         # Counters
         self.counters = {
             'trades': 0,
@@ -96,6 +108,7 @@ class M1IngestionEngine:
             }
             self.raw_trades[symbol].append(event)
             self.recent_prices[symbol].append((timestamp, price))
+            self.symbol_versions[symbol] += 1
             self.counters['trades'] += 1
 
             return event
@@ -182,6 +195,7 @@ class M1IngestionEngine:
                 'quote_qty': quantity * price
             }
             self.raw_liquidations[symbol].append(event)
+            self.symbol_versions[symbol] += 1
             self.counters['liquidations'] += 1
             
             return event
@@ -272,6 +286,7 @@ class M1IngestionEngine:
                 self.previous_depth[symbol] = self.latest_depth[symbol]
 
             self.latest_depth[symbol] = event  # Store latest for primitive computation
+            self.symbol_versions[symbol] += 1
             self.counters['depth'] += 1
 
             return event
@@ -286,6 +301,10 @@ class M1IngestionEngine:
     def record_oi(self, symbol: str):
         self.counters['oi'] += 1
 
+    def get_symbol_version(self, symbol: str) -> int:
+        """Return input version for symbol (changes iff trade/liquidation/depth state changed)."""
+        return self.symbol_versions.get(symbol, 0)
+
     def get_buffers(self) -> Dict:
         """Return copy of raw buffers."""
         return {
@@ -0,0 +1,234 @@
+"""
+M1 Columnar Ring Buffers (Internal)
+
+Fixed-capacity, per-field ring buffers for M1 raw event history.
+
+- Each field is a preallocated array (float64 'd', integer codes for labels)
+- Every value is written twice (slot i and i + capacity), so the live window
+  is always one contiguous slice: column() returns a zero-copy memoryview,
+  oldest -> newest, without materializing per-event dicts
+- Row access (len, [i], iteration) rebuilds the normalized event dict, so
+  callers that treated the buffers as deques of dicts keep working
+
+Column views alias the ring storage: they are valid until the next append()
+to the same buffer. Take them, compute, drop them.
+"""
+
+from abc import ABC, abstractmethod
+from array import array
+from typing import Dict, Iterator, List, Optional, Tuple
+
+_NAN = float('nan')
+
+
+class ColumnarRingBuffer(ABC):
+    """
+    Bounded event history stored as one array per field.
+
+    Subclasses declare COLUMNS and implement _values()/_row().
+    """
+
+    # (field name, array typecode); 'h' columns hold label codes
+    COLUMNS: Tuple[Tuple[str, str], ...] = ()
+
+    def __init__(self, capacity: int):
+        """
+        Args:
+            capacity: Maximum live events (oldest overwritten first, like deque maxlen)
+        """
+        if capacity <= 0:
+            raise ValueError(f"capacity must be > 0, got {capacity}")
+        self.maxlen = capacity
+        self.symbol: Optional[str] = None
+        self._arrays: List[array] = [
+            array(typecode, [0]) * (2 * capacity) for _, typecode in self.COLUMNS
+        ]
+        self._views: Dict[str, memoryview] = {
+            name: memoryview(arr) for (name, _), arr in zip(self.COLUMNS, self._arrays)
+        }
+        # Label code <-> string, per label column
+        self._label_codes: Dict[str, Dict[str, int]] = {}
+        self._label_names: Dict[str, List[str]] = {}
+        # Next write slot and number of live events
+        self._pos = 0
+        self._len = 0
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __getitem__(self, index: int) -> Dict:
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("ring buffer index out of range")
+        return self._row(self._start() + index)
+
+    def __iter__(self) -> Iterator[Dict]:
+        start = self._start()
+        for slot in range(start, start + self._len):
+            yield self._row(slot)
+
+    def _start(self) -> int:
+        # Slot of the oldest live event (window is [start, start + len))
+        return (self._pos - self._len) % self.maxlen
+
+    def append(self, event: Dict) -> None:
+        """Store a normalized event (only its COLUMNS are kept)."""
+        self.symbol = event.get('symbol', self.symbol)
+        pos = self._pos
+        mirror = pos + self.maxlen
+        for arr, value in zip(self._arrays, self._values(event)):
+            arr[pos] = value
+            arr[mirror] = value
+        self._pos = pos + 1 if pos + 1 < self.maxlen else 0
+        if self._len < self.maxlen:
+            self._len += 1
+
+    def column(self, name: str) -> memoryview:
+        """Zero-copy view of a field over the live window, oldest first."""
+        start = self._start()
+        return self._views[name][start:start + self._len]
+
+    def labels(self, name: str) -> List[str]:
+        """Label column decoded to strings, oldest first."""
+        names = self._label_names.get(name, [])
+        return [names[code] for code in self.column(name)]
+
+    def _encode(self, name: str, label: str) -> int:
+        codes = self._label_codes.setdefault(name, {})
+        code = codes.get(label)
+        if code is None:
+            names = self._label_names.setdefault(name, [])
+            code = len(names)
+            codes[label] = code
+            names.append(label)
+        return code
+
+    def _label(self, name: str, slot: int) -> str:
+        return self._label_names[name][self._views[name][slot]]
+
+    @abstractmethod
+    def _values(self, event: Dict) -> tuple:
+        """Column values for event, in COLUMNS order."""
+        pass
+
+    @abstractmethod
+    def _row(self, slot: int) -> Dict:
+        """Rebuild the normalized event dict stored at slot."""
+        pass
+
+
+class TradeRingBuffer(ColumnarRingBuffer):
+    """Normalized trades (see M1IngestionEngine.normalize_trade)."""
+
+    COLUMNS = (
+        ('timestamp', 'd'),
+        ('price', 'd'),
+        ('quantity', 'd'),
+        ('quote_qty', 'd'),
+        ('side', 'h'),
+        ('side_validation', 'h'),
+    )
+
+    def _values(self, event: Dict) -> tuple:
+        return (
+            event['timestamp'],
+            event['price'],
+            event['quantity'],
+            event['quote_qty'],
+            self._encode('side', event['side']),
+            self._encode('side_validation', event['side_validation']),
+        )
+
+    def _row(self, slot: int) -> Dict:
+        views = self._views
+        quantity = views['quantity'][slot]
+        return {
+            'timestamp': views['timestamp'][slot],
+            'symbol': self.symbol,
+            'price': views['price'][slot],
+            'quantity': quantity,
+            'side': self._label('side', slot),
+            'base_qty': quantity,
+            'quote_qty': views['quote_qty'][slot],
+            'side_validation': self._label('side_validation', slot)
+        }
+
+
+class LiquidationRingBuffer(ColumnarRingBuffer):
+    """Normalized liquidations (see M1IngestionEngine.normalize_liquidation)."""
+
+    COLUMNS = (
+        ('timestamp', 'd'),
+        ('price', 'd'),
+        ('quantity', 'd'),
+        ('quote_qty', 'd'),
+        ('side', 'h'),
+    )
+
+    def _values(self, event: Dict) -> tuple:
+        return (
+            event['timestamp'],
+            event['price'],
+            event['quantity'],
+            event['quote_qty'],
+            self._encode('side', event['side']),
+        )
+
+    def _row(self, slot: int) -> Dict:
+        views = self._views
+        quantity = views['quantity'][slot]
+        return {
+            'timestamp': views['timestamp'][slot],
+            'symbol': self.symbol,
+            'price': views['price'][slot],
+            'quantity': quantity,
+            'side': self._label('side', slot),
+            'base_qty': quantity,
+            'quote_qty': views['quote_qty'][slot]
+        }
+
+
+class DepthRingBuffer(ColumnarRingBuffer):
+    """Normalized depth snapshots (see M1IngestionEngine.normalize_depth).
+
+    Missing best bid/ask prices are stored as NaN and read back as None.
+    """
+
+    COLUMNS = (
+        ('timestamp', 'd'),
+        ('bid_size', 'd'),
+        ('ask_size', 'd'),
+        ('best_bid_price', 'd'),
+        ('best_ask_price', 'd'),
+        ('bid_levels', 'l'),
+        ('ask_levels', 'l'),
+    )
+
+    def _values(self, event: Dict) -> tuple:
+        best_bid = event['best_bid_price']
+        best_ask = event['best_ask_price']
+        return (
+            event['timestamp'],
+            event['bid_size'],
+            event['ask_size'],
+            _NAN if best_bid is None else best_bid,
+            _NAN if best_ask is None else best_ask,
+            event['bid_levels'],
+            event['ask_levels'],
+        )
+
+    def _row(self, slot: int) -> Dict:
+        views = self._views
+        best_bid = views['best_bid_price'][slot]
+        best_ask = views['best_ask_price'][slot]
+        return {
+            'timestamp': views['timestamp'][slot],
+            'symbol': self.symbol,
+            'bid_size': views['bid_size'][slot],
+            'ask_size': views['ask_size'][slot],
+            'best_bid_price': best_bid if best_bid == best_bid else None,
+            'best_ask_price': best_ask if best_ask == best_ask else None,
+            'bid_levels': views['bid_levels'][slot],
+            'ask_levels': views['ask_levels'][slot]
+        }
@@ -154,3 +154,14 @@ class ObservationSnapshot:
     counters: SystemCounters
     promoted_events: Optional[List[Dict[str, Any]]]
     primitives: Dict[str, M4PrimitiveBundle]  # symbol -> bundle
+
+
+@dataclass(frozen=True)
+class PublishedSnapshot:
+    """Snapshot as of last advance, as published for readers.
+
+    version increases by one on every published snapshot. Readers (UI,
+    dashboards) use it to skip work when nothing new was published.
+    """
+    version: int
+    snapshot: ObservationSnapshot
@@ -7,6 +7,8 @@ Deterministic replay harness for historical data validation.
 from replay.replay_harness import ReplayHarness, ReplayConfig, ReplayState
 from replay.replay_data_loader import HistoricalDataLoader, MarketSnapshot, CandleData
 from replay.replay_instrumentation import ReplayInstrumentationLogger
+from replay.replay_runner import ParallelReplayRunner, ReplayShard
+from replay.replay_sweep import ReplaySweep, SweepVariant
 
 __all__ = [
     "ReplayHarness",
@@ -16,4 +18,8 @@ __all__ = [
     "MarketSnapshot",
     "CandleData",
     "ReplayInstrumentationLogger",
+    "ParallelReplayRunner",
+    "ReplayShard",
+    "ReplaySweep",
+    "SweepVariant",
 ]
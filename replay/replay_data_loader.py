@@ -111,14 +111,20 @@ class HistoricalDataLoader:
         if self._data is None:
             raise RuntimeError("Data not loaded. Call load() first.")
         
-        for _, row in self._data.iterrows():
+        # Whole columns as Python floats (no per-row Series construction)
+        columns = [
+            self._data[name].to_numpy(dtype='float64').tolist()
+            for name in ('timestamp', 'open', 'high', 'low', 'close', 'volume')
+        ]
+        
+        for timestamp, open_, high, low, close, volume in zip(*columns):
             candle = CandleData(
-                timestamp=float(row['timestamp']),
-                open=float(row['open']),
-                high=float(row['high']),
-                low=float(row['low']),
-                close=float(row['close']),
-                volume=float(row['volume']),
+                timestamp=timestamp,
+                open=open_,
+                high=high,
+                low=low,
+                close=close,
+                volume=volume,
                 symbol=self._symbol
             )
             
@@ -8,7 +8,7 @@ Authority: Replay Harness Specification v1.0, System v1.0 Freeze
 """
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import Iterator, Optional, Tuple
 from pathlib import Path
 import hashlib
 import json
@@ -114,6 +114,9 @@ class ReplayHarness:
         )
         
         self._snapshot_count = 0
+        
+        # Actions taken during warm-up (rate-limit context, not metrics)
+        self._warmup_action_timestamps: list = []
     
     def run(self) -> dict:
         """
@@ -163,6 +166,89 @@ class ReplayHarness:
         
         return metrics
     
+    def replay(
+        self,
+        *,
+        start_time: Optional[float] = None,
+        end_time: Optional[float] = None,
+        warmup_start: Optional[float] = None
+    ) -> ReplayInstrumentationLogger:
+        """
+        Execute the pipeline over one time window, without console output
+        or artifacts (used by the parallel replay runner).
+        
+        Snapshots in [warmup_start, start_time) run the pipeline to build
+        up state but are not recorded; snapshots in [start_time, end_time)
+        are recorded.
+        
+        Args:
+            start_time: First recorded timestamp (None = from the start)
+            end_time: End of the window, exclusive (None = to the end)
+            warmup_start: First warm-up timestamp (None = no warm-up)
+        
+        Returns:
+            Instrumentation of the recorded window (not finalized)
+        """
+        self._data_loader.load()
+        recording = self._logger
+        warmup = ReplayInstrumentationLogger()
+        
+        for snapshot in self._data_loader.iter_snapshots():
+            ts = snapshot.timestamp
+            if end_time is not None and ts >= end_time:
+                break
+            if start_time is not None and ts < start_time:
+                if warmup_start is not None and ts >= warmup_start:
+                    self._logger = warmup
+                    self._process_snapshot(snapshot)
+                continue
+            
+            self._logger = recording
+            self._warmup_action_timestamps = warmup.temporal.action_timestamps
+            self._process_snapshot(snapshot)
+            self._snapshot_count += 1
+        
+        self._logger = recording
+        return recording
+    
+    def compute_reproducibility_hash(self, metrics: dict) -> str:
+        """Reproducibility hash of this run's finalized metrics."""
+        return self._compute_reproducibility_hash(metrics)
+    
+    @property
+    def snapshot_count(self) -> int:
+        """Snapshots processed (recorded) so far."""
+        return self._snapshot_count
+    
+    @property
+    def instrumentation(self) -> ReplayInstrumentationLogger:
+        """Instrumentation of this run (not finalized)."""
+        return self._logger
+    
+    def iter_decisions(self) -> Iterator[Tuple[MarketSnapshot, Optional[PolicyDecision]]]:
+        """
+        Load the data and yield (snapshot, decision) for every snapshot.
+        
+        Only the decision source runs; EP-4 is left to the consumer
+        (run_decision_pass on one or more harnesses).
+        """
+        self._data_loader.load()
+        for snapshot in self._data_loader.iter_snapshots():
+            yield snapshot, self._create_stub_decision(snapshot)
+            self._snapshot_count += 1
+    
+    def run_decision_pass(self, snapshot: MarketSnapshot, decision: Optional[PolicyDecision]):
+        """
+        Run the configuration-dependent pipeline (EP-4 and logging) for a
+        decision computed elsewhere, and count the snapshot.
+        
+        Args:
+            snapshot: Market snapshot
+            decision: Policy decision for this snapshot (None = no decision)
+        """
+        self._evaluate_decision(snapshot, decision)
+        self._snapshot_count += 1
+    
     def _process_snapshot(self, snapshot: MarketSnapshot):
         """
         Process single market snapshot through full pipeline.
@@ -172,6 +258,26 @@ class ReplayHarness:
         Args:
             snapshot: Market snapshot
         """
+        # NOTE: M1-M6 and EP-2/EP-3 integration stubbed for v1.0
+        # In production, would execute full pipeline here
+        # For now, demonstrating EP-4 execution path only
+        
+        # Stub: Create a mock policy decision (normally from EP-3)
+        # In real implementation, this comes from full M1→EP-3 pipeline
+        decision = self._create_stub_decision(snapshot)
+        self._evaluate_decision(snapshot, decision)
+    
+    def _evaluate_decision(self, snapshot: MarketSnapshot, decision: Optional[PolicyDecision]):
+        """
+        Configuration-dependent part of the pipeline: EP-4 and logging.
+        
+        Sweep mode calls this (via run_decision_pass) once per variant
+        with a shared decision.
+        
+        Args:
+            snapshot: Market snapshot
+            decision: Policy decision for this snapshot (None = no decision)
+        """
         # Update replay state
         self._state = ReplayState(
             current_timestamp=snapshot.timestamp,
@@ -182,14 +288,6 @@ class ReplayHarness:
             actions_in_last_minute=self._count_recent_actions(snapshot.timestamp)
         )
         
-        # NOTE: M1-M6 and EP-2/EP-3 integration stubbed for v1.0
-       # In production, would execute full pipeline here
-        # For now, demonstrating EP-4 execution path only
-        
-        # Stub: Create a mock policy decision (normally from EP-3)
-        # In real implementation, this comes from full M1→EP-3 pipeline
-        decision = self._create_stub_decision(snapshot)
-        
         # Execute EP-4 (DRY-RUN mode)
         if decision is not None:
             result = self._execute_ep4(decision, snapshot)
@@ -272,6 +370,9 @@ class ReplayHarness:
         return sum(
             1 for ts in self._logger.temporal.action_timestamps
             if ts >= window_start
+        ) + sum(
+            1 for ts in self._warmup_action_timestamps
+            if ts >= window_start
         )
     
     def _save_artifacts(self, metrics: dict):
@@ -186,8 +186,42 @@ class ReplayInstrumentationLogger:
         elif result_code == "REJECTED":
             self.execution.rejected_count += 1
     
+    def merge(self, other: "ReplayInstrumentationLogger"):
+        """
+        Add another run's (unfinalized) instrumentation to this one.
+        
+        Counters and reason codes are summed, observations concatenated and
+        action timestamps combined in time order (stable), so temporal
+        metrics describe the union of both runs.
+        
+        Args:
+            other: Instrumentation of another shard
+        """
+        for mine, theirs in (
+            (self.observation, other.observation),
+            (self.proposal, other.proposal),
+            (self.arbitration, other.arbitration),
+            (self.execution, other.execution),
+        ):
+            for name, value in vars(theirs).items():
+                if isinstance(value, int):
+                    setattr(mine, name, getattr(mine, name) + value)
+                elif isinstance(value, dict):
+                    for key, count in value.items():
+                        getattr(mine, name)[key] += count
+        
+        self.observation.primitive_outputs.extend(other.observation.primitive_outputs)
+        self.temporal.action_timestamps = sorted(
+            self.temporal.action_timestamps + other.temporal.action_timestamps
+        )
+        self._events.extend(other._events)
+    
     def finalize_temporal_metrics(self):
-        """Compute final temporal metrics."""
+        """Compute final temporal metrics (idempotent)."""
+        self.temporal.time_between_actions = []
+        self.temporal.longest_inactivity = 0.0
+        self.temporal.burst_count = 0
+        
         if len(self.temporal.action_timestamps) < 2:
             return
         
@@ -0,0 +1,240 @@
+"""
+Parallel Replay Runner - Replay Harness v1.0
+
+Runs replay shards (symbols, optionally split into time windows) across a
+process pool and merges their instrumentation.
+
+Deterministic: shards are planned in a fixed order (symbol, then window
+start) and results are combined in that order, so the combined metrics and
+hash do not depend on the number of workers or on completion order.
+
+Time windows: a symbol's data range is split into consecutive windows of
+window_seconds. Each window after the first replays warmup_seconds of
+preceding data first, unrecorded, to rebuild pipeline state (e.g. the
+action rate-limit context) before its recorded range.
+
+Authority: Replay Harness Specification v1.0
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Dict, List, Optional
+import hashlib
+import json
+
+from replay.replay_data_loader import HistoricalDataLoader
+from replay.replay_harness import ReplayConfig, ReplayHarness
+from replay.replay_instrumentation import ReplayInstrumentationLogger
+
+
+# ==============================================================================
+# Shards
+# ==============================================================================
+
+@dataclass(frozen=True)
+class ReplayShard:
+    """
+    One unit of replay work.
+    Recorded range is [start_time, end_time); None = open-ended.
+    """
+    symbol: str
+    data_path: Path
+    start_time: Optional[float] = None
+    end_time: Optional[float] = None
+    warmup_start: Optional[float] = None
+
+
+@dataclass(frozen=True)
+class ShardResult:
+    """Outcome of one shard."""
+    shard: ReplayShard
+    metrics: dict
+    reproducibility_hash: str
+    snapshots: int
+    instrumentation: ReplayInstrumentationLogger
+
+
+def run_shard(base_config: ReplayConfig, shard: ReplayShard) -> ShardResult:
+    """
+    Replay one shard (worker-process entry point).
+
+    Args:
+        base_config: Risk/exchange/account configuration shared by all shards
+        shard: Symbol, data file and time window
+
+    Returns:
+        ShardResult with unfinalized instrumentation for merging
+    """
+    config = replace(base_config, data_path=shard.data_path, symbol=shard.symbol)
+    harness = ReplayHarness(config=config)
+    instrumentation = harness.replay(
+        start_time=shard.start_time,
+        end_time=shard.end_time,
+        warmup_start=shard.warmup_start
+    )
+
+    # Finalize a copy: the original is merged (and finalized) by the runner
+    shard_logger = ReplayInstrumentationLogger()
+    shard_logger.merge(instrumentation)
+    metrics = shard_logger.to_dict()
+
+    return ShardResult(
+        shard=shard,
+        metrics=metrics,
+        reproducibility_hash=harness.compute_reproducibility_hash(metrics),
+        snapshots=harness.snapshot_count,
+        instrumentation=instrumentation
+    )
+
+
+# ==============================================================================
+# Runner
+# ==============================================================================
+
+class ParallelReplayRunner:
+    """
+    Process-parallel replay over many symbols.
+
+    Guarantees:
+    - Same combined metrics and hash for any worker count
+    - Each shard runs the same harness code as a single-symbol replay
+    """
+
+    def __init__(
+        self,
+        *,
+        base_config: ReplayConfig,
+        data_paths: Dict[str, Path],
+        workers: int = 0,
+        window_seconds: Optional[float] = None,
+        warmup_seconds: float = 0.0
+    ):
+        """
+        Initialize runner.
+
+        Args:
+            base_config: Shared configuration (its output_dir receives the
+                combined artifacts; data_path/symbol are set per shard)
+            data_paths: Symbol -> data file
+            workers: Worker processes (0 or 1 = run shards in-process)
+            window_seconds: Split each symbol into windows of this length
+                (None = one shard per symbol)
+            warmup_seconds: Unrecorded lead-in replayed before each window
+        """
+        self._base_config = base_config
+        self._data_paths = dict(data_paths)
+        self._workers = workers
+        self._window_seconds = window_seconds
+        self._warmup_seconds = warmup_seconds
+
+    def plan(self) -> List[ReplayShard]:
+        """
+        Shards in canonical order (symbol, window start).
+
+        Returns:
+            Shard list; windows of a symbol tile its data range exactly
+        """
+        shards = []
+        for symbol in sorted(self._data_paths):
+            data_path = self._data_paths[symbol]
+            if not self._window_seconds:
+                shards.append(ReplayShard(symbol=symbol, data_path=data_path))
+                continue
+
+            loader = HistoricalDataLoader(data_path=data_path, symbol=symbol)
+            loader.load()
+            first, last = loader.get_time_range()
+
+            start = first
+            while True:
+                end = start + self._window_seconds
+                is_first = start == first
+                is_last = end > last
+                shards.append(ReplayShard(
+                    symbol=symbol,
+                    data_path=data_path,
+                    start_time=None if is_first else start,
+                    end_time=None if is_last else end,
+                    warmup_start=(
+                        None if is_first or self._warmup_seconds <= 0
+                        else max(first, start - self._warmup_seconds)
+                    )
+                ))
+                if is_last:
+                    break
+                start = end
+        return shards
+
+    def run(self) -> dict:
+        """
+        Execute all shards and merge their results.
+
+        Returns:
+            Combined metrics, per-shard metrics/hashes and the combined hash
+        """
+        shards = self.plan()
+        configs = [self._base_config] * len(shards)
+
+        if self._workers > 1 and len(shards) > 1:
+            with ProcessPoolExecutor(max_workers=self._workers) as pool:
+                results = list(pool.map(run_shard, configs, shards))
+        else:
+            results = [run_shard(config, shard) for config, shard in zip(configs, shards)]
+
+        combined = ReplayInstrumentationLogger()
+        for result in results:
+            combined.merge(result.instrumentation)
+        metrics = combined.to_dict()
+
+        summary = {
+            "metrics": metrics,
+            "shards": [
+                {
+                    "symbol": r.shard.symbol,
+                    "start_time": r.shard.start_time,
+                    "end_time": r.shard.end_time,
+                    "snapshots": r.snapshots,
+                    "reproducibility_hash": r.reproducibility_hash,
+                    "metrics": r.metrics
+                }
+                for r in results
+            ],
+            "snapshots": sum(r.snapshots for r in results),
+            "reproducibility_hash": self._combined_hash(results, metrics),
+        }
+        self._save_artifacts(summary)
+        return summary
+
+    def _combined_hash(self, results: List[ShardResult], metrics: dict) -> str:
+        """
+        Hash of all shard hashes in plan order plus the merged metrics.
+
+        Args:
+            results: Shard results in plan order
+            metrics: Merged metrics
+
+        Returns:
+            SHA256 hash (hex)
+        """
+        hasher = hashlib.sha256()
+        hasher.update(b"SYSTEM_V1.0_FROZEN")
+        for result in results:
+            shard = result.shard
+            hasher.update(json.dumps(
+                [shard.symbol, shard.start_time, shard.end_time, result.reproducibility_hash]
+            ).encode())
+        hasher.update(json.dumps(metrics, sort_keys=True).encode())
+        return hasher.hexdigest()
+
+    def _save_artifacts(self, summary: dict):
+        """
+        Save combined metrics.
+
+        Args:
+            summary: Run summary
+        """
+        output_dir = self._base_config.output_dir
+        output_dir.mkdir(parents=True, exist_ok=True)
+        with open(output_dir / "parallel_replay_metrics.json", 'w') as f:
+            json.dump(summary, f, indent=2)
@@ -0,0 +1,133 @@
+"""
+Replay Sweep - Replay Harness v1.0
+
+Evaluates many risk/exchange configurations against one replay.
+
+The data is loaded once and the observation pipeline (M1 → EP-3) runs once
+per snapshot; its decision is fanned out to every variant, each with its
+own EP-4 orchestrator, mocked exchange adapter, replay state and metrics.
+An N-variant sweep costs one replay plus N EP-4 evaluations per snapshot
+instead of N full replays.
+
+Each variant's metrics and hash equal those of a standalone ReplayHarness
+run with that variant's configuration.
+
+Authority: Replay Harness Specification v1.0
+"""
+
+from dataclasses import dataclass, replace
+from typing import Dict, List, Optional
+import json
+
+from replay.replay_harness import ReplayConfig, ReplayHarness
+from execution.ep4_risk_gates import RiskConfig
+from execution.ep4_exchange_adapter import ExchangeConstraints
+
+
+# ==============================================================================
+# Variants
+# ==============================================================================
+
+@dataclass(frozen=True)
+class SweepVariant:
+    """
+    One configuration evaluated in a sweep.
+    None = use the base configuration's value.
+    """
+    name: str
+    risk_config: Optional[RiskConfig] = None
+    exchange_constraints: Optional[ExchangeConstraints] = None
+    initial_balance: Optional[float] = None
+
+    def apply(self, base_config: ReplayConfig) -> ReplayConfig:
+        """Base configuration with this variant's overrides."""
+        overrides = {
+            key: value
+            for key, value in (
+                ("risk_config", self.risk_config),
+                ("exchange_constraints", self.exchange_constraints),
+                ("initial_balance", self.initial_balance),
+            )
+            if value is not None
+        }
+        return replace(base_config, **overrides)
+
+
+# ==============================================================================
+# Sweep
+# ==============================================================================
+
+class ReplaySweep:
+    """
+    Side-by-side replay of several configurations over shared snapshots.
+
+    Guarantees:
+    - Data loaded and decisions computed once per snapshot
+    - Variants never share EP-4 state
+    - Per-variant results identical to standalone replays
+    """
+
+    def __init__(self, *, base_config: ReplayConfig, variants: List[SweepVariant]):
+        """
+        Initialize sweep.
+
+        Args:
+            base_config: Data, symbol and output configuration (also the
+                defaults for variant overrides)
+            variants: Configurations to evaluate (names must be unique)
+
+        Raises:
+            ValueError: If variants is empty or names repeat
+        """
+        names = [variant.name for variant in variants]
+        if not names:
+            raise ValueError("Sweep requires at least one variant")
+        if len(set(names)) != len(names):
+            raise ValueError(f"Duplicate sweep variant names: {names}")
+
+        self._base_config = base_config
+        self._variants = list(variants)
+
+        # Shared observation pipeline (data loader + decision source)
+        self._observer = ReplayHarness(config=base_config)
+
+        # One harness per variant: own EP-4 adapter, state and logger
+        self._lanes = [
+            ReplayHarness(config=variant.apply(base_config))
+            for variant in self._variants
+        ]
+
+    def run(self) -> Dict[str, dict]:
+        """
+        Execute the sweep.
+
+        Returns:
+            Variant name -> {"metrics", "reproducibility_hash", "snapshots"}
+        """
+        for snapshot, decision in self._observer.iter_decisions():
+            for lane in self._lanes:
+                lane.run_decision_pass(snapshot, decision)
+
+        results = {}
+        for variant, lane in zip(self._variants, self._lanes):
+            metrics = lane.instrumentation.to_dict()
+            results[variant.name] = {
+                "metrics": metrics,
+                "reproducibility_hash": lane.compute_reproducibility_hash(metrics),
+                "snapshots": lane.snapshot_count,
+            }
+
+        self._save_artifacts(results)
+        return results
+
+    def _save_artifacts(self, results: Dict[str, dict]):
+        """
+        Save per-variant metrics.
+
+        Args:
+            results: Sweep results
+        """
+        output_dir = self._base_config.output_dir
+        output_dir.mkdir(parents=True, exist_ok=True)
+        with open(output_dir / "sweep_metrics.json", 'w') as f:
+            json.dump(results, f, indent=2)
@@ -209,6 +209,20 @@ def test_replay_harness_creates_output_files(sample_replay_config):
     assert (output_dir / "replay_config.json").exists()
 
 
+def test_decision_pass_matches_replay(sample_replay_config):
+    """Decisions fed through run_decision_pass equal a standalone replay."""
+    standalone = ReplayHarness(config=sample_replay_config)
+    expected = standalone.replay().to_dict()
+    
+    observer = ReplayHarness(config=sample_replay_config)
+    lane = ReplayHarness(config=sample_replay_config)
+    for snapshot, decision in observer.iter_decisions():
+        lane.run_decision_pass(snapshot, decision)
+    
+    assert lane.instrumentation.to_dict() == expected
+    assert lane.snapshot_count == observer.snapshot_count == standalone.snapshot_count
+
+
 # ==============================================================================
 # Bit-Reproducibility Tests
 # ==============================================================================
@@ -0,0 +1,157 @@
+"""
+Parallel Replay Runner Tests - Determinism & Sharding
+
+Tests for process-parallel replay: shard planning, instrumentation merge,
+and combined hash independence from worker count.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# Configure temp directories to use D drive
+import runtime.env_setup  # noqa: F401
+
+import pytest
+from pathlib import Path
+import tempfile
+
+from replay.replay_instrumentation import ReplayInstrumentationLogger
+from replay.replay_harness import ReplayConfig
+from replay.replay_runner import ParallelReplayRunner, ReplayShard
+from execution.ep4_risk_gates import RiskConfig
+from execution.ep4_exchange_adapter import ExchangeConstraints
+
+
+# ==============================================================================
+# Test Fixtures
+# ==============================================================================
+
+def _write_csv(path: Path, count: int, start: float = 1000.0, price: float = 50000.0):
+    with open(path, 'w') as f:
+        f.write("timestamp,open,high,low,close,volume\n")
+        for i in range(count):
+            p = price + (i % 7) * 10.0
+            f.write(f"{start + i * 60.0},{p},{p + 50.0},{p - 50.0},{p + 5.0},{100.0 + i}\n")
+
+
+@pytest.fixture
+def symbol_data():
+    """CSV data for three symbols of different lengths."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        paths = {}
+        for symbol, count in (("BTCUSDT", 50), ("ETHUSDT", 37), ("SOLUSDT", 12)):
+            path = Path(tmpdir) / f"{symbol}.csv"
+            _write_csv(path, count)
+            paths[symbol] = path
+        yield paths
+
+
+@pytest.fixture
+def base_config():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield ReplayConfig(
+            data_path=Path("unused.csv"),
+            symbol="UNUSED",
+            output_dir=Path(tmpdir),
+            risk_config=RiskConfig(10.0, 100000.0, 3.0, 5, 1.0),
+            exchange_constraints=ExchangeConstraints(
+                0.001, 100.0, 0.001, 0.1, 10.0, "CROSS"
+            ),
+            account_id="TEST",
+            initial_balance=10000.0
+        )
+
+
+# ==============================================================================
+# Shard Planning Tests
+# ==============================================================================
+
+def test_plan_one_shard_per_symbol_sorted(base_config, symbol_data):
+    runner = ParallelReplayRunner(base_config=base_config, data_paths=symbol_data)
+
+    shards = runner.plan()
+
+    assert [s.symbol for s in shards] == ["BTCUSDT", "ETHUSDT", "SOLUSDT"]
+    assert all(s.start_time is None and s.end_time is None for s in shards)
+
+
+def test_plan_windows_tile_range_with_warmup(base_config, symbol_data):
+    runner = ParallelReplayRunner(
+        base_config=base_config,
+        data_paths={"BTCUSDT": symbol_data["BTCUSDT"]},
+        window_seconds=600.0,
+        warmup_seconds=120.0
+    )
+
+    shards = runner.plan()
+
+    # 50 candles, 60s apart: 2940s of data -> 5 windows of 600s
+    assert len(shards) == 5
+    assert shards[0] == ReplayShard("BTCUSDT", symbol_data["BTCUSDT"], None, 1600.0, None)
+    for previous, shard in zip(shards, shards[1:]):
+        assert shard.start_time == previous.end_time
+        assert shard.warmup_start == shard.start_time - 120.0
+    assert shards[-1].end_time is None
+
+
+# ==============================================================================
+# Merge Tests
+# ==============================================================================
+
+def test_merge_equals_single_logger():
+    """Merged shard loggers equal one logger that saw every event."""
+    single = ReplayInstrumentationLogger()
+    shards = [ReplayInstrumentationLogger() for _ in range(3)]
+    events = [
+        ("SUCCESS", "OK", 1000.0), ("FAILED_SAFE", "RISK_GATE_X", 1001.0),
+        ("SUCCESS", "OK", 1030.0), ("NOOP", "NONE", 1040.0),
+        ("SUCCESS", "OK", 1200.0), ("FAILED_SAFE", "EXCHANGE_CONSTRAINT_Y", 1300.0),
+        ("REJECTED", "NO", 1400.0), ("SUCCESS", "OK", 1410.0),
+    ]
+    for i, (result, reason, ts) in enumerate(events):
+        for logger in (single, shards[i % 3]):
+            logger.log_execution(result_code=result, reason_code=reason, timestamp=ts)
+            logger.log_arbitration(decision_code="NO_ACTION", reason_code=reason)
+            logger.log_observation(tier="A", primitive="p", output={"i": i}, is_nonzero=i % 2 == 0)
+
+    merged = ReplayInstrumentationLogger()
+    for logger in shards:
+        merged.merge(logger)
+
+    assert merged.to_dict() == single.to_dict()
+    # Finalizing again does not change the metrics
+    assert merged.to_dict() == single.to_dict()
+
+
+# ==============================================================================
+# Parallel Run Tests
+# ==============================================================================
+
+def test_combined_hash_independent_of_workers(base_config, symbol_data):
+    serial = ParallelReplayRunner(
+        base_config=base_config, data_paths=symbol_data, workers=0,
+        window_seconds=900.0, warmup_seconds=120.0
+    ).run()
+    parallel = ParallelReplayRunner(
+        base_config=base_config, data_paths=symbol_data, workers=3,
+        window_seconds=900.0, warmup_seconds=120.0
+    ).run()
+
+    assert parallel["reproducibility_hash"] == serial["reproducibility_hash"]
+    assert parallel["metrics"] == serial["metrics"]
+    assert [s["reproducibility_hash"] for s in parallel["shards"]] == \
+        [s["reproducibility_hash"] for s in serial["shards"]]
+    assert (base_config.output_dir / "parallel_replay_metrics.json").exists()
+
+
+def test_windowed_run_covers_every_snapshot_once(base_config, symbol_data):
+    whole = ParallelReplayRunner(base_config=base_config, data_paths=symbol_data).run()
+    windowed = ParallelReplayRunner(
+        base_config=base_config, data_paths=symbol_data,
+        window_seconds=420.0, warmup_seconds=300.0
+    ).run()
+
+    assert whole["snapshots"] == windowed["snapshots"] == 50 + 37 + 12
+    assert windowed["metrics"]["execution"] == whole["metrics"]["execution"]
+    assert windowed["metrics"]["arbitration"] == whole["metrics"]["arbitration"]
@@ -0,0 +1,96 @@
+"""
+Replay Sweep Tests - Shared Observation, Independent Variants
+
+Tests that a sweep reproduces standalone replays for every variant.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# Configure temp directories to use D drive
+import runtime.env_setup  # noqa: F401
+
+import pytest
+from dataclasses import replace
+from pathlib import Path
+import tempfile
+
+from replay.replay_harness import ReplayHarness, ReplayConfig
+from replay.replay_sweep import ReplaySweep, SweepVariant
+from execution.ep4_risk_gates import RiskConfig
+from execution.ep4_exchange_adapter import ExchangeConstraints
+
+
+# ==============================================================================
+# Test Fixtures
+# ==============================================================================
+
+@pytest.fixture
+def base_config():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        data_path = Path(tmpdir) / "BTCUSDT.csv"
+        with open(data_path, 'w') as f:
+            f.write("timestamp,open,high,low,close,volume\n")
+            for i in range(40):
+                p = 50000.0 + (i % 5) * 25.0
+                f.write(f"{1000.0 + i * 30.0},{p},{p + 50.0},{p - 50.0},{p + 5.0},{100.0 + i}\n")
+        yield ReplayConfig(
+            data_path=data_path,
+            symbol="BTCUSDT",
+            output_dir=Path(tmpdir) / "out",
+            risk_config=RiskConfig(10.0, 100000.0, 3.0, 5, 1.0),
+            exchange_constraints=ExchangeConstraints(
+                0.001, 100.0, 0.001, 0.1, 10.0, "CROSS"
+            ),
+            account_id="TEST",
+            initial_balance=10000.0
+        )
+
+
+VARIANTS = [
+    SweepVariant(name="base"),
+    SweepVariant(name="tight", risk_config=RiskConfig(1.0, 10000.0, 1.0, 1, 30.0)),
+    SweepVariant(name="small_account", initial_balance=500.0),
+]
+
+
+# ==============================================================================
+# Sweep Tests
+# ==============================================================================
+
+def test_sweep_matches_standalone_replays(base_config):
+    """Every variant equals a full replay with its own configuration."""
+    results = ReplaySweep(base_config=base_config, variants=VARIANTS).run()
+
+    assert list(results) == ["base", "tight", "small_account"]
+    for variant in VARIANTS:
+        harness = ReplayHarness(config=variant.apply(
+            replace(base_config, output_dir=base_config.output_dir / variant.name)
+        ))
+        metrics = harness.run()
+
+        assert results[variant.name]["metrics"] == metrics
+        assert results[variant.name]["reproducibility_hash"] == \
+            harness.compute_reproducibility_hash(metrics)
+        assert results[variant.name]["snapshots"] == 40
+
+    assert (base_config.output_dir / "sweep_metrics.json").exists()
+
+
+def test_variants_have_independent_ep4_state(base_config):
+    sweep = ReplaySweep(base_config=base_config, variants=VARIANTS)
+
+    adapters = {id(lane._exchange_adapter) for lane in sweep._lanes}
+    loggers = {id(lane._logger) for lane in sweep._lanes}
+    assert len(adapters) == len(loggers) == len(VARIANTS)
+    assert sweep._lanes[1]._config.risk_config.max_actions_per_minute == 1
+    assert sweep._lanes[2]._config.initial_balance == 500.0
+    assert sweep._lanes[2]._config.risk_config == base_config.risk_config
+
+
+def test_sweep_rejects_duplicate_or_empty_variants(base_config):
+    with pytest.raises(ValueError):
+        ReplaySweep(base_config=base_config, variants=[])
+    with pytest.raises(ValueError):
+        ReplaySweep(base_config=base_config, variants=[SweepVariant("a"), SweepVariant("a")])
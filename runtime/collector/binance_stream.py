@@ -0,0 +1,384 @@
+"""
+Binance Combined Stream Decoder.
+
+Decodes raw combined-stream frames ({"stream": ..., "data": ...}) into typed
+BinanceStreamEvent records, off the asyncio event loop.
+
+- Stream name -> (symbol, event_type) is resolved through a routing table
+  built once from the subscribed stream list (no per-frame string parsing)
+- JSON is parsed with orjson when installed, stdlib json otherwise
+- Numeric fields are converted once here, so the loop-side dispatcher only
+  applies state updates (calculators, DB logging, observation ingest)
+
+BinanceStreamDecoder runs decode_frame() on a worker thread and hands
+decoded events back to the loop in batches via call_soon_threadsafe. The
+frame queue is bounded; frames arriving while it is full are dropped,
+counted (frames_dropped) and reported by a rate-limited warning.
+Liquidation (forceOrder) frames are never dropped: they are queued past
+the bound.
+"""
+
+import json
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+    ORJSON_AVAILABLE = True
+except ImportError:
+    _json_loads = json.loads
+    ORJSON_AVAILABLE = False
+
+
+# Substring -> event type, checked in order against the lowercased stream name
+_STREAM_TYPES = (
+    ('aggtrade', 'TRADE'),
+    ('forceorder', 'LIQUIDATION'),
+    ('kline', 'KLINE'),
+    ('bookticker', 'DEPTH'),
+    ('depth20', 'DEPTH_L2'),
+    ('markprice', 'MARK_PRICE'),
+)
+
+
+@dataclass
+class BinanceStreamEvent:
+    """Decoded stream event.
+
+    Type-specific fields are None when absent from (or invalid in) the payload.
+    """
+    symbol: str
+    event_type: str  # TRADE, LIQUIDATION, KLINE, DEPTH, DEPTH_L2, MARK_PRICE, UNKNOWN
+    ts: float  # System clock timestamp (seconds)
+    payload: Dict[str, Any]  # Raw payload, forwarded to ObservationSystem
+
+    # Stream-specific timestamp for DB logging and calculators (seconds)
+    event_ts: Optional[float] = None
+
+    # TRADE / LIQUIDATION
+    price: Optional[float] = None
+    quantity: Optional[float] = None
+    side: Optional[str] = None  # Liquidation order side (BUY/SELL)
+    is_buyer_maker: bool = False
+
+    # DEPTH: (best_bid_price, best_bid_qty, best_ask_price, best_ask_qty)
+    book_top: Optional[Tuple[float, float, float, float]] = None
+
+    # MARK_PRICE
+    index_price: Optional[float] = None
+    funding_rate: Optional[float] = None
+    next_funding_time: Optional[float] = None
+
+    # KLINE (closed candles only): (open_time, open, high, low, close, volume, trade_count)
+    candle: Optional[Tuple[float, float, float, float, float, float, int]] = None
+
+    # Authoritative mark price update for execution, if this event carries one
+    mark_price: Optional[Decimal] = None
+
+
+# Minimum seconds between drop warnings
+DROP_WARNING_INTERVAL_SEC = 10.0
+
+
+class DropWarning:
+    """Rate-limited warning for dropped stream data.
+
+    Drops are accumulated and logged at most once per interval, so a burst
+    produces one line with its count instead of one line per drop.
+    """
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        what: str,
+        interval: float = DROP_WARNING_INTERVAL_SEC,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self._logger = logger
+        self._what = what
+        self._interval = interval
+        self._clock = clock
+        self._pending = 0
+        self._last_warning: Optional[float] = None
+
+    def record(self, count: int = 1):
+        """Count dropped items; log if the interval has passed."""
+        self._pending += count
+        now = self._clock()
+        if self._last_warning is None or now - self._last_warning >= self._interval:
+            self._logger.warning(f"Dropped {self._pending} {self._what} (queue full)")
+            self._pending = 0
+            self._last_warning = now
+
+
+def is_liquidation_frame(raw: Any) -> bool:
+    """True if a raw combined-stream frame is from a forceOrder stream."""
+    if isinstance(raw, (bytes, bytearray)):
+        return b'forceOrder' in raw
+    return 'forceOrder' in raw
+
+
+def classify_stream(stream: str) -> Tuple[str, str]:
+    """Resolve stream name to (symbol, event_type).
+
+    Symbol is the upper-cased stream prefix; for the global liquidation
+    stream (!forceOrder@arr) it is replaced per event by the order symbol.
+    """
+    symbol = stream.split('@')[0].upper()
+    lowered = stream.lower()
+    for marker, event_type in _STREAM_TYPES:
+        if marker in lowered:
+            return symbol, event_type
+    return symbol, 'UNKNOWN'
+
+
+def build_stream_routes(streams: Iterable[str]) -> Dict[str, Tuple[str, str]]:
+    """Precompute stream name -> (symbol, event_type) routing table."""
+    return {stream: classify_stream(stream) for stream in streams}
+
+
+def _clock_ts(payload: Dict[str, Any], event_type: str) -> float:
+    # 'E' is event time, 'T' varies by stream type
+    # For markPrice, 'T' is next_funding_time (FUTURE!) - must use 'E'
+    if 'E' in payload:
+        return int(payload['E']) / 1000.0
+    if 'T' in payload and event_type != 'MARK_PRICE':
+        return int(payload['T']) / 1000.0
+    return time.time()
+
+
+def decode_frame(
+    raw: Any,
+    routes: Dict[str, Tuple[str, str]]
+) -> BinanceStreamEvent:
+    """Decode one combined-stream frame.
+
+    Args:
+        raw: Frame as received (str or bytes)
+        routes: Routing table from build_stream_routes(); unknown streams are
+            classified and added
+
+    Raises:
+        ValueError/KeyError: Frame is not valid combined-stream JSON
+    """
+    data = _json_loads(raw)
+    stream = data['stream']
+    payload = data['data']
+
+    route = routes.get(stream)
+    if route is None:
+        route = classify_stream(stream)
+        routes[stream] = route
+    symbol, event_type = route
+
+    event = BinanceStreamEvent(
+        symbol=symbol,
+        event_type=event_type,
+        ts=_clock_ts(payload, event_type),
+        payload=payload
+    )
+
+    try:
+        if event_type == 'TRADE':
+            event.event_ts = int(payload.get('T', 0)) / 1000.0 if 'T' in payload else time.time()
+            event.is_buyer_maker = payload.get('m', False)
+            if 'p' in payload:
+                event.mark_price = Decimal(str(payload['p']))
+            event.price = float(payload.get('p', 0))
+            event.quantity = float(payload.get('q', 0))
+
+        elif event_type == 'LIQUIDATION':
+            if 'o' in payload:
+                order = payload['o']
+                # For global !forceOrder@arr stream, get symbol from order data
+                event.symbol = order.get('s', symbol)
+                event.event_ts = event.ts
+                event.side = order.get('S', 'UNKNOWN')
+                event.price = float(order.get('p', 0))
+                event.quantity = float(order.get('q', 0))
+
+        elif event_type == 'KLINE':
+            k = payload.get('k')
+            if k and k.get('x', False):  # Only closed candles
+                event.candle = (
+                    int(k['t']) / 1000.0,
+                    float(k['o']), float(k['h']), float(k['l']), float(k['c']),
+                    float(k.get('v', 0)),
+                    int(k.get('n', 0))
+                )
+
+        elif event_type == 'DEPTH':
+            if 'b' in payload and 'B' in payload and 'a' in payload and 'A' in payload:
+                event.event_ts = int(payload.get('T', 0)) / 1000.0 if payload.get('T') else time.time()
+                event.book_top = (
+                    float(payload['b']), float(payload['B']),
+                    float(payload['a']), float(payload['A'])
+                )
+
+        elif event_type == 'DEPTH_L2':
+            event.event_ts = int(payload.get('T', 0)) / 1000.0 if payload.get('T') else time.time()
+            bids = payload.get('b', [])
+            asks = payload.get('a', [])
+            # Mark price from mid if both sides available
+            if bids and asks:
+                mid = (float(bids[0][0]) + float(asks[0][0])) / 2
+                event.mark_price = Decimal(str(mid))
+
+        elif event_type == 'MARK_PRICE':
+            event.event_ts = int(payload.get('E', 0)) / 1000.0 if payload.get('E') else time.time()
+            mark_price = float(payload.get('p', 0))
+            event.index_price = float(payload.get('i', 0)) if payload.get('i') else None
+            event.funding_rate = float(payload.get('r', 0)) if payload.get('r') else None
+            event.next_funding_time = float(payload.get('T', 0)) / 1000.0 if payload.get('T') else None
+            if mark_price > 0:
+                event.price = mark_price
+                event.mark_price = Decimal(str(mark_price))
+    except (TypeError, ValueError, KeyError, IndexError, ArithmeticError):
+        # Malformed fields: leave the remaining typed fields unset, the raw
+        # payload is still forwarded for observation ingest
+        pass
+
+    return event
+
+
+class BinanceStreamDecoder:
+    """Worker-thread decoder for raw Binance stream frames.
+
+    The receive loop only calls submit(); decoded events are delivered to
+    sink(events) on the event loop thread, in batches of up to batch_size.
+    """
+
+    def __init__(
+        self,
+        routes: Dict[str, Tuple[str, str]],
+        batch_size: int = 256,
+        max_queued_frames: int = 50_000
+    ):
+        """Initialize decoder.
+
+        Args:
+            routes: Routing table from build_stream_routes()
+            batch_size: Maximum events handed to the loop per callback
+            max_queued_frames: Frames waiting for decode before new ones are
+                dropped (liquidation frames are queued regardless)
+        """
+        self._routes = routes
+        self._batch_size = batch_size
+        self._max_queued_frames = max_queued_frames
+        # Unbounded; submit() enforces max_queued_frames except for liquidations
+        self._frames: queue.Queue = queue.Queue()
+        self._logger = logging.getLogger("BinanceStreamDecoder")
+        self._drop_warning = DropWarning(self._logger, "Binance stream frames")
+
+        self._loop = None
+        self._sink: Optional[Callable[[List[BinanceStreamEvent]], None]] = None
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+
+        # Stats
+        self._frames_received = 0
+        self._frames_dropped = 0
+        self._liquidations_over_bound = 0  # Liquidation frames queued while full
+        self._events_decoded = 0
+        self._decode_errors = 0
+        self._batches_delivered = 0
+
+    def start(self, loop, sink: Callable[[List[BinanceStreamEvent]], None]):
+        """Start the worker thread.
+
+        Args:
+            loop: asyncio event loop that owns sink
+            sink: Called on the loop thread with each decoded batch
+        """
+        if self._running:
+            return
+        self._loop = loop
+        self._sink = sink
+        self._running = True
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def submit(self, raw: Any):
+        """Queue a raw frame for decoding (non-blocking).
+
+        While the queue is full, frames are dropped unless they carry a
+        liquidation.
+        """
+        self._frames_received += 1
+        if self._frames.qsize() >= self._max_queued_frames:
+            if not is_liquidation_frame(raw):
+                self._frames_dropped += 1
+                self._drop_warning.record()
+                return
+            self._liquidations_over_bound += 1
+        self._frames.put_nowait(raw)
+
+    def stop(self, timeout: float = 5.0):
+        """Stop the worker after draining queued frames."""
+        if not self._running:
+            return
+        self._running = False
+        self._frames.put_nowait(None)  # Wake worker
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+
+    def _run(self):
+        """Worker loop: drain frames, decode, deliver batch to the loop."""
+        stopping = False
+        while not stopping:
+            frame = self._frames.get()
+            if frame is None:
+                if not self._running:
+                    break
+                continue
+
+            frames = [frame]
+            while len(frames) < self._batch_size:
+                try:
+                    frame = self._frames.get_nowait()
+                except queue.Empty:
+                    break
+                if frame is None:
+                    # Deliver what we have, then exit
+                    stopping = not self._running
+                    break
+                frames.append(frame)
+
+            events = []
+            for raw in frames:
+                try:
+                    events.append(decode_frame(raw, self._routes))
+                except Exception as e:
+                    self._decode_errors += 1
+                    self._logger.warning(f"Stream decode error: {e}")
+
+            if not events:
+                continue
+
+            self._events_decoded += len(events)
+            self._batches_delivered += 1
+            try:
+                self._loop.call_soon_threadsafe(self._sink, events)
+            except RuntimeError:
+                # Event loop closed during shutdown
+                break
+
+    def get_stats(self) -> dict:
+        """Get decoder statistics."""
+        return {
+            'frames_received': self._frames_received,
+            'frames_dropped': self._frames_dropped,
+            'liquidations_over_bound': self._liquidations_over_bound,
+            'events_decoded': self._events_decoded,
+            'decode_errors': self._decode_errors,
+            'batches_delivered': self._batches_delivered,
+            'queue_depth': self._frames.qsize(),
+            'orjson': ORJSON_AVAILABLE
+        }
@@ -0,0 +1,290 @@
+"""
+Clock Scheduler for the M6 execution cycle.
+
+Drives snapshot computation and the M6 cycle on a fixed deadline grid
+(period_sec), so the decision cadence does not drift with compute time.
+
+Modes:
+- serial: at each deadline, compute the snapshot then run the cycle inline
+- decoupled: a worker thread computes the snapshot ahead of each deadline
+  (lead time tracks recent compute duration); at the deadline the loop runs
+  the cycle on the handed-off snapshot if it is no older than
+  max_staleness_sec, otherwise skips the cycle
+
+In decoupled mode a new computation is only requested once the worker is
+idle and its last handoff has been consumed (or skipped) at a deadline, so
+the cycle and the worker never touch observation state at the same time.
+A handoff that misses its deadline is therefore taken at the next one
+(subject to max_staleness_sec) before the next computation starts. Event
+ingest keeps running on the loop meanwhile.
+
+Per-stage durations (ms) are recorded in a StageTimer and exported by
+get_metrics().
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+
+class StageTimer:
+    """Per-stage duration statistics (count, last/mean/max in ms).
+
+    Thread-safe: the loop and the decoupled worker record into one timer.
+    """
+
+    def __init__(self):
+        # stage -> [count, total_sec, max_sec, last_sec]
+        self._stages: Dict[str, list] = {}
+        self._lock = threading.Lock()
+
+    def record(self, stage: str, seconds: float):
+        """Record one duration for stage."""
+        with self._lock:
+            stats = self._stages.get(stage)
+            if stats is None:
+                self._stages[stage] = [1, seconds, seconds, seconds]
+                return
+            stats[0] += 1
+            stats[1] += seconds
+            if seconds > stats[2]:
+                stats[2] = seconds
+            stats[3] = seconds
+
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        """Get per-stage statistics."""
+        with self._lock:
+            stages = [(stage, list(stats)) for stage, stats in self._stages.items()]
+        return {
+            stage: {
+                'count': count,
+                'last_ms': last * 1000.0,
+                'mean_ms': total / count * 1000.0,
+                'max_ms': peak * 1000.0,
+            }
+            for stage, (count, total, peak, last) in stages
+        }
+
+
+@dataclass
+class SnapshotHandoff:
+    """Snapshot computed by the worker, waiting for the next deadline."""
+    snapshot: Any
+    stream_time: float  # Stream time the snapshot was computed for
+    requested_at: float  # Monotonic time the computation was requested
+    sequence: int
+
+
+class ClockScheduler:
+    """Deadline-driven snapshot/M6 cycle scheduler."""
+
+    def __init__(
+        self,
+        compute: Callable[[float], Any],
+        consume: Callable[[Any, float], None],
+        period_sec: float = 0.2,
+        max_staleness_sec: float = 0.5,
+        decoupled: bool = False,
+        timer: Optional[StageTimer] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """Initialize scheduler.
+
+        Args:
+            compute: compute(stream_time) -> snapshot (None to skip the cycle)
+            consume: consume(snapshot, stream_time), runs the cycle on the loop
+            period_sec: Deadline spacing (0.2 = 5Hz)
+            max_staleness_sec: Oldest handoff (since request) the cycle accepts
+            decoupled: Compute snapshots on a worker thread
+            timer: Stage timer shared with compute/consume (created if None)
+            clock: Monotonic clock, must match the event loop's timebase
+        """
+        self._compute = compute
+        self._consume = consume
+        self._period = period_sec
+        self._max_staleness = max_staleness_sec
+        self._decoupled = decoupled
+        self.timer = timer if timer is not None else StageTimer()
+        self._clock = clock
+        self._logger = logging.getLogger("ClockScheduler")
+
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+        self._wakeup = threading.Event()
+
+        # Worker handoff (decoupled mode)
+        self._request: Optional[tuple] = None  # (stream_time, requested_at)
+        self._computing = False
+        self._latest: Optional[SnapshotHandoff] = None
+        self._consumed_sequence = 0
+        self._sequence = 0
+        self._compute_ewma: Optional[float] = None
+
+        # Stats
+        self._ticks = 0
+        self._cycles = 0
+        self._missed_ticks = 0
+        self._stale_skips = 0
+        self._not_ready = 0
+        self._compute_errors = 0
+
+    async def run(self, stream_time: Callable[[], Optional[float]]):
+        """Run until stop().
+
+        Args:
+            stream_time: Returns the current stream time, or None before the
+                first stream event (no cycles run until then)
+        """
+        self._running = True
+        if self._decoupled:
+            self._thread = threading.Thread(target=self._worker, daemon=True)
+            self._thread.start()
+
+        next_tick = self._clock()
+        try:
+            while self._running:
+                if stream_time() is None:
+                    # Wait for first stream event
+                    await asyncio.sleep(0.5)
+                    next_tick = self._clock()
+                    continue
+
+                if self._decoupled:
+                    # Request the snapshot ahead of the deadline
+                    await self._sleep_until(next_tick - self._lead_time())
+                    if not self._computing and not self._handoff_pending():
+                        self._request_snapshot(stream_time())
+
+                await self._sleep_until(next_tick)
+                now = self._clock()
+                self.timer.record('tick_lateness', max(0.0, now - next_tick))
+                self._ticks += 1
+
+                if self._decoupled:
+                    self._tick_decoupled()
+                else:
+                    self._tick_serial(stream_time())
+
+                # Next deadline on the fixed grid; skip slots already missed
+                next_tick += self._period
+                now = self._clock()
+                if next_tick <= now:
+                    missed = int((now - next_tick) // self._period) + 1
+                    self._missed_ticks += missed
+                    next_tick += missed * self._period
+        finally:
+            self.stop()
+
+    def stop(self, timeout: float = 5.0):
+        """Stop scheduling and the worker thread."""
+        self._running = False
+        self._wakeup.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=timeout)
+            self._thread = None
+
+    async def _sleep_until(self, deadline: float):
+        delay = deadline - self._clock()
+        await asyncio.sleep(delay if delay > 0 else 0)
+
+    def _lead_time(self) -> float:
+        # Start computing early enough to finish by the deadline, within one period
+        if self._compute_ewma is None:
+            return self._period / 2
+        return min(self._period, self._compute_ewma * 1.5 + 0.005)
+
+    def _run_compute(self, ts: float) -> Optional[Any]:
+        start = self._clock()
+        try:
+            snapshot = self._compute(ts)
+        except Exception as e:
+            # Fail silently per constitutional rules - log but don't halt
+            self._compute_errors += 1
+            self._logger.debug(f"Snapshot computation exception: {e}")
+            snapshot = None
+        elapsed = self._clock() - start
+        self.timer.record('compute', elapsed)
+        self._compute_ewma = elapsed if self._compute_ewma is None else (
+            0.8 * self._compute_ewma + 0.2 * elapsed
+        )
+        return snapshot
+
+    def _run_consume(self, snapshot: Any, ts: float):
+        start = self._clock()
+        try:
+            self._consume(snapshot, ts)
+        except Exception as e:
+            self._logger.debug(f"Execution cycle exception: {e}")
+        self.timer.record('cycle', self._clock() - start)
+        self._cycles += 1
+
+    def _tick_serial(self, ts: float):
+        snapshot = self._run_compute(ts)
+        if snapshot is not None:
+            self._run_consume(snapshot, ts)
+
+    def _tick_decoupled(self):
+        handoff = self._latest
+        if handoff is None or handoff.sequence == self._consumed_sequence:
+            # Worker still computing (or computation failed)
+            self._not_ready += 1
+            return
+
+        self._consumed_sequence = handoff.sequence
+        age = self._clock() - handoff.requested_at
+        self.timer.record('snapshot_age', age)
+        if age > self._max_staleness:
+            self._stale_skips += 1
+            return
+        self._run_consume(handoff.snapshot, handoff.stream_time)
+
+    def _handoff_pending(self) -> bool:
+        # A computed snapshot not yet consumed (or skipped) at a deadline
+        handoff = self._latest
+        return handoff is not None and handoff.sequence != self._consumed_sequence
+
+    def _request_snapshot(self, ts: float):
+        self._computing = True
+        self._request = (ts, self._clock())
+        self._wakeup.set()
+
+    def _worker(self):
+        """Worker loop: compute one snapshot per request."""
+        while True:
+            self._wakeup.wait()
+            self._wakeup.clear()
+            if not self._running:
+                break
+            request = self._request
+            if request is None:
+                continue
+            self._request = None
+
+            ts, requested_at = request
+            snapshot = self._run_compute(ts)
+            if snapshot is not None:
+                self._sequence += 1
+                self._latest = SnapshotHandoff(
+                    snapshot=snapshot,
+                    stream_time=ts,
+                    requested_at=requested_at,
+                    sequence=self._sequence
+                )
+            self._computing = False
+
+    def get_metrics(self) -> dict:
+        """Get scheduler counters and per-stage timing."""
+        return {
+            'mode': 'decoupled' if self._decoupled else 'serial',
+            'period_ms': self._period * 1000.0,
+            'ticks': self._ticks,
+            'cycles': self._cycles,
+            'missed_ticks': self._missed_ticks,
+            'stale_skips': self._stale_skips,
+            'not_ready': self._not_ready,
+            'compute_errors': self._compute_errors,
+            'stages': self.timer.get_stats(),
+        }
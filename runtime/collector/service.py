@@ -28,6 +28,10 @@ from runtime.executor.controller import ExecutionController
 from runtime.risk.types import RiskConfig, AccountState
 from runtime.logging.execution_db import ResearchDatabase
 from runtime.logging.buffered_db import BufferedResearchDatabase
+from runtime.collector.clock_scheduler import ClockScheduler, StageTimer
+from runtime.collector.binance_stream import (
+    BinanceStreamDecoder, BinanceStreamEvent, DropWarning, build_stream_routes, decode_frame
+)
 
 # Import Ghost Tracker
 from execution.ep4_ghost_tracker import GhostPositionTracker
@@ -132,6 +136,26 @@ class CollectorService:
         # Track latest stream time to drive system clock
         self._last_stream_time = None
 
+        # Pipelined Binance ingest: decode frames on a worker thread so depth
+        # bursts do not delay _drive_clock (set PIPELINED_INGEST=false to disable)
+        self._pipelined_ingest = os.environ.get("PIPELINED_INGEST", "true").lower() == "true"
+        self._stream_decoder = None
+        self._stream_events_dropped = 0  # Decoded events dropped (dispatch queue full)
+        self._stream_drop_warning = DropWarning(self._logger, "decoded Binance events")
+
+        # M6 clock: fixed 5Hz deadline grid. CLOCK_MODE=decoupled computes
+        # snapshots on a worker thread, handed off at each deadline if no older
+        # than CLOCK_MAX_STALENESS_SEC; serial computes inline (default)
+        self._clock_timer = StageTimer()
+        self._clock_scheduler = ClockScheduler(
+            compute=self._compute_snapshot,
+            consume=self._run_execution_cycle,
+            period_sec=0.2,
+            max_staleness_sec=float(os.environ.get("CLOCK_MAX_STALENESS_SEC", "0.5")),
+            decoupled=os.environ.get("CLOCK_MODE", "serial").lower() == "decoupled",
+            timer=self._clock_timer
+        )
+
         # Ghost Trading Tracker ($1000 initial, 5% position size, all 10 symbols)
         api_key = os.environ.get("BINANCE_API_KEY")
         self.ghost_tracker = GhostPositionTracker(
@@ -429,41 +453,51 @@ class CollectorService:
         await binance_task
 
     async def _drive_clock(self):
-        """Push Wall Clock time to System every 1s and drive M6 execution cycle.
+        """Push stream time to System and drive the M6 execution cycle.
 
         CPU Optimization (2026-01-28): Reduced from 10Hz to 5Hz.
         - 200ms cycle provides good balance of responsiveness and CPU usage
-        """
-        while self._running:
-            # Use latest stream time if available, otherwise fallback to system time (or wait)
-            # User mandate: Use Binance time for everything.
-            if self._last_stream_time is not None:
-                current_time = self._last_stream_time
-            else:
-                # Wait for first stream event
-                await asyncio.sleep(0.5)
-                continue
 
-            try:
-                # 1. Advance System Time
-                self._obs.advance_time(current_time)
-
-                # 2. Query Observation Snapshot
-                snapshot = self._obs.query({'type': 'snapshot'})
-
-                # 3. M6 Execution Cycle (only if observation is not FAILED)
-                if snapshot.status != ObservationStatus.FAILED:
-                    self._execute_m6_cycle(snapshot, current_time)
+        Cycles run on deadlines (ClockScheduler), not "sleep 0.2s after
+        everything finished", so cadence does not drift with compute time.
+        """
+        # User mandate: Use Binance time for everything.
+        await self._clock_scheduler.run(lambda: self._last_stream_time)
 
-                    # 4. Process Ghost Trades based on execution results
-                    self._process_ghost_trades()
+    def _compute_snapshot(self, current_time: float) -> ObservationSnapshot:
+        """Advance System time, publishing the observation snapshot.
 
-            except Exception as e:
-                # Fail silently per constitutional rules - log but don't halt
-                self._logger.debug(f"Clock/Execution cycle exception: {e}")
-                pass
-
-            await asyncio.sleep(0.2)  # 5Hz cycle (was 0.1s / 10Hz)
+        Runs on the loop (serial) or the scheduler worker thread (decoupled).
+        """
+        # 1. Advance System Time (computes and publishes the snapshot)
+        start = time.perf_counter()
+        self._obs.advance_time(current_time, publish_snapshot=True)
+        self._clock_timer.record('advance_time', time.perf_counter() - start)
+
+        # 2. Read Published Snapshot
+        return self._obs.query({'type': 'latest_snapshot'}).snapshot
+
+    def _run_execution_cycle(self, snapshot: ObservationSnapshot, current_time: float):
+        """Run M6 and ghost trade processing on a computed snapshot (loop thread)."""
+        # 3. M6 Execution Cycle (only if observation is not FAILED)
+        if snapshot.status == ObservationStatus.FAILED:
+            return
+
+        start = time.perf_counter()
+        self._execute_m6_cycle(snapshot, current_time)
+        executed = time.perf_counter()
+        self._clock_timer.record('m6_cycle', executed - start)
+
+        # 4. Process Ghost Trades based on execution results
+        self._process_ghost_trades()
+        self._clock_timer.record('ghost_trades', time.perf_counter() - executed)
+
+    def get_clock_metrics(self) -> dict:
+        """Get M6 clock scheduler metrics (cadence, skips, per-stage timing)."""
+        return {
+            **self._clock_scheduler.get_metrics(),
+            'ingest': self._obs.get_deferred_ingest_metrics(),
+        }
 
     def _execute_m6_cycle(self, snapshot: ObservationSnapshot, timestamp: float):
         """Execute one M6 cycle: Policies -> Arbitration -> Execution.
@@ -493,7 +527,9 @@ class CollectorService:
             # Log execution cycle FIRST to establish context
             cycle_id = None
             if hasattr(self, '_execution_db'):
+                db_start = time.perf_counter()
                 cycle_id = self._log_cycle_to_db(snapshot, [], timestamp)
+                self._clock_timer.record('cycle_db_log', time.perf_counter() - db_start)
                 # print(f"DEBUG M6: Started cycle {cycle_id} for {len(snapshot.symbols_active)} symbols")
 
             # Store for ghost tracker
@@ -1318,8 +1354,244 @@ class CollectorService:
             traceback.print_exc()
             return None
 
+    def _handle_binance_event(self, event: BinanceStreamEvent):
+        """Apply one decoded Binance stream event (runs on the event loop).
+
+        Updates mark prices, regime/liquidation calculators, DB logs, the
+        system clock and finally ingests the raw payload into observation.
+        """
+        symbol = event.symbol
+        event_type = event.event_type
+
+        if event.mark_price is not None:
+            # Track mark price (trades, L2 mid, official mark price)
+            self._mark_prices[symbol] = event.mark_price
+
+        if event_type == "TRADE":
+            if event.price is not None:
+                # Log trade event for ground truth validation
+                try:
+                    self._execution_db.log_trade_event(
+                        symbol=symbol,
+                        timestamp=event.event_ts,
+                        price=event.price,
+                        volume=event.quantity,
+                        is_buyer_maker=event.is_buyer_maker
+                    )
+                except:
+                    pass
+
+                # Phase 5: Update regime calculators with trade data
+                try:
+                    price = event.price
+                    volume = event.quantity
+                    timestamp = event.event_ts
+                    is_buyer_maker = event.is_buyer_maker
+
+                    # Memory guard: check symbol limit before adding new
+                    is_new_symbol = symbol not in self._vwap_calculators
+                    if is_new_symbol and len(self._vwap_calculators) >= self._calculator_max_symbols:
+                        self.prune_stale_calculators()
+
+                    # Initialize calculators for symbol if needed
+                    if symbol not in self._vwap_calculators:
+                        self._vwap_calculators[symbol] = VWAPCalculator()
+                    if symbol not in self._atr_calculators:
+                        # Use period=3 for testing (needs 15min for 5m, 90min for 30m instead of 70min/7hrs)
+                        self._atr_calculators[symbol] = MultiTimeframeATR(period=3)
+                    if symbol not in self._orderflow_calculators:
+                        self._orderflow_calculators[symbol] = MultiWindowOrderflow()
+                    if symbol not in self._liquidation_calculators:
+                        self._liquidation_calculators[symbol] = LiquidationZScoreCalculator()
+
+                    # Track last activity for pruning
+                    self._calculator_last_activity[symbol] = timestamp
+
+                    # Update VWAP
+                    self._vwap_calculators[symbol].update(price, volume, timestamp)
+
+                    # Update ATR
+                    self._atr_calculators[symbol].update_trade(price, timestamp)
+
+                    # Update orderflow imbalance
+                    self._orderflow_calculators[symbol].update(is_buyer_maker, volume, timestamp)
+
+                    # Track current price
+                    self._current_prices[symbol] = price
+                except:
+                    pass
+        elif event_type == "LIQUIDATION":
+            if event.price is not None:
+                # Log raw liquidation event
+                try:
+                    self._execution_db.log_liquidation_event(
+                        timestamp=event.event_ts,
+                        symbol=symbol,
+                        side=event.side,
+                        price=event.price,
+                        volume=event.quantity
+                    )
+                except Exception:
+                    pass  # Fail silently per constitutional rules
+
+                # Phase 5: Update liquidation Z-score calculator
+                try:
+                    quantity = event.quantity
+                    price = event.price
+                    side = event.side
+                    timestamp = event.event_ts
+
+                    # Initialize calculator for symbol if needed
+                    if symbol not in self._liquidation_calculators:
+                        self._liquidation_calculators[symbol] = LiquidationZScoreCalculator()
+
+                    # Update liquidation Z-score
+                    self._liquidation_calculators[symbol].update(quantity, timestamp)
+
+                    # Phase 6: Update liquidation burst aggregator (for cascade sniper)
+                    self._liquidation_burst_aggregator.add_event(
+                        timestamp=timestamp,
+                        symbol=symbol,
+                        side=side,
+                        price=price,
+                        quantity=quantity
+                    )
+
+                    # Phase 7: Record to entry quality scorer for exhaustion detection
+                    # This feeds the data-driven entry quality filter
+                    try:
+                        from external_policy.ep2_strategy_cascade_sniper import record_liquidation_event
+                        liq_value = price * quantity
+                        record_liquidation_event(symbol, side, liq_value, timestamp)
+                    except ImportError:
+                        pass  # Module not available
+
+                    # Phase 8: Forward to node bridge for M2 node creation
+                    # This enables geometry strategy to trade from Binance liquidations
+                    if self._node_bridge is not None:
+                        try:
+                            from runtime.hyperliquid.node_adapter.action_extractor import LiquidationEvent
+                            # Convert Binance side to HL side (SELL=LONG liquidated, BUY=SHORT liquidated)
+                            liq_side = 'LONG' if side == 'SELL' else 'SHORT'
+                            liq_event = LiquidationEvent(
+                                timestamp=timestamp,
+                                symbol=symbol,  # Already in BTCUSDT format
+                                wallet_address='BINANCE',  # Marker for Binance source
+                                liquidated_size=quantity,
+                                liquidation_price=price,
+                                side=liq_side,
+                                value=price * quantity,
+                                event_type='BINANCE_LIQUIDATION',
+                                exchange='BINANCE'
+                            )
+                            self._node_bridge.on_liquidation(liq_event)
+                        except Exception:
+                            pass  # Fail silently
+                except:
+                    pass
+        elif event_type == "KLINE":
+            # Log OHLC candle
+            if event.candle is not None:
+                open_time, open_price, high, low, close, volume, trade_count = event.candle
+                try:
+                    self._execution_db.log_ohlc_candle(
+                        symbol=symbol,
+                        timestamp=open_time,
+                        open_price=open_price,
+                        high=high,
+                        low=low,
+                        close=close,
+                        volume=volume,
+                        trade_count=trade_count
+                    )
+                except:
+                    pass
+        elif event_type == "DEPTH":
+            # Log order book update for ground truth validation
+            if event.book_top is not None:
+                best_bid_price, best_bid_qty, best_ask_price, best_ask_qty = event.book_top
+                try:
+                    self._execution_db.log_orderbook_event(
+                        symbol=symbol,
+                        timestamp=event.event_ts,
+                        best_bid_price=best_bid_price,
+                        best_bid_qty=best_bid_qty,
+                        best_ask_price=best_ask_price,
+                        best_ask_qty=best_ask_qty
+                    )
+                except:
+                    pass
+        elif event_type == "DEPTH_L2":
+            # Log L2 orderbook depth (20 levels)
+            bids = event.payload.get('b', [])
+            asks = event.payload.get('a', [])
+            if bids or asks:
+                try:
+                    self._execution_db.log_orderbook_depth(
+                        symbol=symbol,
+                        timestamp=event.event_ts,
+                        bids=bids,
+                        asks=asks
+                    )
+                except:
+                    pass
+        elif event_type == "MARK_PRICE":
+            # Log official mark price with funding info
+            if event.price is not None:
+                try:
+                    self._execution_db.log_mark_price(
+                        symbol=symbol,
+                        timestamp=event.event_ts,
+                        mark_price=event.price,
+                        index_price=event.index_price,
+                        funding_rate=event.funding_rate,
+                        next_funding_time=event.next_funding_time
+                    )
+                except:
+                    pass
+
+        # Update authoritative system clock
+        ts = event.ts
+        if self._last_stream_time is None or ts > self._last_stream_time:
+            self._last_stream_time = ts
+
+        # INGEST (P1: removed debug print from hot path)
+        self._obs.ingest_observation(ts, symbol, event_type, event.payload)
+
+    async def _dispatch_binance_events(self, events_queue: asyncio.Queue):
+        """Apply decoded event batches from the stream decoder.
+
+        Yields to the loop after every batch so a burst of depth updates
+        cannot starve _drive_clock and the M6 cycle.
+        """
+        while self._running:
+            events = await events_queue.get()
+            for event in events:
+                try:
+                    self._handle_binance_event(event)
+                except Exception as e:
+                    print(f"Processing Error: {e}")
+                    import traceback
+                    traceback.print_exc()  # Print full stack trace
+            await asyncio.sleep(0)
+
+    def get_stream_decoder_metrics(self) -> dict:
+        """Get Binance stream decoder metrics (pipelined ingest only)."""
+        if self._stream_decoder is None:
+            return {'pipelined': False}
+        return {
+            'pipelined': True,
+            **self._stream_decoder.get_stats(),
+            'events_dropped': self._stream_events_dropped
+        }
+
     async def _run_binance_stream(self):
-        """Connect to Binance Filtered Stream with exponential backoff reconnection."""
+        """Connect to Binance Filtered Stream with exponential backoff reconnection.
+
+        With pipelined ingest (default), frames are decoded on a worker thread
+        and applied by _dispatch_binance_events; otherwise decode and dispatch
+        run inline in the receive loop.
+        """
         import websockets
 
         # Use all TOP_10_SYMBOLS for full liquidation coverage
@@ -1341,279 +1613,79 @@ class CollectorService:
 
         stream_url = f"wss://fstream.binance.com/stream?streams={'/'.join(streams)}"
 
+        # Precomputed stream name -> (symbol, event_type)
+        routes = build_stream_routes(streams)
+
+        dispatcher = None
+        if self._pipelined_ingest:
+            # Bounded at 1000 batches (up to 256 events each): while full,
+            # batches are dropped except for their liquidation events
+            events_queue = asyncio.Queue()
+
+            def enqueue(events):
+                if events_queue.qsize() >= 1000:
+                    liquidations = [e for e in events if e.event_type == 'LIQUIDATION']
+                    dropped = len(events) - len(liquidations)
+                    if dropped:
+                        self._stream_events_dropped += dropped
+                        self._stream_drop_warning.record(dropped)
+                    if not liquidations:
+                        return
+                    events = liquidations
+                events_queue.put_nowait(events)
+
+            self._stream_decoder = BinanceStreamDecoder(routes)
+            self._stream_decoder.start(asyncio.get_running_loop(), enqueue)
+            dispatcher = asyncio.create_task(self._dispatch_binance_events(events_queue))
+
         # Exponential backoff parameters
         reconnect_delay = 1  # Start with 1 second
         max_reconnect_delay = 60  # Cap at 60 seconds
 
-        while self._running:
-            try:
-                import websockets
-                # Binance Futures WebSocket keepalive requirements:
-                # - Server sends ping every 3 minutes
-                # - Must respond with pong within 10 minutes or disconnect
-                # Configure client to send ping every 60s and wait up to 300s for pong
-                self._logger.info(f"Connecting to Binance ({len(streams)} streams)...")
-                async with websockets.connect(
-                    stream_url,
-                    open_timeout=30,     # 30s handshake timeout per Binance docs
-                    ping_interval=60,    # Send ping every 60 seconds
-                    ping_timeout=300,    # Wait up to 5 minutes for pong
-                    close_timeout=10     # Clean connection close timeout
-                ) as ws:
-                    self._logger.info("Connected to Binance Stream")
-                    reconnect_delay = 1  # Reset backoff on successful connection
-                    while self._running:
-                        try:
+        try:
+            while self._running:
+                try:
+                    import websockets
+                    # Binance Futures WebSocket keepalive requirements:
+                    # - Server sends ping every 3 minutes
+                    # - Must respond with pong within 10 minutes or disconnect
+                    # Configure client to send ping every 60s and wait up to 300s for pong
+                    self._logger.info(f"Connecting to Binance ({len(streams)} streams)...")
+                    async with websockets.connect(
+                        stream_url,
+                        open_timeout=30,     # 30s handshake timeout per Binance docs
+                        ping_interval=60,    # Send ping every 60 seconds
+                        ping_timeout=300,    # Wait up to 5 minutes for pong
+                        close_timeout=10     # Clean connection close timeout
+                    ) as ws:
+                        self._logger.info("Connected to Binance Stream")
+                        reconnect_delay = 1  # Reset backoff on successful connection
+                        while self._running:
                             msg = await ws.recv()
-                            data = json.loads(msg)
-                            stream = data['stream']
-                            payload = data['data']
-
-                            # Parse Symbol & Type
-                            symbol = stream.split('@')[0].upper()
-                            event_type = "UNKNOWN"
-
-                            # P1: Removed DEBUG_STREAM print from hot path
-
-                            if 'aggtrade' in stream.lower():
-                                event_type = "TRADE"
-                                # Track mark price from trades
-                                if 'p' in payload:
-                                    self._mark_prices[symbol] = Decimal(str(payload['p']))
-                                # Log trade event for ground truth validation
-                                try:
-                                    self._execution_db.log_trade_event(
-                                        symbol=symbol,
-                                        timestamp=int(payload.get('T', 0)) / 1000.0 if 'T' in payload else time.time(),
-                                        price=float(payload.get('p', 0)),
-                                        volume=float(payload.get('q', 0)),
-                                        is_buyer_maker=payload.get('m', False)
-                                    )
-                                except:
-                                    pass
-
-                                # Phase 5: Update regime calculators with trade data
-                                try:
-                                    price = float(payload.get('p', 0))
-                                    volume = float(payload.get('q', 0))
-                                    timestamp = int(payload.get('T', 0)) / 1000.0 if 'T' in payload else time.time()
-                                    is_buyer_maker = payload.get('m', False)
-
-                                    # Memory guard: check symbol limit before adding new
-                                    is_new_symbol = symbol not in self._vwap_calculators
-                                    if is_new_symbol and len(self._vwap_calculators) >= self._calculator_max_symbols:
-                                        self.prune_stale_calculators()
-
-                                    # Initialize calculators for symbol if needed
-                                    if symbol not in self._vwap_calculators:
-                                        self._vwap_calculators[symbol] = VWAPCalculator()
-                                    if symbol not in self._atr_calculators:
-                                        # Use period=3 for testing (needs 15min for 5m, 90min for 30m instead of 70min/7hrs)
-                                        self._atr_calculators[symbol] = MultiTimeframeATR(period=3)
-                                    if symbol not in self._orderflow_calculators:
-                                        self._orderflow_calculators[symbol] = MultiWindowOrderflow()
-                                    if symbol not in self._liquidation_calculators:
-                                        self._liquidation_calculators[symbol] = LiquidationZScoreCalculator()
-
-                                    # Track last activity for pruning
-                                    self._calculator_last_activity[symbol] = timestamp
-
-                                    # Update VWAP
-                                    self._vwap_calculators[symbol].update(price, volume, timestamp)
-
-                                    # Update ATR
-                                    self._atr_calculators[symbol].update_trade(price, timestamp)
-
-                                    # Update orderflow imbalance
-                                    self._orderflow_calculators[symbol].update(is_buyer_maker, volume, timestamp)
-
-                                    # Track current price
-                                    self._current_prices[symbol] = price
-                                except:
-                                    pass
-                            elif 'forceorder' in stream.lower():
-                                event_type = "LIQUIDATION"
-                                # P1: Removed DEBUG_STREAM print from hot path
-                                # Log raw liquidation event
-                                if 'o' in payload:
-                                    order = payload['o']
-                                    # For global !forceOrder@arr stream, get symbol from order data
-                                    symbol = order.get('s', symbol)
-                                    try:
-                                        # P1: Removed DEBUG prints from hot path
-                                        side_value = order.get('S', 'UNKNOWN')
-                                        self._execution_db.log_liquidation_event(
-                                            timestamp=ts if 'ts' in locals() else time.time(),
-                                            symbol=symbol,
-                                            side=side_value,
-                                            price=float(order.get('p', 0)),
-                                            volume=float(order.get('q', 0))
-                                        )
-                                    except Exception:
-                                        pass  # Fail silently per constitutional rules
-
-                                # Phase 5: Update liquidation Z-score calculator
-                                try:
-                                    if 'o' in payload:
-                                        order = payload['o']
-                                        quantity = float(order.get('q', 0))
-                                        timestamp = ts if 'ts' in locals() else time.time()
-
-                                        # Initialize calculator for symbol if needed
-                                        if symbol not in self._liquidation_calculators:
-                                            self._liquidation_calculators[symbol] = LiquidationZScoreCalculator()
-
-                                        # Update liquidation Z-score
-                                        self._liquidation_calculators[symbol].update(quantity, timestamp)
-
-                                        # Phase 6: Update liquidation burst aggregator (for cascade sniper)
-                                        price = float(order.get('p', 0))
-                                        side = order.get('S', 'UNKNOWN')
-                                        self._liquidation_burst_aggregator.add_event(
-                                            timestamp=timestamp,
-                                            symbol=symbol,
-                                            side=side,
-                                            price=price,
-                                            quantity=quantity
-                                        )
-
-                                        # Phase 7: Record to entry quality scorer for exhaustion detection
-                                        # This feeds the data-driven entry quality filter
-                                        try:
-                                            from external_policy.ep2_strategy_cascade_sniper import record_liquidation_event
-                                            liq_value = price * quantity
-                                            record_liquidation_event(symbol, side, liq_value, timestamp)
-                                        except ImportError:
-                                            pass  # Module not available
-
-                                        # Phase 8: Forward to node bridge for M2 node creation
-                                        # This enables geometry strategy to trade from Binance liquidations
-                                        if self._node_bridge is not None:
-                                            try:
-                                                from runtime.hyperliquid.node_adapter.action_extractor import LiquidationEvent
-                                                # Convert Binance side to HL side (SELL=LONG liquidated, BUY=SHORT liquidated)
-                                                liq_side = 'LONG' if side == 'SELL' else 'SHORT'
-                                                liq_event = LiquidationEvent(
-                                                    timestamp=timestamp,
-                                                    symbol=symbol,  # Already in BTCUSDT format
-                                                    wallet_address='BINANCE',  # Marker for Binance source
-                                                    liquidated_size=quantity,
-                                                    liquidation_price=price,
-                                                    side=liq_side,
-                                                    value=price * quantity,
-                                                    event_type='BINANCE_LIQUIDATION',
-                                                    exchange='BINANCE'
-                                                )
-                                                self._node_bridge.on_liquidation(liq_event)
-                                            except Exception:
-                                                pass  # Fail silently
-                                except:
-                                    pass
-                            elif 'kline' in stream:
-                                event_type = "KLINE"
-                                # Log OHLC candle
-                                if 'k' in payload:
-                                    k = payload['k']
-                                    if k.get('x', False):  # Only closed candles
-                                        try:
-                                            self._execution_db.log_ohlc_candle(
-                                                symbol=symbol,
-                                                timestamp=int(k['t']) / 1000.0,
-                                                open_price=float(k['o']),
-                                                high=float(k['h']),
-                                                low=float(k['l']),
-                                                close=float(k['c']),
-                                                volume=float(k.get('v', 0)),
-                                                trade_count=int(k.get('n', 0))
-                                            )
-                                        except:
-                                            pass
-                            elif 'bookticker' in stream.lower():
-                                event_type = "DEPTH"
-                                # Log order book update for ground truth validation
-                                try:
-                                    if 'b' in payload and 'B' in payload and 'a' in payload and 'A' in payload:
-                                        ts_orderbook = int(payload.get('T', 0)) / 1000.0 if payload.get('T') else time.time()
-                                        self._execution_db.log_orderbook_event(
-                                            symbol=symbol,
-                                            timestamp=ts_orderbook,
-                                            best_bid_price=float(payload['b']),
-                                            best_bid_qty=float(payload['B']),
-                                            best_ask_price=float(payload['a']),
-                                            best_ask_qty=float(payload['A'])
-                                        )
-                                except:
-                                    pass
-                            elif 'depth20' in stream.lower():
-                                event_type = "DEPTH_L2"
-                                # Log L2 orderbook depth (20 levels)
-                                try:
-                                    ts_depth = int(payload.get('T', 0)) / 1000.0 if payload.get('T') else time.time()
-                                    bids = payload.get('b', [])
-                                    asks = payload.get('a', [])
-                                    if bids or asks:
-                                        self._execution_db.log_orderbook_depth(
-                                            symbol=symbol,
-                                            timestamp=ts_depth,
-                                            bids=bids,
-                                            asks=asks
-                                        )
-                                        # Update mark price from mid if available
-                                        if bids and asks:
-                                            mid = (float(bids[0][0]) + float(asks[0][0])) / 2
-                                            self._mark_prices[symbol] = Decimal(str(mid))
-                                except:
-                                    pass
-                            elif 'markprice' in stream.lower():
-                                event_type = "MARK_PRICE"
-                                # Log official mark price with funding info
-                                try:
-                                    ts_mark = int(payload.get('E', 0)) / 1000.0 if payload.get('E') else time.time()
-                                    mark_price = float(payload.get('p', 0))
-                                    if mark_price > 0:
-                                        self._execution_db.log_mark_price(
-                                            symbol=symbol,
-                                            timestamp=ts_mark,
-                                            mark_price=mark_price,
-                                            index_price=float(payload.get('i', 0)) if payload.get('i') else None,
-                                            funding_rate=float(payload.get('r', 0)) if payload.get('r') else None,
-                                            next_funding_time=float(payload.get('T', 0)) / 1000.0 if payload.get('T') else None
-                                        )
-                                        # Update authoritative mark price
-                                        self._mark_prices[symbol] = Decimal(str(mark_price))
-                                except:
-                                    pass
-
-                            # TIMESTAMP EXTRACTION
-                            # Note: 'E' is event time, 'T' varies by stream type
-                            # For markPrice, 'T' is next_funding_time (FUTURE!) - must use 'E'
-                            ts = time.time()
-                            if 'E' in payload:
-                                ts = int(payload['E']) / 1000.0
-                            elif 'T' in payload and 'markprice' not in stream.lower():
-                                # Only use 'T' for non-markPrice streams (trade timestamp)
-                                ts = int(payload['T']) / 1000.0
-
-                            # Update authoritative system clock
-                            if self._last_stream_time is None or ts > self._last_stream_time:
-                                self._last_stream_time = ts
-
-                            # INGEST (P1: removed debug print from hot path)
-                            self._obs.ingest_observation(ts, symbol, event_type, payload)
-
-                        except Exception as e:
-                            print(f"Processing Error: {e}")
-                            import traceback
-                            traceback.print_exc()  # Print full stack trace
-                            await asyncio.sleep(1)
+                            if self._stream_decoder is not None:
+                                self._stream_decoder.submit(msg)
+                                continue
 
-            except Exception as e:
-                print(f"Connection Failed: {e}. Retrying in {reconnect_delay}s...")
-                import traceback
-                traceback.print_exc()  # Print full traceback
-                await asyncio.sleep(reconnect_delay)
-                # Exponential backoff: double the delay, capped at max
-                reconnect_delay = min(reconnect_delay * 2, max_reconnect_delay)
+                            try:
+                                self._handle_binance_event(decode_frame(msg, routes))
+                            except Exception as e:
+                                print(f"Processing Error: {e}")
+                                import traceback
+                                traceback.print_exc()  # Print full stack trace
+                                await asyncio.sleep(1)
+
+                except Exception as e:
+                    print(f"Connection Failed: {e}. Retrying in {reconnect_delay}s...")
+                    import traceback
+                    traceback.print_exc()  # Print full traceback
+                    await asyncio.sleep(reconnect_delay)
+                    # Exponential backoff: double the delay, capped at max
+                    reconnect_delay = min(reconnect_delay * 2, max_reconnect_delay)
+        finally:
+            if self._stream_decoder is not None:
+                self._stream_decoder.stop()
+            if dispatcher is not None:
+                dispatcher.cancel()
 
 
     def get_execution_log(self):
@@ -1626,6 +1698,7 @@ class CollectorService:
 
     async def stop(self):
         self._running = False
+        self._clock_scheduler.stop()
 
         # Stop Hyperliquid collector if running
         if self._hyperliquid_collector:
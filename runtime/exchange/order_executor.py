@@ -15,6 +15,9 @@ Hardenings:
 - E2: Proper wallet signing for Hyperliquid
 - E3: Partial fill handling with cancel-resubmit
 - E4: Post-fill stop placement
+- E5: Orders and cancels issued within batch_window_ms (opt-in) are
+  coalesced into one exchange action; entry + stop can be submitted as one grouped action.
+  Signing (cached account, precomputed EIP-712 hashes) runs off the event loop.
 """
 
 import time
@@ -32,7 +35,8 @@ import aiohttp
 # E2: Optional eth_account for signing (graceful fallback if not installed)
 try:
     from eth_account import Account
-    from eth_account.messages import encode_typed_data
+    from eth_account.messages import SignableMessage
+    from eth_utils import keccak
     HAS_ETH_ACCOUNT = True
 except ImportError:
     HAS_ETH_ACCOUNT = False
@@ -55,6 +59,52 @@ from .types import (
 from .asset_metadata import get_asset_metadata_service, AssetMetadataService
 
 
+# E2: Hyperliquid EIP-712 domain and Agent message type
+EIP712_DOMAIN = {
+    "name": "Exchange",
+    "version": "1",
+    "chainId": 42161,  # Arbitrum
+    "verifyingContract": "0x0000000000000000000000000000000000000000"
+}
+AGENT_TYPES = {
+    "EIP712Domain": [
+        {"name": "name", "type": "string"},
+        {"name": "version", "type": "string"},
+        {"name": "chainId", "type": "uint256"},
+        {"name": "verifyingContract", "type": "address"}
+    ],
+    "Agent": [
+        {"name": "action", "type": "string"},
+        {"name": "nonce", "type": "uint64"}
+    ]
+}
+
+if HAS_ETH_ACCOUNT:
+    # E5: Domain separator and type hash are constant - hash once
+    _DOMAIN_SEPARATOR = keccak(
+        keccak(text="EIP712Domain(string name,string version,uint256 chainId,address verifyingContract)")
+        + keccak(text=EIP712_DOMAIN["name"])
+        + keccak(text=EIP712_DOMAIN["version"])
+        + EIP712_DOMAIN["chainId"].to_bytes(32, "big")
+        + bytes.fromhex(EIP712_DOMAIN["verifyingContract"][2:]).rjust(32, b"\x00")
+    )
+    _AGENT_TYPE_HASH = keccak(text="Agent(string action,uint64 nonce)")
+
+
+def agent_signable_message(action: Dict, nonce: int) -> "SignableMessage":
+    """E5: EIP-712 message for an Agent(action, nonce) using precomputed hashes.
+
+    Equivalent to encode_typed_data(EIP712_DOMAIN, {"Agent": ...}, message).
+    """
+    action_json = json.dumps(action, separators=(',', ':'))
+    struct_hash = keccak(
+        _AGENT_TYPE_HASH
+        + keccak(text=action_json)
+        + nonce.to_bytes(32, "big")
+    )
+    return SignableMessage(b"\x01", _DOMAIN_SEPARATOR, struct_hash)
+
+
 class StopOrderState(Enum):
     """X1: Stop order lifecycle states."""
     PENDING_PLACEMENT = "PENDING_PLACEMENT"  # Registered, waiting for entry fill
@@ -119,6 +169,10 @@ class ExecutorConfig:
     use_testnet: bool = False
     request_timeout: float = 10.0
 
+    # E5: Action batching (0 = submit each order/cancel on its own)
+    batch_window_ms: float = 0.0        # Coalesce orders/cancels issued within this window
+    max_batch_size: int = 20            # Flush early at this many entries
+
 
 class OrderExecutor:
     """
@@ -170,16 +224,27 @@ class OrderExecutor:
         # HTTP session (initialized on first use)
         self._session: Optional[aiohttp.ClientSession] = None
 
+        # E5: Signing account (created on first use) and last nonce used
+        self._account = None
+        self._last_nonce = 0
+
+        # E5: Pending batched entries per action type: (entry, future)
+        self._batches: Dict[str, List[Tuple[Dict, asyncio.Future]]] = {
+            "order": [], "cancel": [], "cancelByCloid": []
+        }
+        self._batch_timers: Dict[str, asyncio.TimerHandle] = {}
+        self._flush_tasks: set = set()
+
         # E3: Partial fill tracking
         self._partial_resubmit_counts: Dict[str, int] = {}
 
         # E4: Stop placement tracking
         self._pending_stop_placements: Dict[str, Dict] = {}  # order_id -> stop config
-        self._placed_stops: Dict[str, str] = {}  # entry_order_id -> stop_order_id
+        self._placed_stops: Dict[str, str] = {}  # entry_order_id -> stop oid (or cloid)
 
         # X1: Stop order lifecycle tracking
         self._stop_order_status: Dict[str, StopOrderStatus] = {}  # entry_order_id -> status
-        self._stop_order_by_stop_id: Dict[str, str] = {}  # stop_order_id -> entry_order_id
+        self._stop_order_by_stop_id: Dict[str, str] = {}  # stop oid (or cloid) -> entry_order_id
 
         # X2-B: Callback for stop placement failure (caller can emit BLOCK)
         self._on_stop_failure: Optional[Callable[[str, str, str], None]] = None  # (entry_id, symbol, error)
@@ -224,7 +289,11 @@ class OrderExecutor:
         return self._session
 
     async def close(self):
-        """Close HTTP session."""
+        """Send pending batches, then close HTTP session."""
+        for kind in list(self._batches):
+            self._flush_batch(kind)
+        if self._flush_tasks:
+            await asyncio.gather(*self._flush_tasks, return_exceptions=True)
         if self._session and not self._session.closed:
             await self._session.close()
 
@@ -232,6 +301,9 @@ class OrderExecutor:
         """
         Submit an order to Hyperliquid.
 
+        E5: With batch_window_ms > 0 the order is coalesced with other
+        orders submitted within the window into one exchange action.
+
         Args:
             request: Order request with all parameters
 
@@ -257,8 +329,19 @@ class OrderExecutor:
         payload = self._build_order_payload(request)
 
         # Submit order
-        response = await self._submit_to_exchange(payload, request)
+        if self._config.batch_window_ms > 0:
+            http_status, data, error, index = await self._enqueue_action(
+                "order", payload["action"]["orders"][0]
+            )
+            response = self._order_response(request, http_status, data, error, index)
+        else:
+            response = await self._submit_to_exchange(payload, request)
+
+        self._record_submission(request, response, submit_ts)
+        return response
 
+    def _record_submission(self, request: OrderRequest, response: OrderResponse, submit_ts: int):
+        """Track an accepted order (or log its rejection) after submission."""
         with self._lock:
             if response.success:
                 # Track pending order
@@ -291,7 +374,97 @@ class OrderExecutor:
                 self._log_execution('order_rejected', request, error=response.error_message)
                 self._metrics.add_order(success=False, rejected=True)
 
-        return response
+    async def submit_order_with_stop(
+        self,
+        request: OrderRequest,
+        stop_config: Dict
+    ) -> Tuple[OrderResponse, Optional[OrderResponse]]:
+        """
+        E5: Submit an entry and its protective stop as one grouped action.
+
+        The stop is sent with "normalTpsl" grouping, so the exchange sizes it
+        to the entry and saves the post-fill round trip of place_stop_for_fill.
+        If the exchange accepts the entry but rejects the stop, the stop is
+        registered for post-fill placement instead (E4 fallback). Both legs
+        are validated before anything is sent.
+
+        The exchange reports a grouped stop with a status string instead of
+        a resting oid, so the stop is tracked (and cancelled) by its cloid.
+
+        Args:
+            request: Entry order request
+            stop_config: Stop configuration (see register_stop_for_entry)
+
+        Returns:
+            (entry response, stop response or None if the entry was not submitted)
+        """
+        submit_ts = self._now_ns()
+
+        stop_request = self._build_stop_request(
+            request.client_order_id,
+            stop_config,
+            entry_price=request.expected_price or request.price,
+            size=request.size
+        )
+
+        with self._lock:
+            validation_error = self._validate_request(request)
+            if not validation_error:
+                stop_error = self._validate_request(stop_request)
+                if stop_error:
+                    validation_error = f"Stop: {stop_error}"
+            if validation_error:
+                self._log_execution('order_rejected', request, error=validation_error)
+                self._metrics.add_order(success=False, rejected=True)
+                return OrderResponse(
+                    success=False,
+                    client_order_id=request.client_order_id,
+                    status=OrderStatus.REJECTED,
+                    error_message=validation_error
+                ), None
+
+        action = {
+            "type": "order",
+            "orders": [
+                self._build_order_payload(request)["action"]["orders"][0],
+                self._build_order_payload(stop_request)["action"]["orders"][0],
+            ],
+            "grouping": "normalTpsl"
+        }
+        http_status, data, error = await self._post_action(action, request.symbol)
+
+        response = self._order_response(request, http_status, data, error, 0)
+        self._record_submission(request, response, submit_ts)
+        if not response.success:
+            return response, None
+
+        stop_response = self._order_response(stop_request, http_status, data, error, 1)
+        self._record_submission(stop_request, stop_response, submit_ts)
+
+        with self._lock:
+            if stop_response.success:
+                stop_status = StopOrderStatus(
+                    entry_order_id=response.order_id,
+                    stop_order_id=stop_response.order_id,
+                    state=StopOrderState.PLACED,
+                    stop_price=stop_config['stop_price'],
+                    symbol=stop_config['symbol'],
+                    side=stop_config.get('side', 'SELL'),
+                    size=stop_request.size,
+                    placement_attempts=1,
+                    placed_at_ns=self._now_ns()
+                )
+                self._stop_order_status[response.order_id] = stop_status
+                self._placed_stops[response.order_id] = stop_response.order_id
+                self._stop_order_by_stop_id[stop_response.order_id] = response.order_id
+            else:
+                self._logger.warning(
+                    f"E5: Grouped stop rejected for entry {response.order_id}, "
+                    f"falling back to post-fill placement: {stop_response.error_message}"
+                )
+                self._pending_stop_placements[response.order_id] = stop_config
+
+        return response, stop_response
 
     def _validate_request(self, request: OrderRequest) -> Optional[str]:
         """Validate order request. Returns error message or None."""
@@ -345,6 +518,9 @@ class OrderExecutor:
             "r": request.reduce_only,
             "t": order_type_struct,
         }
+        cloid = self._stop_cloid(request)
+        if cloid is not None:
+            order["c"] = cloid
 
         # Build action
         action = {
@@ -362,6 +538,23 @@ class OrderExecutor:
 
         return payload
 
+    @staticmethod
+    def _stop_cloid(request: OrderRequest) -> Optional[str]:
+        """E5: 128-bit hex cloid derived from a stop order's client order ID.
+
+        Trigger orders may be reported without an oid; the cloid lets them
+        be tracked and cancelled anyway. None for non-stop orders.
+        """
+        if request.order_type not in (OrderType.STOP_MARKET, OrderType.STOP_LIMIT):
+            return None
+        if not request.client_order_id:
+            return None
+        return "0x" + hashlib.md5(request.client_order_id.encode()).hexdigest()
+
+    @staticmethod
+    def _is_cloid(order_id: str) -> bool:
+        return len(order_id) == 34 and order_id.startswith("0x")
+
     def _build_order_type_struct(self, request: OrderRequest) -> Dict:
         """Build order type structure for Hyperliquid."""
         if request.order_type == OrderType.MARKET:
@@ -467,9 +660,104 @@ class OrderExecutor:
         request: OrderRequest
     ) -> OrderResponse:
         """Submit order payload to Hyperliquid API with E1 exponential backoff."""
-        # Sign payload if private key available
+        http_status, data, error = await self._post_action(payload["action"], request.symbol)
+        return self._order_response(request, http_status, data, error, 0)
+
+    def _order_response(
+        self,
+        request: OrderRequest,
+        http_status: Optional[int],
+        data: Optional[Dict],
+        error: Optional[str],
+        index: int
+    ) -> OrderResponse:
+        """Build the OrderResponse for the order at index of an order action."""
+        if http_status is None:
+            # All retries exhausted
+            return OrderResponse(
+                success=False,
+                client_order_id=request.client_order_id,
+                status=OrderStatus.FAILED,
+                error_message=f"All retries failed: {error}"
+            )
+
+        if http_status == 200 and data.get("status") == "ok":
+            # Extract order ID from response
+            status = self._action_status(data, index)
+            order_id = None
+
+            if isinstance(status, dict):
+                if "error" in status:
+                    # E5: Rejected within an accepted (possibly batched) action
+                    return OrderResponse(
+                        success=False,
+                        client_order_id=request.client_order_id,
+                        status=OrderStatus.REJECTED,
+                        error_message=str(status["error"]),
+                        raw_response=data
+                    )
+                if "resting" in status:
+                    order_id = str(status["resting"]["oid"])
+                elif "filled" in status:
+                    order_id = str(status["filled"]["oid"])
+
+            return OrderResponse(
+                success=True,
+                order_id=order_id or self._stop_cloid(request) or request.client_order_id,
+                client_order_id=request.client_order_id,
+                status=OrderStatus.SUBMITTED,
+                raw_response=data
+            )
+
+        # Non-retryable rejection (e.g., insufficient margin)
+        error_msg = data.get("response", str(data))
+        return OrderResponse(
+            success=False,
+            client_order_id=request.client_order_id,
+            status=OrderStatus.REJECTED,
+            error_code=str(http_status),
+            error_message=str(error_msg),
+            raw_response=data
+        )
+
+    @staticmethod
+    def _action_status(data: Dict, index: int) -> Any:
+        """Per-entry status of an accepted action (None if not reported)."""
+        response_data = data.get("response", {})
+        if not isinstance(response_data, dict) or "data" not in response_data:
+            return None
+        statuses = response_data["data"].get("statuses", [])
+        return statuses[index] if index < len(statuses) else None
+
+    def _next_nonce(self) -> int:
+        """Millisecond nonce, strictly increasing per executor."""
+        with self._lock:
+            self._last_nonce = max(int(time.time() * 1000), self._last_nonce + 1)
+            return self._last_nonce
+
+    async def _post_action(
+        self,
+        action: Dict,
+        label: str
+    ) -> Tuple[Optional[int], Optional[Dict], Optional[str]]:
+        """
+        Sign and POST one exchange action with E1 exponential backoff.
+
+        Args:
+            action: Exchange action ("order" or "cancel")
+            label: Symbol(s) for log messages
+
+        Returns:
+            (HTTP status, response JSON, None), or (None, None, last error)
+            if all retries failed
+        """
+        payload = {"action": action, "nonce": self._next_nonce()}
+
+        # Sign payload if private key available (off the event loop)
         if self._private_key:
-            payload = self._sign_payload(payload)
+            payload = await asyncio.get_running_loop().run_in_executor(
+                None, self._sign_payload, payload
+            )
 
         last_error = None
 
@@ -484,58 +772,19 @@ class OrderExecutor:
                     headers={"Content-Type": "application/json"}
                 ) as response:
                     data = await response.json()
-
-                    if response.status == 200 and data.get("status") == "ok":
-                        # Extract order ID from response
-                        response_data = data.get("response", {})
-                        order_id = None
-
-                        if "data" in response_data:
-                            statuses = response_data["data"].get("statuses", [])
-                            if statuses and len(statuses) > 0:
-                                status = statuses[0]
-                                if "resting" in status:
-                                    order_id = str(status["resting"]["oid"])
-                                elif "filled" in status:
-                                    order_id = str(status["filled"]["oid"])
-
-                        return OrderResponse(
-                            success=True,
-                            order_id=order_id or request.client_order_id,
-                            client_order_id=request.client_order_id,
-                            status=OrderStatus.SUBMITTED,
-                            raw_response=data
-                        )
-                    else:
-                        # Non-retryable rejection (e.g., insufficient margin)
-                        error_msg = data.get("response", str(data))
-                        return OrderResponse(
-                            success=False,
-                            client_order_id=request.client_order_id,
-                            status=OrderStatus.REJECTED,
-                            error_code=str(response.status),
-                            error_message=str(error_msg),
-                            raw_response=data
-                        )
+                    return response.status, data, None
 
             except aiohttp.ClientError as e:
                 last_error = f"Network error: {e}"
-                self._logger.warning(
-                    f"E1: Retry {attempt + 1}/{self._config.max_retries} "
-                    f"for {request.symbol}: {last_error}"
-                )
             except asyncio.TimeoutError:
                 last_error = "Request timeout"
-                self._logger.warning(
-                    f"E1: Retry {attempt + 1}/{self._config.max_retries} "
-                    f"for {request.symbol}: {last_error}"
-                )
             except Exception as e:
                 last_error = str(e)
-                self._logger.warning(
-                    f"E1: Retry {attempt + 1}/{self._config.max_retries} "
-                    f"for {request.symbol}: {last_error}"
-                )
+
+            self._logger.warning(
+                f"E1: Retry {attempt + 1}/{self._config.max_retries} "
+                f"for {label}: {last_error}"
+            )
 
             # E1: Exponential backoff before next retry
             if attempt < self._config.max_retries - 1:
@@ -545,14 +794,80 @@ class OrderExecutor:
 
         # All retries exhausted
         self._logger.error(
-            f"E1: All {self._config.max_retries} retries failed for {request.symbol}"
-        )
-        return OrderResponse(
-            success=False,
-            client_order_id=request.client_order_id,
-            status=OrderStatus.FAILED,
-            error_message=f"All retries failed: {last_error}"
+            f"E1: All {self._config.max_retries} retries failed for {label}"
         )
+        return None, None, last_error
+
+    # =========================================================================
+    # E5: Action batching
+    # =========================================================================
+
+    async def _enqueue_action(
+        self,
+        kind: str,
+        entry: Dict
+    ) -> Tuple[Optional[int], Optional[Dict], Optional[str], int]:
+        """
+        Add an order or cancel entry to the pending batch and await its flush.
+
+        The first entry of a batch starts the batch window; the batch is sent
+        when the window closes or max_batch_size entries are pending.
+
+        Args:
+            kind: "order", "cancel" or "cancelByCloid"
+            entry: Order entry ({"a", "b", "p", ...}), cancel ({"a", "o"})
+                or cancel by cloid ({"asset", "cloid"})
+
+        Returns:
+            (HTTP status, response JSON, error, index of entry in the action)
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        batch = self._batches[kind]
+        batch.append((entry, future))
+
+        if len(batch) >= self._config.max_batch_size:
+            self._flush_batch(kind)
+        elif len(batch) == 1:
+            self._batch_timers[kind] = loop.call_later(
+                self._config.batch_window_ms / 1000.0, self._flush_batch, kind
+            )
+
+        return await future
+
+    def _flush_batch(self, kind: str):
+        """Send the pending batch of kind as one action (runs as a task)."""
+        timer = self._batch_timers.pop(kind, None)
+        if timer is not None:
+            timer.cancel()
+
+        batch, self._batches[kind] = self._batches[kind], []
+        if not batch:
+            return
+
+        task = asyncio.ensure_future(self._send_batch(kind, batch))
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def _send_batch(self, kind: str, batch: List[Tuple[Dict, asyncio.Future]]):
+        """POST one batched action and resolve each entry's future."""
+        entries = [entry for entry, _ in batch]
+        if kind == "order":
+            action = {"type": "order", "orders": entries, "grouping": "na"}
+        else:
+            action = {"type": kind, "cancels": entries}
+
+        try:
+            http_status, data, error = await self._post_action(action, f"{len(entries)} {kind}s")
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for index, (_, future) in enumerate(batch):
+            if not future.done():
+                future.set_result((http_status, data, error, index))
 
     def _sign_payload(self, payload: Dict) -> Dict:
         """
@@ -561,6 +876,9 @@ class OrderExecutor:
         Hyperliquid uses EIP-712 typed data signing.
         Requires eth_account library for production use.
 
+        E5: The account is created once and the domain/type hashes are
+        precomputed; this runs in an executor thread via _post_action.
+
         Args:
             payload: Order payload to sign
 
@@ -579,52 +897,14 @@ class OrderExecutor:
             return payload
 
         try:
-            # Hyperliquid EIP-712 domain
-            domain = {
-                "name": "Exchange",
-                "version": "1",
-                "chainId": 42161,  # Arbitrum
-                "verifyingContract": "0x0000000000000000000000000000000000000000"
-            }
-
-            # Build typed data for signing
-            # Hyperliquid uses a specific message format
             action = payload.get("action", {})
             nonce = payload.get("nonce", int(time.time() * 1000))
 
-            # Create message hash for Hyperliquid
-            message = {
-                "action": json.dumps(action, separators=(',', ':')),
-                "nonce": nonce
-            }
+            if self._account is None:
+                self._account = Account.from_key(self._private_key)
 
-            types = {
-                "EIP712Domain": [
-                    {"name": "name", "type": "string"},
-                    {"name": "version", "type": "string"},
-                    {"name": "chainId", "type": "uint256"},
-                    {"name": "verifyingContract", "type": "address"}
-                ],
-                "Agent": [
-                    {"name": "action", "type": "string"},
-                    {"name": "nonce", "type": "uint64"}
-                ]
-            }
-
-            typed_data = {
-                "types": types,
-                "primaryType": "Agent",
-                "domain": domain,
-                "message": message
-            }
-
-            # Sign with eth_account
-            account = Account.from_key(self._private_key)
-            signed = account.sign_typed_data(
-                domain_data=domain,
-                message_types={"Agent": types["Agent"]},
-                message_data=message
-            )
+            # Sign Agent(action, nonce) with the Hyperliquid EIP-712 domain
+            signed = self._account.sign_message(agent_signable_message(action, nonce))
 
             # Add signature to payload
             payload["signature"] = {
@@ -646,45 +926,48 @@ class OrderExecutor:
         """
         Cancel an existing order.
 
+        E5: With batch_window_ms > 0 the cancel is coalesced with other
+        cancels submitted within the window.
+
+        Orders known only by cloid (grouped stops without an oid) are
+        cancelled with a cancelByCloid action.
+
         Args:
-            order_id: Order ID to cancel
+            order_id: Order ID (exchange oid or cloid) to cancel
             symbol: Symbol of the order
 
         Returns:
             True if cancel submitted successfully
         """
-        payload = {
-            "action": {
-                "type": "cancel",
-                "cancels": [{
-                    "a": self._get_asset_index(symbol),
-                    "o": int(order_id)
-                }]
-            },
-            "nonce": int(time.time() * 1000)
-        }
+        try:
+            if self._is_cloid(order_id):
+                kind = "cancelByCloid"
+                cancel = {"asset": self._get_asset_index(symbol), "cloid": order_id}
+            else:
+                kind = "cancel"
+                cancel = {"a": self._get_asset_index(symbol), "o": int(order_id)}
 
-        if self._private_key:
-            payload = self._sign_payload(payload)
+            if self._config.batch_window_ms > 0:
+                http_status, data, error, index = await self._enqueue_action(kind, cancel)
+            else:
+                http_status, data, error = await self._post_action(
+                    {"type": kind, "cancels": [cancel]}, symbol
+                )
+                index = 0
 
-        try:
-            session = await self._get_session()
-
-            async with session.post(
-                f"{self._api_url}/exchange",
-                json=payload,
-                headers={"Content-Type": "application/json"}
-            ) as response:
-                data = await response.json()
-
-                if response.status == 200 and data.get("status") == "ok":
-                    with self._lock:
-                        if order_id in self._order_updates:
-                            self._order_updates[order_id].status = OrderStatus.CANCELED
-                        self._pending_orders.pop(order_id, None)
-                    return True
+            if http_status == 200 and data.get("status") == "ok":
+                status = self._action_status(data, index)
+                if isinstance(status, dict) and "error" in status:
+                    self._logger.warning(f"Cancel rejected for {order_id}: {status['error']}")
+                    return False
 
-                return False
+                with self._lock:
+                    if order_id in self._order_updates:
+                        self._order_updates[order_id].status = OrderStatus.CANCELED
+                    self._pending_orders.pop(order_id, None)
+                return True
+
+            return False
 
         except Exception as e:
             self._logger.error(f"Error canceling order {order_id}: {e}")
@@ -1126,6 +1409,35 @@ class OrderExecutor:
                 f"stop @ {stop_config.get('stop_price')}"
             )
 
+    def _build_stop_request(
+        self,
+        entry_order_id: str,
+        stop_config: Dict,
+        entry_price: Optional[float],
+        size: float
+    ) -> OrderRequest:
+        """E4: Reduce-only stop-market request protecting an entry.
+
+        Args:
+            entry_order_id: Entry order (or client order) ID
+            stop_config: Stop configuration (see register_stop_for_entry)
+            entry_price: Entry/fill price (decides tp vs sl trigger)
+            size: Default stop size if stop_config has none
+        """
+        stop_side = OrderSide.SELL if stop_config.get('side') == 'SELL' else OrderSide.BUY
+        return OrderRequest(
+            symbol=stop_config['symbol'],
+            side=stop_side,
+            size=stop_config.get('size', size),
+            order_type=OrderType.STOP_MARKET,
+            stop_price=stop_config['stop_price'],
+            expected_price=entry_price,
+            reduce_only=True,
+            client_order_id=f"{entry_order_id}_SL",
+            strategy_id=stop_config.get('strategy_id'),
+            event_id=stop_config.get('event_id')
+        )
+
     async def place_stop_for_fill(self, entry_order_id: str, fill: OrderFill) -> Optional[OrderResponse]:
         """
         E4 + X2-A: Place stop loss after entry fill with retry logic.
@@ -1148,18 +1460,8 @@ class OrderExecutor:
             return None
 
         # Create stop order request
-        stop_side = OrderSide.SELL if stop_config.get('side') == 'SELL' else OrderSide.BUY
-        stop_request = OrderRequest(
-            symbol=stop_config['symbol'],
-            side=stop_side,
-            size=stop_config.get('size', fill.size),
-            order_type=OrderType.STOP_MARKET,
-            stop_price=stop_config['stop_price'],
-            expected_price=fill.price,
-            reduce_only=True,
-            client_order_id=f"{entry_order_id}_SL",
-            strategy_id=stop_config.get('strategy_id'),
-            event_id=stop_config.get('event_id')
+        stop_request = self._build_stop_request(
+            entry_order_id, stop_config, entry_price=fill.price, size=fill.size
         )
 
         # X1: Initialize stop order status
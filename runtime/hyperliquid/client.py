@@ -39,6 +39,8 @@ class ClientConfig:
     max_reconnect_delay: float = 60.0
     ping_interval: float = 30.0
     request_timeout: float = 10.0
+    max_connections: int = 32  # Pooled HTTP connections (>= poller concurrency)
+    api_url: Optional[str] = None  # REST endpoint override (e.g. local mock server)
 
 
 class HyperliquidClient:
@@ -62,6 +64,8 @@ class HyperliquidClient:
         else:
             self._api_url = MAINNET_API_URL
             self._ws_url = MAINNET_WS_URL
+        if self.config.api_url:
+            self._api_url = self.config.api_url.rstrip('/')
 
         # Connection state
         self._running = False
@@ -98,7 +102,8 @@ class HyperliquidClient:
         """Start the client and open session."""
         self._running = True
         self._session = aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=self.config.request_timeout)
+            timeout=aiohttp.ClientTimeout(total=self.config.request_timeout),
+            connector=aiohttp.TCPConnector(limit=self.config.max_connections)
         )
 
     async def stop(self):
@@ -8,7 +8,9 @@ Polling tiers:
 - Tier 2 (>$100k positions): Poll every 30 seconds
 - Tier 3 (all others): Poll every 5 minutes
 
-Rate limiting: Stays under 1000 requests/minute to avoid API throttling.
+Rate limiting: the PollEngine's weight budget, shared with the other
+pollers using the same engine. Due wallets are polled concurrently, closest
+to liquidation first.
 
 Constitutional compliance:
 - Only polls for factual position data
@@ -25,6 +27,7 @@ from collections import defaultdict
 import heapq
 
 from ..client import HyperliquidClient
+from ..poll_engine import PollEngine, PollJob, get_shared_engine
 from ..types import WalletState
 from .indexed_wallets import IndexedWalletStore
 
@@ -32,10 +35,6 @@ from .indexed_wallets import IndexedWalletStore
 @dataclass
 class PollerConfig:
     """Configuration for batch position poller."""
-    # Rate limiting
-    max_requests_per_minute: int = 1000  # Stay under API limit
-    request_delay: float = 0.06  # ~1000/min (60/1000 = 0.06)
-
     # Tier thresholds (USD position value)
     tier1_threshold: float = 1_000_000  # $1M
     tier2_threshold: float = 100_000    # $100k
@@ -52,7 +51,7 @@ class PollerConfig:
     proximity_tier1: float = 10.0  # <10% from liq -> poll every 5s
 
     # Batch settings
-    batch_size: int = 50  # Wallets per batch
+    batch_size: int = 50  # Max due wallets dispatched per round
 
     # Discovery polling
     discovery_interval: float = 600.0  # Check new wallets every 10 min
@@ -65,6 +64,7 @@ class PollTask:
     address: str = field(compare=False)
     tier: int = field(compare=False)
     last_position_value: float = field(default=0, compare=False)
+    min_liq_distance: float = field(default=100.0, compare=False)  # % (poll priority)
 
 
 class BatchPositionPoller:
@@ -90,13 +90,18 @@ class BatchPositionPoller:
         self,
         client: HyperliquidClient,
         store: IndexedWalletStore,
-        config: Optional[PollerConfig] = None
+        config: Optional[PollerConfig] = None,
+        engine: Optional[PollEngine] = None
     ):
         self.config = config or PollerConfig()
         self._client = client
         self._store = store
         self._logger = logging.getLogger("BatchPositionPoller")
 
+        # Concurrent, rate-limited request scheduling; injected by the owner
+        # or the loop's shared engine (resolved on first poll)
+        self._engine = engine
+
         # Scheduling
         self._poll_queue: List[PollTask] = []  # Min-heap by next_poll_time
         self._scheduled_addresses: Set[str] = set()
@@ -265,18 +270,30 @@ class BatchPositionPoller:
                     await asyncio.sleep(wait_time)
                     continue
 
-                # Pop task
-                task = heapq.heappop(self._poll_queue)
-
-                # Skip if wallet was removed
-                if task.address not in self._scheduled_addresses:
-                    continue
-
-                # Poll wallet
-                await self._poll_wallet(task)
-
-                # Rate limiting delay
-                await asyncio.sleep(self.config.request_delay)
+                # Pop all due tasks (up to batch_size), skipping removed wallets
+                due: List[PollTask] = []
+                while (self._poll_queue and len(due) < self.config.batch_size
+                       and self._poll_queue[0].next_poll_time <= now):
+                    task = heapq.heappop(self._poll_queue)
+                    if task.address in self._scheduled_addresses:
+                        due.append(task)
+
+                # Poll concurrently (rate limited by the engine); a poll
+                # should complete within one interval of becoming due
+                await self.engine.run(
+                    [
+                        PollJob(
+                            priority=task.min_liq_distance,
+                            seq=i,
+                            key=task.address,
+                            tier=task.tier,
+                            deadline=task.next_poll_time + self._get_interval(task.tier),
+                            payload=task
+                        )
+                        for i, task in enumerate(due)
+                    ],
+                    lambda job: self._poll_wallet(job.payload)
+                )
 
             except Exception as e:
                 self._logger.error(f"Poll loop error: {e}")
@@ -333,7 +350,8 @@ class BatchPositionPoller:
                     next_poll_time=time.time() + interval,
                     address=task.address,
                     tier=new_tier,
-                    last_position_value=total_value
+                    last_position_value=total_value,
+                    min_liq_distance=min_liq_dist
                 )
                 heapq.heappush(self._poll_queue, new_task)
 
@@ -344,7 +362,8 @@ class BatchPositionPoller:
                     next_poll_time=time.time() + backoff,
                     address=task.address,
                     tier=task.tier,
-                    last_position_value=task.last_position_value
+                    last_position_value=task.last_position_value,
+                    min_liq_distance=task.min_liq_distance
                 )
                 heapq.heappush(self._poll_queue, new_task)
 
@@ -358,7 +377,8 @@ class BatchPositionPoller:
                 next_poll_time=time.time() + backoff,
                 address=task.address,
                 tier=task.tier,
-                last_position_value=task.last_position_value
+                last_position_value=task.last_position_value,
+                min_liq_distance=task.min_liq_distance
             )
             heapq.heappush(self._poll_queue, new_task)
 
@@ -433,44 +453,44 @@ class BatchPositionPoller:
     # Batch Polling (for bulk operations)
     # =========================================================================
 
-    async def poll_batch(self, addresses: List[str]) -> Dict[str, WalletState]:
+    async def poll_batch(self, addresses: List[str], tier: int = 3) -> Dict[str, WalletState]:
         """
         Poll a batch of addresses.
 
-        Used for initial discovery or bulk refresh.
+        Used for initial discovery or bulk refresh. tier labels the engine metrics.
 
         Returns dict of address -> WalletState
         """
         results = {}
+        done = 0
 
-        for i, addr in enumerate(addresses):
-            try:
-                state = await self._client.get_clearinghouse_state(addr)
-                if state:
-                    results[addr] = state
-
-                    # Update store
-                    total_value = sum(
-                        pos.position_value for pos in state.positions.values()
-                    )
-                    self._store.update_position(addr, total_value)
+        async def poll(job: PollJob):
+            nonlocal done
+            addr = job.key
+            state = await self._client.get_clearinghouse_state(addr)
+            if state:
+                results[addr] = state
 
-                # Rate limiting
-                await asyncio.sleep(self.config.request_delay)
+                # Update store
+                total_value = sum(
+                    pos.position_value for pos in state.positions.values()
+                )
+                self._store.update_position(addr, total_value)
 
-                # Progress logging
-                if (i + 1) % 100 == 0:
-                    self._logger.info(f"Batch progress: {i + 1}/{len(addresses)}")
+            # Progress logging
+            done += 1
+            if done % 100 == 0:
+                self._logger.info(f"Batch progress: {done}/{len(addresses)}")
 
-            except Exception as e:
-                self._logger.debug(f"Batch poll error for {addr[:10]}...: {e}")
+        # Errors are logged by the engine and omitted from results
+        await self.engine.run(self.engine.make_jobs(addresses, tier=tier), poll)
 
         return results
 
     async def poll_all_tier1(self) -> Dict[str, WalletState]:
         """Poll all Tier 1 wallets immediately."""
         tier1_addresses = self._store.get_tier1_addresses()
-        return await self.poll_batch(tier1_addresses)
+        return await self.poll_batch(tier1_addresses, tier=1)
 
     # =========================================================================
     # Callbacks
@@ -488,6 +508,13 @@ class BatchPositionPoller:
     # Stats
     # =========================================================================
 
+    @property
+    def engine(self) -> PollEngine:
+        """Polling engine (the loop's shared engine if none was injected)."""
+        if self._engine is None:
+            self._engine = get_shared_engine()
+        return self._engine
+
     def get_stats(self) -> Dict:
         """Get poller statistics."""
         tier_counts = defaultdict(int)
@@ -505,7 +532,8 @@ class BatchPositionPoller:
                 self._successful_polls / self._total_polls * 100
                 if self._total_polls > 0 else 0
             ),
-            "tier_counts": dict(tier_counts)
+            "tier_counts": dict(tier_counts),
+            "engine": self._engine.get_metrics() if self._engine else {}
         }
 
     def get_queue_status(self) -> Dict:
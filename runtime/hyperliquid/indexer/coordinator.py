@@ -24,6 +24,9 @@ from dataclasses import dataclass
 from typing import Callable, Dict, List, Optional
 
 from ..client import HyperliquidClient
+from ..poll_engine import (
+    API_WEIGHT_PER_MINUTE, INFO_REQUEST_WEIGHT, PollEngine, PollEngineConfig, get_shared_engine
+)
 from ..types import WalletState, LiquidationProximity
 from .block_fetcher import BlockFetcher, BlockFetcherConfig
 from .tx_parser import TransactionParser
@@ -43,7 +46,7 @@ class IndexerConfig:
     tier1_interval: float = 5.0
     tier2_interval: float = 30.0
     tier3_interval: float = 300.0
-    max_requests_per_minute: int = 1000
+    max_requests_per_minute: int = 1000  # Poll budget, capped at the API weight budget
 
     # Storage
     db_path: str = "indexed_wallets.db"
@@ -77,10 +80,14 @@ class IndexerCoordinator:
     def __init__(
         self,
         client: HyperliquidClient,
-        config: Optional[IndexerConfig] = None
+        config: Optional[IndexerConfig] = None,
+        engine: Optional[PollEngine] = None
     ):
         self.config = config or IndexerConfig()
         self._client = client
+        # Polling engine shared by every poller of this indexer (get_poll_engine);
+        # resolved in start() if not injected (_build_poll_engine)
+        self._engine = engine
         self._logger = logging.getLogger("IndexerCoordinator")
 
         # Components (initialized in start())
@@ -165,13 +172,15 @@ class IndexerCoordinator:
         poller_config = PollerConfig(
             tier1_interval=self.config.tier1_interval,
             tier2_interval=self.config.tier2_interval,
-            tier3_interval=self.config.tier3_interval,
-            max_requests_per_minute=self.config.max_requests_per_minute
+            tier3_interval=self.config.tier3_interval
         )
+        if self._engine is None:
+            self._engine = self._build_poll_engine()
         self._poller = BatchPositionPoller(
             self._client,
             self._store,
-            poller_config
+            poller_config,
+            engine=self._engine
         )
 
         # Setup callbacks
@@ -336,6 +345,21 @@ class IndexerCoordinator:
             "poller": self._poller.get_stats() if self._poller else {}
         }
 
+    def _build_poll_engine(self) -> PollEngine:
+        """Polling engine for max_requests_per_minute.
+
+        A budget at or above the API's uses the loop's shared engine, so the
+        indexer and the other pollers spend one API budget between them. A
+        lower budget gets its own engine.
+        """
+        weight_per_minute = min(
+            self.config.max_requests_per_minute * INFO_REQUEST_WEIGHT,
+            API_WEIGHT_PER_MINUTE
+        )
+        if weight_per_minute >= API_WEIGHT_PER_MINUTE:
+            return get_shared_engine()
+        return PollEngine(PollEngineConfig(weight_per_minute=weight_per_minute))
+
     def get_store(self) -> IndexedWalletStore:
         """Get the indexed wallet store."""
         return self._store
@@ -344,6 +368,11 @@ class IndexerCoordinator:
         """Get the position poller."""
         return self._poller
 
+    def get_poll_engine(self) -> Optional[PollEngine]:
+        """Polling engine of the position poller (inject into other pollers,
+        e.g. TieredPoller, to share its rate budget). None before start()."""
+        return self._engine
+
     def set_wallet_discovered_callback(self, callback: Callable):
         """Set callback for new wallet discovery."""
         self._on_wallet_discovered = callback
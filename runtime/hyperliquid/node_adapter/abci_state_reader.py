@@ -0,0 +1,244 @@
+"""
+ABCI State Reader
+
+Streaming, selective decoder for the node's abci_state.rmp.
+
+The state file is ~1GB of msgpack and expands to 5-10GB of Python objects
+when fully unpacked. Position tracking only needs three subtrees of
+exchange.perp_dexs[0].clearinghouse:
+
+- meta.universe[i].szDecimals
+- oracle.pxs[i][0].px
+- user_states.users_with_positions / user_states.user_to_state[*].p.p
+
+This reader walks the document with msgpack.Unpacker headers, skipping every
+other subtree without constructing it, and stops as soon as the first perp
+dex has been read. Positions are kept as compact raw records (integers as
+stored in state); scaling by szDecimals happens when a record is used, since
+meta may follow user_states in the file.
+
+Memory is bounded by the extracted records plus the read buffer.
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Any, BinaryIO, Dict, NamedTuple, Optional, Set
+
+import msgpack
+
+# Bytes per read from the state file
+READ_SIZE = 1 << 20
+
+
+class PositionRecord(NamedTuple):
+    """One perp position as stored in user_to_state (unscaled)."""
+    asset_id: int
+    size_raw: int          # s: size * 10^szDecimals (negative for short)
+    entry_ntl_raw: int     # e: entry notional * 1e6
+    is_isolated: bool      # l has 'I'
+    leverage: Any          # l.I.l (isolated) or l.C (cross)
+    margin_adj_raw: int    # l.I.u (isolated), 0 for cross
+
+    @classmethod
+    def from_state(cls, asset_id: int, pos: Dict) -> 'PositionRecord':
+        """Build from a position map {s, e, l, M, f}."""
+        l_data = pos.get('l', {})
+        if 'I' in l_data:
+            isolated = l_data['I']
+            fields = (asset_id, pos.get('s', 0), pos.get('e', 0), True,
+                      isolated.get('l', 1), isolated.get('u', 0))
+        else:
+            fields = (asset_id, pos.get('s', 0), pos.get('e', 0), False, l_data.get('C', 1), 0)
+        # tuple.__new__ skips the keyword-argument constructor (hot path)
+        return tuple.__new__(cls, fields)
+
+
+@dataclass
+class AbciPositionSnapshot:
+    """Position-relevant extract of one abci_state.rmp version."""
+    sz_decimals: Dict[int, int] = field(default_factory=dict)
+    oracle_pxs_raw: Dict[int, int] = field(default_factory=dict)
+    users_with_positions: Set[str] = field(default_factory=set)
+    # wallet -> asset_id -> position, for every user_to_state entry with positions
+    positions: Dict[str, Dict[int, PositionRecord]] = field(default_factory=dict)
+    position_count: int = 0
+    decode_ms: float = 0.0
+
+    def oracle_prices(self) -> Dict[int, float]:
+        """Oracle prices by asset ID: price = raw_px / 10^(6 - szDecimals)."""
+        return {
+            asset_id: raw_px / 10 ** (6 - self.sz_decimals.get(asset_id, 0))
+            for asset_id, raw_px in self.oracle_pxs_raw.items()
+        }
+
+
+def read_position_snapshot(path: str) -> AbciPositionSnapshot:
+    """Decode the position extract of the state file at path."""
+    with open(path, 'rb') as f:
+        return decode_position_snapshot(f)
+
+
+def decode_position_snapshot(stream: BinaryIO) -> AbciPositionSnapshot:
+    """Decode the position extract from a binary stream of abci_state.rmp."""
+    start = time.perf_counter()
+    unpacker = msgpack.Unpacker(
+        stream, raw=False, strict_map_key=False, read_size=READ_SIZE
+    )
+    snapshot = AbciPositionSnapshot()
+
+    if (_seek_key(unpacker, 'exchange') and _seek_key(unpacker, 'perp_dexs')
+            and _array_header(unpacker)):
+        # Only the first (main) perp dex; the rest of the file is not read
+        if _seek_key(unpacker, 'clearinghouse'):
+            _read_clearinghouse(unpacker, snapshot)
+
+    snapshot.decode_ms = (time.perf_counter() - start) * 1000
+    return snapshot
+
+
+# ==================== Traversal ====================
+
+def _map_header(unpacker: msgpack.Unpacker) -> Optional[int]:
+    """Map length, or None (value skipped) if the next value is not a map."""
+    try:
+        return unpacker.read_map_header()
+    except ValueError:
+        unpacker.skip()
+        return None
+
+
+def _array_header(unpacker: msgpack.Unpacker) -> Optional[int]:
+    """Array length, or None (value skipped) if the next value is not an array."""
+    try:
+        return unpacker.read_array_header()
+    except ValueError:
+        unpacker.skip()
+        return None
+
+
+def _seek_key(unpacker: msgpack.Unpacker, wanted: str) -> bool:
+    """Enter the next map and stop at the value of key wanted.
+
+    Values of other keys are skipped. The entries after wanted are left
+    unread, so this is only used where the rest of the map is not needed.
+    """
+    count = _map_header(unpacker)
+    for _ in range(count or 0):
+        if unpacker.unpack() == wanted:
+            return True
+        unpacker.skip()
+    return False
+
+
+def _map_items(unpacker: msgpack.Unpacker):
+    """Iterate the keys of the next map; the caller reads or skips each value."""
+    count = _map_header(unpacker)
+    for _ in range(count or 0):
+        yield unpacker.unpack()
+
+
+def _read_clearinghouse(unpacker: msgpack.Unpacker, snapshot: AbciPositionSnapshot) -> None:
+    for key in _map_items(unpacker):
+        if key == 'meta':
+            for meta_key in _map_items(unpacker):
+                if meta_key == 'universe':
+                    _read_universe(unpacker, snapshot)
+                else:
+                    unpacker.skip()
+        elif key == 'oracle':
+            for oracle_key in _map_items(unpacker):
+                if oracle_key == 'pxs':
+                    _read_oracle_pxs(unpacker, snapshot)
+                else:
+                    unpacker.skip()
+        elif key == 'user_states':
+            for us_key in _map_items(unpacker):
+                if us_key == 'users_with_positions':
+                    wallets = unpacker.unpack()
+                    if isinstance(wallets, list):
+                        snapshot.users_with_positions.update(wallets)
+                elif us_key == 'user_to_state':
+                    _read_user_to_state(unpacker, snapshot)
+                else:
+                    unpacker.skip()
+        else:
+            unpacker.skip()
+
+
+def _read_universe(unpacker: msgpack.Unpacker, snapshot: AbciPositionSnapshot) -> None:
+    for asset_id in range(_array_header(unpacker) or 0):
+        asset = unpacker.unpack()
+        snapshot.sz_decimals[asset_id] = (
+            asset.get('szDecimals', 0) if isinstance(asset, dict) else 0
+        )
+
+
+def _read_oracle_pxs(unpacker: msgpack.Unpacker, snapshot: AbciPositionSnapshot) -> None:
+    for asset_id in range(_array_header(unpacker) or 0):
+        px_data = unpacker.unpack()
+        if px_data and isinstance(px_data, list):
+            snapshot.oracle_pxs_raw[asset_id] = px_data[0].get('px', 0)
+
+
+def _read_user_to_state(unpacker: msgpack.Unpacker, snapshot: AbciPositionSnapshot) -> None:
+    # users_with_positions, if it preceded user_to_state: other users are
+    # skipped whole (they have no positions)
+    with_positions = snapshot.users_with_positions or None
+    read_array_header = unpacker.read_array_header
+    skip = unpacker.skip
+    unpack = unpacker.unpack
+    positions = snapshot.positions
+
+    for _ in range(_array_header(unpacker) or 0):
+        try:
+            length = read_array_header()
+        except ValueError:
+            skip()
+            continue
+        if length < 2:
+            for _ in range(length):
+                skip()
+            continue
+
+        wallet = unpack()
+        if with_positions is not None and wallet not in with_positions:
+            skip()
+            records = None
+        else:
+            records = _read_user_positions(unpacker)
+        for _ in range(length - 2):
+            skip()
+
+        if records:
+            positions[wallet] = records
+            snapshot.position_count += len(records)
+
+
+def _read_user_positions(unpacker: msgpack.Unpacker) -> Dict[int, PositionRecord]:
+    """Positions of one user state map (its p.p list) by asset ID; everything else skipped."""
+    read_map_header = unpacker.read_map_header
+    skip = unpacker.skip
+    unpack = unpacker.unpack
+    from_state = PositionRecord.from_state
+    records: Dict[int, PositionRecord] = {}
+
+    try:
+        user_keys = read_map_header()
+    except ValueError:
+        skip()
+        return records
+
+    for _ in range(user_keys):
+        if unpack() != 'p':
+            skip()
+            continue
+        for _ in range(_map_header(unpacker) or 0):
+            if unpack() != 'p':
+                skip()
+                continue
+            for _ in range(_array_header(unpacker) or 0):
+                pos_item = unpack()
+                if (isinstance(pos_item, list) and len(pos_item) >= 2
+                        and isinstance(pos_item[1], dict)):
+                    records[pos_item[0]] = from_state(pos_item[0], pos_item[1])
+    return records
@@ -6,14 +6,19 @@ Parses Hyperliquid node blocks and extracts relevant actions:
 - forceOrder: Liquidation executions (ground truth)
 - order: Order activity (for position change detection)
 
+Blocks are pre-filtered with a byte-level scan for the action type strings
+before the full json.loads; blocks without any relevant action produce no
+events either way. extract_block_batch() is the worker-pool entry point
+for decoding a range of blocks in another process.
+
 Constitutional: No filtering, no ranking. Extract ALL matching actions.
 """
 
 import json
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 
 from .asset_mapping import get_coin_name
 from .metrics import ExtractorMetrics
@@ -84,6 +89,17 @@ class LiquidationEvent:
         }
 
 
+@dataclass
+class BlockEventBatch:
+    """Events extracted from a contiguous range of blocks, in block order."""
+    prices: List[PriceEvent] = field(default_factory=list)
+    liquidations: List[LiquidationEvent] = field(default_factory=list)
+    orders: List[OrderActivity] = field(default_factory=list)
+    blocks: int = 0           # Blocks in the range
+    blocks_skipped: int = 0   # Blocks dropped by the pre-filter (no relevant actions)
+    metrics: Optional[ExtractorMetrics] = None  # Set when extracted in a worker
+
+
 class BlockActionExtractor:
     """
     Extracts relevant actions from Hyperliquid node blocks.
@@ -117,18 +133,46 @@ class BlockActionExtractor:
         self._extract_cancels = extract_cancels
         self._focus_coins = set(focus_coins) if focus_coins else None
 
+        # Quoted action type strings a block must contain to be parsed
+        markers = ['"SetGlobalAction"', '"forceOrder"']
+        if extract_orders:
+            markers.append('"order"')
+        if extract_cancels:
+            markers.extend(['"cancel"', '"cancelByCloid"'])
+        self._markers = tuple(markers)
+        self._byte_markers = tuple(m.encode() for m in markers)
+
         # Metrics
         self.metrics = ExtractorMetrics()
 
+    def may_contain_actions(self, block_json: Union[str, bytes]) -> bool:
+        """Byte-level pre-filter: False only if the block has no extracted action type."""
+        markers = self._byte_markers if isinstance(block_json, bytes) else self._markers
+        return any(marker in block_json for marker in markers)
+
+    def extract_batch(self, blocks: Sequence[Union[str, bytes]]) -> BlockEventBatch:
+        """Extract the events of a range of raw blocks, skipping irrelevant ones unparsed."""
+        batch = BlockEventBatch(blocks=len(blocks))
+        for block_json in blocks:
+            if not self.may_contain_actions(block_json):
+                batch.blocks_skipped += 1
+                continue
+            prices, liquidations, orders = self.extract_from_block(block_json)
+            batch.prices.extend(prices)
+            batch.liquidations.extend(liquidations)
+            batch.orders.extend(orders)
+        self.metrics.blocks_skipped += batch.blocks_skipped
+        return batch
+
     def extract_from_block(
         self,
-        block_json: str
+        block_json: Union[str, bytes]
     ) -> Tuple[List[PriceEvent], List[LiquidationEvent], List[OrderActivity]]:
         """
         Extract all relevant actions from a block.
 
         Args:
-            block_json: Raw JSON string of the block
+            block_json: Raw JSON string (or bytes) of the block
 
         Returns:
             Tuple of (price_events, liquidation_events, order_activities)
@@ -418,5 +462,28 @@ class BlockActionExtractor:
             'price_events': self.metrics.price_events,
             'liquidation_events': self.metrics.liquidation_events,
             'avg_extraction_ms': round(self.metrics.avg_extraction_time_ms, 3),
+            'blocks_skipped': self.metrics.blocks_skipped,
             'errors': self.metrics.extraction_errors,
         }
+
+
+def extract_block_batch(
+    blocks: Sequence[bytes],
+    extract_orders: bool = True,
+    extract_cancels: bool = False,
+    focus_coins: Optional[List[str]] = None,
+) -> BlockEventBatch:
+    """
+    Extract a range of blocks with a fresh extractor (worker-process entry point).
+
+    The extractor's metrics travel back on the batch so the caller can merge
+    them into its own.
+    """
+    extractor = BlockActionExtractor(
+        extract_orders=extract_orders,
+        extract_cancels=extract_cancels,
+        focus_coins=focus_coins,
+    )
+    batch = extractor.extract_batch(blocks)
+    batch.metrics = extractor.metrics
+    return batch
@@ -58,9 +58,15 @@ class NodeAdapterConfig:
     min_position_value_usd: float = 1000.0
 
     # ========== Performance Configuration ==========
-    # Number of JSON parse workers (0 = single-threaded)
+    # Number of JSON parse worker processes (0 = single-threaded, off the event loop)
     json_parse_workers: int = 0
 
+    # Bytes read from a replica_cmds file per chunk
+    read_chunk_bytes: int = 4 * 1024 * 1024
+
+    # Blocks per decode batch (one worker task / one event batch each)
+    block_batch_size: int = 256
+
     # Enable backpressure handling
     enable_backpressure: bool = True
 
@@ -100,6 +106,11 @@ class NodeAdapterConfig:
     # Hours of historical data to catch up (if skip_catchup=False)
     catchup_hours: int = 6
 
+    # Directory for node_fills sidecar indexes (liquidation offsets and the
+    # processed offset per hourly file). Lives next to the node data, outside
+    # the working tree; empty = keep indexes in memory only
+    fills_index_path: str = "~/hl/node_fills_index"
+
 
 @dataclass
 class WindowsConnectorConfig:
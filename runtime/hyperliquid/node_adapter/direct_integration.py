@@ -12,6 +12,12 @@ Data sources:
 - replica_cmds: Block data with SetGlobalAction (prices), orders
 - node_fills: User fills including liquidations (has "liquidation" field with liquidatedUser)
 
+Block pipeline: replica_cmds files are read in large chunks off the event
+loop (complete lines only), split into block ranges, pre-filtered and
+decoded either in one executor thread or in a process pool
+(config.json_parse_workers), and delivered in block order as one
+BlockEventBatch per range (on_batch) or as individual events.
+
 Note: node_fills format changed - liquidations now identified by "liquidation" field,
 not trade_dir_override. Example:
 {"coin":"ADA","px":"0.31441","sz":"1948.0","side":"B",...,"liquidation":{"liquidatedUser":"0x...","markPx":"0.31447","method":"market"}}
@@ -21,16 +27,29 @@ import asyncio
 import json
 import logging
 import os
+import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Callable, Dict, Optional
-
-from .action_extractor import BlockActionExtractor, PriceEvent, LiquidationEvent, OrderActivity
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .action_extractor import (
+    BlockActionExtractor,
+    BlockEventBatch,
+    PriceEvent,
+    LiquidationEvent,
+    OrderActivity,
+    extract_block_batch,
+)
 from .config import NodeAdapterConfig
+from .fills_index import FillsFileIndex, sidecar_path
 from .sync_monitor import SyncMonitor
 
 logger = logging.getLogger(__name__)
 
+# Seconds between sidecar saves of the tailed fills file's index
+INDEX_SAVE_INTERVAL = 5.0
+
 
 class TradeFileReader:
     """
@@ -52,15 +71,20 @@ class TradeFileReader:
             "method": "market"
         }
     }]
+
+    Each hourly file has a FillsFileIndex: only lines containing a
+    "liquidation" field are decoded, and with an index_dir the processed
+    offset survives restarts (catch-up resumes where it stopped).
     """
 
-    def __init__(self, data_path: Path, catchup_hours: int = 6):
+    def __init__(self, data_path: Path, catchup_hours: int = 6, index_dir: Optional[Path] = None):
         """
         Initialize trade file reader.
 
         Args:
             data_path: Path to ~/hl/data
             catchup_hours: Number of past hours to read on startup for catch-up
+            index_dir: Directory for persistent fills indexes (None = in memory only)
         """
         self._data_path = data_path
         self._current_hour_file: Optional[Path] = None
@@ -68,9 +92,19 @@ class TradeFileReader:
         self._liquidations_found = 0
         self._processed_files: set = set()  # Track files we've fully read
         self._catchup_hours = catchup_hours
+        self._index_dir = index_dir
+        self._indexes: Dict[Path, FillsFileIndex] = {}
+        self._index_saved_at = 0.0
+        # (index, end offset) read but not yet confirmed delivered
+        self._undelivered: List[Tuple[FillsFileIndex, int]] = []
 
     def read_new_liquidations(self) -> list[LiquidationEvent]:
-        """Read new liquidation fills from node_fills."""
+        """Read new liquidation fills from node_fills.
+
+        The persisted processed offsets only advance in mark_delivered(),
+        so call it once the returned liquidations have been handed on; a
+        crash before that re-delivers them after restart.
+        """
         liquidations = []
 
         # Use node_fills instead of node_trades - fills have liquidation info
@@ -101,7 +135,7 @@ class TradeFileReader:
             catchup_files = hour_files[-self._catchup_hours:]
             for f in catchup_files[:-1]:  # All except last (which we'll tail)
                 if f not in self._processed_files:
-                    liqs = self._read_file_liquidations(f, from_position=0)
+                    liqs = self._read_file_liquidations(f, from_position=self._get_index(f).processed_to)
                     liquidations.extend(liqs)
                     self._processed_files.add(f)
                     logger.info(f"Catch-up: {f.name} -> {len(liqs)} liquidations")
@@ -112,8 +146,12 @@ class TradeFileReader:
         # Check if file changed
         if latest_hour != self._current_hour_file:
             logger.debug(f"New trade file: {latest_hour}")
+            previous = self._indexes.pop(self._current_hour_file, None)
+            if previous:
+                previous.save()
             self._current_hour_file = latest_hour
-            self._file_position = 0
+            # Resume after what an earlier run already delivered
+            self._file_position = self._get_index(latest_hour).processed_to
 
         # Read new lines from latest file
         liqs = self._read_file_liquidations(latest_hour, from_position=self._file_position)
@@ -121,50 +159,71 @@ class TradeFileReader:
 
         return liquidations
 
+    def _get_index(self, file_path: Path) -> FillsFileIndex:
+        index = self._indexes.get(file_path)
+        if index is None:
+            index = FillsFileIndex.load(file_path, sidecar_path(self._index_dir, file_path))
+            self._indexes[file_path] = index
+        return index
+
     def _read_file_liquidations(self, file_path: Path, from_position: int = 0) -> list[LiquidationEvent]:
-        """Read liquidations from a node_fills file."""
+        """Read liquidations from complete lines of a node_fills file after from_position."""
         liquidations = []
 
         try:
-            file_size = file_path.stat().st_size
-            if file_size <= from_position:
+            index = self._get_index(file_path)
+            if file_path.stat().st_size <= from_position:
                 return liquidations
 
-            with open(file_path, 'r') as f:
-                f.seek(from_position)
+            end = index.update()
+            offsets = index.liquidation_offsets(from_position, end)
 
-                for line in f:
-                    line = line.strip()
-                    if not line:
+            for line in index.read_lines(offsets):
+                try:
+                    # node_fills format: [address, fill_data]
+                    fill_entry = json.loads(line)
+                    if not isinstance(fill_entry, list) or len(fill_entry) < 2:
                         continue
 
-                    try:
-                        # node_fills format: [address, fill_data]
-                        fill_entry = json.loads(line)
-                        if not isinstance(fill_entry, list) or len(fill_entry) < 2:
-                            continue
-
-                        address = fill_entry[0]
-                        fill = fill_entry[1]
-
-                        # Only extract liquidations (has "liquidation" field)
-                        if fill.get('liquidation'):
-                            liq = self._parse_liquidation(fill, address)
-                            if liq:
-                                liquidations.append(liq)
-                                self._liquidations_found += 1
-                    except json.JSONDecodeError:
-                        continue
+                    address = fill_entry[0]
+                    fill = fill_entry[1]
+
+                    # Only extract liquidations (has "liquidation" field)
+                    if isinstance(fill, dict) and fill.get('liquidation'):
+                        liq = self._parse_liquidation(fill, address)
+                        if liq:
+                            liquidations.append(liq)
+                            self._liquidations_found += 1
+                except json.JSONDecodeError:
+                    continue
 
-                # Update position only for the tailed file
-                if file_path == self._current_hour_file:
-                    self._file_position = f.tell()
+            # Update position only for the tailed file
+            if file_path == self._current_hour_file:
+                self._file_position = end
+            if end > index.processed_to:
+                self._undelivered.append((index, end))
+            if file_path != self._current_hour_file:
+                # Catch-up files are not read again
+                self._indexes.pop(file_path, None)
 
         except Exception as e:
             logger.error(f"Error reading fills file {file_path}: {e}")
 
         return liquidations
 
+    def mark_delivered(self) -> None:
+        """Advance processed offsets past everything read so far and persist them."""
+        undelivered, self._undelivered = self._undelivered, []
+        now = time.time()
+        for index, end in undelivered:
+            if end <= index.processed_to:
+                continue
+            index.processed_to = end
+            # The tailed file grows every poll: persist it periodically
+            if index.path != self._current_hour_file or now - self._index_saved_at >= INDEX_SAVE_INTERVAL:
+                index.save()
+                self._index_saved_at = now
+
     def _parse_liquidation(self, fill: Dict, address: str = '') -> Optional[LiquidationEvent]:
         """Parse a liquidation fill into LiquidationEvent.
 
@@ -217,7 +276,6 @@ class TradeFileReader:
     def _parse_timestamp(self, time_str: str) -> float:
         """Parse ISO timestamp to Unix seconds."""
         if not time_str:
-            import time
             return time.time()
 
         try:
@@ -226,7 +284,6 @@ class TradeFileReader:
             dt = datetime.fromisoformat(clean_str)
             return dt.timestamp()
         except Exception:
-            import time
             return time.time()
 
     @property
@@ -247,20 +304,25 @@ class DirectNodeIntegration:
         on_liquidation: Optional[Callable[[LiquidationEvent], None]] = None,
         on_order_activity: Optional[Callable[[OrderActivity], None]] = None,
         config: Optional[NodeAdapterConfig] = None,
+        on_batch: Optional[Callable[[BlockEventBatch], None]] = None,
     ):
         """
         Initialize direct integration.
 
         Args:
             on_price: Callback for price events (SetGlobalAction)
-            on_liquidation: Callback for liquidation events (forceOrder)
+            on_liquidation: Callback for liquidation events (forceOrder and node_fills)
             on_order_activity: Callback for order activity
             config: Optional configuration override
+            on_batch: Callback for the block events of one block range. When
+                set, replica_cmds events go here instead of the per-event
+                callbacks (node_fills liquidations still use on_liquidation)
         """
         self._config = config or NodeAdapterConfig()
         self._on_price = on_price
         self._on_liquidation = on_liquidation
         self._on_order_activity = on_order_activity
+        self._on_batch = on_batch
 
         # Expand ~ in paths
         self._data_path = Path(os.path.expanduser(self._config.node_data_path))
@@ -273,7 +335,15 @@ class DirectNodeIntegration:
             focus_coins=self._config.focus_coins or None,
         )
         self._sync_monitor = SyncMonitor(self._state_path)
-        self._trade_reader = TradeFileReader(self._data_path)
+        self._trade_reader = TradeFileReader(
+            self._data_path,
+            catchup_hours=self._config.catchup_hours,
+            index_dir=(Path(os.path.expanduser(self._config.fills_index_path))
+                       if self._config.fills_index_path else None),
+        )
+
+        # Decode worker processes (None = decode in one executor thread)
+        self._decode_pool: Optional[ProcessPoolExecutor] = None
 
         # State
         self._running = False
@@ -294,6 +364,8 @@ class DirectNodeIntegration:
 
         self._running = True
         logger.info(f"Starting direct node integration from {self._data_path}")
+        if self._config.json_parse_workers > 0:
+            self._decode_pool = ProcessPoolExecutor(max_workers=self._config.json_parse_workers)
 
         try:
             await self._run_loop()
@@ -304,6 +376,9 @@ class DirectNodeIntegration:
             raise
         finally:
             self._running = False
+            if self._decode_pool:
+                self._decode_pool.shutdown(wait=False, cancel_futures=True)
+                self._decode_pool = None
 
     async def stop(self) -> None:
         """Stop the integration."""
@@ -320,6 +395,7 @@ class DirectNodeIntegration:
             'prices_emitted': self._prices_emitted,
             'liquidations_emitted': self._liquidations_emitted,
             'liquidations_from_trades': self._trade_reader.liquidations_found,
+            'blocks_skipped': self._extractor.metrics.blocks_skipped,
             'current_session': str(self._current_session) if self._current_session else None,
             'current_file': str(self._current_file) if self._current_file else None,
         }
@@ -414,7 +490,9 @@ class DirectNodeIntegration:
         if not self._on_liquidation:
             return
 
-        liquidations = self._trade_reader.read_new_liquidations()
+        # Index scans and catch-up reads are blocking file I/O
+        loop = asyncio.get_running_loop()
+        liquidations = await loop.run_in_executor(None, self._trade_reader.read_new_liquidations)
 
         for liq in liquidations:
             try:
@@ -423,41 +501,89 @@ class DirectNodeIntegration:
             except Exception as e:
                 logger.error(f"Error in liquidation callback: {e}")
 
+        # Persist progress only after delivery (at-least-once across restarts)
+        await loop.run_in_executor(None, self._trade_reader.mark_delivered)
+
     async def _process_file(self) -> None:
-        """Process new lines from current block file."""
+        """Process new complete lines from current block file, chunk by chunk."""
         if not self._current_file or not self._current_file.exists():
             return
 
+        loop = asyncio.get_running_loop()
         try:
-            file_size = self._current_file.stat().st_size
-            if file_size <= self._file_position:
-                return  # No new data
-
-            with open(self._current_file, 'r') as f:
-                f.seek(self._file_position)
-
-                for line in f:
-                    if not line.strip():
-                        continue
-
-                    # Pass raw JSON string to extractor
-                    await self._process_block(line)
-
-                self._file_position = f.tell()
+            while self._running:
+                file_size = self._current_file.stat().st_size
+                if file_size <= self._file_position:
+                    return  # No new data
+
+                # Blocking read off the event loop
+                blocks, end = await loop.run_in_executor(
+                    None, read_block_lines, self._current_file,
+                    self._file_position, self._config.read_chunk_bytes,
+                )
+                if end == self._file_position:
+                    return  # Only a partial line so far
+                self._file_position = end
+
+                for batch in await self._decode_blocks(blocks):
+                    self._emit_batch(batch)
 
         except Exception as e:
             logger.error(f"Error processing file: {e}")
 
-    async def _process_block(self, block_json: str) -> None:
-        """Process a single block and emit events."""
-        self._blocks_processed += 1
+    async def _decode_blocks(self, blocks: List[bytes]) -> List[BlockEventBatch]:
+        """Decode blocks into per-range event batches (in block order)."""
+        size = max(1, self._config.block_batch_size)
+        ranges = [blocks[i:i + size] for i in range(0, len(blocks), size)]
+        loop = asyncio.get_running_loop()
 
-        # Extract events (extractor expects JSON string)
-        prices, liquidations, orders = self._extractor.extract_from_block(block_json)
+        if self._decode_pool is None:
+            return await loop.run_in_executor(
+                None, lambda: [self._extractor.extract_batch(r) for r in ranges]
+            )
 
+        batches = await asyncio.gather(*(
+            loop.run_in_executor(
+                self._decode_pool, extract_block_batch, r,
+                self._config.extract_orders, self._config.extract_cancels,
+                self._config.focus_coins or None,
+            )
+            for r in ranges
+        ))
+        for batch in batches:
+            self._extractor.metrics.merge(batch.metrics)
+            batch.metrics = None
+        return batches
+
+    def _emit_batch(self, batch: BlockEventBatch) -> None:
+        """Deliver the events of one block range."""
+        interval = self._config.log_block_interval
+        logged_before = self._blocks_processed // interval if interval > 0 else 0
+        self._blocks_processed += batch.blocks
+
+        if self._on_batch:
+            try:
+                self._on_batch(batch)
+                self._prices_emitted += len(batch.prices)
+                self._liquidations_emitted += len(batch.liquidations)
+            except Exception as e:
+                logger.error(f"Error in batch callback: {e}")
+        else:
+            self._emit_events(batch)
+
+        # Log progress periodically
+        if interval > 0 and self._blocks_processed // interval > logged_before:
+            logger.info(
+                f"Processed {self._blocks_processed} blocks, "
+                f"{self._prices_emitted} prices, "
+                f"{self._liquidations_emitted} liquidations"
+            )
+
+    def _emit_events(self, batch: BlockEventBatch) -> None:
+        """Deliver a batch through the per-event callbacks."""
         # Emit price events
         if self._on_price:
-            for price in prices:
+            for price in batch.prices:
                 try:
                     self._on_price(price)
                     self._prices_emitted += 1
@@ -466,7 +592,7 @@ class DirectNodeIntegration:
 
         # Emit liquidation events
         if self._on_liquidation:
-            for liq in liquidations:
+            for liq in batch.liquidations:
                 try:
                     self._on_liquidation(liq)
                     self._liquidations_emitted += 1
@@ -475,19 +601,36 @@ class DirectNodeIntegration:
 
         # Emit order activity
         if self._on_order_activity:
-            for order in orders:
+            for order in batch.orders:
                 try:
                     self._on_order_activity(order)
                 except Exception as e:
                     logger.error(f"Error in order callback: {e}")
 
-        # Log progress periodically
-        if self._config.log_block_interval > 0 and self._blocks_processed % self._config.log_block_interval == 0:
-            logger.info(
-                f"Processed {self._blocks_processed} blocks, "
-                f"{self._prices_emitted} prices, "
-                f"{self._liquidations_emitted} liquidations"
-            )
+
+def read_block_lines(path: Path, position: int, chunk_bytes: int) -> Tuple[List[bytes], int]:
+    """
+    Read complete lines from position, about chunk_bytes at a time.
+
+    Returns (non-empty stripped lines, position after the last newline). A
+    trailing partial line is left for the next read.
+    """
+    with open(path, 'rb') as f:
+        f.seek(position)
+        data = f.read(chunk_bytes)
+        cut = data.rfind(b'\n')
+        # A single line longer than the chunk: keep reading until it ends
+        while cut < 0 and len(data) >= chunk_bytes:
+            more = f.read(chunk_bytes)
+            if not more:
+                break
+            data += more
+            cut = data.rfind(b'\n')
+
+    if cut < 0:
+        return [], position
+    lines = [line.strip() for line in data[:cut].split(b'\n')]
+    return [line for line in lines if line], position + cut + 1
 
 
 async def run_standalone(
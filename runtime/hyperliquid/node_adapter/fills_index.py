@@ -0,0 +1,165 @@
+"""
+Fills Index
+
+Sidecar index for node_fills/hourly files, so liquidation catch-up does not
+json-decode every fill.
+
+Per hourly file the index records:
+- indexed_to: end of the last complete line scanned
+- processed_to: end of the last line whose liquidations were delivered
+- checkpoints: (byte offset, fill time ms) of a line start about every
+  CHECKPOINT_BYTES, for timestamp -> offset lookups
+- liquidations: start offsets of lines containing a "liquidation" field
+
+Scanning is a byte search for the quoted field name; only matching lines are
+decoded later (a match in another field only costs one extra decode). The
+index is extended incrementally as the node appends to the file, and saved
+as JSON under the index directory (<dir>/<date>/<hour>.json) so a restart
+resumes from processed_to instead of re-reading the hour.
+"""
+
+import json
+import logging
+import re
+from bisect import bisect_left, bisect_right
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Distance between timestamp checkpoints
+CHECKPOINT_BYTES = 1024 * 1024
+
+# Bytes scanned per read while extending an index
+SCAN_CHUNK_BYTES = 8 * 1024 * 1024
+
+_LIQUIDATION_MARKER = b'"liquidation"'
+_TIME_PATTERN = re.compile(rb'"time"\s*:\s*(\d+)')
+
+
+class FillsFileIndex:
+    """Offsets of one hourly fills file (see module docstring)."""
+
+    def __init__(self, path: Path, sidecar: Optional[Path] = None):
+        self.path = path
+        self.sidecar = sidecar
+        self.indexed_to = 0
+        self.processed_to = 0
+        self.checkpoints: List[Tuple[int, int]] = []
+        self.liquidations: List[int] = []
+
+    @classmethod
+    def load(cls, path: Path, sidecar: Optional[Path] = None) -> 'FillsFileIndex':
+        """Load the saved index of path (a fresh index if missing, stale or corrupt)."""
+        index = cls(path, sidecar)
+        if sidecar is None or not sidecar.exists():
+            return index
+        try:
+            with open(sidecar, 'r') as f:
+                data = json.load(f)
+            indexed_to = int(data['indexed_to'])
+            # File replaced or truncated since the index was written
+            if indexed_to > path.stat().st_size:
+                return index
+            index.indexed_to = indexed_to
+            index.processed_to = min(int(data['processed_to']), indexed_to)
+            index.checkpoints = [(int(o), int(t)) for o, t in data['checkpoints']]
+            index.liquidations = [int(o) for o in data['liquidations']]
+        except Exception as e:
+            logger.warning(f"Ignoring fills index {sidecar}: {e}")
+            return cls(path, sidecar)
+        return index
+
+    def save(self) -> None:
+        if self.sidecar is None:
+            return
+        try:
+            self.sidecar.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.sidecar.with_suffix('.tmp')
+            with open(tmp, 'w') as f:
+                json.dump({
+                    'indexed_to': self.indexed_to,
+                    'processed_to': self.processed_to,
+                    'checkpoints': self.checkpoints,
+                    'liquidations': self.liquidations,
+                }, f)
+            tmp.replace(self.sidecar)
+        except Exception as e:
+            logger.error(f"Failed to save fills index {self.sidecar}: {e}")
+
+    def update(self) -> int:
+        """Index complete lines appended since the last update; return new indexed_to."""
+        with open(self.path, 'rb') as f:
+            f.seek(self.indexed_to)
+            while True:
+                data = f.read(SCAN_CHUNK_BYTES)
+                end = data.rfind(b'\n') + 1
+                if end == 0:
+                    if len(data) < SCAN_CHUNK_BYTES:
+                        break  # Partial line (or nothing) at the end
+                    # A line longer than a chunk: read the rest of it
+                    rest = f.readline()
+                    if not rest.endswith(b'\n'):
+                        break
+                    data += rest
+                    end = len(data)
+                self._scan(data[:end], self.indexed_to)
+                self.indexed_to += end
+                f.seek(self.indexed_to)
+        return self.indexed_to
+
+    def _scan(self, data: bytes, base: int) -> None:
+        """Record liquidation lines and checkpoints of complete lines data at base."""
+        pos = data.find(_LIQUIDATION_MARKER)
+        while pos >= 0:
+            line_start = data.rfind(b'\n', 0, pos) + 1
+            self.liquidations.append(base + line_start)
+            line_end = data.find(b'\n', pos)
+            pos = data.find(_LIQUIDATION_MARKER, line_end)
+
+        next_checkpoint = self.checkpoints[-1][0] + CHECKPOINT_BYTES if self.checkpoints else 0
+        while next_checkpoint < base + len(data):
+            local = max(0, next_checkpoint - base)
+            if local > 0:
+                # Start of the next line
+                local = data.find(b'\n', local - 1) + 1
+                if local == 0 or local >= len(data):
+                    break
+            line_end = data.find(b'\n', local)
+            match = _TIME_PATTERN.search(data, local, line_end)
+            if match:
+                self.checkpoints.append((base + local, int(match.group(1))))
+                next_checkpoint = base + local + CHECKPOINT_BYTES
+            else:
+                next_checkpoint = base + line_end + 1
+
+    def liquidation_offsets(self, start: int, end: Optional[int] = None) -> List[int]:
+        """Start offsets of liquidation lines in [start, end)."""
+        end = self.indexed_to if end is None else end
+        return self.liquidations[bisect_left(self.liquidations, start):bisect_left(self.liquidations, end)]
+
+    def offset_at(self, time_ms: int) -> int:
+        """
+        Offset to start reading to see every fill at or after time_ms.
+
+        This is the last checkpoint with an earlier time, so a few fills
+        before time_ms may follow (fill times are near-monotonic in a file).
+        """
+        i = bisect_right([t for _, t in self.checkpoints], time_ms - 1)
+        return self.checkpoints[i - 1][0] if i else 0
+
+    def read_lines(self, offsets: List[int]) -> List[bytes]:
+        """Read the lines starting at offsets."""
+        lines = []
+        with open(self.path, 'rb') as f:
+            for offset in offsets:
+                f.seek(offset)
+                lines.append(f.readline())
+        return lines
+
+
+def sidecar_path(index_dir: Optional[Path], fills_file: Path) -> Optional[Path]:
+    """Sidecar of an hourly fills file (<index_dir>/<date>/<hour>.json)."""
+    if index_dir is None:
+        return None
+    return index_dir / fills_file.parent.name / f"{fills_file.name}.json"
@@ -0,0 +1,175 @@
+"""
+Liquidation Index
+
+Per-coin, per-side positions sorted by liquidation price, for oracle-tick
+tier updates and coin-level proximity aggregates.
+
+Each side is ordered by distance key d, closest to liquidation first as
+price moves against it:
+- LONG:  d = -liquidation_price  (liquidated when price falls)
+- SHORT: d = +liquidation_price  (liquidated when price rises)
+
+Proximity is monotone in d, so "within threshold of liquidation" is always a
+prefix of a side. Prefix sums of size, value and liquidation price give the
+LiquidationProximity aggregates of that prefix without visiting positions.
+
+A tier boundary t sits at d = -p(1 - t) (LONG) or d = p(1 + t) (SHORT). A
+position's tier can only change between prices p_old and p_new if its d lies
+between the boundary at p_old and at p_new, so a tick only visits those
+positions (plus positions added since the last tick).
+
+Only positions with liquidation_price > 0 are indexed; the others have
+infinite proximity and are never at risk.
+"""
+
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# Relative widening of tier-boundary bands, so positions whose float
+# proximity lands on the other side of a boundary than the d comparison
+# are still visited (and then classified exactly by the caller)
+_BAND_MARGIN = 1e-9
+
+
+class _SideIndex:
+    """Positions of one coin and side, sorted by distance key."""
+
+    __slots__ = ('sign', 'members', 'dirty', 'keys', 'positions',
+                 'size_sums', 'value_sums', 'liq_sums')
+
+    def __init__(self, sign: float):
+        # -1.0 for LONG, +1.0 for SHORT: d = sign * liquidation_price
+        self.sign = sign
+        self.members: Dict[str, object] = {}  # wallet -> PositionCache
+        self.dirty = False
+        self.keys: List[float] = []
+        self.positions: List[object] = []
+        self.size_sums: List[float] = [0.0]
+        self.value_sums: List[float] = [0.0]
+        self.liq_sums: List[float] = [0.0]
+
+    def ensure_sorted(self) -> None:
+        if not self.dirty:
+            return
+        sign = self.sign
+        positions = sorted(self.members.values(), key=lambda pos: sign * pos.liquidation_price)
+        self.positions = positions
+        self.keys = [sign * pos.liquidation_price for pos in positions]
+        self.size_sums = list(accumulate((abs(pos.size) for pos in positions), initial=0.0))
+        self.value_sums = list(accumulate((pos.position_value for pos in positions), initial=0.0))
+        self.liq_sums = list(accumulate((pos.liquidation_price for pos in positions), initial=0.0))
+        self.dirty = False
+
+    def band(self, low: float, high: float) -> List[object]:
+        """Positions with distance key in [low, high] (widened by _BAND_MARGIN)."""
+        margin = _BAND_MARGIN * max(abs(low), abs(high))
+        keys = self.keys
+        return self.positions[bisect_left(keys, low - margin):bisect_right(keys, high + margin)]
+
+
+class CoinLiquidationIndex:
+    """
+    Sorted LONG/SHORT liquidation prices of one coin's cached positions.
+
+    The index also remembers the price at which the tiers of its positions
+    were last evaluated, and which positions were added since then.
+    """
+
+    __slots__ = ('long', 'short', 'price', 'pending')
+
+    def __init__(self):
+        self.long = _SideIndex(-1.0)
+        self.short = _SideIndex(1.0)
+        # Price the indexed tiers are consistent with (None = unknown)
+        self.price: Optional[float] = None
+        # wallet -> position added/replaced since the last tick
+        self.pending: Dict[str, object] = {}
+
+    def __len__(self) -> int:
+        return len(self.long.members) + len(self.short.members)
+
+    def add(self, cached) -> None:
+        """Index cached (replacing any earlier position of its wallet)."""
+        self.discard(cached.wallet)
+        if cached.liquidation_price <= 0:
+            return
+        side = self.long if cached.side == "LONG" else self.short
+        side.members[cached.wallet] = cached
+        side.dirty = True
+        self.pending[cached.wallet] = cached
+
+    def discard(self, wallet: str) -> None:
+        for side in (self.long, self.short):
+            if side.members.pop(wallet, None) is not None:
+                side.dirty = True
+        self.pending.pop(wallet, None)
+
+    def reprice(self, price: float, thresholds: Sequence[float]) -> List[object]:
+        """
+        Move the index to price; return the positions whose tier may differ.
+
+        thresholds are the proximity tier boundaries. The caller re-evaluates
+        the returned positions exactly; all others keep their tier.
+        """
+        old_price = self.price
+        self.price = price if price > 0 else None
+
+        if old_price is None or price <= 0:
+            self.pending.clear()
+            return list(self.long.members.values()) + list(self.short.members.values())
+
+        candidates = list(self.pending.values())
+        self.pending.clear()
+        if price == old_price:
+            return candidates
+
+        for side in (self.long, self.short):
+            if not side.members:
+                continue
+            side.ensure_sorted()
+            for t in thresholds:
+                # Boundary in d: sign * p * (1 + sign * t)
+                d_old = side.sign * old_price * (1 + side.sign * t)
+                d_new = side.sign * price * (1 + side.sign * t)
+                candidates.extend(side.band(min(d_old, d_new), max(d_old, d_new)))
+        return candidates
+
+    def at_risk(self, side_name: str, price: float, threshold: float) -> Tuple[int, float, float, float, Optional[float]]:
+        """
+        Aggregates of one side's positions with proximity <= threshold.
+
+        Returns (count, size, value, distance_sum, closest_liquidation), where
+        closest_liquidation is the at-risk liquidation price farthest from
+        price (min for LONG, max for SHORT), or None when nothing is at risk.
+        """
+        side = self.long if side_name == "LONG" else self.short
+        if not side.members:
+            return 0, 0.0, 0.0, 0.0, None
+        side.ensure_sorted()
+
+        if side_name == "LONG":
+            count = bisect_left(
+                side.positions, True,
+                key=lambda pos: (price - pos.liquidation_price) / price > threshold,
+            )
+        else:
+            count = bisect_left(
+                side.positions, True,
+                key=lambda pos: (pos.liquidation_price - price) / price > threshold,
+            )
+        if count == 0:
+            return 0, 0.0, 0.0, 0.0, None
+
+        liq_sum = side.liq_sums[count]
+        distance_sum = (
+            (count * price - liq_sum) / price if side_name == "LONG"
+            else (liq_sum - count * price) / price
+        )
+        return (
+            count,
+            side.size_sums[count],
+            side.value_sums[count],
+            distance_sum,
+            side.positions[count - 1].liquidation_price,
+        )
@@ -58,6 +58,9 @@ class ExtractorMetrics:
     # Errors
     extraction_errors: int = 0
 
+    # Blocks dropped by the byte-level pre-filter (never parsed)
+    blocks_skipped: int = 0
+
     # Timing
     total_extraction_time_ms: float = 0.0
     extractions_count: int = 0
@@ -66,6 +69,11 @@ class ExtractorMetrics:
     def avg_extraction_time_ms(self) -> float:
         return self.total_extraction_time_ms / self.extractions_count if self.extractions_count > 0 else 0.0
 
+    def merge(self, other: 'ExtractorMetrics') -> None:
+        """Add the counters of another extractor (e.g. a worker's) to these."""
+        for name in self.__dataclass_fields__:
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+
 
 @dataclass
 class PositionStateMetrics:
@@ -89,6 +97,11 @@ class PositionStateMetrics:
     last_discovery_scan_time: float = 0.0
     last_discovery_scan_duration_ms: float = 0.0
 
+    # State file decoding (abci_state.rmp)
+    state_reloads: int = 0
+    last_state_decode_ms: float = 0.0
+    state_positions_decoded: int = 0
+
     # Proximity alerts
     proximity_alerts_emitted: int = 0
     tier_promotions: int = 0
@@ -19,7 +19,7 @@ from collections import defaultdict
 from dataclasses import dataclass
 from typing import Optional, Dict, Callable, Awaitable, List, Tuple
 
-from .action_extractor import PriceEvent, LiquidationEvent, OrderActivity
+from .action_extractor import BlockEventBatch, PriceEvent, LiquidationEvent, OrderActivity
 from runtime.hyperliquid.types import LiquidationProximity
 from memory.candidate_zones import CandidateZoneManager, CandidateZoneConfig
 
@@ -423,6 +423,49 @@ class ObservationBridge:
         dropping data due to node/Binance time domain mismatch.
         Original event.timestamp preserved in payload for data accuracy.
         """
+        if not self._forward_price(event):
+            return
+
+        # Update position manager with new prices (batched)
+        # We update every price event - PSM handles the proximity calculation
+        if self._psm and self._prices_forwarded % 50 == 0:
+            # Batch update every ~50 prices to reduce overhead
+            try:
+                self._psm.update_prices(self._latest_prices)
+            except Exception as e:
+                self._errors += 1
+                logger.error(f"Error forwarding price event: {e}")
+
+    def on_block_batch(self, batch: BlockEventBatch) -> None:
+        """
+        Handle the events of one decoded block range.
+
+        Equivalent to on_price / on_liquidation / on_order_activity for each
+        event (prices, then liquidations, then orders), except that the
+        PositionStateManager sees at most one price update per batch and one
+        order-activity notification per (wallet, coin).
+        """
+        before = self._prices_forwarded
+        for event in batch.prices:
+            self._forward_price(event)
+        if self._psm and self._prices_forwarded // 50 > before // 50:
+            try:
+                self._psm.update_prices(self._latest_prices)
+            except Exception as e:
+                self._errors += 1
+                logger.error(f"Error forwarding price event: {e}")
+
+        for event in batch.liquidations:
+            self.on_liquidation(event)
+
+        if self._psm and batch.orders:
+            for wallet, coin in dict.fromkeys((o.wallet, o.coin) for o in batch.orders):
+                asyncio.create_task(self._psm.on_order_activity(wallet, coin))
+        for event in batch.orders:
+            self._forward_order(event)
+
+    def _forward_price(self, event: PriceEvent) -> bool:
+        """Forward a price to M1 and candidate zones; False on error."""
         try:
             # Use wall clock for governance freshness check
             # Node timestamps are from when events occurred on HL network,
@@ -448,21 +491,17 @@ class ObservationBridge:
             prev_price = self._latest_prices.get(event.symbol)
             self._latest_prices[event.symbol] = event.oracle_price
 
-            # Update position manager with new prices (batched)
-            # We update every price event - PSM handles the proximity calculation
-            if self._psm and self._prices_forwarded % 50 == 0:
-                # Batch update every ~50 prices to reduce overhead
-                self._psm.update_prices(self._latest_prices)
-
             # Update candidate zones with price movement
             if self._candidate_zone_manager:
                 self._candidate_zone_manager.update_from_price(
                     event.symbol, event.oracle_price, prev_price
                 )
+            return True
 
         except Exception as e:
             self._errors += 1
             logger.error(f"Error forwarding price event: {e}")
+            return False
 
     def on_liquidation(self, event: LiquidationEvent) -> None:
         """
@@ -534,13 +573,21 @@ class ObservationBridge:
         Filters orders by notional value and forwards large orders (>$10k) to M1.
         Also notifies PositionStateManager for position refresh triggers.
         """
-        try:
-            # Notify position manager for potential position refresh
-            if self._psm:
+        # Notify position manager for potential position refresh
+        if self._psm:
+            try:
                 asyncio.create_task(
                     self._psm.on_order_activity(event.wallet, event.coin)
                 )
+            except Exception as e:
+                self._errors += 1
+                logger.error(f"Error forwarding order event: {e}")
+                return
+        self._forward_order(event)
 
+    def _forward_order(self, event: OrderActivity) -> None:
+        """Forward an order to M1 if its notional passes the filter."""
+        try:
             # Filter by notional value for M1 forwarding
             if event.notional < self._min_order_notional:
                 self._orders_filtered += 1
@@ -815,6 +862,7 @@ def create_integrated_node(
         on_liquidation=bridge.on_liquidation,
         on_order_activity=bridge.on_order_activity,
         config=cfg,
+        on_batch=bridge.on_block_batch,
     )
 
     # Wire proximity provider to governance if position tracking is enabled
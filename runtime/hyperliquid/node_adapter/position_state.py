@@ -23,12 +23,13 @@ from typing import Dict, List, Optional, Set, Tuple, Callable, Awaitable
 from collections import defaultdict
 
 try:
-    import msgpack
+    from .abci_state_reader import AbciPositionSnapshot, PositionRecord, read_position_snapshot
     MSGPACK_AVAILABLE = True
 except ImportError:
     MSGPACK_AVAILABLE = False
 
-from .asset_mapping import get_coin_name, PRIORITY_COINS
+from .asset_mapping import COIN_TO_ASSET_ID, get_coin_name, PRIORITY_COINS
+from .liquidation_index import CoinLiquidationIndex
 from .metrics import PositionStateMetrics
 
 # Import LiquidationProximity for governance compatibility
@@ -59,7 +60,7 @@ class PositionCache:
     margin: float
     side: str                      # "LONG" or "SHORT"
     last_read: float               # When position was last read from state
-    last_proximity: float = 0.0    # Last calculated proximity
+    last_proximity: float = 0.0    # Proximity at the last tier evaluation (may lag the price)
     refresh_tier: RefreshTier = RefreshTier.DISCOVERY
 
     @property
@@ -85,8 +86,18 @@ class PositionCache:
 
         return proximity
 
-    def to_dict(self) -> Dict:
-        """Convert to event dict for emission."""
+    def to_dict(self, current_price: Optional[float] = None) -> Dict:
+        """Convert to event dict for emission.
+
+        Args:
+            current_price: Latest mark/oracle price; proximity_pct is computed
+                from it (last_proximity is only updated for positions
+                re-evaluated at a tier boundary)
+        """
+        if current_price and current_price > 0 and self.liquidation_price > 0:
+            proximity = self.calculate_proximity(current_price)
+        else:
+            proximity = self.last_proximity
         return {
             'timestamp': self.last_read,
             'symbol': self.coin,
@@ -98,7 +109,7 @@ class PositionCache:
             'margin_used': self.margin,
             'position_value': self.position_value,
             'side': self.side,
-            'proximity_pct': self.last_proximity * 100,
+            'proximity_pct': proximity * 100,
             'refresh_tier': self.refresh_tier.value,
             'event_type': 'HL_POSITION',
             'exchange': 'HYPERLIQUID',
@@ -188,6 +199,9 @@ class PositionStateManager:
             RefreshTier.DISCOVERY: set(),
         }
 
+        # Liquidation-price index: coin -> sorted LONG/SHORT positions
+        self._liq_index: Dict[str, CoinLiquidationIndex] = {}
+
         # Latest prices
         self._prices: Dict[str, float] = {}
 
@@ -210,9 +224,12 @@ class PositionStateManager:
         # Asset metadata (populated on first state read)
         self._sz_decimals: Dict[int, int] = {}
         self._oracle_prices: Dict[int, float] = {}
+        # Coin -> asset ID for the assets of the loaded state version
+        self._coin_asset_ids: Dict[str, int] = {}
 
         # State file caching (2026-01-28: Fix for OOM - 968MB file was being reloaded constantly)
-        self._cached_state: Optional[Dict] = None
+        # Only the position extract is kept (see abci_state_reader)
+        self._cached_snapshot: Optional['AbciPositionSnapshot'] = None
         self._cached_state_mtime: float = 0.0
 
     async def start(self) -> None:
@@ -286,9 +303,12 @@ class PositionStateManager:
 
     def update_prices(self, prices: Dict[str, float]) -> List[ProximityAlert]:
         """
-        Update oracle prices and recalculate all proximities.
+        Update oracle prices and re-tier positions that crossed a threshold.
 
-        Called on every SetGlobalAction (~every 3s).
+        Called on every SetGlobalAction (~every 3s). Only positions whose
+        liquidation price lies between a tier boundary at the previous and
+        the new price (or that changed since the last update) are
+        re-evaluated; see liquidation_index.
 
         Args:
             prices: Dict of symbol -> oracle_price
@@ -298,16 +318,22 @@ class PositionStateManager:
         """
         self._prices.update(prices)
         alerts = []
+        thresholds = (
+            self._critical_threshold,
+            self._watchlist_threshold,
+            self._monitored_threshold,
+        )
 
-        for wallet, positions in self._cache.items():
-            for coin, cached in positions.items():
-                price = self._prices.get(coin)
-                if not price:
-                    continue
+        for coin, index in self._liq_index.items():
+            price = self._prices.get(coin)
+            if not price:
+                continue
+
+            for cached in index.reprice(price, thresholds):
+                wallet = cached.wallet
 
                 # Calculate new proximity
                 new_proximity = cached.calculate_proximity(price)
-                old_proximity = cached.last_proximity
                 cached.last_proximity = new_proximity
 
                 # Determine new tier
@@ -353,12 +379,19 @@ class PositionStateManager:
         return alerts
 
     def get_proximity(self, wallet: str, coin: str) -> Optional[float]:
-        """Get cached proximity for a position."""
+        """Get proximity for a position at the latest oracle price."""
         positions = self._cache.get(wallet)
         if not positions:
             return None
         cached = positions.get(coin)
-        return cached.last_proximity if cached else None
+        if not cached:
+            return None
+        price = self._prices.get(coin)
+        return cached.calculate_proximity(price) if price else cached.last_proximity
+
+    def position_to_dict(self, cached: PositionCache) -> Dict:
+        """Event dict of a cached position, proximity at the latest oracle price."""
+        return cached.to_dict(self._prices.get(cached.coin))
 
     def get_position(self, wallet: str, coin: str) -> Optional[PositionCache]:
         """Get cached position."""
@@ -411,6 +444,8 @@ class PositionStateManager:
 
         This aggregates all positions within threshold_pct of liquidation
         and returns a LiquidationProximity object compatible with governance.
+        Each side is a binary search plus prefix-sum lookups in the
+        liquidation index.
 
         Args:
             coin: Coin symbol (e.g., "BTC")
@@ -419,71 +454,36 @@ class PositionStateManager:
         Returns:
             LiquidationProximity or None if no positions at risk
         """
-        positions = self.get_positions_by_coin(coin)
-        if not positions:
+        index = self._liq_index.get(coin)
+        if not index:
+            # No position with a liquidation price can be at risk
             return None
 
         # Get current price from stored prices
         current_price = self._prices.get(coin, 0.0)
         if not current_price:
             # Fallback to entry price if no oracle price
-            for pos in positions:
+            for pos in self.get_positions_by_coin(coin):
                 if pos.entry_price > 0:
                     current_price = pos.entry_price
                     break
-        if not current_price:
+        if not current_price or current_price < 0:
             return None
 
-        # Aggregate by side
-        long_positions = []
-        short_positions = []
         now = time.time()
+        long_count, long_size, long_value, long_dist_sum, long_closest = index.at_risk(
+            "LONG", current_price, threshold_pct
+        )
+        short_count, short_size, short_value, short_dist_sum, short_closest = index.at_risk(
+            "SHORT", current_price, threshold_pct
+        )
 
-        for pos in positions:
-            if pos.liquidation_price <= 0:
-                continue
-
-            # Calculate proximity
-            proximity = pos.calculate_proximity(current_price)
-
-            if proximity > threshold_pct:
-                continue  # Not at risk
-
-            pos_data = {
-                'size': abs(pos.size),
-                'value': pos.position_value,
-                'liq_price': pos.liquidation_price,
-                'distance_pct': proximity,
-            }
-
-            if pos.side == 'LONG':
-                long_positions.append(pos_data)
-            elif pos.side == 'SHORT':
-                short_positions.append(pos_data)
-
-        total_count = len(long_positions) + len(short_positions)
+        total_count = long_count + short_count
         if total_count == 0:
             return None
 
-        # Compute long aggregates
-        long_count = len(long_positions)
-        long_size = sum(p['size'] for p in long_positions)
-        long_value = sum(p['value'] for p in long_positions)
-        long_closest = min((p['liq_price'] for p in long_positions), default=None)
-        long_avg_dist = (
-            sum(p['distance_pct'] for p in long_positions) / long_count
-            if long_count > 0 else 0.0
-        )
-
-        # Compute short aggregates
-        short_count = len(short_positions)
-        short_size = sum(p['size'] for p in short_positions)
-        short_value = sum(p['value'] for p in short_positions)
-        short_closest = max((p['liq_price'] for p in short_positions), default=None)
-        short_avg_dist = (
-            sum(p['distance_pct'] for p in short_positions) / short_count
-            if short_count > 0 else 0.0
-        )
+        long_avg_dist = long_dist_sum / long_count if long_count > 0 else 0.0
+        short_avg_dist = short_dist_sum / short_count if short_count > 0 else 0.0
 
         return LiquidationProximity(
             coin=coin,
@@ -536,13 +536,22 @@ class PositionStateManager:
         """
         # Read position from state
         position_data = await self._read_position_from_state(wallet, coin)
+        return await self._apply_refresh(wallet, coin, position_data)
 
+    async def _apply_refresh(
+        self,
+        wallet: str,
+        coin: str,
+        position_data: Optional[Dict]
+    ) -> Optional[PositionCache]:
+        """Update cache from a re-read position (None = position closed)."""
         if position_data is None:
             # Position closed
             if wallet in self._cache and coin in self._cache[wallet]:
                 old = self._cache[wallet][coin]
                 self._by_tier[old.refresh_tier].discard((wallet, coin))
                 del self._cache[wallet][coin]
+                self._unindex_position(wallet, coin)
 
                 # Clean up empty wallet dict (memory guard)
                 if not self._cache[wallet]:
@@ -572,8 +581,10 @@ class PositionStateManager:
         self.metrics.watchlist_refreshes += 1
         updated = []
 
-        for wallet, coin in list(self._by_tier[RefreshTier.WATCHLIST]):
-            cached = await self.refresh_position(wallet, coin)
+        keys = list(self._by_tier[RefreshTier.WATCHLIST])
+        # One state lookup pass for the whole tier
+        for (wallet, coin), data in zip(keys, await self._read_positions_from_state(keys)):
+            cached = await self._apply_refresh(wallet, coin, data)
             if cached:
                 updated.append(cached)
 
@@ -584,8 +595,9 @@ class PositionStateManager:
         """Refresh all MONITORED tier positions."""
         updated = []
 
-        for wallet, coin in list(self._by_tier[RefreshTier.MONITORED]):
-            cached = await self.refresh_position(wallet, coin)
+        keys = list(self._by_tier[RefreshTier.MONITORED])
+        for (wallet, coin), data in zip(keys, await self._read_positions_from_state(keys)):
+            cached = await self._apply_refresh(wallet, coin, data)
             if cached:
                 updated.append(cached)
 
@@ -654,6 +666,23 @@ class PositionStateManager:
         else:
             return RefreshTier.DISCOVERY
 
+    def _index_position(self, cached: PositionCache) -> None:
+        """Add or replace a position in the liquidation index of its coin."""
+        index = self._liq_index.get(cached.coin)
+        if index is None:
+            index = self._liq_index[cached.coin] = CoinLiquidationIndex()
+        index.add(cached)
+        if not index:
+            del self._liq_index[cached.coin]
+
+    def _unindex_position(self, wallet: str, coin: str) -> None:
+        """Remove a closed position from the liquidation index."""
+        index = self._liq_index.get(coin)
+        if index is not None:
+            index.discard(wallet)
+            if not index:
+                del self._liq_index[coin]
+
     def _tier_priority(self, tier: RefreshTier) -> int:
         """Get numeric priority for tier (higher = more urgent)."""
         return {
@@ -671,7 +700,6 @@ class PositionStateManager:
 
         # Fall back to oracle prices from state file (keyed by asset ID)
         # Need to reverse lookup: coin name -> asset ID
-        from .asset_mapping import COIN_TO_ASSET_ID
         asset_id = COIN_TO_ASSET_ID.get(coin)
         if asset_id is not None and asset_id in self._oracle_prices:
             return self._oracle_prices[asset_id]
@@ -718,11 +746,12 @@ class PositionStateManager:
 
             self._cache[wallet][coin] = cached
             self._by_tier[cached.refresh_tier].add((wallet, coin))
+            self._index_position(cached)
 
             # Emit update
             if self.on_position_update:
                 asyncio.create_task(self._safe_callback(
-                    self.on_position_update, cached.to_dict()
+                    self.on_position_update, self.position_to_dict(cached)
                 ))
 
             return cached
@@ -738,8 +767,7 @@ class PositionStateManager:
         """
         Read a single position from state file.
 
-        TODO: Optimize to seek directly to wallet if possible.
-        For now, does targeted search through state.
+        O(1) lookup in the wallet/asset index of the decoded state version.
         """
         if not MSGPACK_AVAILABLE:
             return None
@@ -755,12 +783,30 @@ class PositionStateManager:
         except Exception:
             return None
 
-    def _get_cached_state(self) -> Optional[Dict]:
-        """Get cached state, reloading only if file changed.
+    async def _read_positions_from_state(
+        self,
+        keys: List[Tuple[str, str]]
+    ) -> List[Optional[Dict]]:
+        """Read several (wallet, coin) positions in one executor call."""
+        if not MSGPACK_AVAILABLE or not keys:
+            return [None] * len(keys)
+
+        try:
+            return await asyncio.get_event_loop().run_in_executor(
+                None,
+                self._read_positions_sync,
+                keys
+            )
+        except Exception:
+            return [None] * len(keys)
+
+    def _get_cached_snapshot(self) -> Optional['AbciPositionSnapshot']:
+        """Get cached position extract, re-decoding only if the file changed.
 
         Memory optimization (2026-01-28): The state file is ~1GB and expands to 5-10GB
         as Python objects. Previously we were reloading it on every position read,
-        causing OOM. Now we cache and only reload when mtime changes.
+        causing OOM. Now we cache and only reload when mtime changes, and the
+        reload streams the file keeping only meta, oracle prices and positions.
         """
         if not os.path.exists(self._state_file):
             return None
@@ -769,87 +815,67 @@ class PositionStateManager:
             current_mtime = os.path.getmtime(self._state_file)
 
             # Only reload if file changed
-            if self._cached_state is None or current_mtime > self._cached_state_mtime:
-                with open(self._state_file, 'rb') as f:
-                    self._cached_state = msgpack.unpack(f, raw=False, strict_map_key=False)
+            if self._cached_snapshot is None or current_mtime > self._cached_state_mtime:
+                snapshot = read_position_snapshot(self._state_file)
+                self._cached_snapshot = snapshot
                 self._cached_state_mtime = current_mtime
 
-            return self._cached_state
+                self._sz_decimals = snapshot.sz_decimals
+                self._oracle_prices = snapshot.oracle_prices()
+                self._coin_asset_ids = {
+                    get_coin_name(asset_id): asset_id
+                    for asset_id in set(snapshot.sz_decimals) | set(snapshot.oracle_pxs_raw)
+                }
+
+                self.metrics.state_reloads += 1
+                self.metrics.last_state_decode_ms = snapshot.decode_ms
+                self.metrics.state_positions_decoded = snapshot.position_count
+
+            return self._cached_snapshot
         except Exception:
             return None
 
     def _read_position_sync(self, target_wallet: str, target_coin: str) -> Optional[Dict]:
         """Synchronously read position from state file."""
-        data = self._get_cached_state()
-        if data is None:
-            return None
-
-        try:
-            exchange = data.get('exchange', {})
-            perp_dexs = exchange.get('perp_dexs', [])
-
-            if not perp_dexs:
-                return None
-
-            main_dex = perp_dexs[0]
-            ch = main_dex.get('clearinghouse', {})
-
-            # Update metadata if needed
-            if not self._sz_decimals:
-                meta = ch.get('meta', {})
-                universe = meta.get('universe', [])
-                self._sz_decimals = {i: u.get('szDecimals', 0) for i, u in enumerate(universe)}
-
-            # Update oracle prices using correct scaling
-            oracle = ch.get('oracle', {})
-            pxs = oracle.get('pxs', [])
-            for asset_id, px_data in enumerate(pxs):
-                if px_data and isinstance(px_data, list) and px_data:
-                    raw_px = px_data[0].get('px', 0)
-                    sz_dec = self._sz_decimals.get(asset_id, 0)
-                    scale = 10 ** (6 - sz_dec)
-                    self._oracle_prices[asset_id] = raw_px / scale
-
-            # Get user state
-            us = ch.get('user_states', {})
-            user_to_state = us.get('user_to_state', [])
-
-            # Find target user
-            for item in user_to_state:
-                if not isinstance(item, (list, tuple)) or len(item) < 2:
-                    continue
+        return self._read_positions_sync([(target_wallet, target_coin)])[0]
 
-                wallet = item[0]
-                if wallet != target_wallet:
-                    continue
-
-                user_data = item[1]
-                if not isinstance(user_data, dict):
-                    continue
-
-                p_data = user_data.get('p', {})
-                pos_list = p_data.get('p', [])
-
-                for pos_item in pos_list:
-                    if not isinstance(pos_item, list) or len(pos_item) < 2:
-                        continue
-
-                    asset_id = pos_item[0]
-                    coin = get_coin_name(asset_id)
-
-                    if coin != target_coin:
-                        continue
+    def _read_positions_sync(self, keys: List[Tuple[str, str]]) -> List[Optional[Dict]]:
+        """Synchronously read (wallet, coin) positions from state file (None = not found)."""
+        snapshot = self._get_cached_snapshot()
+        if snapshot is None:
+            return [None] * len(keys)
 
-                    pos = pos_item[1]
-                    if isinstance(pos, dict):
-                        return self._extract_position_data(asset_id, pos)
+        results = []
+        for wallet, coin in keys:
+            try:
+                record = self._find_record(snapshot, wallet, coin)
+                results.append(
+                    self._position_data_from_record(record) if record is not None else None
+                )
+            except Exception:
+                results.append(None)
+        return results
 
-                break  # Found user, position not found
+    def _find_record(
+        self,
+        snapshot: 'AbciPositionSnapshot',
+        wallet: str,
+        coin: str
+    ) -> Optional['PositionRecord']:
+        """Position record of wallet in coin, or None."""
+        records = snapshot.positions.get(wallet)
+        if not records:
+            return None
 
-            return None  # Position not found
+        asset_id = self._coin_asset_ids.get(coin)
+        if asset_id is not None:
+            return records.get(asset_id)
 
-        except Exception:
-            return None
+        # Asset outside the state universe: match the wallet's few positions by name
+        for asset_id, record in records.items():
+            if get_coin_name(asset_id) == coin:
+                return record
+        return None
 
     async def _parse_full_state(self) -> Dict[str, Dict[str, Dict]]:
         """Parse full state file for discovery scan."""
@@ -866,7 +892,7 @@ class PositionStateManager:
 
     def _parse_full_state_sync(self) -> Dict[str, Dict[str, Dict]]:
         """
-        Synchronously parse full state file.
+        Synchronously collect positions of all users with positions.
 
         Position data is in: perp_dexs[0].clearinghouse.user_states.user_to_state
         Each user has: p.p = [[asset_id, {s, e, l, M, f}], ...]
@@ -878,74 +904,24 @@ class PositionStateManager:
         - M: margin table ID
         - f: funding info {a, o, c}
         """
-        data = self._get_cached_state()
-        if data is None:
+        snapshot = self._get_cached_snapshot()
+        if snapshot is None:
             return {}
 
         positions = {}
 
         try:
-            exchange = data.get('exchange', {})
-            perp_dexs = exchange.get('perp_dexs', [])
-
-            if not perp_dexs:
-                return {}
-
-            main_dex = perp_dexs[0]
-            ch = main_dex.get('clearinghouse', {})
-
-            # Get asset metadata for scaling
-            meta = ch.get('meta', {})
-            universe = meta.get('universe', [])
-            self._sz_decimals = {i: u.get('szDecimals', 0) for i, u in enumerate(universe)}
-
-            # Get oracle prices
-            # Formula: price = raw_px / 10^(6 - szDecimals)
-            oracle = ch.get('oracle', {})
-            pxs = oracle.get('pxs', [])
-            self._oracle_prices = {}
-            for asset_id, px_data in enumerate(pxs):
-                if px_data and isinstance(px_data, list) and px_data:
-                    raw_px = px_data[0].get('px', 0)
-                    sz_dec = self._sz_decimals.get(asset_id, 0)
-                    scale = 10 ** (6 - sz_dec)
-                    self._oracle_prices[asset_id] = raw_px / scale
-
-            # Get user states
-            us = ch.get('user_states', {})
-            users_with_positions = set(us.get('users_with_positions', []))
-            user_to_state = us.get('user_to_state', [])
-
-            # Build user state map
-            user_state_map = {}
-            for item in user_to_state:
-                if isinstance(item, (list, tuple)) and len(item) >= 2:
-                    user_state_map[item[0]] = item[1]
-
-            # Process users with positions
-            for wallet in users_with_positions:
-                user_data = user_state_map.get(wallet)
-                if not user_data or not isinstance(user_data, dict):
+            for wallet in snapshot.users_with_positions:
+                records = snapshot.positions.get(wallet)
+                if not records:
                     continue
 
-                p_data = user_data.get('p', {})
-                pos_list = p_data.get('p', [])
-
                 wallet_positions = {}
 
-                for pos_item in pos_list:
-                    if not isinstance(pos_item, list) or len(pos_item) < 2:
-                        continue
-
-                    asset_id = pos_item[0]
-                    pos = pos_item[1]
-
-                    if not isinstance(pos, dict):
-                        continue
-
-                    pos_data = self._extract_position_data(asset_id, pos)
+                for record in records.values():
+                    pos_data = self._position_data_from_record(record)
                     if pos_data and abs(pos_data['size']) > 0.0001:
-                        coin = get_coin_name(asset_id)
+                        coin = get_coin_name(record.asset_id)
                         wallet_positions[coin] = pos_data
 
                 if wallet_positions:
@@ -958,8 +934,12 @@ class PositionStateManager:
         return positions
 
     def _extract_position_data(self, asset_id: int, pos: Dict) -> Optional[Dict]:
+        """Extract position data from a state position map {s, e, l, M, f}."""
+        return self._position_data_from_record(PositionRecord.from_state(asset_id, pos))
+
+    def _position_data_from_record(self, record: 'PositionRecord') -> Optional[Dict]:
         """
-        Extract position data from state structure.
+        Extract position data from a decoded state position record.
 
         Position structure: {s, e, l, M, f}
         - s: size (scaled by 10^szDecimals)
@@ -971,27 +951,22 @@ class PositionStateManager:
         liq_price = entry_price - side * (margin - maint_margin) / |size| / correction
         where correction = 1 - side / maintenance_leverage
         """
-        s = pos.get('s', 0)
+        s = record.size_raw
         if not s:
             return None
+        asset_id = record.asset_id
 
         # Get scaling
         sz_dec = self._sz_decimals.get(asset_id, 0)
         size = s / (10 ** sz_dec)
 
         # Entry notional (scaled by 1e6)
-        entry_ntl = pos.get('e', 0) / 1e6
+        entry_ntl = record.entry_ntl_raw / 1e6
 
         # Leverage info
-        l_data = pos.get('l', {})
-        is_isolated = 'I' in l_data
-
-        if is_isolated:
-            leverage = l_data['I'].get('l', 1)
-            margin_adj = l_data['I'].get('u', 0) / 1e6  # Unrealized margin adjustment
-        else:
-            leverage = l_data.get('C', 1)
-            margin_adj = 0
+        is_isolated = record.is_isolated
+        leverage = record.leverage
+        margin_adj = record.margin_adj_raw / 1e6 if is_isolated else 0  # Unrealized margin adjustment
 
         # Calculate entry price
         entry_price = entry_ntl / abs(size) if size != 0 else 0
@@ -0,0 +1,268 @@
+"""
+Wallet Polling Engine
+
+Shared request scheduler for the tiered and batch wallet pollers.
+
+Polls run concurrently (bounded by max_concurrency over the client's pooled
+aiohttp session) while a weighted token bucket keeps the request rate under
+the API's per-minute weight budget. Latency is overlapped instead of paid
+per wallet, so a tier sweep is limited by the rate budget rather than by
+round-trip time.
+
+Within a run, jobs start in priority order (lower = sooner; callers use
+distance to liquidation) and each job may carry a deadline. Completions
+after their deadline are counted per tier.
+
+Pollers created without an engine use get_shared_engine(), one engine per
+event loop, so the rate budget is shared unless an owner injects its own.
+
+Constitutional compliance:
+- Scheduling only; no interpretation of polled data
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+import weakref
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+
+
+logger = logging.getLogger(__name__)
+
+
+# Hyperliquid info endpoint weights (clearinghouseState, allMids, l2Book = 2)
+INFO_REQUEST_WEIGHT = 2.0
+API_WEIGHT_PER_MINUTE = 1200.0
+
+
+@dataclass
+class PollEngineConfig:
+    """Configuration for the polling engine."""
+    weight_per_minute: float = API_WEIGHT_PER_MINUTE  # Rate budget
+    burst_weight: Optional[float] = None  # Bucket capacity (default: 1s of budget)
+    request_weight: float = INFO_REQUEST_WEIGHT  # Weight of one poll
+    max_concurrency: int = 16  # Polls in flight
+
+
+class TokenBucket:
+    """
+    Weighted token bucket rate limiter.
+
+    Refills continuously at weight_per_minute / 60 per second up to
+    capacity. Waiters are served in arrival order.
+    """
+
+    def __init__(
+        self,
+        weight_per_minute: float,
+        capacity: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """Initialize token bucket.
+
+        Args:
+            weight_per_minute: Sustained budget
+            capacity: Maximum burst (default: one second of budget, min 1)
+            clock: Monotonic time source (seconds)
+        """
+        if weight_per_minute <= 0:
+            raise ValueError("weight_per_minute must be positive")
+        self._rate = weight_per_minute / 60.0
+        self._capacity = capacity if capacity is not None else max(self._rate, 1.0)
+        self._clock = clock
+        self._tokens = self._capacity
+        self._updated = clock()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = self._clock()
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+    def try_acquire(self, weight: float = 1.0) -> bool:
+        """Take weight tokens if available now.
+
+        Returns:
+            True if tokens were taken
+        """
+        self._refill()
+        if self._tokens >= weight:
+            self._tokens -= weight
+            return True
+        return False
+
+    async def acquire(self, weight: float = 1.0):
+        """Wait until weight tokens are available, then take them.
+
+        Args:
+            weight: Request weight (capped at capacity)
+        """
+        weight = min(weight, self._capacity)
+        async with self._lock:
+            while not self.try_acquire(weight):
+                await asyncio.sleep((weight - self._tokens) / self._rate)
+
+    @property
+    def available(self) -> float:
+        """Tokens currently available."""
+        self._refill()
+        return self._tokens
+
+
+@dataclass(order=True)
+class PollJob:
+    """A poll to run. Ordered by priority (lower = sooner), then submission."""
+    priority: float
+    seq: int = field(default=0)
+    key: str = field(default='', compare=False)
+    tier: int = field(default=3, compare=False)
+    deadline: Optional[float] = field(default=None, compare=False)  # time.time()
+    payload: Any = field(default=None, compare=False)
+
+
+@dataclass
+class TierPollMetrics:
+    """Per-tier polling metrics."""
+    polls: int = 0
+    errors: int = 0
+    deadline_misses: int = 0
+    max_lateness_ms: int = 0
+    last_run_ms: int = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        return {
+            'polls': self.polls,
+            'errors': self.errors,
+            'deadline_misses': self.deadline_misses,
+            'max_lateness_ms': self.max_lateness_ms,
+            'last_run_ms': self.last_run_ms,
+        }
+
+
+class PollEngine:
+    """
+    Concurrent, rate-limited poll scheduler.
+
+    One engine may be shared by several pollers: the rate budget and the
+    concurrency bound apply across all runs in progress.
+
+    Usage:
+        engine = PollEngine(PollEngineConfig(max_concurrency=32))
+        jobs = engine.make_jobs(wallets, priority=distance_to_liq, tier=2, deadline=t)
+        results = await engine.run(jobs, poll_one)
+    """
+
+    def __init__(self, config: Optional[PollEngineConfig] = None):
+        self.config = config or PollEngineConfig()
+        self._bucket = TokenBucket(self.config.weight_per_minute, self.config.burst_weight)
+        self._slots = asyncio.Semaphore(self.config.max_concurrency)
+        self._seq = itertools.count()
+        self._metrics: Dict[int, TierPollMetrics] = {}
+
+    def make_jobs(
+        self,
+        keys: Iterable[str],
+        *,
+        tier: int,
+        priority: Optional[Callable[[str], float]] = None,
+        deadline: Optional[float] = None
+    ) -> List[PollJob]:
+        """Build jobs for a set of keys.
+
+        Args:
+            keys: Wallet addresses (or other poll keys)
+            tier: Tier for metrics
+            priority: key -> priority (default: all equal, submission order)
+            deadline: Completion deadline shared by all jobs (time.time())
+        """
+        return [
+            PollJob(
+                priority=priority(key) if priority else 0.0,
+                seq=next(self._seq),
+                key=key,
+                tier=tier,
+                deadline=deadline
+            )
+            for key in keys
+        ]
+
+    async def run(
+        self,
+        jobs: Iterable[PollJob],
+        poll: Callable[[PollJob], Awaitable[Any]]
+    ) -> Dict[str, Any]:
+        """Run jobs concurrently under the rate budget.
+
+        Args:
+            jobs: Jobs to run (started in priority order)
+            poll: Coroutine function polling one job
+
+        Returns:
+            Job key -> poll result, or the exception it raised
+        """
+        queue = list(jobs)
+        heapq.heapify(queue)
+        results: Dict[str, Any] = {}
+        start = time.time()
+        tiers = {job.tier for job in queue}
+
+        async def worker():
+            while queue:
+                job = heapq.heappop(queue)
+                async with self._slots:
+                    await self._bucket.acquire(self.config.request_weight)
+                    metrics = self._tier_metrics(job.tier)
+                    try:
+                        results[job.key] = await poll(job)
+                    except Exception as e:
+                        logger.debug(f"Poll {job.key[:10]}... failed: {e}")
+                        results[job.key] = e
+                        metrics.errors += 1
+                    metrics.polls += 1
+                    if job.deadline is not None:
+                        lateness = time.time() - job.deadline
+                        if lateness > 0:
+                            metrics.deadline_misses += 1
+                            metrics.max_lateness_ms = max(
+                                metrics.max_lateness_ms, int(lateness * 1000)
+                            )
+
+        workers = min(self.config.max_concurrency, len(queue))
+        await asyncio.gather(*(worker() for _ in range(workers)))
+
+        elapsed_ms = int((time.time() - start) * 1000)
+        for tier in tiers:
+            self._tier_metrics(tier).last_run_ms = elapsed_ms
+        return results
+
+    def _tier_metrics(self, tier: int) -> TierPollMetrics:
+        metrics = self._metrics.get(tier)
+        if metrics is None:
+            metrics = self._metrics[tier] = TierPollMetrics()
+        return metrics
+
+    def get_metrics(self) -> Dict[int, Dict[str, int]]:
+        """Per-tier metrics."""
+        return {tier: m.to_dict() for tier, m in sorted(self._metrics.items())}
+
+
+# Default engine per event loop (asyncio primitives are bound to one loop)
+_shared_engines: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, PollEngine]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_shared_engine() -> PollEngine:
+    """Default engine shared by all pollers on the running event loop.
+
+    Uses PollEngineConfig defaults (the full API weight budget). Must be
+    called from a coroutine.
+    """
+    loop = asyncio.get_running_loop()
+    engine = _shared_engines.get(loop)
+    if engine is None:
+        engine = _shared_engines[loop] = PollEngine()
+    return engine
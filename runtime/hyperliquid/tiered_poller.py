@@ -20,6 +20,7 @@ from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Set, Callable, Any
 
 from runtime.hyperliquid.hl_data_store import HLDataStore, PollCycleStats, now_ns
+from runtime.hyperliquid.poll_engine import PollEngine, get_shared_engine
 
 
 logger = logging.getLogger(__name__)
@@ -56,9 +57,26 @@ class WalletState:
     next_poll_ts: int = 0
     last_total_value: float = 0.0
     consecutive_empty: int = 0
+    min_liq_distance_pct: float = 100.0  # Closest position to liquidation (poll priority)
     last_snapshot_ids: Dict[str, int] = field(default_factory=dict)  # coin -> snapshot_id
 
 
+def _liq_distance_pct(pos: Dict) -> float:
+    """Distance from mark to liquidation price in % (100.0 if unknown).
+
+    Mark price is derived from positionValue / |szi|.
+    """
+    try:
+        size = abs(float(pos.get('szi', 0)))
+        liq_px = float(pos.get('liquidationPx') or 0)
+        mark_px = abs(float(pos.get('positionValue', 0))) / size if size else 0.0
+    except (TypeError, ValueError):
+        return 100.0
+    if liq_px <= 0 or mark_px <= 0:
+        return 100.0
+    return abs(mark_px - liq_px) / mark_px * 100.0
+
+
 class TieredPoller:
     """
     Tiered wallet polling with automatic tier promotion/demotion.
@@ -88,7 +106,8 @@ class TieredPoller:
         data_store: HLDataStore,
         config: Optional[TierConfig] = None,
         on_position_update: Optional[Callable[[str, str, Dict], None]] = None,
-        on_liquidation_detected: Optional[Callable[[str, str, Dict], None]] = None
+        on_liquidation_detected: Optional[Callable[[str, str, Dict], None]] = None,
+        engine: Optional[PollEngine] = None
     ):
         """Initialize tiered poller.
 
@@ -98,11 +117,16 @@ class TieredPoller:
             config: Tier configuration (uses defaults if None)
             on_position_update: Callback for position updates (wallet, coin, position)
             on_liquidation_detected: Callback for liquidation detection (wallet, coin, last_known)
+            engine: Polling engine, normally created by the owner and shared
+                with the other pollers (default: get_shared_engine())
         """
         self._client = client
         self._store = data_store
         self._config = config or TierConfig()
 
+        # Concurrent, rate-limited request scheduling (resolved on first poll)
+        self._engine = engine
+
         # Callbacks
         self._on_position_update = on_position_update
         self._on_liquidation_detected = on_liquidation_detected
@@ -298,13 +322,26 @@ class TieredPoller:
         stats = PollCycleStats()
         wallets_to_poll = list(wallets)  # Copy to avoid modification during iteration
 
-        for wallet in wallets_to_poll:
-            try:
-                await self._poll_wallet(wallet, cycle_id, stats)
-                stats.wallets_polled += 1
-            except Exception as e:
-                logger.warning(f"Error polling wallet {wallet[:10]}...: {e}")
+        # Poll concurrently, closest-to-liquidation first; the cycle should
+        # finish within the tier's interval
+        jobs = self.engine.make_jobs(
+            wallets_to_poll,
+            tier=tier,
+            priority=self._poll_priority,
+            deadline=start_time + self._get_interval_for_tier(tier)
+        )
+
+        async def poll(job):
+            await self._poll_wallet(job.key, cycle_id, stats)
+
+        results = await self.engine.run(jobs, poll)
+
+        for wallet, result in results.items():
+            if isinstance(result, Exception):
+                logger.warning(f"Error polling wallet {wallet[:10]}...: {result}")
                 stats.api_errors += 1
+            else:
+                stats.wallets_polled += 1
 
         stats.duration_ms = int((time.time() - start_time) * 1000)
         self._store.end_poll_cycle(cycle_id, stats)
@@ -314,6 +351,11 @@ class TieredPoller:
 
         return stats
 
+    def _poll_priority(self, wallet: str) -> float:
+        """Poll priority (lower = sooner): distance to liquidation in %."""
+        state = self._wallets.get(wallet)
+        return state.min_liq_distance_pct if state else 100.0
+
     async def _poll_wallet(self, wallet: str, cycle_id: int, stats: PollCycleStats):
         """Poll a single wallet and store results.
 
@@ -348,6 +390,7 @@ class TieredPoller:
         positions = wallet_state.positions if hasattr(wallet_state, 'positions') else []
         current_coins = set()
         total_value = 0.0
+        min_liq_distance = 100.0
 
         for pos in positions:
             coin = pos.get('coin', pos.get('symbol', 'UNKNOWN'))
@@ -369,6 +412,7 @@ class TieredPoller:
             # Calculate value for tier adjustment
             pos_value = abs(float(pos.get('positionValue', 0)))
             total_value += pos_value
+            min_liq_distance = min(min_liq_distance, _liq_distance_pct(pos))
 
             # Callback
             if self._on_position_update:
@@ -401,6 +445,7 @@ class TieredPoller:
 
         # Update state
         state.last_total_value = total_value
+        state.min_liq_distance_pct = min_liq_distance
         state.consecutive_empty = 0 if positions else state.consecutive_empty + 1
 
         # Check for tier changes
@@ -513,6 +558,13 @@ class TieredPoller:
     # Status
     # =========================================================================
 
+    @property
+    def engine(self) -> PollEngine:
+        """Polling engine (the loop's shared engine if none was injected)."""
+        if self._engine is None:
+            self._engine = get_shared_engine()
+        return self._engine
+
     def get_status(self) -> Dict[str, Any]:
         """Get current poller status.
 
@@ -525,6 +577,7 @@ class TieredPoller:
             'tier2_count': len(self._tier2_wallets),
             'tier3_count': len(self._tier3_wallets),
             'tier1_wallets': list(self._tier1_wallets)[:5],  # Sample
+            'engine': self._engine.get_metrics() if self._engine else {},
             'config': {
                 'tier1_interval': self._config.tier1_interval,
                 'tier2_interval': self._config.tier2_interval,
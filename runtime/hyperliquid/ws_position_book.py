@@ -0,0 +1,216 @@
+"""
+Struct-of-arrays position book for one market of the WebSocket tracker.
+
+The tracker keeps positions indexed by market; on every allMids tick the
+moved markets are scanned. This book stores the per-position fields the scan
+needs as NumPy arrays (size, liq price, precomputed trigger prices, side,
+last danger level), so a tick is a handful of vectorized comparisons that
+yield only the slots needing Python work:
+
+- danger level changed (includes positions added since the last tick)
+- danger level >= 2 with notional >= MIN_SIGNAL_NOTIONAL (re-signalled)
+- liq price touched or breached
+
+The TrackedPosition objects are views: current_price, notional,
+distance_pct and in_danger_zone are written back only for those slots on
+the tick, and for the rest of the market when the objects are read through
+the mapping interface (materialize()).
+
+The book is a MutableMapping wallet -> TrackedPosition, so existing index
+bookkeeping (set, del, in, len) works unchanged.
+"""
+
+from collections.abc import MutableMapping
+from typing import Any, Dict, Iterator, List, Tuple
+
+import numpy as np
+
+# Signals are only emitted for positions at least this large (USD notional)
+MIN_SIGNAL_NOTIONAL = 1000
+
+# Danger level of slots that have not been scanned yet (always "changed")
+_UNSCANNED = -1
+
+_INITIAL_CAPACITY = 16
+
+
+class MarketPositionBook(MutableMapping):
+    """Positions of one market, by wallet, backed by parallel arrays."""
+
+    def __init__(self):
+        self._slots: Dict[str, int] = {}
+        self._wallets: List[str] = []
+        self._positions: List[Any] = []
+
+        capacity = _INITIAL_CAPACITY
+        self._size = np.zeros(capacity)
+        self._liq = np.zeros(capacity)
+        self._trigger_2pct = np.zeros(capacity)
+        self._trigger_1pct = np.zeros(capacity)
+        self._trigger_05pct = np.zeros(capacity)
+        self._is_long = np.zeros(capacity, dtype=bool)
+        # distance_pct of positions without a liq price (never recomputed)
+        self._base_distance = np.zeros(capacity)
+        self._level = np.full(capacity, _UNSCANNED, dtype=np.int8)
+        # Slot scanned at self.price but its object not yet updated
+        self._stale = np.zeros(capacity, dtype=bool)
+
+        self.price = 0.0
+        self.published_at = 0.0
+        self._has_stale = False
+
+    # ==================== Mapping ====================
+
+    def __getitem__(self, wallet: str):
+        if self._has_stale:
+            self.materialize()
+        return self._positions[self._slots[wallet]]
+
+    def __setitem__(self, wallet: str, pos) -> None:
+        slot = self._slots.get(wallet)
+        if slot is None:
+            slot = len(self._wallets)
+            if slot == len(self._size):
+                self._grow()
+            self._slots[wallet] = slot
+            self._wallets.append(wallet)
+            self._positions.append(pos)
+        else:
+            self._positions[slot] = pos
+
+        self._size[slot] = pos.size
+        self._liq[slot] = pos.liq_price
+        self._trigger_2pct[slot] = pos.trigger_2pct
+        self._trigger_1pct[slot] = pos.trigger_1pct
+        self._trigger_05pct[slot] = pos.trigger_05pct
+        self._is_long[slot] = pos.side == 'LONG'
+        self._base_distance[slot] = pos.distance_pct
+        self._level[slot] = _UNSCANNED
+        self._stale[slot] = False
+
+    def __delitem__(self, wallet: str) -> None:
+        slot = self._slots.pop(wallet)
+        last = len(self._wallets) - 1
+        if slot != last:
+            # Move the last slot into the hole
+            moved = self._wallets[last]
+            self._wallets[slot] = moved
+            self._positions[slot] = self._positions[last]
+            self._slots[moved] = slot
+            for array in self._arrays():
+                array[slot] = array[last]
+        self._wallets.pop()
+        self._positions.pop()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._slots)
+
+    def __len__(self) -> int:
+        return len(self._wallets)
+
+    def __contains__(self, wallet) -> bool:
+        return wallet in self._slots
+
+    def __repr__(self) -> str:
+        return f"MarketPositionBook({len(self)} positions, price={self.price})"
+
+    # ==================== Tick ====================
+
+    def scan(self, price: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Apply a price tick; return (slots, levels, breached) needing work.
+
+        Levels match TrackedPosition.check_danger(price). The caller handles
+        the returned slots (materialize_slot() first) and removes breached
+        ones afterwards; other slots keep their level and danger state.
+        """
+        n = len(self._wallets)
+        self.price = price
+        if n == 0:
+            empty = np.zeros(0, dtype=np.intp)
+            return empty, empty.astype(np.int8), empty.astype(bool)
+
+        liq = self._liq[:n]
+        is_long = self._is_long[:n]
+
+        # Triggers are ordered (LONG: 0.5% < 1% < 2% above liq; SHORT the
+        # reverse below it), so the level is the number of triggers reached
+        long_level = (
+            (price <= self._trigger_2pct[:n]).astype(np.int8)
+            + (price <= self._trigger_1pct[:n]) + (price <= self._trigger_05pct[:n])
+        )
+        short_level = (
+            (price >= self._trigger_2pct[:n]).astype(np.int8)
+            + (price >= self._trigger_1pct[:n]) + (price >= self._trigger_05pct[:n])
+        )
+        level = np.where(is_long, long_level, short_level)
+        # Zombie check: already at/through the liq price
+        level[np.where(is_long, price <= liq, price >= liq)] = 0
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            distance = np.where(
+                liq > 0,
+                np.where(is_long, price - liq, liq - price) / price * 100,
+                self._base_distance[:n],
+            )
+        breached = distance <= 0
+        resignal = (level >= 2) & (self._size[:n] * price >= MIN_SIGNAL_NOTIONAL)
+
+        slots = np.flatnonzero((level != self._level[:n]) | resignal | breached)
+        self._level[:n] = level
+        self._stale[:n] = True
+        self._has_stale = True
+        return slots, level[slots], breached[slots]
+
+    def materialize_slot(self, slot: int):
+        """Write the last scan into the position object of slot; return it."""
+        pos = self._positions[slot]
+        if self._stale[slot]:
+            self._apply(pos, slot)
+            self._stale[slot] = False
+        return pos
+
+    def materialize(self) -> None:
+        """Write the last scan into every position object."""
+        if not self._has_stale:
+            return
+        n = len(self._wallets)
+        for slot in np.flatnonzero(self._stale[:n]).tolist():
+            self._apply(self._positions[slot], slot)
+        self._stale[:n] = False
+        self._has_stale = False
+
+    def wallet_at(self, slot: int) -> str:
+        return self._wallets[slot]
+
+    def danger_level(self, wallet: str) -> int:
+        """Danger level from the last scan (-1 if not scanned yet)."""
+        return int(self._level[self._slots[wallet]])
+
+    # ==================== Internal ====================
+
+    def _apply(self, pos, slot: int) -> None:
+        price = self.price
+        pos.current_price = price
+        pos.notional = pos.size * price
+        if pos.liq_price > 0:
+            if pos.side == 'LONG':
+                pos.distance_pct = ((price - pos.liq_price) / price) * 100
+            else:
+                pos.distance_pct = ((pos.liq_price - price) / price) * 100
+        if pos.distance_pct > 0:
+            pos.in_danger_zone = bool(self._level[slot] > 0)
+
+    def _arrays(self):
+        return (self._size, self._liq, self._trigger_2pct, self._trigger_1pct,
+                self._trigger_05pct, self._is_long, self._base_distance,
+                self._level, self._stale)
+
+    def _grow(self) -> None:
+        capacity = len(self._size) * 2
+        for name in ('_size', '_liq', '_trigger_2pct', '_trigger_1pct', '_trigger_05pct',
+                     '_is_long', '_base_distance', '_level', '_stale'):
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
@@ -6,6 +6,7 @@ Architecture:
 - Position-centric indexing (by market, not wallet)
 - Precomputed trigger prices (no math on hot path)
 - Price-driven detection (scan only affected market on tick)
+- Struct-of-arrays market books (one vectorized comparison per tick)
 
 This is a HEADLESS risk engine. UI reads from shared state.
 """
@@ -22,6 +23,7 @@ import logging
 from runtime.hyperliquid.shared_state import (
     get_shared_state, SharedPositionState, PositionSnapshot, DangerAlert
 )
+from runtime.hyperliquid.ws_position_book import MarketPositionBook, MIN_SIGNAL_NOTIONAL
 
 # Node client for instant position validation (no rate limits)
 try:
@@ -35,6 +37,10 @@ logger = logging.getLogger(__name__)
 
 WS_URL = 'wss://api.hyperliquid.xyz/ws'
 
+# Seconds between full per-market snapshot refreshes of shared state
+# (UI reads it at 250ms; danger changes are written immediately)
+SNAPSHOT_PUBLISH_INTERVAL = 0.25
+
 
 @dataclass
 class TrackedPosition:
@@ -172,8 +178,8 @@ class WSPositionTracker:
         self._subscribe_queue: Dict[int, List[str]] = defaultdict(list)  # conn_id -> wallets to subscribe
 
         # POSITION-CENTRIC indexing (key optimization)
-        self._market_positions: Dict[str, Dict[str, TrackedPosition]] = defaultdict(dict)
-        # market_positions["JTO"][wallet] = TrackedPosition
+        self._market_positions: Dict[str, MarketPositionBook] = defaultdict(MarketPositionBook)
+        # market_positions["JTO"][wallet] = TrackedPosition (array-backed book per market)
 
         # Also keep wallet-centric for updates
         self._wallet_positions: Dict[str, Dict[str, TrackedPosition]] = defaultdict(dict)
@@ -223,6 +229,7 @@ class WSPositionTracker:
     @property
     def danger_positions(self) -> Dict[str, TrackedPosition]:
         """Read-only access to positions in danger zone."""
+        self._materialize_markets()
         return self._danger_positions
 
     @property
@@ -781,54 +788,34 @@ class WSPositionTracker:
             self._shared_state.update_mid_prices(prices_batch)
 
         # Scan only coins with meaningful price changes
+        now = time.time()
         for coin, price in coins_to_scan:
 
             # POSITION-CENTRIC: Only scan positions in THIS market
-            positions = self._market_positions.get(coin, {})
-            if not positions:
+            book = self._market_positions.get(coin)
+            if not book or price <= 0:
                 continue
 
-            # Fast scan - just comparisons, no math
+            # Vectorized scan - only slots whose danger state needs work come back
+            slots, levels, breached = book.scan(price)
             positions_to_remove = []
-            for wallet, pos in positions.items():
-                danger_level = pos.check_danger(price)
+            for slot, danger_level, is_breached in zip(
+                slots.tolist(), levels.tolist(), breached.tolist()
+            ):
+                pos = book.materialize_slot(slot)
+                wallet = book.wallet_at(slot)
                 key = f"{wallet}:{coin}"
 
-                # ALWAYS update price, notional, and distance for ALL positions
-                pos.current_price = price
-                pos.notional = pos.size * price
-
-                # Calculate distance for ALL positions (needed for UI sorting)
-                if pos.liq_price > 0:
-                    if pos.side == 'LONG':
-                        pos.distance_pct = ((price - pos.liq_price) / price) * 100
-                    else:
-                        pos.distance_pct = ((pos.liq_price - price) / price) * 100
-
                 # LIQUIDATION DETECTION: If price reached/crossed liq price, remove immediately
                 # distance <= 0 means liq price was touched or breached
-                if pos.distance_pct <= 0:
+                if is_breached:
                     positions_to_remove.append((wallet, coin, key, pos.distance_pct))
                     continue  # Don't update shared state for liquidated positions
 
-                # Update shared state snapshot
-                snapshot = PositionSnapshot(
-                    wallet=wallet,
-                    coin=coin,
-                    side=pos.side,
-                    size=pos.size,
-                    notional=pos.notional,
-                    entry_price=pos.entry_price,
-                    liq_price=pos.liq_price,
-                    current_price=pos.current_price,
-                    distance_pct=pos.distance_pct,
-                    leverage=pos.leverage,
-                    danger_level=danger_level,
-                    updated_at=time.time(),
-                    opened_at=pos.opened_at,
-                    discovered_at=pos.discovered_at
+                # Danger state changed: update shared state snapshot now
+                self._shared_state.update_position(
+                    self._position_snapshot(pos, danger_level, now)
                 )
-                self._shared_state.update_position(snapshot)
 
                 if danger_level > 0:
                     pos.in_danger_zone = True
@@ -839,7 +826,7 @@ class WSPositionTracker:
 
                     # Emit signal if newly entered danger or level increased
                     # Only emit if we have meaningful data (notional > $1000)
-                    if (not was_in_danger or danger_level > 1) and pos.notional >= 1000:
+                    if (not was_in_danger or danger_level > 1) and pos.notional >= MIN_SIGNAL_NOTIONAL:
                         self._emit_signal(pos, danger_level)
                 else:
                     # No longer in danger
@@ -860,6 +847,42 @@ class WSPositionTracker:
                 self._liquidated_positions[key] = time.time()
                 print(f"[WSTracker] ⚠️ LIQUIDATED - Removed: {wallet[:10]}...:{coin} (distance was {dist:.2f}%)")
 
+            # Refresh the UI view of the rest of the market at the UI read rate
+            if now - book.published_at >= SNAPSHOT_PUBLISH_INTERVAL:
+                self._publish_market(book, coin, now)
+
+    def _position_snapshot(self, pos: TrackedPosition, danger_level: int, now: float) -> PositionSnapshot:
+        """Shared state snapshot of a materialized position."""
+        return PositionSnapshot(
+            wallet=pos.wallet,
+            coin=pos.coin,
+            side=pos.side,
+            size=pos.size,
+            notional=pos.notional,
+            entry_price=pos.entry_price,
+            liq_price=pos.liq_price,
+            current_price=pos.current_price,
+            distance_pct=pos.distance_pct,
+            leverage=pos.leverage,
+            danger_level=danger_level,
+            updated_at=now,
+            opened_at=pos.opened_at,
+            discovered_at=pos.discovered_at
+        )
+
+    def _publish_market(self, book: MarketPositionBook, coin: str, now: float):
+        """Write snapshots of every position of a market to shared state (one batch)."""
+        book.materialize()
+        snapshots = []
+        for wallet, pos in book.items():
+            danger_level = book.danger_level(wallet)
+            if danger_level < 0:
+                # Added since the scan: level at its own price, as on creation
+                danger_level = pos.check_danger(pos.current_price) if pos.current_price > 0 else 0
+            snapshots.append(self._position_snapshot(pos, danger_level, now))
+        self._shared_state.update_positions_batch(snapshots)
+        book.published_at = now
+
     def _calculate_cross_margin_liq_price(
         self, wallet: str, entry_price: float, size: float, leverage: float
     ) -> float:
@@ -1255,14 +1278,25 @@ class WSPositionTracker:
 
     def get_positions_for_wallet(self, wallet: str) -> List[TrackedPosition]:
         """Get all positions for a wallet."""
-        return list(self._wallet_positions.get(wallet, {}).values())
+        positions = self._wallet_positions.get(wallet, {})
+        for coin in positions:
+            book = self._market_positions.get(coin)
+            if book is not None:
+                book.materialize()
+        return list(positions.values())
 
     def get_all_danger_positions(self) -> List[TrackedPosition]:
         """Get all positions in danger zone (sorted by distance)."""
+        self._materialize_markets()
         positions = list(self._danger_positions.values())
         positions.sort(key=lambda p: p.distance_pct)
         return positions
 
+    def _materialize_markets(self):
+        """Bring position objects of every market up to their last scan."""
+        for book in self._market_positions.values():
+            book.materialize()
+
     def get_connection_stats(self) -> Dict[str, Any]:
         """Get connection and performance stats."""
         return {
@@ -15,7 +15,8 @@ Constitutional: Factual logging only, no interpretation.
 import sqlite3
 import time
 import json
-from typing import List, Dict, Optional, Any
+from contextlib import contextmanager
+from typing import List, Dict, Optional, Any, Tuple
 from pathlib import Path
 from datetime import datetime
 
@@ -35,8 +36,86 @@ class ResearchDatabase:
         self.db_path = db_path
         self.conn = sqlite3.connect(db_path, check_same_thread=False)
         self.conn.row_factory = sqlite3.Row
+
+        # >0 while inside batch(): log_* methods defer their commit
+        self._batch_depth = 0
         
         self._create_schema()
+
+    def _commit(self):
+        """Commit unless a batch() transaction is open."""
+        if self._batch_depth == 0:
+            self.conn.commit()
+
+    @contextmanager
+    def batch(self):
+        """Group writes into a single transaction.
+
+        log_* methods called inside the block skip their per-call commit;
+        one commit is issued when the outermost block exits (rollback on error).
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        except Exception:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.conn.rollback()
+            raise
+        self._batch_depth -= 1
+        if self._batch_depth == 0:
+            self.conn.commit()
+
+    def supports_batch(self, method_name: str) -> bool:
+        """Whether log method can be written via insert_batch()."""
+        return method_name in self._BATCH_INSERTS
+
+    def insert_batch(self, method_name: str, calls: List[Tuple[tuple, dict]]) -> int:
+        """Write many buffered calls of one log_* method with a single executemany.
+
+        Args:
+            method_name: Batchable log method name (see supports_batch)
+            calls: List of (args, kwargs) exactly as passed to the log method
+
+        Returns:
+            Number of rows written. Calls whose arguments cannot be converted
+            to a row are skipped. Does not commit (use inside batch()).
+        """
+        sql, builder_name = self._BATCH_INSERTS[method_name]
+        builder = getattr(self, builder_name)
+
+        rows = []
+        for args, kwargs in calls:
+            try:
+                row = builder(*args, **kwargs)
+            except Exception:
+                continue
+            if row is not None:
+                rows.append(row)
+
+        if not rows:
+            return 0
+
+        # Savepoint so a failing executemany leaves no partial rows behind
+        if not self.conn.in_transaction:
+            self.conn.execute("BEGIN")
+        self.conn.execute("SAVEPOINT insert_batch")
+        try:
+            self.conn.executemany(sql, rows)
+            self.conn.execute("RELEASE insert_batch")
+            return len(rows)
+        except sqlite3.Error:
+            self.conn.execute("ROLLBACK TO insert_batch")
+            self.conn.execute("RELEASE insert_batch")
+            # Isolate bad rows so one invalid write does not drop the table batch
+            written = 0
+            for row in rows:
+                try:
+                    self.conn.execute(sql, row)
+                    written += 1
+                except sqlite3.Error:
+                    pass
+            return written
     
     def _create_schema(self):
         """Create complete research database schema."""
@@ -1133,15 +1212,12 @@ class ResearchDatabase:
         ))
         
         cycle_id = cursor.lastrowid
-        self.conn.commit()
+        self._commit()
         return cycle_id
     
     def log_m2_nodes(self, cycle_id: int, nodes: List[Dict[str, Any]]):
         """Log M2 node snapshots."""
-        cursor = self.conn.cursor()
-        
-        for node in nodes:
-            cursor.execute("""
+        self.conn.executemany("""
                 INSERT INTO m2_nodes (
                     cycle_id, node_id, symbol, side,
                     price_center, price_band,
@@ -1150,7 +1226,7 @@ class ResearchDatabase:
                     liquidation_count, trade_execution_count, liquidation_proximity_count,
                     volume_total, creation_reason, presence_intervals_json
                 ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
+            """, [(
                 cycle_id, node['id'], node['symbol'], node.get('side'),
                 node['price_center'], node['price_band'],
                 node.get('state', 'ACTIVE'), node.get('active', True),
@@ -1163,16 +1239,13 @@ class ResearchDatabase:
                 node.get('volume_total'),
                 node.get('creation_reason'),
                 json.dumps(node.get('presence_intervals', []))
-            ))
+            ) for node in nodes])
         
-        self.conn.commit()
+        self._commit()
     
     def log_primitive_values(self, cycle_id: int, primitives_by_symbol: Dict[str, Dict[str, Any]]):
         """Log full primitive values (not just booleans)."""
-        cursor = self.conn.cursor()
-        
-        for symbol, primitives in primitives_by_symbol.items():
-            cursor.execute("""
+        self.conn.executemany("""
                 INSERT INTO primitive_values (
                     cycle_id, symbol,
                     zone_penetration_depth, zone_penetration_direction,
@@ -1188,7 +1261,7 @@ class ResearchDatabase:
                     absorption_event, refill_event,
                     liquidation_density, directional_continuity_value, trade_burst_count
                 ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
+            """, [(
                 cycle_id, symbol,
                 primitives.get('zone_penetration_depth'),
                 primitives.get('zone_penetration_direction'),
@@ -1213,10 +1286,40 @@ class ResearchDatabase:
                 primitives.get('liquidation_density'),
                 primitives.get('directional_continuity_value'),
                 primitives.get('trade_burst_count')
-            ))
+            ) for symbol, primitives in primitives_by_symbol.items()])
         
-        self.conn.commit()
+        self._commit()
     
+    # -------------------------------------------------------------------------
+    # Single-row market/event inserts
+    #
+    # Each log_* method below is split into an INSERT statement and a row
+    # builder taking the same arguments, so insert_batch() can write many
+    # buffered calls with one executemany.
+    # -------------------------------------------------------------------------
+
+    _LIQUIDATION_EVENT_SQL = """
+        INSERT INTO liquidation_events (
+            timestamp, symbol, side, price, volume,
+            created_node_id, reinforced_node_id
+        ) VALUES (?, ?, ?, ?, ?, ?, ?)
+    """
+
+    @staticmethod
+    def _liquidation_event_row(
+        timestamp: float,
+        symbol: str,
+        side: str,
+        price: float,
+        volume: float,
+        node_result: Optional[Dict[str, Any]] = None
+    ) -> tuple:
+        return (
+            timestamp, symbol, side, price, volume,
+            node_result.get('created_node_id') if node_result else None,
+            node_result.get('reinforced_node_id') if node_result else None
+        )
+
     def log_liquidation_event(
         self,
         timestamp: float,
@@ -1227,21 +1330,30 @@ class ResearchDatabase:
         node_result: Optional[Dict[str, Any]] = None
     ):
         """Log liquidation event for market context."""
-        cursor = self.conn.cursor()
-        
-        cursor.execute("""
-            INSERT INTO liquidation_events (
-                timestamp, symbol, side, price, volume,
-                created_node_id, reinforced_node_id
-            ) VALUES (?, ?, ?, ?, ?, ?, ?)
-        """, (
-            timestamp, symbol, side, price, volume,
-            node_result.get('created_node_id') if node_result else None,
-            node_result.get('reinforced_node_id') if node_result else None
+        self.conn.execute(self._LIQUIDATION_EVENT_SQL, self._liquidation_event_row(
+            timestamp, symbol, side, price, volume, node_result
         ))
-        
-        self.conn.commit()
-    
+        self._commit()
+
+    _OHLC_CANDLE_SQL = """
+        INSERT INTO ohlc_candles (
+            symbol, timestamp, open, high, low, close, volume, trade_count
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
+    @staticmethod
+    def _ohlc_candle_row(
+        symbol: str,
+        timestamp: float,
+        open_price: float,
+        high: float,
+        low: float,
+        close: float,
+        volume: float = 0,
+        trade_count: int = 0
+    ) -> tuple:
+        return (symbol, timestamp, open_price, high, low, close, volume, trade_count)
+
     def log_ohlc_candle(
         self,
         symbol: str,
@@ -1254,16 +1366,31 @@ class ResearchDatabase:
         trade_count: int = 0
     ):
         """Log 1-minute OHLC candle."""
-        cursor = self.conn.cursor()
-
-        cursor.execute("""
-            INSERT INTO ohlc_candles (
-                symbol, timestamp, open, high, low, close, volume, trade_count
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
+        self.conn.execute(self._OHLC_CANDLE_SQL, self._ohlc_candle_row(
             symbol, timestamp, open_price, high, low, close, volume, trade_count
         ))
-        self.conn.commit()
+        self._commit()
+
+    _ORDERBOOK_EVENT_SQL = """
+        INSERT INTO orderbook_events (
+            symbol, timestamp, best_bid_price, best_bid_qty,
+            best_ask_price, best_ask_qty
+        ) VALUES (?, ?, ?, ?, ?, ?)
+    """
+
+    @staticmethod
+    def _orderbook_event_row(
+        symbol: str,
+        timestamp: float,
+        best_bid_price: float,
+        best_bid_qty: float,
+        best_ask_price: float,
+        best_ask_qty: float
+    ) -> tuple:
+        return (
+            symbol, timestamp, best_bid_price, best_bid_qty,
+            best_ask_price, best_ask_qty
+        )
 
     def log_orderbook_event(
         self,
@@ -1275,18 +1402,39 @@ class ResearchDatabase:
         best_ask_qty: float
     ):
         """Log order book best bid/ask update."""
-        cursor = self.conn.cursor()
-
-        cursor.execute("""
-            INSERT INTO orderbook_events (
-                symbol, timestamp, best_bid_price, best_bid_qty,
-                best_ask_price, best_ask_qty
-            ) VALUES (?, ?, ?, ?, ?, ?)
-        """, (
+        self.conn.execute(self._ORDERBOOK_EVENT_SQL, self._orderbook_event_row(
             symbol, timestamp, best_bid_price, best_bid_qty,
             best_ask_price, best_ask_qty
         ))
-        self.conn.commit()
+        self._commit()
+
+    _ORDERBOOK_DEPTH_SQL = """
+        INSERT INTO orderbook_depth (
+            symbol, timestamp, bids, asks,
+            bid_total_qty, ask_total_qty, mid_price, spread_bps
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
+    @staticmethod
+    def _orderbook_depth_row(
+        symbol: str,
+        timestamp: float,
+        bids: list,
+        asks: list
+    ) -> tuple:
+        # Calculate aggregates
+        bid_total = sum(float(b[1]) for b in bids) if bids else 0
+        ask_total = sum(float(a[1]) for a in asks) if asks else 0
+
+        best_bid = float(bids[0][0]) if bids else 0
+        best_ask = float(asks[0][0]) if asks else 0
+        mid_price = (best_bid + best_ask) / 2 if best_bid and best_ask else 0
+        spread_bps = ((best_ask - best_bid) / mid_price * 10000) if mid_price else 0
+
+        return (
+            symbol, timestamp, json.dumps(bids), json.dumps(asks),
+            bid_total, ask_total, mid_price, spread_bps
+        )
 
     def log_orderbook_depth(
         self,
@@ -1303,27 +1451,31 @@ class ResearchDatabase:
             bids: List of [price, qty] pairs for bids
             asks: List of [price, qty] pairs for asks
         """
-        cursor = self.conn.cursor()
-
-        # Calculate aggregates
-        bid_total = sum(float(b[1]) for b in bids) if bids else 0
-        ask_total = sum(float(a[1]) for a in asks) if asks else 0
+        self.conn.execute(self._ORDERBOOK_DEPTH_SQL, self._orderbook_depth_row(
+            symbol, timestamp, bids, asks
+        ))
+        self._commit()
 
-        best_bid = float(bids[0][0]) if bids else 0
-        best_ask = float(asks[0][0]) if asks else 0
-        mid_price = (best_bid + best_ask) / 2 if best_bid and best_ask else 0
-        spread_bps = ((best_ask - best_bid) / mid_price * 10000) if mid_price else 0
+    _MARK_PRICE_SQL = """
+        INSERT INTO mark_prices (
+            symbol, timestamp, mark_price, index_price,
+            funding_rate, next_funding_time
+        ) VALUES (?, ?, ?, ?, ?, ?)
+    """
 
-        cursor.execute("""
-            INSERT INTO orderbook_depth (
-                symbol, timestamp, bids, asks,
-                bid_total_qty, ask_total_qty, mid_price, spread_bps
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            symbol, timestamp, json.dumps(bids), json.dumps(asks),
-            bid_total, ask_total, mid_price, spread_bps
-        ))
-        self.conn.commit()
+    @staticmethod
+    def _mark_price_row(
+        symbol: str,
+        timestamp: float,
+        mark_price: float,
+        index_price: float = None,
+        funding_rate: float = None,
+        next_funding_time: float = None
+    ) -> tuple:
+        return (
+            symbol, timestamp, mark_price, index_price,
+            funding_rate, next_funding_time
+        )
 
     def log_mark_price(
         self,
@@ -1344,18 +1496,27 @@ class ResearchDatabase:
             funding_rate: Current funding rate (optional)
             next_funding_time: Next funding timestamp (optional)
         """
-        cursor = self.conn.cursor()
-
-        cursor.execute("""
-            INSERT INTO mark_prices (
-                symbol, timestamp, mark_price, index_price,
-                funding_rate, next_funding_time
-            ) VALUES (?, ?, ?, ?, ?, ?)
-        """, (
+        self.conn.execute(self._MARK_PRICE_SQL, self._mark_price_row(
             symbol, timestamp, mark_price, index_price,
             funding_rate, next_funding_time
         ))
-        self.conn.commit()
+        self._commit()
+
+    _TRADE_EVENT_SQL = """
+        INSERT INTO trade_events (
+            symbol, timestamp, price, volume, is_buyer_maker
+        ) VALUES (?, ?, ?, ?, ?)
+    """
+
+    @staticmethod
+    def _trade_event_row(
+        symbol: str,
+        timestamp: float,
+        price: float,
+        volume: float,
+        is_buyer_maker: bool = False
+    ) -> tuple:
+        return (symbol, timestamp, price, volume, is_buyer_maker)
 
     def log_trade_event(
         self,
@@ -1366,16 +1527,10 @@ class ResearchDatabase:
         is_buyer_maker: bool = False
     ):
         """Log individual trade event for ground truth validation."""
-        cursor = self.conn.cursor()
-
-        cursor.execute("""
-            INSERT INTO trade_events (
-                symbol, timestamp, price, volume, is_buyer_maker
-            ) VALUES (?, ?, ?, ?, ?)
-        """, (
+        self.conn.execute(self._TRADE_EVENT_SQL, self._trade_event_row(
             symbol, timestamp, price, volume, is_buyer_maker
         ))
-        self.conn.commit()
+        self._commit()
 
     def log_policy_outcome(
         self,
@@ -1419,10 +1574,27 @@ class ResearchDatabase:
             executed_action, execution_success, rejection_reason,
             ghost_trade_id, realized_pnl, holding_duration_sec, exit_reason
         ))
-        self.conn.commit()
+        self._commit()
 
         return cursor.lastrowid
 
+    _MANDATE_SQL = """
+        INSERT INTO mandates (
+            cycle_id, symbol, mandate_type, authority, timestamp
+        ) VALUES (?, ?, ?, ?, ?)
+    """
+
+    @staticmethod
+    def _mandate_row(
+        cycle_id: int,
+        symbol: str,
+        mandate_type: str,
+        authority: float,
+        timestamp: float
+    ) -> Optional[tuple]:
+        if cycle_id is None: return None
+        return (cycle_id, symbol, mandate_type, authority, timestamp)
+
     def log_mandate(
         self,
         cycle_id: int,
@@ -1432,18 +1604,33 @@ class ResearchDatabase:
         timestamp: float
     ):
         """Log generated mandate."""
-        if cycle_id is None: return
-        cursor = self.conn.cursor()
-        
-        cursor.execute("""
-            INSERT INTO mandates (
-                cycle_id, symbol, mandate_type, authority, timestamp
-            ) VALUES (?, ?, ?, ?, ?)
-        """, (
-            cycle_id, symbol, mandate_type, authority, timestamp
-        ))
-        
-        self.conn.commit()
+        row = self._mandate_row(cycle_id, symbol, mandate_type, authority, timestamp)
+        if row is None: return
+        self.conn.execute(self._MANDATE_SQL, row)
+        self._commit()
+
+    # Matches table: cycle_id, symbol, mandate_count, conflicting_mandates, winning_policy, resolution_reason
+    _ARBITRATION_ROUND_SQL = """
+        INSERT INTO arbitration_rounds (
+            cycle_id, symbol, mandate_count, conflicting_mandates,
+            winning_policy, resolution_reason
+        ) VALUES (?, ?, ?, ?, ?, ?)
+    """
+
+    @staticmethod
+    def _arbitration_round_row(
+        cycle_id: int,
+        symbol: str,
+        mandate_count: int,
+        conflicting_mandates: str,
+        winning_mandate_type: str,
+        resolution_reason: str
+    ) -> Optional[tuple]:
+        if cycle_id is None: return None
+        return (
+            cycle_id, symbol, mandate_count, conflicting_mandates,
+            winning_mandate_type, resolution_reason
+        )
 
     def log_arbitration_round(
         self,
@@ -1455,49 +1642,78 @@ class ResearchDatabase:
         resolution_reason: str
     ):
         """Log arbitration conflict resolution."""
-        if cycle_id is None: return
-        cursor = self.conn.cursor()
-        
-        # Matches table: cycle_id, symbol, mandate_count, conflicting_mandates, winning_policy, resolution_reason
-        cursor.execute("""
-            INSERT INTO arbitration_rounds (
-                cycle_id, symbol, mandate_count, conflicting_mandates,
-                winning_policy, resolution_reason
-            ) VALUES (?, ?, ?, ?, ?, ?)
-        """, (
+        row = self._arbitration_round_row(
             cycle_id, symbol, mandate_count, conflicting_mandates,
             winning_mandate_type, resolution_reason
-        ))
-        
-        self.conn.commit()
+        )
+        if row is None: return
+        self.conn.execute(self._ARBITRATION_ROUND_SQL, row)
+        self._commit()
+
+    # Matches table: cycle_id, policy_name, symbol, generated_proposal, triggering_primitives, proposal_reason
+    _POLICY_EVALUATION_SQL = """
+        INSERT INTO policy_evaluations (
+            cycle_id, policy_name, symbol,
+            generated_proposal, triggering_primitives, proposal_reason
+        ) VALUES (?, ?, ?, ?, ?, ?)
+    """
 
-    def log_policy_evaluation(
-        self,
+    @staticmethod
+    def _policy_evaluation_row(
         cycle_id: int,
         symbol: str,
         policy_name: str,
         is_active: bool,
         confidence: float,
         components: Dict[str, Any]
-    ):
-        """Log policy evaluation details."""
-        if cycle_id is None: return
-        cursor = self.conn.cursor()
-        
-        # Matches table: cycle_id, policy_name, symbol, generated_proposal, triggering_primitives, proposal_reason
-        cursor.execute("""
-            INSERT INTO policy_evaluations (
-                cycle_id, policy_name, symbol,
-                generated_proposal, triggering_primitives, proposal_reason
-            ) VALUES (?, ?, ?, ?, ?, ?)
-        """, (
+    ) -> Optional[tuple]:
+        if cycle_id is None: return None
+        return (
             cycle_id, policy_name, symbol,
             1 if is_active else 0,
             json.dumps(components),
             f"Confidence: {confidence}"
-        ))
-        
-        self.conn.commit()
+        )
+
+    def log_policy_evaluation(
+        self,
+        cycle_id: int,
+        symbol: str,
+        policy_name: str,
+        is_active: bool,
+        confidence: float,
+        components: Dict[str, Any]
+    ):
+        """Log policy evaluation details."""
+        row = self._policy_evaluation_row(
+            cycle_id, symbol, policy_name, is_active, confidence, components
+        )
+        if row is None: return
+        self.conn.execute(self._POLICY_EVALUATION_SQL, row)
+        self._commit()
+
+    _M2_NODE_EVENT_SQL = """
+        INSERT INTO m2_node_events (
+            timestamp, event_type, node_id, symbol,
+            price, side, volume, strength_after
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
+    @staticmethod
+    def _m2_node_event_row(
+        timestamp: float,
+        event_type: str,
+        node_id: str,
+        symbol: str,
+        price: float,
+        side: str,
+        volume: float,
+        strength_after: float
+    ) -> tuple:
+        return (
+            timestamp, event_type, node_id, symbol,
+            price, side, volume, strength_after
+        )
 
     def log_m2_node_event(
         self,
@@ -1511,19 +1727,25 @@ class ResearchDatabase:
         strength_after: float
     ):
         """Log individual M2 node event (CREATED, REINFORCED, etc.)."""
-        cursor = self.conn.cursor()
-        
-        cursor.execute("""
-            INSERT INTO m2_node_events (
-                timestamp, event_type, node_id, symbol,
-                price, side, volume, strength_after
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
+        self.conn.execute(self._M2_NODE_EVENT_SQL, self._m2_node_event_row(
             timestamp, event_type, node_id, symbol,
             price, side, volume, strength_after
         ))
-        
-        self.conn.commit()
+        self._commit()
+
+    # log method -> (INSERT statement, row builder) for insert_batch()
+    _BATCH_INSERTS = {
+        'log_liquidation_event': (_LIQUIDATION_EVENT_SQL, '_liquidation_event_row'),
+        'log_ohlc_candle': (_OHLC_CANDLE_SQL, '_ohlc_candle_row'),
+        'log_orderbook_event': (_ORDERBOOK_EVENT_SQL, '_orderbook_event_row'),
+        'log_orderbook_depth': (_ORDERBOOK_DEPTH_SQL, '_orderbook_depth_row'),
+        'log_mark_price': (_MARK_PRICE_SQL, '_mark_price_row'),
+        'log_trade_event': (_TRADE_EVENT_SQL, '_trade_event_row'),
+        'log_mandate': (_MANDATE_SQL, '_mandate_row'),
+        'log_arbitration_round': (_ARBITRATION_ROUND_SQL, '_arbitration_round_row'),
+        'log_policy_evaluation': (_POLICY_EVALUATION_SQL, '_policy_evaluation_row'),
+        'log_m2_node_event': (_M2_NODE_EVENT_SQL, '_m2_node_event_row'),
+    }
 
     # =========================================================================
     # Hyperliquid Logging Methods
@@ -1575,7 +1797,7 @@ class ResearchDatabase:
             leverage, margin_used, unrealized_pnl,
             position_value, distance_to_liquidation_pct
         ))
-        self.conn.commit()
+        self._commit()
 
     def log_hl_liquidation_proximity(
         self,
@@ -1628,7 +1850,7 @@ class ResearchDatabase:
             short_avg_distance_pct, short_closest_liquidation,
             total_positions_at_risk, total_value_at_risk
         ))
-        self.conn.commit()
+        self._commit()
 
     def log_hl_cascade_event(
         self,
@@ -1672,7 +1894,7 @@ class ResearchDatabase:
             positions_at_risk, value_at_risk, dominant_side,
             closest_liquidation, notes
         ))
-        self.conn.commit()
+        self._commit()
 
     def add_hl_tracked_wallet(
         self,
@@ -1697,7 +1919,7 @@ class ResearchDatabase:
                 wallet_address, wallet_type, label
             ) VALUES (?, ?, ?)
         """, (wallet_address.lower(), wallet_type, label))
-        self.conn.commit()
+        self._commit()
 
         return cursor.lastrowid
 
@@ -1764,7 +1986,7 @@ class ResearchDatabase:
             VALUES (?, ?)
         """, (cycle_ts, cycle_type))
 
-        self.conn.commit()
+        self._commit()
         return cursor.lastrowid
 
     def end_hl_poll_cycle(
@@ -1799,7 +2021,7 @@ class ResearchDatabase:
         """, (wallets_polled, positions_found, liquidations_detected,
               api_errors, duration_ms, cycle_id))
 
-        self.conn.commit()
+        self._commit()
 
     def log_hl_position_snapshot_raw(
         self,
@@ -1852,7 +2074,7 @@ class ResearchDatabase:
             margin_used, position_value, unrealized_pnl
         ))
 
-        self.conn.commit()
+        self._commit()
         return cursor.lastrowid
 
     def log_hl_wallet_snapshot_raw(
@@ -1887,7 +2109,7 @@ class ResearchDatabase:
         """, (snapshot_ts, poll_cycle_id, wallet_address.lower(),
               account_value, total_margin_used, withdrawable))
 
-        self.conn.commit()
+        self._commit()
         return cursor.lastrowid
 
     def log_hl_liquidation_event_raw(
@@ -1939,7 +2161,7 @@ class ResearchDatabase:
             prev_snapshot_id, detection_method
         ))
 
-        self.conn.commit()
+        self._commit()
         return cursor.lastrowid
 
     def log_hl_oi_snapshot_raw(
@@ -1972,7 +2194,7 @@ class ResearchDatabase:
             ) VALUES (?, ?, ?, ?, ?, ?)
         """, (snapshot_ts, coin, open_interest, funding_rate, premium, day_ntl_vlm))
 
-        self.conn.commit()
+        self._commit()
         return cursor.lastrowid
 
     def log_hl_mark_price_raw(
@@ -2000,7 +2222,7 @@ class ResearchDatabase:
             VALUES (?, ?, ?, ?)
         """, (snapshot_ts, coin, mark_px, oracle_px))
 
-        self.conn.commit()
+        self._commit()
         return cursor.lastrowid
 
     def log_hl_funding_snapshot(
@@ -2028,7 +2250,7 @@ class ResearchDatabase:
             VALUES (?, ?, ?, ?)
         """, (snapshot_ts, coin, funding_rate, next_funding_ts))
 
-        self.conn.commit()
+        self._commit()
         return cursor.lastrowid
 
     def log_binance_funding_snapshot(
@@ -2063,7 +2285,7 @@ class ResearchDatabase:
             VALUES (?, ?, ?, ?, ?, ?)
         """, (snapshot_ts, coin, funding_rate, funding_time, mark_price, index_price))
 
-        self.conn.commit()
+        self._commit()
         return cursor.lastrowid
 
     def log_spot_price_snapshot(
@@ -2093,7 +2315,7 @@ class ResearchDatabase:
             VALUES (?, ?, ?, ?)
         """, (snapshot_ts, coin, price, source))
 
-        self.conn.commit()
+        self._commit()
         return cursor.lastrowid
 
     def get_binance_funding_history(
@@ -2191,7 +2413,7 @@ class ResearchDatabase:
         """, (wallet_address.lower(), discovery_ts, source_type,
               source_coin, source_value, source_metadata))
 
-        self.conn.commit()
+        self._commit()
         return cursor.lastrowid
 
     def set_hl_wallet_tier(
@@ -2220,7 +2442,7 @@ class ResearchDatabase:
                 updated_at = datetime('now')
         """, (wallet_address.lower(), tier, next_poll_ts))
 
-        self.conn.commit()
+        self._commit()
 
     def get_hl_wallets_due_for_poll(self, tier: int, current_ts: int) -> List[str]:
         """Get wallets that are due for polling in a specific tier.
@@ -2279,7 +2501,7 @@ class ResearchDatabase:
                 WHERE wallet_address = ?
             """, (last_poll_ts, next_poll_ts, wallet_address.lower()))
 
-        self.conn.commit()
+        self._commit()
 
     # =========================================================================
     # HLP24 Query Methods (for replay/analysis)
@@ -2417,7 +2639,7 @@ class ResearchDatabase:
             coin, start_ts, end_ts, oi_drop_pct, liquidation_count,
             wave_count, price_start, price_end, price_5min_after, outcome
         ))
-        self.conn.commit()
+        self._commit()
         return cursor.lastrowid
 
     def log_cascade_wave(
@@ -2449,7 +2671,7 @@ class ResearchDatabase:
                 liquidation_count, oi_drop_pct
             ) VALUES (?, ?, ?, ?, ?, ?)
         """, (cascade_id, wave_num, start_ts, end_ts, liquidation_count, oi_drop_pct))
-        self.conn.commit()
+        self._commit()
         return cursor.lastrowid
 
     def log_validation_result(
@@ -2488,7 +2710,7 @@ class ResearchDatabase:
             hypothesis_name, run_ts, total_events, supporting_events,
             success_rate, calibrated_threshold, status, notes
         ))
-        self.conn.commit()
+        self._commit()
         return cursor.lastrowid
 
     def get_labeled_cascades(
@@ -2637,7 +2859,7 @@ class ResearchDatabase:
             status, 1 if is_robust else 0, next_review_date,
             regime, strategy_name, version, notes
         ))
-        self.conn.commit()
+        self._commit()
         return cursor.lastrowid
 
     def get_active_threshold(
@@ -2785,7 +3007,7 @@ class ResearchDatabase:
             1 if is_robust else 0, grid_min, grid_max, grid_step,
             candidates_json, sensitivity_json, notes
         ))
-        self.conn.commit()
+        self._commit()
         return cursor.lastrowid
 
     def get_optimization_history(
@@ -2854,7 +3076,7 @@ class ResearchDatabase:
             ts_ns, window_name, metric_name, sample_count,
             mean_value, p50, p75, p95, p99, max_value, min_value
         ))
-        self.conn.commit()
+        self._commit()
         return cursor.lastrowid
 
     def log_decay_signal(
@@ -2893,7 +3115,7 @@ class ResearchDatabase:
             ts_ns, metric_name, recent_window, baseline_window,
             recent_value, baseline_value, change_pct, z_score
         ))
-        self.conn.commit()
+        self._commit()
         return cursor.lastrowid
 
     def get_decay_signals(
@@ -2964,7 +3186,7 @@ class ResearchDatabase:
                 ts_ns, event_type, details, previous_state, new_state
             ) VALUES (?, ?, ?, ?, ?)
         """, (ts_ns, event_type, details, previous_state, new_state))
-        self.conn.commit()
+        self._commit()
         return cursor.lastrowid
 
     def get_catastrophe_events(
@@ -3049,7 +3271,7 @@ class ResearchDatabase:
             trigger_reason,
             1 if manual_override_required else 0,
         ))
-        self.conn.commit()
+        self._commit()
 
     def log_recovery_attempt(
         self,
@@ -3077,7 +3299,7 @@ class ResearchDatabase:
                 ts_ns, failure_type, attempt_num, success, details
             ) VALUES (?, ?, ?, ?, ?)
         """, (ts_ns, failure_type, attempt_num, 1 if success else 0, details))
-        self.conn.commit()
+        self._commit()
         return cursor.lastrowid
 
     def get_recovery_attempts(
@@ -3168,7 +3390,7 @@ class ResearchDatabase:
             latency_p50_ns, latency_p95_ns, latency_p99_ns,
             slippage_mean_bps, slippage_p95_bps, sample_count
         ))
-        self.conn.commit()
+        self._commit()
         return cursor.lastrowid
 
     def get_gating_decisions(
@@ -3272,7 +3494,7 @@ class ResearchDatabase:
             gross_profit, gross_loss, profit_factor, expectancy_bps,
             avg_slippage_bps, max_slippage_bps
         ))
-        self.conn.commit()
+        self._commit()
         return cursor.lastrowid
 
     def get_strategy_performance(
@@ -3366,7 +3588,7 @@ class ResearchDatabase:
             strategy_id, symbol, win_rate, expectancy_bps,
             profit_factor, sample_count
         ))
-        self.conn.commit()
+        self._commit()
         return cursor.lastrowid
 
     def get_governor_decisions(
@@ -3467,7 +3689,7 @@ class ResearchDatabase:
             impact_containment, drawdown_discipline, strategy_diversification,
             reason
         ))
-        self.conn.commit()
+        self._commit()
         return cursor.lastrowid
 
     def save_capital_governor_state(
@@ -3509,7 +3731,7 @@ class ResearchDatabase:
             freeze_until_ns, freeze_reason, 1 if quarantine_active else 0,
             quarantine_pct, last_ath_ns, ath_value, consecutive_wins
         ))
-        self.conn.commit()
+        self._commit()
 
     def load_capital_governor_state(self) -> Optional[Dict]:
         """Load capital governor state.
@@ -3608,7 +3830,7 @@ class ResearchDatabase:
             alpha_trust, risk_trust, consistency_trust,
             1 if allows_trading else 0, capital_override, reason
         ))
-        self.conn.commit()
+        self._commit()
         return cursor.lastrowid
 
     def save_meta_governor_state(
@@ -3646,7 +3868,7 @@ class ResearchDatabase:
             capital_override,
             1 if requires_manual_reset else 0
         ))
-        self.conn.commit()
+        self._commit()
 
     def load_meta_governor_state(self) -> Optional[Dict]:
         """Load meta governor state.
@@ -3731,7 +3953,7 @@ class ResearchDatabase:
             ts_ns, metric_name, observed_value, baseline_mean,
             baseline_std, z_score, description
         ))
-        self.conn.commit()
+        self._commit()
         return cursor.lastrowid
 
     def get_unknown_threat_signals(
@@ -5341,7 +5341,11 @@ class MainWindow(QMainWindow):
         try:
             now = time.time()  # Define now at start of update cycle
 
-            snapshot: ObservationSnapshot = self.obs_system.query({'type': 'snapshot'})
+            # Read the collector's published snapshot (no M4 recomputation)
+            published = self.obs_system.query({'type': 'latest_snapshot'})
+            if published is None:
+                return  # Collector has not computed a snapshot yet
+            snapshot: ObservationSnapshot = published.snapshot
 
             if snapshot.status == ObservationStatus.FAILED:
                 raise SystemHaltedException("Status reports FAILED")
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Enriched Node Memory Benchmark
+
+Measures retained heap bytes per EnrichedLiquidityMemoryNode (tracemalloc),
+for nodes carrying increasing amounts of interaction/liquidation evidence,
+as held by ContinuityMemoryStore across active, dormant and archived sets.
+
+Usage:
+    python scripts/benchmark_enriched_node_memory.py
+    python scripts/benchmark_enriched_node_memory.py --nodes 20000 --interactions 0 10 50
+"""
+
+import argparse
+import gc
+import random
+import sys
+import tracemalloc
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from memory.enriched_memory_node import EnrichedLiquidityMemoryNode
+
+
+def build_node(i: int, interactions: int, rng: random.Random) -> EnrichedLiquidityMemoryNode:
+    """Node with `interactions` trade events and one liquidation per ten."""
+    center = 50000.0 * (1 + rng.uniform(-0.05, 0.05))
+    node = EnrichedLiquidityMemoryNode(
+        id=f"BTCUSDT_{i}",
+        symbol="BTCUSDT",
+        price_center=center,
+        price_band=center * 0.001,
+        side="both",
+        first_seen_ts=1000.0,
+        last_interaction_ts=1000.0,
+        strength=0.5,
+        confidence=0.5,
+        active=True,
+        decay_rate=0.0001,
+        creation_reason="benchmark",
+    )
+    ts = 1000.0
+    for k in range(interactions):
+        ts += rng.expovariate(0.2)
+        node.record_trade_execution(ts, rng.expovariate(1.0), rng.random() < 0.5)
+        if k % 10 == 0:
+            node.record_liquidation(ts, rng.choice(["BUY", "SELL"]))
+    node.checkpoint_strength()
+    return node
+
+
+def bytes_per_node(node_count: int, interactions: int, seed: int) -> float:
+    rng = random.Random(seed)
+    gc.collect()
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    nodes = [build_node(i, interactions, rng) for i in range(node_count)]
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # Exclude the holding list itself
+    held = current - baseline - sys.getsizeof(nodes)
+    return held / node_count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark EnrichedLiquidityMemoryNode memory")
+    parser.add_argument("--nodes", type=int, default=10000)
+    parser.add_argument("--interactions", type=int, nargs="+", default=[0, 5, 20])
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    print(f"{'interactions':>12} {'bytes/node':>12} {'MB per 10k':>11}")
+    for interactions in args.interactions:
+        per_node = bytes_per_node(args.nodes, interactions, args.seed)
+        print(f"{interactions:>12} {per_node:>12.0f} {per_node * 10000 / 1e6:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
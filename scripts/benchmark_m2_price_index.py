@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+M2 Price Index Benchmark
+
+Measures per-trade cost of the ContinuityMemoryStore node lookup used by
+ObservationSystem._associate_trade_with_nodes (get_nodes_near_price), for
+increasing node counts, against the previous full linear scan over
+_active_nodes.
+
+Usage:
+    python scripts/benchmark_m2_price_index.py
+    python scripts/benchmark_m2_price_index.py --nodes 1000 10000 50000 --trades 20000
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from memory.m2_continuity_store import ContinuityMemoryStore
+
+SYMBOLS = [
+    "BTCUSDT", "ETHUSDT", "SOLUSDT", "BNBUSDT", "XRPUSDT",
+    "DOGEUSDT", "ADAUSDT", "AVAXUSDT", "LINKUSDT", "DOTUSDT",
+]
+
+
+def build_store(node_count: int, rng: random.Random):
+    """Populate a store with liquidation-style nodes (0.1% bands) across symbols."""
+    store = ContinuityMemoryStore()
+    base_prices = {s: 10 ** rng.uniform(-1, 5) for s in SYMBOLS}
+    for i in range(node_count):
+        symbol = SYMBOLS[i % len(SYMBOLS)]
+        center = base_prices[symbol] * (1 + rng.uniform(-0.05, 0.05))
+        store.add_or_update_node(
+            node_id=f"{symbol}_{i}",
+            symbol=symbol,
+            price_center=center,
+            price_band=center * 0.001,
+            side="both",
+            timestamp=1000.0,
+            creation_reason="benchmark",
+        )
+    return store, base_prices
+
+
+def linear_scan(store: ContinuityMemoryStore, symbol: str, price: float):
+    """Previous get_nodes_near_price implementation (full scan)."""
+    return [
+        node for node in store._active_nodes.values()
+        if node.symbol == symbol and node.overlaps(price)
+    ]
+
+
+def time_per_trade(fn, store, trades) -> float:
+    start = time.perf_counter()
+    for symbol, price in trades:
+        fn(store, symbol, price)
+    return (time.perf_counter() - start) / len(trades) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark M2 per-trade node lookup")
+    parser.add_argument("--nodes", type=int, nargs="+", default=[100, 1000, 5000, 20000])
+    parser.add_argument("--trades", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    print(f"{'nodes':>8} {'scan us/trade':>15} {'index us/trade':>15} {'speedup':>9}")
+    for node_count in args.nodes:
+        rng = random.Random(args.seed)
+        store, base_prices = build_store(node_count, rng)
+        trades = []
+        for _ in range(args.trades):
+            symbol = rng.choice(SYMBOLS)
+            trades.append((symbol, base_prices[symbol] * (1 + rng.uniform(-0.05, 0.05))))
+
+        scan_us = time_per_trade(linear_scan, store, trades)
+        index_us = time_per_trade(
+            lambda st, sym, px: st.get_nodes_near_price(sym, px), store, trades
+        )
+        print(f"{node_count:>8} {scan_us:>15.2f} {index_us:>15.2f} {scan_us / index_us:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -17,7 +17,9 @@ from data_pipeline.replay.db_feeds import (
     DatabaseTradeFeed,
     DatabaseLiquidationFeed,
     DatabaseCandleFeed,
+    DatabaseReplaySource,
 )
+from masterframe.replay import EventLoop
 
 
 class TestDatabaseOrderbookFeed:
@@ -28,7 +30,7 @@ class TestDatabaseOrderbookFeed:
         """Feed initializes with connection."""
         mock_conn = MagicMock()
         mock_cursor = MagicMock()
-        mock_cursor.fetchone.return_value = None  # No data
+        mock_cursor.fetchmany.return_value = []  # No data
         mock_conn.cursor.return_value = mock_cursor
         mock_connect.return_value = mock_conn
         
@@ -44,11 +46,11 @@ class TestDatabaseOrderbookFeed:
         mock_cursor = MagicMock()
         
         # Mock data row
-        mock_cursor.fetchone.return_value = (
+        mock_cursor.fetchmany.return_value = [(
             1000.0,  # timestamp
             '[[50000.0, 1.0]]',  # bids JSON
             '[[50001.0, 1.0]]'   # asks JSON
-        )
+        )]
         
         mock_conn.cursor.return_value = mock_cursor
         mock_connect.return_value = mock_conn
@@ -62,7 +64,7 @@ class TestDatabaseOrderbookFeed:
         """has_more() returns False when no data."""
         mock_conn = MagicMock()
         mock_cursor = MagicMock()
-        mock_cursor.fetchone.return_value = None
+        mock_cursor.fetchmany.return_value = []
         mock_conn.cursor.return_value = mock_cursor
         mock_connect.return_value = mock_conn
         
@@ -75,11 +77,11 @@ class TestDatabaseOrderbookFeed:
         """peek_next_timestamp() returns timestamp without consuming."""
         mock_conn = MagicMock()
         mock_cursor = MagicMock()
-        mock_cursor.fetchone.return_value = (
+        mock_cursor.fetchmany.return_value = [(
             1234.0,
             '[[50000.0, 1.0]]',
             '[[50001.0, 1.0]]'
-        )
+        )]
         mock_conn.cursor.return_value = mock_cursor
         mock_connect.return_value = mock_conn
         
@@ -98,11 +100,13 @@ class TestDatabaseOrderbookFeed:
         mock_conn = MagicMock()
         mock_cursor = MagicMock()
         
-        # Two rows, then None
-        mock_cursor.fetchone.side_effect = [
-            (1000.0, '[[50000.0, 1.0]]', '[[50001.0, 1.0]]'),
-            (2000.0, '[[50100.0, 1.0]]', '[[50101.0, 1.0]]'),
-            None
+        # Two rows, then end of cursor
+        mock_cursor.fetchmany.side_effect = [
+            [
+                (1000.0, '[[50000.0, 1.0]]', '[[50001.0, 1.0]]'),
+                (2000.0, '[[50100.0, 1.0]]', '[[50101.0, 1.0]]'),
+            ],
+            [],
         ]
         
         mock_conn.cursor.return_value = mock_cursor
@@ -130,7 +134,7 @@ class TestDatabaseOrderbookFeed:
         """Time range parameters added to SQL."""
         mock_conn = MagicMock()
         mock_cursor = MagicMock()
-        mock_cursor.fetchone.return_value = None
+        mock_cursor.fetchmany.return_value = []
         mock_conn.cursor.return_value = mock_cursor
         mock_connect.return_value = mock_conn
         
@@ -161,9 +165,11 @@ class TestDatabaseTradeFeed:
         mock_conn = MagicMock()
         mock_cursor = MagicMock()
         
-        mock_cursor.fetchone.side_effect = [
-            (1000.0, 50000.0, 1.5, True),  # trade data
-            None
+        mock_cursor.fetchmany.side_effect = [
+            [
+                (1000.0, 50000.0, 1.5, True),  # trade data
+            ],
+            [],
         ]
         
         mock_conn.cursor.return_value = mock_cursor
@@ -188,9 +194,11 @@ class TestDatabaseLiquidationFeed:
         mock_conn = MagicMock()
         mock_cursor = MagicMock()
         
-        mock_cursor.fetchone.side_effect = [
-            (1000.0, "SELL", 50000.0, 2.0),
-            None
+        mock_cursor.fetchmany.side_effect = [
+            [
+                (1000.0, "SELL", 50000.0, 2.0),
+            ],
+            [],
         ]
         
         mock_conn.cursor.return_value = mock_cursor
@@ -215,9 +223,11 @@ class TestDatabaseCandleFeed:
         mock_conn = MagicMock()
         mock_cursor = MagicMock()
         
-        mock_cursor.fetchone.side_effect = [
-            (1000.0, 50000.0, 50100.0, 49900.0, 50050.0, 1000.0, True),
-            None
+        mock_cursor.fetchmany.side_effect = [
+            [
+                (1000.0, 50000.0, 50100.0, 49900.0, 50050.0, 1000.0, True),
+            ],
+            [],
         ]
         
         mock_conn.cursor.return_value = mock_cursor
@@ -233,5 +243,87 @@ class TestDatabaseCandleFeed:
         assert event.data.close == 50050.0
 
 
+
+def _batched_cursor(rows, batch_size):
+    """Cursor mock serving rows through fetchmany(batch_size)."""
+    cursor = MagicMock()
+    batches = [rows[i:i + batch_size] for i in range(0, len(rows), batch_size)] + [[]]
+    cursor.fetchmany.side_effect = batches
+    return cursor
+
+
+class TestServerSideStreaming:
+    """Test batched server-side cursor streaming."""
+    
+    @patch('data_pipeline.replay.db_feeds.psycopg2.connect')
+    def test_named_cursor_batches(self, mock_connect):
+        """Rows stream from a named cursor in fetchmany batches."""
+        rows = [
+            (float(i), f'[[{50000 + i}.0, 1.0], [49999.0, 2.0]]', f'[[{50001 + i}.0, 1.0]]')
+            for i in range(25)
+        ]
+        mock_conn = MagicMock()
+        mock_cursor = _batched_cursor(rows, 10)
+        mock_conn.cursor.return_value = mock_cursor
+        mock_connect.return_value = mock_conn
+        
+        feed = DatabaseOrderbookFeed("postgresql://test", "BTCUSDT", batch_size=10)
+        
+        assert mock_conn.cursor.call_args.kwargs['name'].startswith('replay_orderbook_events_')
+        assert mock_cursor.fetchmany.call_count == 1  # Only the first batch so far
+        
+        events = []
+        while feed.has_more():
+            events.append(feed.emit_next())
+        
+        assert [e.timestamp for e in events] == [float(i) for i in range(25)]
+        assert mock_cursor.fetchmany.call_count == 4
+        assert events[3].data.bids == ((50003.0, 1.0), (49999.0, 2.0))
+        assert events[3].data.asks == ((50004.0, 1.0),)
+        assert events[3].data.mid_price == (50003.0 + 50004.0) / 2.0
+    
+    @patch('data_pipeline.replay.db_feeds.psycopg2.connect')
+    def test_jsonb_columns(self, mock_connect):
+        """Already-decoded (jsonb) book columns are accepted."""
+        mock_conn = MagicMock()
+        mock_conn.cursor.return_value = _batched_cursor(
+            [(1.0, [[100.0, 1.0]], [[102.0, 1.0]])], 10)
+        mock_connect.return_value = mock_conn
+        
+        feed = DatabaseOrderbookFeed("postgresql://test", "BTCUSDT")
+        
+        assert feed.emit_next().data.mid_price == 101.0
+    
+    @patch('data_pipeline.replay.db_feeds.psycopg2.connect')
+    def test_replay_source_shares_connection_and_merges(self, mock_connect):
+        """All feeds use one connection; events reach the loop in time order."""
+        mock_conn = MagicMock()
+        mock_conn.cursor.side_effect = [
+            _batched_cursor([(2.0, '[[1.0, 1.0]]', '[[3.0, 1.0]]'),
+                             (5.0, '[[1.0, 1.0]]', '[[3.0, 1.0]]')], 2),
+            _batched_cursor([(1.0, 100.0, 1.0, True), (5.0, 100.0, 1.0, False)], 2),
+            _batched_cursor([(3.0, "SELL", 100.0, 1.0)], 2),
+            _batched_cursor([(4.0, 1.0, 1.0, 1.0, 1.0, 1.0, True)], 2),
+        ]
+        mock_connect.return_value = mock_conn
+        
+        source = DatabaseReplaySource("postgresql://test", "BTCUSDT", batch_size=2)
+        
+        mock_connect.assert_called_once()
+        loop = EventLoop()
+        processed = []
+        for event_type in ('orderbook', 'trade', 'liquidation', 'kline'):
+            loop.register_handler(event_type, lambda e: processed.append((e.timestamp, e.event_type)))
+        
+        assert source.run(loop) == 6
+        assert processed == [
+            (1.0, 'trade'), (2.0, 'orderbook'), (3.0, 'liquidation'),
+            (4.0, 'kline'), (5.0, 'orderbook'), (5.0, 'trade'),
+        ]
+        
+        source.close()
+        mock_conn.close.assert_called_once()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "-s"])
@@ -75,9 +75,11 @@ class TestEventShapeParity:
         
         mock_conn = MagicMock()
         mock_cursor = MagicMock()
-        mock_cursor.fetchone.side_effect = [
-            (1000.0, '[[50000.0, 1.0]]', '[[50001.0, 1.0]]'),
-            None
+        mock_cursor.fetchmany.side_effect = [
+            [
+                (1000.0, '[[50000.0, 1.0]]', '[[50001.0, 1.0]]'),
+            ],
+            [],
         ]
         mock_conn.cursor.return_value = mock_cursor
         
@@ -99,9 +101,11 @@ class TestEventShapeParity:
         # Test orderbook feed
         mock_conn = MagicMock()
         mock_cursor = MagicMock()
-        mock_cursor.fetchone.side_effect = [
-            (1000.0, '[[50000.0, 1.0]]', '[[50001.0, 1.0]]'),
-            None
+        mock_cursor.fetchmany.side_effect = [
+            [
+                (1000.0, '[[50000.0, 1.0]]', '[[50001.0, 1.0]]'),
+            ],
+            [],
         ]
         mock_conn.cursor.return_value = mock_cursor
         
@@ -111,9 +115,11 @@ class TestEventShapeParity:
             assert isinstance(event, Event)
         
         # Test trade feed
-        mock_cursor.fetchone.side_effect = [
-            (1000.0, 50000.0, 1.0, True),
-            None
+        mock_cursor.fetchmany.side_effect = [
+            [
+                (1000.0, 50000.0, 1.0, True),
+            ],
+            [],
         ]
         
         with patch('data_pipeline.replay.db_feeds.psycopg2.connect', return_value=mock_conn):
@@ -148,9 +154,11 @@ class TestHandlerCompatibility:
         # Test with database orderbook feed
         mock_conn = MagicMock()
         mock_cursor = MagicMock()
-        mock_cursor.fetchone.side_effect = [
-            (1000.0, '[[50000.0, 1.0]]', '[[50001.0, 1.0]]'),
-            None
+        mock_cursor.fetchmany.side_effect = [
+            [
+                (1000.0, '[[50000.0, 1.0]]', '[[50001.0, 1.0]]'),
+            ],
+            [],
         ]
         mock_conn.cursor.return_value = mock_cursor
         
@@ -166,9 +174,11 @@ class TestHandlerCompatibility:
         
         # Test with trade feed
         events_received.clear()
-        mock_cursor.fetchone.side_effect = [
-            (2000.0, 50000.0, 1.0, True),
-            None
+        mock_cursor.fetchmany.side_effect = [
+            [
+                (2000.0, 50000.0, 1.0, True),
+            ],
+            [],
         ]
         
         with patch('data_pipeline.replay.db_feeds.psycopg2.connect', return_value=mock_conn):
@@ -193,11 +203,13 @@ class TestOrderingParity:
         mock_cursor = MagicMock()
         
         # Multiple events in order
-        mock_cursor.fetchone.side_effect = [
-            (1000.0, '[[50000.0, 1.0]]', '[[50001.0, 1.0]]'),
-            (2000.0, '[[50100.0, 1.0]]', '[[50101.0, 1.0]]'),
-            (3000.0, '[[50200.0, 1.0]]', '[[50201.0, 1.0]]'),
-            None
+        mock_cursor.fetchmany.side_effect = [
+            [
+                (1000.0, '[[50000.0, 1.0]]', '[[50001.0, 1.0]]'),
+                (2000.0, '[[50100.0, 1.0]]', '[[50101.0, 1.0]]'),
+                (3000.0, '[[50200.0, 1.0]]', '[[50201.0, 1.0]]'),
+            ],
+            [],
         ]
         mock_conn.cursor.return_value = mock_cursor
         
@@ -220,7 +232,7 @@ class TestOrderingParity:
         
         mock_conn = MagicMock()
         mock_cursor = MagicMock()
-        mock_cursor.fetchone.return_value = (1000.0, '[[50000.0, 1.0]]', '[[50001.0, 1.0]]')
+        mock_cursor.fetchmany.return_value = [(1000.0, '[[50000.0, 1.0]]', '[[50001.0, 1.0]]')]
         mock_conn.cursor.return_value = mock_cursor
         
         with patch('data_pipeline.replay.db_feeds.psycopg2.connect', return_value=mock_conn):
@@ -264,9 +276,11 @@ class TestNoSourceAwareness:
         # Works with any feed type
         mock_conn = MagicMock()
         mock_cursor = MagicMock()
-        mock_cursor.fetchone.side_effect = [
-            (1000.0, '[[50000.0, 1.0]]', '[[50001.0, 1.0]]'),
-            None
+        mock_cursor.fetchmany.side_effect = [
+            [
+                (1000.0, '[[50000.0, 1.0]]', '[[50001.0, 1.0]]'),
+            ],
+            [],
         ]
         mock_conn.cursor.return_value = mock_cursor
         
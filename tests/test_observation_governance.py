@@ -15,6 +15,7 @@ Authority: EPISTEMIC_CONSTITUTION.md, SYSTEM_CANON.md
 
 import pytest
 import sys
+import threading
 import time
 
 sys.path.append('D:/liquidation-trading')
@@ -780,5 +781,224 @@ class TestObservationSystemInvariants:
             obs.query({'type': 'snapshot'})
 
 
+
+# ============================================================================
+# TEST SUITE 7: Primitive Reuse (Dirty Tracking)
+# ============================================================================
+
+class TestObservationSystemPrimitiveReuse:
+    @pytest.fixture
+    def obs(self):
+        return ObservationSystem(['BTCUSDT', 'ETHUSDT'])
+
+    @staticmethod
+    def _trade(obs, ts, price, qty='0.5', maker=False, symbol='BTCUSDT'):
+        obs.ingest_observation(ts, symbol, 'TRADE', {
+            'p': str(price), 'q': qty, 'T': int(ts * 1000), 'm': maker
+        })
+
+    @staticmethod
+    def _fresh_primitives(obs):
+        """Recompute all primitives with caches cleared."""
+        obs._market_primitive_cache.clear()
+        obs._bundle_cache.clear()
+        return obs.query({'type': 'snapshot'}).primitives
+
+    def test_idle_symbol_reuses_previous_bundle(self, obs):
+        """Symbols without new input return the previous bundle object."""
+        obs.advance_time(1700000000.0)
+        for i in range(12):
+            self._trade(obs, 1700000000.0 + i * 0.01, 50000.0 + i)
+
+        first = obs.query({'type': 'snapshot'})
+        obs.advance_time(1700000000.2)
+        second = obs.query({'type': 'snapshot'})
+
+        assert second.primitives['BTCUSDT'] is first.primitives['BTCUSDT']
+        assert second.primitives['ETHUSDT'] is first.primitives['ETHUSDT']
+        assert obs.get_primitive_cache_metrics()['hits'] == 2
+
+    def test_new_input_invalidates_only_changed_symbol(self, obs):
+        """A trade on one symbol recomputes that symbol only."""
+        obs.advance_time(1700000000.0)
+        for i in range(12):
+            self._trade(obs, 1700000000.0 + i * 0.01, 50000.0 + i)
+        first = obs.query({'type': 'snapshot'})
+
+        self._trade(obs, 1700000000.15, 50100.0)
+        second = obs.query({'type': 'snapshot'})
+
+        assert second.primitives['BTCUSDT'] is not first.primitives['BTCUSDT']
+        assert second.primitives['ETHUSDT'] is first.primitives['ETHUSDT']
+        assert second.primitives['BTCUSDT'].trade_burst.trade_count == 13
+
+    def test_reuse_across_second_boundary_matches_fresh_computation(self, obs):
+        """Reused primitives carry the same snapshot-time IDs as a fresh computation."""
+        obs.advance_time(1700000000.0)
+        for i in range(12):
+            self._trade(obs, 1700000000.0 + i * 0.01, 50000.0 + (i % 3))
+        obs.query({'type': 'snapshot'})
+
+        obs.advance_time(1700000003.0)
+        reused = obs.query({'type': 'snapshot'}).primitives['BTCUSDT']
+
+        assert reused.price_traversal_velocity.traversal_id == "BTCUSDT_1700000003"
+        assert reused == self._fresh_primitives(obs)['BTCUSDT']
+
+    def test_cached_snapshots_match_uncached_over_event_sequence(self, obs):
+        """Dirty tracking never changes snapshot contents."""
+        ts = 1700000000.0
+        obs.advance_time(ts)
+        for step in range(40):
+            ts += 0.2
+            obs.advance_time(ts)
+            if step % 3 == 0:
+                self._trade(obs, ts, 50000.0 + step, qty='0.05', maker=step % 2 == 0)
+            if step % 5 == 0:
+                obs.ingest_observation(ts, 'BTCUSDT', 'DEPTH', {
+                    'E': int(ts * 1000),
+                    'b': [['49999.0', str(10.0 + step)]],
+                    'a': [['50001.0', str(8.0 + step % 4)]]
+                })
+            if step % 7 == 0:
+                obs.ingest_observation(ts, 'ETHUSDT', 'LIQUIDATION', {
+                    'E': int(ts * 1000),
+                    'o': {'p': str(3000.0 + step), 'q': '2.0', 'S': 'SELL'}
+                })
+                self._trade(obs, ts, 3000.0 + step, qty='1.0', symbol='ETHUSDT')
+
+            cached = obs.query({'type': 'snapshot'}).primitives
+            assert cached == self._fresh_primitives(obs)
+
+
+# ============================================================================
+# TEST SUITE: Deferred Ingest (snapshot on another thread)
+# ============================================================================
+
+class TestObservationSystemDeferredIngest:
+    def _trade(self, obs, ts, price):
+        obs.ingest_observation(ts, 'BTCUSDT', 'TRADE', {
+            'p': str(price), 'q': '1.0', 'T': int(ts * 1000), 'm': False
+        })
+
+    def test_ingest_deferred_while_state_locked(self):
+        """Events arriving during a snapshot are applied in order afterwards."""
+        obs = ObservationSystem(['BTCUSDT'])
+        obs.advance_time(1700000000.0)
+        self._trade(obs, 1700000000.0, 50000.0)
+
+        with obs._state_lock:
+            self._trade(obs, 1700000000.1, 50001.0)
+            self._trade(obs, 1700000000.2, 50002.0)
+            assert len(obs._m1.raw_trades['BTCUSDT']) == 1
+
+        assert obs.get_deferred_ingest_metrics() == {'deferred_total': 2, 'deferred_pending': 2}
+        obs.query({'type': 'snapshot'})
+        prices = list(obs._m1.raw_trades['BTCUSDT'].column('price'))
+        assert prices == [50000.0, 50001.0, 50002.0]
+        assert obs.get_deferred_ingest_metrics()['deferred_pending'] == 0
+
+    def test_next_ingest_drains_deferred_first(self):
+        """A direct ingest applies earlier deferred events before its own."""
+        obs = ObservationSystem(['BTCUSDT'])
+        obs.advance_time(1700000000.0)
+        with obs._state_lock:
+            self._trade(obs, 1700000000.1, 50001.0)
+        self._trade(obs, 1700000000.2, 50002.0)
+
+        prices = list(obs._m1.raw_trades['BTCUSDT'].column('price'))
+        assert prices == [50001.0, 50002.0]
+
+
+    def test_hl_liquidation_tracking_shared_across_threads(self):
+        """Recording (ingest) and pruning (cleanup) may run on different threads."""
+        obs = ObservationSystem(['BTCUSDT'])
+        now = time.time()
+
+        def record():
+            for i in range(2000):
+                obs.record_hl_liquidation(f'SYM{i % 50}', now, 1000.0)
+
+        def prune():
+            for _ in range(200):
+                obs.prune_hl_liquidation_tracking()
+
+        threads = [threading.Thread(target=record), threading.Thread(target=prune)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert obs.get_hl_liquidation_metrics()['symbols_tracked'] == 50
+        assert all(len(obs._hl_liquidation_values[s]) == 40
+                   for s in obs._hl_liquidation_timestamps)
+
+
+# ============================================================================
+# TEST SUITE: Published Snapshot Slot
+# ============================================================================
+
+class TestObservationSystemPublishedSnapshot:
+    def test_latest_snapshot_none_before_first_compute(self):
+        obs = ObservationSystem(['BTCUSDT'])
+
+        assert obs.query({'type': 'latest_snapshot'}) is None
+        assert obs.query({'type': 'snapshot_since', 'version': 0}) is None
+
+    def test_advance_publishes_versioned_snapshot(self):
+        obs = ObservationSystem(['BTCUSDT'])
+        obs.advance_time(1700000000.0, publish_snapshot=True)
+
+        published = obs.query({'type': 'latest_snapshot'})
+        assert published.version == 1
+        assert published.snapshot.timestamp == 1700000000.0
+
+        obs.advance_time(1700000001.0, publish_snapshot=True)
+        published = obs.query({'type': 'latest_snapshot'})
+        assert published.version == 2
+        assert published.snapshot.timestamp == 1700000001.0
+
+    def test_snapshot_query_does_not_publish(self):
+        obs = ObservationSystem(['BTCUSDT'])
+        obs.advance_time(1700000000.0)
+
+        obs.query({'type': 'snapshot'})
+        assert obs.query({'type': 'latest_snapshot'}) is None
+
+        obs.advance_time(1700000001.0, publish_snapshot=True)
+        obs.query({'type': 'snapshot'})
+        assert obs.query({'type': 'latest_snapshot'}).version == 1
+
+    def test_readers_never_recompute(self):
+        obs = ObservationSystem(['BTCUSDT'])
+        obs.advance_time(1700000000.0, publish_snapshot=True)
+
+        calls = []
+        original = obs._get_snapshot
+        obs._get_snapshot = lambda: calls.append(1) or original()
+
+        for _ in range(10):
+            obs.query({'type': 'latest_snapshot'})
+            obs.query({'type': 'snapshot_since', 'version': 0})
+        assert calls == []
+
+    def test_snapshot_since_version(self):
+        obs = ObservationSystem(['BTCUSDT'])
+        obs.advance_time(1700000000.0, publish_snapshot=True)
+
+        assert obs.query({'type': 'snapshot_since', 'version': 0}).version == 1
+        assert obs.query({'type': 'snapshot_since', 'version': 1}) is None
+
+        obs.advance_time(1700000000.5, publish_snapshot=True)
+        assert obs.query({'type': 'snapshot_since', 'version': 1}).version == 2
+
+    def test_published_queries_halt_on_failure(self):
+        obs = ObservationSystem(['BTCUSDT'])
+        obs.advance_time(1700000000.0, publish_snapshot=True)
+        obs._trigger_failure("test")
+
+        with pytest.raises(SystemHaltedException):
+            obs.query({'type': 'latest_snapshot'})
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
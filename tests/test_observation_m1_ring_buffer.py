@@ -0,0 +1,97 @@
+"""
+M1 Columnar Ring Buffer Test Suite
+
+Verifies the columnar rings behave like deque(maxlen=...) of normalized
+event dicts, and that column views are contiguous, zero-copy windows.
+"""
+
+import random
+from collections import deque
+
+import pytest
+
+from observation.internal.m1_ingestion import M1IngestionEngine
+from observation.internal.m1_ring_buffer import DepthRingBuffer, TradeRingBuffer
+
+
+def _trade(i, rng):
+    price = round(rng.uniform(99, 101), 2)
+    quantity = round(rng.expovariate(1.0), 3)
+    return {
+        'timestamp': 1700000000.0 + i,
+        'symbol': 'BTCUSDT',
+        'price': price,
+        'quantity': quantity,
+        'side': rng.choice(['BUY', 'SELL']),
+        'base_qty': quantity,
+        'quote_qty': quantity * price,
+        'side_validation': rng.choice(['VALIDATED', 'MISMATCH', 'UNVALIDATED'])
+    }
+
+
+class TestColumnarRingBuffer:
+    def test_matches_deque_through_wraparound(self):
+        """Rows, indexing and columns match a maxlen deque of the same events."""
+        rng = random.Random(11)
+        ring = TradeRingBuffer(7)
+        reference = deque(maxlen=7)
+
+        for i in range(30):
+            event = _trade(i, rng)
+            ring.append(event)
+            reference.append(event)
+
+            assert len(ring) == len(reference)
+            assert list(ring) == list(reference)
+            assert ring[0] == reference[0]
+            assert ring[-1] == reference[-1]
+            assert list(ring.column('price')) == [e['price'] for e in reference]
+            assert list(ring.column('timestamp')) == [e['timestamp'] for e in reference]
+            assert ring.labels('side') == [e['side'] for e in reference]
+
+    def test_column_is_zero_copy_view(self):
+        """column() aliases ring storage instead of copying it."""
+        ring = TradeRingBuffer(4)
+        rng = random.Random(1)
+        for i in range(6):
+            ring.append(_trade(i, rng))
+
+        view = ring.column('price')
+        assert isinstance(view, memoryview)
+        assert view.contiguous
+        assert view.obj is ring.column('price').obj
+        assert view[1:3].tolist() == [ring[1]['price'], ring[2]['price']]
+
+    def test_index_out_of_range(self):
+        """Indexing past the live window raises IndexError."""
+        ring = TradeRingBuffer(3)
+        ring.append(_trade(0, random.Random(0)))
+        with pytest.raises(IndexError):
+            ring[1]
+        with pytest.raises(IndexError):
+            ring[-2]
+
+    def test_depth_missing_prices_round_trip(self):
+        """None best bid/ask prices are restored as None."""
+        ring = DepthRingBuffer(2)
+        event = {
+            'timestamp': 1.0, 'symbol': 'BTCUSDT', 'bid_size': 0.0, 'ask_size': 2.0,
+            'best_bid_price': None, 'best_ask_price': 101.0, 'bid_levels': 0, 'ask_levels': 1
+        }
+        ring.append(event)
+        assert ring[0] == event
+
+
+class TestM1ColumnarBuffers:
+    def test_engine_columns_follow_ingest(self):
+        """Engine buffers expose ingested trades as columns, oldest first."""
+        engine = M1IngestionEngine(trade_buffer_size=5)
+        for i in range(8):
+            engine.normalize_trade('BTCUSDT', {
+                'p': str(100 + i), 'q': '1.0', 'T': 1700000000000 + i * 1000, 'm': i % 2 == 0
+            })
+
+        trades = engine.raw_trades['BTCUSDT']
+        assert list(trades.column('price')) == [103.0, 104.0, 105.0, 106.0, 107.0]
+        assert trades.labels('side') == ['BUY', 'SELL', 'BUY', 'SELL', 'BUY']
+        assert engine.get_buffers()['trades']['BTCUSDT'][0]['price'] == 103.0
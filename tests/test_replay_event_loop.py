@@ -247,6 +247,46 @@ class TestEventLoop:
         loop.run()
         
         assert loop.get_events_processed() == 10
+    
+    def test_run_stream_interleaves_scheduled_events(self):
+        """Streamed events and handler-scheduled events run in time order."""
+        loop = EventLoop()
+        processed = []
+        
+        def on_stream(event: Event):
+            processed.append((event.timestamp, 'stream'))
+            if event.timestamp == 1.0:
+                # Follow-ups: one due before the next stream event, one after all
+                loop.schedule_event(Event(1.5, 'scheduled', None))
+                loop.schedule_event(Event(9.0, 'scheduled', None))
+        
+        loop.register_handler('stream', on_stream)
+        loop.register_handler('scheduled', lambda e: processed.append((e.timestamp, 'scheduled')))
+        
+        loop.run_stream(Event(float(t), 'stream', None) for t in (1, 2, 3))
+        
+        assert processed == [
+            (1.0, 'stream'), (1.5, 'scheduled'), (2.0, 'stream'),
+            (3.0, 'stream'), (9.0, 'scheduled'),
+        ]
+        assert loop.get_current_time() == 9.0
+        assert loop.get_events_processed() == 5
+    
+    def test_run_stream_stop(self):
+        """stop() during a streamed event ends the run without pulling more."""
+        loop = EventLoop()
+        pulled = []
+        
+        def stream():
+            for t in range(10):
+                pulled.append(t)
+                yield Event(float(t), 'test', None)
+        
+        loop.register_handler('test', lambda e: loop.stop() if e.timestamp == 2.0 else None)
+        loop.run_stream(stream())
+        
+        assert loop.get_events_processed() == 3
+        assert pulled == [0, 1, 2]
 
 
 if __name__ == "__main__":
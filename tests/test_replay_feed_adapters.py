@@ -27,6 +27,7 @@ from masterframe.replay.feed_adapters import (
     LiquidationFeedAdapter,
     KlineFeedAdapter,
     get_next_event,
+    merge_feeds,
     schedule_all_events,
 )
 
@@ -249,6 +250,38 @@ class TestMultiFeedSynchronization:
         
         event = get_next_event([adapter1, adapter2])
         assert event is None
+    
+    def test_merge_feeds_matches_get_next_event(self):
+        """Heap merge yields the same sequence as repeated get_next_event."""
+        import random
+        rng = random.Random(1)
+        
+        def make_adapters():
+            rng.seed(1)
+            return [
+                TradeFeedAdapter([AggressiveTrade(float(rng.randint(0, 50)), 100.0, 1.0, True)
+                                  for _ in range(40)]),
+                LiquidationFeedAdapter([LiquidationEvent(float(rng.randint(0, 50)), "BTCUSDT",
+                                                         "SELL", 0.1, 100.0, 10.0)
+                                        for _ in range(30)]),
+                TradeFeedAdapter([]),
+                KlineFeedAdapter([Kline(float(rng.randint(0, 50)), 1.0, 1.0, 1.0, 1.0, 1.0, '1m')
+                                  for _ in range(20)], '1m'),
+            ]
+        
+        expected = []
+        adapters = make_adapters()
+        while True:
+            event = get_next_event(adapters)
+            if event is None:
+                break
+            expected.append((event.timestamp, event.event_type, event.data))
+        
+        adapters = make_adapters()
+        merged = [(e.timestamp, e.event_type, e.data) for e in merge_feeds(adapters)]
+        
+        assert merged == expected
+        assert len(merged) == 90
 
 
 class TestIntegrationWithEventLoop:
@@ -0,0 +1,210 @@
+"""
+Unit tests for the streaming abci_state.rmp position decoder.
+
+Tests:
+- Selective decode matches a full msgpack.unpack walk of the same state
+- Unrelated subtrees and later perp dexs are skipped, in any key order
+- PositionStateManager discovery/targeted/batched reads from the decoded extract
+"""
+
+import asyncio
+import io
+import os
+import random
+import tempfile
+
+import msgpack
+import pytest
+
+from runtime.hyperliquid.node_adapter.abci_state_reader import (
+    PositionRecord,
+    decode_position_snapshot,
+)
+from runtime.hyperliquid.node_adapter.asset_mapping import get_coin_name
+from runtime.hyperliquid.node_adapter.position_state import (
+    PositionCache,
+    PositionStateManager,
+    RefreshTier,
+)
+
+
+def _position(rng):
+    size = rng.choice([-1, 1]) * rng.randint(1, 10 ** 7)
+    if rng.random() < 0.5:
+        leverage = {'I': {'l': rng.randint(1, 40), 'u': rng.randint(0, 10 ** 9)}}
+    else:
+        leverage = {'C': rng.randint(1, 50)}
+    return {
+        's': size,
+        'e': abs(size) * rng.randint(1, 10 ** 5),
+        'l': leverage,
+        'M': rng.randint(0, 5),
+        'f': {'a': 0, 'o': 0, 'c': 0},
+    }
+
+
+def _state(seed=1, users=200, assets=8):
+    """Synthetic state with the clearinghouse keys in shuffled order."""
+    rng = random.Random(seed)
+    user_to_state = []
+    with_positions = []
+    for i in range(users):
+        wallet = f"0x{i:040x}"
+        positions = [[a, _position(rng)] for a in rng.sample(range(assets), rng.randint(0, 3))]
+        user = {
+            'c': {'balance': rng.randint(0, 10 ** 9), 'history': list(range(rng.randint(0, 50)))},
+            'p': {'p': positions, 'other': [1, 2, 3]},
+            'orders': [{'oid': j, 'px': j * 10} for j in range(rng.randint(0, 5))],
+        }
+        user_to_state.append([wallet, dict(rng.sample(sorted(user.items()), len(user)))])
+        if positions and rng.random() < 0.9:
+            with_positions.append(wallet)
+
+    clearinghouse = {
+        'user_states': {
+            'user_to_state': user_to_state,
+            'junk': {'x': list(range(1000))},
+            'users_with_positions': with_positions,
+        },
+        'oracle': {'pxs': [[{'px': rng.randint(1, 10 ** 8)}] for _ in range(assets)], 'ts': 1},
+        'meta': {'universe': [{'name': f'A{a}', 'szDecimals': a % 6} for a in range(assets)]},
+        'balances': [[i, i * 2] for i in range(5000)],
+    }
+    items = list(clearinghouse.items())
+    rng.shuffle(items)
+    return {
+        'blocks': [{'height': h, 'txs': ['t' * 20] * 10} for h in range(500)],
+        'exchange': {
+            'spot': {'books': list(range(2000))},
+            'perp_dexs': [
+                {'books': ['b'] * 100, 'clearinghouse': dict(items)},
+                {'clearinghouse': {'meta': {'universe': []}}},
+            ],
+        },
+    }
+
+
+def _reference_positions(state):
+    """(wallet, asset_id) -> position map, via a full unpack walk."""
+    ch = state['exchange']['perp_dexs'][0]['clearinghouse']
+    result = {}
+    for wallet, user in ch['user_states']['user_to_state']:
+        for asset_id, pos in user['p']['p']:
+            result[(wallet, asset_id)] = pos
+    return ch, result
+
+
+class TestDecodePositionSnapshot:
+    def test_matches_full_unpack(self):
+        """Extract equals the same fields read from the fully unpacked state."""
+        state = _state()
+        snapshot = decode_position_snapshot(io.BytesIO(msgpack.packb(state)))
+        ch, expected = _reference_positions(state)
+
+        assert snapshot.sz_decimals == {
+            i: u['szDecimals'] for i, u in enumerate(ch['meta']['universe'])
+        }
+        assert snapshot.oracle_pxs_raw == {
+            i: px[0]['px'] for i, px in enumerate(ch['oracle']['pxs'])
+        }
+        assert snapshot.users_with_positions == set(ch['user_states']['users_with_positions'])
+
+        decoded = {
+            (wallet, asset_id): record
+            for wallet, records in snapshot.positions.items()
+            for asset_id, record in records.items()
+        }
+        assert decoded == {
+            key: PositionRecord.from_state(key[1], pos) for key, pos in expected.items()
+        }
+        assert snapshot.position_count == len(expected)
+
+    def test_missing_subtrees(self):
+        """States without perp dexs or positions decode to an empty extract."""
+        for state in ({}, {'exchange': {}}, {'exchange': {'perp_dexs': []}}, [1, 2]):
+            snapshot = decode_position_snapshot(io.BytesIO(msgpack.packb(state)))
+            assert snapshot.positions == {}
+            assert snapshot.sz_decimals == {}
+
+    def test_unexpected_types_are_skipped(self):
+        """Malformed user entries are skipped like the full-walk reader did."""
+        state = {'exchange': {'perp_dexs': [{'clearinghouse': {'user_states': {
+            'user_to_state': [
+                'not-a-pair',
+                ['0xa'],
+                ['0xb', 'not-a-map'],
+                ['0xc', {'p': {'p': [[0, {'s': 5, 'e': 50, 'l': {'C': 2}}], 'bad', [1]]}}],
+            ],
+        }}}]}}
+        snapshot = decode_position_snapshot(io.BytesIO(msgpack.packb(state)))
+        assert list(snapshot.positions) == ['0xc']
+        assert snapshot.positions['0xc'] == {
+            0: PositionRecord(asset_id=0, size_raw=5, entry_ntl_raw=50,
+                              is_isolated=False, leverage=2, margin_adj_raw=0)
+        }
+
+
+class TestPositionStateManagerDecode:
+    @pytest.fixture
+    def state_dir(self):
+        with tempfile.TemporaryDirectory() as path:
+            self.state = _state(seed=3)
+            with open(os.path.join(path, 'abci_state.rmp'), 'wb') as f:
+                f.write(msgpack.packb(self.state))
+            yield path
+
+    def test_discovery_and_targeted_reads(self, state_dir):
+        """Discovery and targeted reads agree with the full-walk position data."""
+        manager = PositionStateManager(state_dir)
+        positions = manager._parse_full_state_sync()
+        ch, expected = _reference_positions(self.state)
+        with_positions = set(ch['user_states']['users_with_positions'])
+
+        expected_discovery = {}
+        for (wallet, asset_id), pos in expected.items():
+            if wallet not in with_positions:
+                continue
+            data = manager._extract_position_data(asset_id, pos)
+            if data and abs(data['size']) > 0.0001:
+                expected_discovery.setdefault(wallet, {})[get_coin_name(asset_id)] = data
+        assert positions == expected_discovery
+        assert manager.metrics.state_reloads == 1
+
+        (wallet, asset_id), pos = next(iter(expected.items()))
+        coin = get_coin_name(asset_id)
+        assert manager._read_position_sync(wallet, coin) == manager._extract_position_data(asset_id, pos)
+        assert manager._read_position_sync(wallet, 'NOT_A_COIN') is None
+        # Unchanged file: no re-decode
+        assert manager.metrics.state_reloads == 1
+
+    def test_batched_reads_match_single_reads(self, state_dir):
+        """Tier refresh batch lookups equal per-position lookups."""
+        manager = PositionStateManager(state_dir)
+        _, expected = _reference_positions(self.state)
+        keys = [(wallet, get_coin_name(asset_id)) for wallet, asset_id in expected]
+        keys += [('0xmissing', 'BTC'), (keys[0][0], 'NOT_A_COIN')]
+
+        batch = manager._read_positions_sync(keys)
+        assert batch == [manager._read_position_sync(wallet, coin) for wallet, coin in keys]
+        assert batch[-2:] == [None, None]
+        assert all(data is not None for data in batch[:-2])
+
+    def test_refresh_watchlist_updates_and_closes(self, state_dir):
+        """Watchlist refresh re-reads open positions and drops closed ones."""
+        manager = PositionStateManager(state_dir)
+        _, expected = _reference_positions(self.state)
+        wallet, asset_id = next(iter(expected))
+        coin = get_coin_name(asset_id)
+        for key in ((wallet, coin), ('0xgone', 'BTC')):
+            manager._cache[key[0]][key[1]] = PositionCache(
+                wallet=key[0], coin=key[1], size=1.0, entry_price=1.0,
+                liquidation_price=0.9, margin=1.0, side='LONG', last_read=0.0,
+                refresh_tier=RefreshTier.WATCHLIST,
+            )
+            manager._by_tier[RefreshTier.WATCHLIST].add(key)
+
+        updated = asyncio.run(manager.refresh_watchlist())
+
+        assert [(c.wallet, c.coin) for c in updated] == [(wallet, coin)]
+        assert manager.get_position(wallet, coin).last_read > 0
+        assert not manager.has_position('0xgone')
@@ -0,0 +1,202 @@
+"""
+Unit tests for Binance combined stream decoder.
+
+Tests stream routing, typed field extraction, worker-thread delivery,
+the bounded frame queue and drop warnings.
+"""
+
+import asyncio
+import json
+import logging
+from decimal import Decimal
+
+import pytest
+
+from runtime.collector.binance_stream import (
+    BinanceStreamDecoder,
+    DropWarning,
+    build_stream_routes,
+    classify_stream,
+    decode_frame,
+)
+
+
+STREAMS = [
+    "btcusdt@aggTrade", "btcusdt@forceOrder", "!forceOrder@arr",
+    "btcusdt@bookTicker", "btcusdt@depth20@100ms", "btcusdt@markPrice@1s",
+]
+
+
+def _frame(stream, data):
+    return json.dumps({'stream': stream, 'data': data})
+
+
+class TestStreamRouting:
+    """Tests for stream name routing."""
+
+    def test_routes_cover_subscribed_streams(self):
+        """Every subscribed stream resolves to symbol and event type."""
+        routes = build_stream_routes(STREAMS)
+        assert routes["btcusdt@aggTrade"] == ("BTCUSDT", "TRADE")
+        assert routes["btcusdt@forceOrder"] == ("BTCUSDT", "LIQUIDATION")
+        assert routes["!forceOrder@arr"][1] == "LIQUIDATION"
+        assert routes["btcusdt@bookTicker"] == ("BTCUSDT", "DEPTH")
+        assert routes["btcusdt@depth20@100ms"] == ("BTCUSDT", "DEPTH_L2")
+        assert routes["btcusdt@markPrice@1s"] == ("BTCUSDT", "MARK_PRICE")
+
+    def test_unknown_stream_added_to_routes(self):
+        """Streams missing from the table are classified and cached."""
+        routes = build_stream_routes([])
+        event = decode_frame(_frame("ethusdt@kline_1m", {'E': 1000}), routes)
+        assert event.event_type == "KLINE"
+        assert routes["ethusdt@kline_1m"] == classify_stream("ethusdt@kline_1m")
+
+    def test_unrecognised_stream_is_unknown(self):
+        """Unrecognised stream types route to UNKNOWN."""
+        assert classify_stream("btcusdt@ticker") == ("BTCUSDT", "UNKNOWN")
+
+
+class TestDecodeFrame:
+    """Tests for per-type field extraction."""
+
+    @pytest.fixture
+    def routes(self):
+        return build_stream_routes(STREAMS)
+
+    def test_trade(self, routes):
+        """Trade fields and mark price come from the payload."""
+        event = decode_frame(_frame("btcusdt@aggTrade", {
+            'E': 1700000000100, 'T': 1700000000050, 'p': '50000.10', 'q': '0.5', 'm': True
+        }), routes)
+        assert event.event_type == "TRADE"
+        assert event.ts == 1700000000.1
+        assert event.event_ts == 1700000000.05
+        assert event.price == 50000.1
+        assert event.quantity == 0.5
+        assert event.is_buyer_maker is True
+        assert event.mark_price == Decimal('50000.10')
+
+    def test_global_liquidation_uses_order_symbol(self, routes):
+        """!forceOrder@arr events take symbol from the order."""
+        event = decode_frame(_frame("!forceOrder@arr", {
+            'E': 1700000000000,
+            'o': {'s': 'SOLUSDT', 'S': 'SELL', 'p': '100.5', 'q': '20'}
+        }), routes)
+        assert event.symbol == "SOLUSDT"
+        assert event.side == "SELL"
+        assert event.price == 100.5
+        assert event.quantity == 20.0
+        assert event.event_ts == event.ts == 1700000000.0
+
+    def test_book_ticker(self, routes):
+        """Best bid/ask are extracted only when all four fields exist."""
+        event = decode_frame(_frame("btcusdt@bookTicker", {
+            'T': 1700000000000, 'b': '49999', 'B': '1', 'a': '50001', 'A': '2'
+        }), routes)
+        assert event.book_top == (49999.0, 1.0, 50001.0, 2.0)
+
+        partial = decode_frame(_frame("btcusdt@bookTicker", {'b': '49999'}), routes)
+        assert partial.book_top is None
+
+    def test_depth_mid_mark_price(self, routes):
+        """L2 depth sets mark price from mid."""
+        event = decode_frame(_frame("btcusdt@depth20@100ms", {
+            'E': 1700000000000, 'T': 1700000000000,
+            'b': [['100', '1']], 'a': [['102', '1']]
+        }), routes)
+        assert event.event_type == "DEPTH_L2"
+        assert event.mark_price == Decimal('101.0')
+
+    def test_mark_price_clock_ignores_next_funding_time(self, routes):
+        """markPrice 'T' is next funding time and never drives the clock."""
+        event = decode_frame(_frame("btcusdt@markPrice@1s", {
+            'E': 1700000000000, 'T': 1700003600000, 'p': '50000', 'i': '49990', 'r': '0.0001'
+        }), routes)
+        assert event.ts == 1700000000.0
+        assert event.price == 50000.0
+        assert event.index_price == 49990.0
+        assert event.funding_rate == 0.0001
+        assert event.next_funding_time == 1700003600.0
+
+    def test_malformed_fields_keep_payload(self, routes):
+        """Invalid numbers leave typed fields unset but keep the event."""
+        event = decode_frame(_frame("btcusdt@aggTrade", {'E': 1000, 'p': 'bad', 'q': '1'}), routes)
+        assert event.price is None
+        assert event.payload['p'] == 'bad'
+
+    def test_invalid_json_raises(self, routes):
+        """Non-JSON frames raise."""
+        with pytest.raises(Exception):
+            decode_frame("not json", routes)
+
+
+class TestBinanceStreamDecoder:
+    """Tests for worker-thread decoding."""
+
+    def test_events_delivered_on_loop_in_order(self):
+        """Frames are decoded off-loop and delivered in receive order."""
+        async def run():
+            loop = asyncio.get_running_loop()
+            received = asyncio.Queue()
+            decoder = BinanceStreamDecoder(build_stream_routes(STREAMS), batch_size=16)
+            decoder.start(loop, received.put_nowait)
+
+            for i in range(100):
+                decoder.submit(_frame("btcusdt@aggTrade", {'E': 1000 + i, 'p': '1', 'q': '1'}))
+            decoder.submit("garbage")
+
+            events = []
+            while len(events) < 100:
+                batch = await asyncio.wait_for(received.get(), timeout=5.0)
+                assert len(batch) <= 16
+                events.extend(batch)
+
+            decoder.stop()
+            return events, decoder.get_stats()
+
+        events, stats = asyncio.run(run())
+        assert [e.ts for e in events] == [(1000 + i) / 1000.0 for i in range(100)]
+        assert stats['frames_received'] == 101
+        assert stats['events_decoded'] == 100
+        assert stats['decode_errors'] == 1
+
+    def test_full_queue_drops_and_counts_frames(self):
+        """Frames beyond max_queued_frames are dropped, not queued."""
+        decoder = BinanceStreamDecoder(build_stream_routes(STREAMS), max_queued_frames=10)
+        for i in range(15):
+            decoder.submit(_frame("btcusdt@aggTrade", {'E': 1000 + i, 'p': '1', 'q': '1'}))
+
+        stats = decoder.get_stats()
+        assert stats['frames_received'] == 15
+        assert stats['frames_dropped'] == 5
+        assert stats['queue_depth'] == 10
+
+    def test_full_queue_keeps_liquidation_frames(self):
+        """Liquidation frames are queued past max_queued_frames."""
+        decoder = BinanceStreamDecoder(build_stream_routes(STREAMS), max_queued_frames=2)
+        for i in range(3):
+            decoder.submit(_frame("btcusdt@aggTrade", {'E': 1000 + i, 'p': '1', 'q': '1'}))
+        decoder.submit(_frame("!forceOrder@arr", {'E': 2000, 'o': {'s': 'ETHUSDT'}}).encode())
+        decoder.submit(_frame("btcusdt@forceOrder", {'E': 2001, 'o': {'s': 'BTCUSDT'}}))
+
+        stats = decoder.get_stats()
+        assert stats['frames_dropped'] == 1
+        assert stats['liquidations_over_bound'] == 2
+        assert stats['queue_depth'] == 4
+
+    def test_drops_logged_once_per_interval(self, caplog):
+        """Drops within the interval are summed into the next warning."""
+        now = [0.0]
+        warning = DropWarning(logging.getLogger("test"), "frames", interval=10.0, clock=lambda: now[0])
+
+        with caplog.at_level(logging.WARNING):
+            warning.record()
+            for _ in range(5):
+                warning.record(2)
+            now[0] = 10.0
+            warning.record()
+
+        assert [r.getMessage() for r in caplog.records] == [
+            "Dropped 1 frames (queue full)",
+            "Dropped 11 frames (queue full)",
+        ]
@@ -0,0 +1,154 @@
+"""
+Unit tests for batched block decoding in DirectNodeIntegration.
+
+Tests:
+- The byte pre-filter only drops blocks without extracted events
+- extract_batch / extract_block_batch equal per-block extract_from_block
+- Chunked reads return complete lines only and resume after them
+- Integration file processing (thread and process pool) emits the same
+  events in block order
+"""
+
+import asyncio
+import json
+import random
+
+import pytest
+
+from runtime.hyperliquid.node_adapter.action_extractor import (
+    BlockActionExtractor,
+    extract_block_batch,
+)
+from runtime.hyperliquid.node_adapter.config import NodeAdapterConfig
+from runtime.hyperliquid.node_adapter.direct_integration import (
+    DirectNodeIntegration,
+    read_block_lines,
+)
+
+
+def _action(rng):
+    kind = rng.choice(['SetGlobalAction', 'forceOrder', 'order', 'cancel', 'noop', 'evmRawTx'])
+    if kind == 'SetGlobalAction':
+        return {'type': kind, 'pxs': [[str(rng.uniform(1, 1e5)), str(rng.uniform(1, 1e5))]
+                                      for _ in range(rng.randint(1, 5))]}
+    if kind == 'forceOrder':
+        return {'type': kind, 'asset': rng.randint(0, 5), 'isBuy': rng.random() < 0.5,
+                'sz': str(rng.uniform(0.1, 10)), 'px': str(rng.uniform(1, 1e5))}
+    if kind == 'order':
+        return {'type': kind, 'orders': [{'a': rng.randint(0, 5), 'b': rng.random() < 0.5,
+                                          'p': str(rng.uniform(1, 1e5)), 's': str(rng.uniform(0.1, 10)),
+                                          'r': False}]}
+    if kind == 'cancel':
+        return {'type': kind, 'cancels': [{'a': 0, 'o': 1}]}
+    return {'type': kind, 'note': 'order forceOrder'}  # Marker words, but not as a type
+
+
+def _block(rng, height):
+    bundles = [
+        [f"0x{rng.randrange(16 ** 8):08x}",
+         {'signed_actions': [{'action': _action(rng)} for _ in range(rng.randint(1, 3))]}]
+        for _ in range(rng.randint(0, 3))
+    ]
+    return json.dumps({'abci_block': {
+        'time': f"2025-01-01T00:00:{height % 60:02d}.{height:06d}",
+        'signed_action_bundles': bundles,
+    }})
+
+
+def _blocks(seed=1, count=300):
+    rng = random.Random(seed)
+    blocks = [_block(rng, h) for h in range(count)]
+    blocks[7] = 'not json'
+    return blocks
+
+
+def _per_block(extractor, blocks):
+    prices, liquidations, orders = [], [], []
+    for block in blocks:
+        p, l, o = extractor.extract_from_block(block)
+        prices.extend(p)
+        liquidations.extend(l)
+        orders.extend(o)
+    return prices, liquidations, orders
+
+
+@pytest.mark.parametrize('extract_orders,extract_cancels', [(True, False), (False, False), (True, True)])
+def test_prefilter_never_drops_events(extract_orders, extract_cancels):
+    extractor = BlockActionExtractor(extract_orders=extract_orders, extract_cancels=extract_cancels)
+    for block in _blocks(seed=2):
+        if not extractor.may_contain_actions(block.encode()):
+            assert extractor.extract_from_block(block) == ([], [], [])
+            assert not extractor.may_contain_actions(block)
+
+
+def test_batch_extraction_matches_per_block():
+    blocks = _blocks(seed=3)
+    raw = [block.encode() for block in blocks]
+    expected = _per_block(BlockActionExtractor(), blocks)
+
+    extractor = BlockActionExtractor()
+    batch = extractor.extract_batch(raw)
+    assert (batch.prices, batch.liquidations, batch.orders) == expected
+    assert batch.blocks == len(blocks)
+    assert 0 < batch.blocks_skipped < len(blocks)
+    assert extractor.metrics.blocks_skipped == batch.blocks_skipped
+
+    worker = extract_block_batch(raw)
+    assert (worker.prices, worker.liquidations, worker.orders) == expected
+    assert worker.metrics.blocks_skipped == batch.blocks_skipped
+    assert worker.metrics.price_events == len(expected[0])
+
+
+def test_read_block_lines_holds_back_partial_line(tmp_path):
+    path = tmp_path / 'blocks'
+    path.write_bytes(b'{"a": 1}\n\n{"b": 2}\n{"c":')
+
+    lines, end = read_block_lines(path, 0, 4)
+    assert lines == [b'{"a": 1}']
+    lines, end = read_block_lines(path, end, 1024)
+    assert lines == [b'{"b": 2}']
+    assert read_block_lines(path, end, 1024) == ([], end)
+
+    with open(path, 'ab') as f:
+        f.write(b' 3}\n')
+    lines, end = read_block_lines(path, end, 1024)
+    assert lines == [b'{"c": 3}']
+    assert end == path.stat().st_size
+
+
+@pytest.mark.parametrize('workers', [0, 2])
+def test_integration_emits_events_in_block_order(tmp_path, workers):
+    blocks = _blocks(seed=4, count=500)
+    path = tmp_path / 'blocks'
+    path.write_text('\n'.join(blocks) + '\n')
+    expected = _per_block(BlockActionExtractor(), blocks)
+
+    emitted = ([], [], [])
+    config = NodeAdapterConfig(json_parse_workers=workers, read_chunk_bytes=16 * 1024,
+                               block_batch_size=64, log_block_interval=100)
+    integration = DirectNodeIntegration(
+        on_price=emitted[0].append,
+        on_liquidation=emitted[1].append,
+        on_order_activity=emitted[2].append,
+        config=config,
+    )
+
+    async def run():
+        integration._running = True
+        integration._current_file = path
+        try:
+            if workers:
+                from concurrent.futures import ProcessPoolExecutor
+                integration._decode_pool = ProcessPoolExecutor(max_workers=workers)
+            await integration._process_file()
+        finally:
+            if integration._decode_pool:
+                integration._decode_pool.shutdown()
+
+    asyncio.run(run())
+
+    assert emitted == expected
+    assert integration._file_position == path.stat().st_size
+    assert integration._blocks_processed == len(blocks)
+    assert integration._prices_emitted == len(expected[0])
+    assert integration._extractor.metrics.price_events == len(expected[0])
@@ -0,0 +1,129 @@
+"""
+Unit tests for BufferedResearchDatabase.
+
+Tests batched executemany flushes, single-commit transactions and WAL setup.
+"""
+
+import os
+import tempfile
+import pytest
+
+from runtime.logging.execution_db import ResearchDatabase
+from runtime.logging.buffered_db import BufferedResearchDatabase
+
+
+def _count(db, table):
+    return db.conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+class TestBufferedResearchDatabase:
+    """Test buffered flush behavior."""
+
+    @pytest.fixture
+    def db(self):
+        """Create temporary research database."""
+        fd, path = tempfile.mkstemp(suffix='.db')
+        os.close(fd)
+        db = ResearchDatabase(path)
+        yield db
+        db.close()
+        for suffix in ('', '-wal', '-shm'):
+            if os.path.exists(path + suffix):
+                os.unlink(path + suffix)
+
+    @pytest.fixture
+    def buffered(self, db):
+        """Create buffered wrapper that only flushes when asked."""
+        buffered = BufferedResearchDatabase(
+            db, flush_interval_sec=3600, max_buffer_size=10**9,
+            enable_high_frequency_logs=True
+        )
+        yield buffered
+        buffered.close()
+
+    def test_wal_mode_enabled(self, db, buffered):
+        """Wrapper switches the connection to WAL with NORMAL sync."""
+        assert db.conn.execute("PRAGMA journal_mode").fetchone()[0] == 'wal'
+        # NORMAL == 1
+        assert db.conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+
+    def test_flush_writes_all_rows_with_single_commit(self, db, buffered):
+        """Mixed buffered writes land in one transaction."""
+        statements = []
+        db.conn.set_trace_callback(statements.append)
+
+        for i in range(50):
+            buffered.log_trade_event('BTCUSDT', 1000.0 + i, 50000.0 + i, 0.1, i % 2 == 0)
+            buffered.log_orderbook_event('BTCUSDT', 1000.0 + i, 49999.0, 1.0, 50001.0, 2.0)
+        buffered.log_orderbook_depth('BTCUSDT', 1000.0, [[49999.0, 1.0]], [[50001.0, 2.0]])
+        buffered.log_mark_price('BTCUSDT', 1000.0, 50000.0, funding_rate=0.0001)
+        buffered.log_liquidation_event(1000.0, 'BTCUSDT', 'SELL', 49000.0, 2.5)
+        buffered.log_ohlc_candle('BTCUSDT', 960.0, 1.0, 2.0, 0.5, 1.5, volume=10.0)
+        cycle_id = buffered.log_cycle(1000.0, 'OK', {}, ['BTCUSDT'], 1, 1)
+        buffered.log_mandate(cycle_id, 'BTCUSDT', 'ENTRY', 0.5, 1000.0)
+        buffered.log_mandate(None, 'BTCUSDT', 'ENTRY', 0.5, 1000.0)
+        buffered.log_m2_node_event(1000.0, 'CREATED', 'n1', 'BTCUSDT', 49000.0, 'bid', 2.5, 0.4)
+
+        buffered.flush()
+        db.conn.set_trace_callback(None)
+
+        assert [s for s in statements if s.strip().upper() == 'COMMIT'] == ['COMMIT']
+        assert _count(db, 'trade_events') == 50
+        assert _count(db, 'orderbook_events') == 50
+        assert _count(db, 'orderbook_depth') == 1
+        assert _count(db, 'mark_prices') == 1
+        assert _count(db, 'liquidation_events') == 1
+        assert _count(db, 'ohlc_candles') == 1
+        assert _count(db, 'execution_cycles') == 1
+        # Mandate without cycle_id is skipped, as in log_mandate
+        assert _count(db, 'mandates') == 1
+        assert _count(db, 'm2_node_events') == 1
+        assert buffered.get_stats()['writes_flushed'] == 108
+
+    def test_flush_preserves_row_values(self, db, buffered):
+        """Batched rows match what the direct log_* call writes."""
+        db.log_orderbook_depth('ETHUSDT', 1.0, [[100.0, 1.0], [99.0, 2.0]], [[102.0, 4.0]])
+        buffered.log_orderbook_depth('ETHUSDT', 2.0, [[100.0, 1.0], [99.0, 2.0]], [[102.0, 4.0]])
+        buffered.flush()
+
+        rows = db.conn.execute(
+            "SELECT bids, asks, bid_total_qty, ask_total_qty, mid_price, spread_bps "
+            "FROM orderbook_depth ORDER BY timestamp"
+        ).fetchall()
+        assert len(rows) == 2
+        assert tuple(rows[0]) == tuple(rows[1])
+
+    def test_invalid_row_skipped(self, db, buffered):
+        """A malformed call does not drop the rest of its batch."""
+        buffered.log_trade_event('BTCUSDT', 1.0, 100.0, 1.0)
+        buffered.log_trade_event('BTCUSDT', 2.0, 100.0, 1.0, False, 'unexpected')
+        buffered.log_trade_event('BTCUSDT', 3.0, 100.0, 1.0)
+        buffered.flush()
+
+        assert _count(db, 'trade_events') == 2
+
+    def test_failed_executemany_does_not_duplicate_rows(self, db):
+        """Rows written before an executemany failure are not inserted twice."""
+        db.conn.execute(
+            "CREATE TRIGGER reject_mark BEFORE INSERT ON mark_prices "
+            "WHEN NEW.mark_price = 3.0 BEGIN SELECT RAISE(ABORT, 'rejected'); END"
+        )
+        calls = [(('BTCUSDT', float(i), float(i)), {}) for i in (1, 2, 3, 4)]
+
+        with db.batch():
+            written = db.insert_batch('log_mark_price', calls)
+
+        prices = [r[0] for r in db.conn.execute(
+            "SELECT mark_price FROM mark_prices ORDER BY timestamp"
+        )]
+        assert written == 3
+        assert prices == [1.0, 2.0, 4.0]
+
+    def test_batch_rolls_back_on_error(self, db):
+        """Writes inside a failed batch() are not committed."""
+        with pytest.raises(RuntimeError):
+            with db.batch():
+                db.log_trade_event('BTCUSDT', 1.0, 100.0, 1.0)
+                raise RuntimeError("boom")
+
+        assert _count(db, 'trade_events') == 0
@@ -0,0 +1,185 @@
+"""
+Unit tests for the M6 clock scheduler.
+
+Tests deadline cadence, worker handoff, staleness skips and stage timing.
+"""
+
+import asyncio
+import threading
+import time
+
+from runtime.collector.clock_scheduler import ClockScheduler, StageTimer
+
+
+def _run_for(scheduler, seconds, stream_time=lambda: 1000.0):
+    async def run():
+        task = asyncio.create_task(scheduler.run(stream_time))
+        await asyncio.sleep(seconds)
+        scheduler.stop()
+        await asyncio.wait_for(task, timeout=2.0)
+    asyncio.run(run())
+
+
+class TestStageTimer:
+    """Tests for per-stage statistics."""
+
+    def test_stats(self):
+        """Count, last, mean and max are reported in ms."""
+        timer = StageTimer()
+        timer.record('compute', 0.002)
+        timer.record('compute', 0.004)
+        stats = timer.get_stats()['compute']
+        assert stats['count'] == 2
+        assert stats['last_ms'] == 4.0
+        assert abs(stats['mean_ms'] - 3.0) < 1e-9
+        assert stats['max_ms'] == 4.0
+
+    def test_concurrent_records_all_counted(self):
+        """Loop and worker threads can record into one timer."""
+        timer = StageTimer()
+
+        def record():
+            for _ in range(5000):
+                timer.record('compute', 0.001)
+                timer.get_stats()
+
+        threads = [threading.Thread(target=record) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert timer.get_stats()['compute']['count'] == 20000
+
+
+class TestClockScheduler:
+    """Tests for deadline scheduling."""
+
+    def test_serial_cadence_compensates_for_compute_time(self):
+        """Cycles follow the deadline grid, not period + compute time."""
+        cycles = []
+
+        def compute(ts):
+            time.sleep(0.03)
+            return ts
+
+        scheduler = ClockScheduler(compute, lambda snapshot, ts: cycles.append(ts), period_sec=0.05)
+        _run_for(scheduler, 0.6)
+
+        metrics = scheduler.get_metrics()
+        assert metrics['mode'] == 'serial'
+        # Sleep-after-work would give ~7 cycles (0.6 / 0.08)
+        assert len(cycles) >= 10
+        assert metrics['missed_ticks'] == 0
+        assert {'compute', 'cycle', 'tick_lateness'} <= set(metrics['stages'])
+
+    def test_overrun_skips_missed_deadlines(self):
+        """A cycle longer than the period skips slots instead of bursting."""
+        cycles = []
+
+        def consume(snapshot, ts):
+            cycles.append(time.monotonic())
+            time.sleep(0.12)
+
+        scheduler = ClockScheduler(lambda ts: ts, consume, period_sec=0.05)
+        _run_for(scheduler, 0.5)
+
+        assert scheduler.get_metrics()['missed_ticks'] > 0
+        gaps = [b - a for a, b in zip(cycles, cycles[1:])]
+        assert all(gap >= 0.12 for gap in gaps)
+
+    def test_decoupled_computes_on_worker_and_consumes_on_loop(self):
+        """Snapshots are computed off-loop and handed to the loop thread."""
+        compute_threads = set()
+        consume_threads = set()
+        loop_thread = []
+
+        def compute(ts):
+            compute_threads.add(threading.get_ident())
+            time.sleep(0.01)
+            return ('snapshot', ts)
+
+        def consume(snapshot, ts):
+            consume_threads.add(threading.get_ident())
+            assert snapshot == ('snapshot', ts)
+
+        async def run():
+            loop_thread.append(threading.get_ident())
+            scheduler = ClockScheduler(compute, consume, period_sec=0.05, decoupled=True)
+            task = asyncio.create_task(scheduler.run(lambda: 1000.0))
+            await asyncio.sleep(0.5)
+            scheduler.stop()
+            await asyncio.wait_for(task, timeout=2.0)
+            return scheduler.get_metrics()
+
+        metrics = asyncio.run(run())
+        assert metrics['mode'] == 'decoupled'
+        assert metrics['cycles'] >= 6
+        assert consume_threads == {loop_thread[0]}
+        assert loop_thread[0] not in compute_threads
+        assert 'snapshot_age' in metrics['stages']
+
+    def test_decoupled_skips_stale_snapshots(self):
+        """Handoffs older than max_staleness_sec are not consumed."""
+        cycles = []
+
+        def compute(ts):
+            time.sleep(0.08)
+            return ts
+
+        scheduler = ClockScheduler(
+            compute, lambda snapshot, ts: cycles.append(ts),
+            period_sec=0.05, max_staleness_sec=0.02, decoupled=True
+        )
+        _run_for(scheduler, 0.5)
+
+        metrics = scheduler.get_metrics()
+        assert cycles == []
+        assert metrics['stale_skips'] > 0
+        assert metrics['not_ready'] > 0
+
+    def test_decoupled_cycle_never_overlaps_compute(self):
+        """A late handoff is consumed before the next computation starts."""
+        computing = threading.Event()
+        overlaps = []
+        durations = iter([0.01, 0.07, 0.03, 0.09, 0.02, 0.06] * 20)
+
+        def compute(ts):
+            computing.set()
+            time.sleep(next(durations, 0.01))
+            computing.clear()
+            return ts
+
+        def consume(snapshot, ts):
+            for _ in range(5):
+                if computing.is_set():
+                    overlaps.append(ts)
+                time.sleep(0.002)
+
+        scheduler = ClockScheduler(
+            compute, consume, period_sec=0.05, max_staleness_sec=1.0, decoupled=True
+        )
+        _run_for(scheduler, 1.2)
+
+        metrics = scheduler.get_metrics()
+        assert metrics['not_ready'] > 0
+        assert metrics['cycles'] >= 6
+        assert overlaps == []
+
+    def test_waits_for_stream_time(self):
+        """No cycles run before the first stream event."""
+        cycles = []
+        scheduler = ClockScheduler(lambda ts: ts, lambda snapshot, ts: cycles.append(ts), period_sec=0.05)
+        _run_for(scheduler, 0.2, stream_time=lambda: None)
+        assert cycles == []
+        assert scheduler.get_metrics()['ticks'] == 0
+
+    def test_compute_errors_counted(self):
+        """Compute exceptions skip the cycle and are counted."""
+        def compute(ts):
+            raise RuntimeError("halted")
+
+        scheduler = ClockScheduler(compute, lambda snapshot, ts: None, period_sec=0.05)
+        _run_for(scheduler, 0.2)
+        metrics = scheduler.get_metrics()
+        assert metrics['compute_errors'] > 0
+        assert metrics['cycles'] == 0
@@ -0,0 +1,175 @@
+"""
+Unit tests for the segmented market event store.
+
+Tests:
+- Recent-events cache indexing and limits
+- JSON sanitization of event records
+- Tail cursors over segments and the legacy single file (needs pyarrow)
+"""
+
+import math
+
+import pandas as pd
+import pytest
+
+from ui.backend.event_store import (
+    EventTail,
+    LEGACY_EVENTS_FILE,
+    RecentEventsCache,
+    SegmentedEventStore,
+    to_json_records,
+)
+
+
+def _events(start, count, symbol='BTCUSDT'):
+    return pd.DataFrame({
+        'event_id': [f'e{i}' for i in range(start, start + count)],
+        'type': ['TRADE' if i % 2 == 0 else 'LIQUIDATION' for i in range(start, start + count)],
+        'symbol': [symbol] * count,
+        'timestamp': [1000.0 + i for i in range(start, start + count)],
+        'price': [50000.0 + i for i in range(start, start + count)],
+    })
+
+
+def _ids(df):
+    return df['event_id'].tolist() if len(df) else []
+
+
+class TestRecentEventsCache:
+    """Tests for the in-memory query cache."""
+
+    def test_query_by_type_symbol_and_both(self):
+        cache = RecentEventsCache(max_per_key=100)
+        cache.add(_events(0, 4))
+        cache.add(_events(4, 4, symbol='ETHUSDT'))
+
+        assert [r['event_id'] for r in cache.query()] == [f'e{i}' for i in range(8)]
+        assert [r['event_id'] for r in cache.query(event_type='TRADE')] == ['e0', 'e2', 'e4', 'e6']
+        assert [r['event_id'] for r in cache.query(symbol='ETHUSDT')] == ['e4', 'e5', 'e6', 'e7']
+        assert [r['event_id'] for r in cache.query('LIQUIDATION', 'BTCUSDT')] == ['e1', 'e3']
+        assert cache.query('KLINE') == []
+
+    def test_limit_returns_newest_oldest_first(self):
+        cache = RecentEventsCache(max_per_key=100)
+        cache.add(_events(0, 10))
+        assert [r['event_id'] for r in cache.query(limit=3)] == ['e7', 'e8', 'e9']
+        assert cache.query(limit=0) == []
+
+    def test_bounded_per_key(self):
+        cache = RecentEventsCache(max_per_key=3)
+        cache.add(_events(0, 10))
+        assert [r['event_id'] for r in cache.query(limit=100)] == ['e7', 'e8', 'e9']
+        assert [r['event_id'] for r in cache.query(event_type='TRADE')] == ['e4', 'e6', 'e8']
+
+    def test_add_returns_records(self):
+        records = RecentEventsCache().add(_events(0, 2))
+        assert [r['event_id'] for r in records] == ['e0', 'e1']
+        assert RecentEventsCache().add(pd.DataFrame()) == []
+
+    def test_large_batch_converts_only_retained_rows(self):
+        df = pd.concat([_events(0, 20), _events(20, 3, symbol='ETHUSDT'), _events(23, 20)],
+                       ignore_index=True)
+        cache = RecentEventsCache(max_per_key=3)
+        records = cache.add(df)
+
+        # Last 3 overall plus last 3 per (type, symbol), in file order
+        assert [r['event_id'] for r in records] == ['e20', 'e21', 'e22', 'e37', 'e38', 'e39', 'e40', 'e41', 'e42']
+        assert [r['event_id'] for r in cache.query(symbol='ETHUSDT')] == ['e20', 'e21', 'e22']
+        assert [r['event_id'] for r in cache.query(event_type='LIQUIDATION')] == ['e37', 'e39', 'e41']
+        assert [r['event_id'] for r in cache.query()] == ['e40', 'e41', 'e42']
+
+
+def test_to_json_records_replaces_nan_and_inf():
+    df = pd.DataFrame({'a': [1.0, math.nan, math.inf], 'b': ['x', None, 'z']})
+    assert to_json_records(df) == [
+        {'a': 1.0, 'b': 'x'},
+        {'a': None, 'b': None},
+        {'a': None, 'b': 'z'},
+    ]
+
+
+class TestEventTail:
+    """Tests for tail cursors (parquet I/O)."""
+
+    @pytest.fixture(autouse=True)
+    def _parquet(self):
+        pytest.importorskip('pyarrow')
+
+    def test_segments_read_once(self, tmp_path):
+        store = SegmentedEventStore(tmp_path)
+        tail = store.tail()
+        assert len(tail.read_new()) == 0
+
+        store.append(_events(0, 3))
+        store.append(_events(3, 2))
+        assert _ids(tail.read_new()) == ['e0', 'e1', 'e2', 'e3', 'e4']
+        assert len(tail.read_new()) == 0
+
+        store.append(_events(5, 1))
+        assert _ids(tail.read_new()) == ['e5']
+        assert [s['rows'] for s in store.segments()] == [3, 2, 1]
+
+        # A second cursor starts at the beginning
+        assert len(store.tail(columns=['event_id']).read_new()) == 6
+
+    def test_empty_append_is_noop(self, tmp_path):
+        store = SegmentedEventStore(tmp_path)
+        assert store.append(pd.DataFrame()) is None
+        assert not store.has_manifest()
+
+    def test_legacy_reads_only_new_row_groups(self, tmp_path):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        path = tmp_path / LEGACY_EVENTS_FILE
+        tail = EventTail(SegmentedEventStore(tmp_path))
+
+        def write(frames):
+            with pq.ParquetWriter(path, pa.Schema.from_pandas(frames[0], preserve_index=False)) as writer:
+                for frame in frames:
+                    writer.write_table(pa.Table.from_pandas(frame, preserve_index=False))
+
+        write([_events(0, 4)])
+        assert _ids(tail.read_new()) == ['e0', 'e1', 'e2', 'e3']
+        assert len(tail.read_new()) == 0  # Unchanged file is not opened
+
+        read_groups = []
+        original = pq.ParquetFile.read_row_groups
+
+        def spy(self, row_groups, *args, **kwargs):
+            read_groups.append(list(row_groups))
+            return original(self, row_groups, *args, **kwargs)
+
+        pq.ParquetFile.read_row_groups = spy
+        try:
+            write([_events(0, 4), _events(4, 3), _events(7, 2)])
+            assert _ids(tail.read_new()) == ['e4', 'e5', 'e6', 'e7', 'e8']
+        finally:
+            pq.ParquetFile.read_row_groups = original
+
+        # Group 0 holds the last returned row (continuity check), then new groups
+        assert read_groups == [[0, 1, 2]]
+
+    def test_legacy_rewritten_file_resumes_after_last_id(self, tmp_path):
+        path = tmp_path / LEGACY_EVENTS_FILE
+        tail = EventTail(SegmentedEventStore(tmp_path))
+
+        _events(0, 5).to_parquet(path, index=False)
+        assert len(tail.read_new()) == 5
+
+        # Rotated: oldest rows dropped, new rows appended
+        _events(3, 6).to_parquet(path, index=False)
+        assert _ids(tail.read_new()) == ['e5', 'e6', 'e7', 'e8']
+
+        # Truncated below the rows already returned
+        _events(20, 2).to_parquet(path, index=False)
+        assert _ids(tail.read_new()) == ['e20', 'e21']
+
+    def test_manifest_takes_over_from_legacy(self, tmp_path):
+        store = SegmentedEventStore(tmp_path)
+        tail = store.tail()
+        _events(0, 2).to_parquet(tmp_path / LEGACY_EVENTS_FILE, index=False)
+        assert len(tail.read_new()) == 2
+
+        store.append(_events(2, 2))
+        assert _ids(tail.read_new()) == ['e2', 'e3']
@@ -0,0 +1,158 @@
+"""
+Unit tests for the node_fills sidecar index.
+
+Tests:
+- Indexed liquidation reads equal decoding every fill line
+- Incremental indexing of a growing file (partial lines held back)
+- Timestamp checkpoints bound every fill at or after a time
+- Restarts resume from the persisted processed offset
+"""
+
+import json
+import random
+
+import pytest
+
+from runtime.hyperliquid.node_adapter import fills_index
+from runtime.hyperliquid.node_adapter.direct_integration import TradeFileReader
+from runtime.hyperliquid.node_adapter.fills_index import FillsFileIndex, sidecar_path
+
+BASE_TIME_MS = 1769835752163
+
+
+def _fill_line(rng, i):
+    fill = {
+        'coin': rng.choice(['BTC', 'ETH', 'SOL']),
+        'side': rng.choice(['A', 'B']),
+        'time': BASE_TIME_MS + i * 10,
+        'px': str(rng.uniform(1, 1e5)),
+        'sz': str(rng.uniform(0.1, 10)),
+        'dir': rng.choice(['Open Long', 'Close Long', 'Open Short', 'Close Short']),
+    }
+    if rng.random() < 0.05:
+        fill['liquidation'] = {'liquidatedUser': f"0x{i:040x}", 'markPx': fill['px'], 'method': 'market'}
+    elif rng.random() < 0.01:
+        fill['liquidation'] = None  # Field present but empty: not a liquidation
+    return json.dumps([f"0x{rng.randrange(16 ** 40):040x}", fill]) + '\n'
+
+
+def _fills(seed, count, start=0):
+    rng = random.Random(seed)
+    return ''.join(_fill_line(rng, i) for i in range(start, start + count))
+
+
+def _reference(reader, text):
+    """Liquidations from decoding every line (the pre-index reader)."""
+    result = []
+    for line in text.splitlines():
+        address, fill = json.loads(line)
+        if fill.get('liquidation'):
+            result.append(reader._parse_liquidation(fill, address))
+    return result
+
+
+def _hour_file(tmp_path, date='20260101', hour='9'):
+    path = tmp_path / 'data' / 'node_fills' / 'hourly' / date / hour
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+@pytest.fixture
+def small_chunks(monkeypatch):
+    monkeypatch.setattr(fills_index, 'SCAN_CHUNK_BYTES', 4096)
+    monkeypatch.setattr(fills_index, 'CHECKPOINT_BYTES', 8192)
+
+
+def test_indexed_reads_match_full_decode(tmp_path, small_chunks):
+    path = _hour_file(tmp_path)
+    text = _fills(1, 3000)
+    path.write_text(text)
+
+    reader = TradeFileReader(tmp_path / 'data', catchup_hours=0)
+    assert reader.read_new_liquidations() == _reference(reader, text)
+    assert reader.liquidations_found == len(_reference(reader, text)) > 0
+    assert reader.read_new_liquidations() == []
+
+
+def test_growing_file_indexes_complete_lines_only(tmp_path, small_chunks):
+    path = _hour_file(tmp_path)
+    text = _fills(2, 2000)
+    reader = TradeFileReader(tmp_path / 'data', catchup_hours=0)
+
+    emitted = []
+    rng = random.Random(3)
+    cut = 0
+    while cut < len(text):
+        cut = min(len(text), cut + rng.randint(1, 20000))
+        path.write_text(text[:cut])
+        emitted.extend(reader.read_new_liquidations())
+        index = reader._indexes[path]
+        assert text[:index.indexed_to].endswith('\n') or index.indexed_to == 0
+        assert index.indexed_to == text[:cut].rfind('\n') + 1
+
+    assert emitted == _reference(reader, text)
+
+
+def test_checkpoints_bound_fill_times(tmp_path, small_chunks):
+    path = _hour_file(tmp_path)
+    text = _fills(4, 4000)
+    path.write_text(text)
+    index = FillsFileIndex(path)
+    index.update()
+    assert len(index.checkpoints) > 10
+
+    starts = [0]
+    for line in text.splitlines(keepends=True)[:-1]:
+        starts.append(starts[-1] + len(line.encode()))
+    times = {start: json.loads(line)[1]['time'] for start, line in zip(starts, text.splitlines())}
+    for offset, time_ms in index.checkpoints:
+        assert times[offset] == time_ms
+
+    for target in [BASE_TIME_MS - 1, BASE_TIME_MS + 12345, BASE_TIME_MS + 39990, BASE_TIME_MS + 10 ** 6]:
+        offset = index.offset_at(target)
+        assert all(t < target for start, t in times.items() if start < offset)
+
+
+def test_restart_resumes_from_processed_offset(tmp_path):
+    index_dir = tmp_path / 'index'
+    old = _hour_file(tmp_path, hour='8')
+    tail = _hour_file(tmp_path, hour='9')
+    old.write_text(_fills(5, 500))
+    tail.write_text(_fills(6, 500))
+
+    first = TradeFileReader(tmp_path / 'data', catchup_hours=2, index_dir=index_dir)
+    delivered = first.read_new_liquidations()
+    assert delivered
+    first.mark_delivered()
+    first._indexes[tail].save()  # As on a periodic save
+    assert sidecar_path(index_dir, tail).exists()
+
+    with open(tail, 'a') as f:
+        f.write(_fills(7, 500, start=500))
+
+    # Restart: only fills appended since the last save are delivered
+    second = TradeFileReader(tmp_path / 'data', catchup_hours=2, index_dir=index_dir)
+    resumed = second.read_new_liquidations()
+    assert resumed == _reference(second, _fills(7, 500, start=500))
+
+    # A truncated/replaced file invalidates its sidecar
+    tail.write_text(_fills(8, 10))
+    index = FillsFileIndex.load(tail, sidecar_path(index_dir, tail))
+    assert index.indexed_to == 0 and index.processed_to == 0
+
+
+def test_undelivered_liquidations_are_read_again_after_restart(tmp_path):
+    index_dir = tmp_path / 'index'
+    old = _hour_file(tmp_path, hour='8')
+    tail = _hour_file(tmp_path, hour='9')
+    old.write_text(_fills(5, 500))
+    tail.write_text(_fills(6, 500))
+
+    first = TradeFileReader(tmp_path / 'data', catchup_hours=2, index_dir=index_dir)
+    delivered = first.read_new_liquidations()
+    assert delivered
+    first._indexes[tail].save()
+
+    # Crash before mark_delivered(): nothing is lost on restart
+    second = TradeFileReader(tmp_path / 'data', catchup_hours=2, index_dir=index_dir)
+    assert second.read_new_liquidations() == delivered
@@ -0,0 +1,201 @@
+"""
+Unit tests for the liquidation-price index of PositionStateManager.
+
+Tests:
+- Oracle ticks re-tier exactly like re-evaluating every cached position
+- Coin proximity aggregates match a full scan of the coin's positions
+- Closed and replaced positions leave the index
+- Emitted proximity follows the latest price, not the last tier evaluation
+"""
+
+import asyncio
+import random
+
+import pytest
+
+from runtime.hyperliquid.node_adapter.position_state import (
+    PositionStateManager,
+    RefreshTier,
+)
+
+COINS = ['BTC', 'ETH', 'SOL']
+
+
+def _position_data(rng, price):
+    side = rng.choice([-1, 1])
+    # Liquidation prices clustered around the tier boundaries
+    distance = rng.choice([rng.uniform(0, 0.08), rng.uniform(-0.01, 0.01), 0.02, 0.005])
+    liq = price * (1 - side * distance) if rng.random() > 0.05 else 0.0
+    return {
+        'size': side * rng.uniform(0.1, 100),
+        'entry': price * rng.uniform(0.9, 1.1),
+        'liq': liq,
+        'margin': rng.uniform(1, 1000),
+    }
+
+
+async def _populate(manager, rng, count, prices):
+    for i in range(count):
+        coin = rng.choice(COINS)
+        await manager._update_cache_from_data(f"0x{i % (count // 2):04x}", coin,
+                                              _position_data(rng, prices[coin]))
+
+
+def _expected_tiers(manager, prices):
+    """(wallet, coin) -> tier from re-evaluating every cached position."""
+    expected = {}
+    for position in manager.get_all_positions():
+        tier = position.refresh_tier
+        price = prices.get(position.coin)
+        if price:
+            tier = manager._determine_tier(position.calculate_proximity(price))
+        expected[(position.wallet, position.coin)] = tier
+    return expected
+
+
+def _reference_proximity(manager, coin, price, threshold):
+    """(count, size, value, avg distance, closest) per side, by full scan."""
+    result = {}
+    for side in ('LONG', 'SHORT'):
+        at_risk = [
+            p for p in manager.get_positions_by_coin(coin)
+            if p.side == side and p.liquidation_price > 0
+            and p.calculate_proximity(price) <= threshold
+        ]
+        liqs = [p.liquidation_price for p in at_risk]
+        result[side] = (
+            len(at_risk),
+            sum(abs(p.size) for p in at_risk),
+            sum(p.position_value for p in at_risk),
+            sum(p.calculate_proximity(price) for p in at_risk) / len(at_risk) if at_risk else 0.0,
+            (min(liqs) if side == 'LONG' else max(liqs)) if liqs else None,
+        )
+    return result
+
+
+def test_price_ticks_match_full_reevaluation():
+    """Tiers, alerts and tier sets equal a re-evaluation of every position."""
+    async def run():
+        rng = random.Random(7)
+        prices = {'BTC': 50000.0, 'ETH': 3000.0, 'SOL': 150.0}
+        manager = PositionStateManager('/nonexistent')
+        manager.update_prices(prices)
+        await _populate(manager, rng, 600, prices)
+
+        for step in range(200):
+            if step % 20 == 10:
+                # Refreshes and closes between ticks
+                await _populate(manager, rng, 40, prices)
+                for position in rng.sample(manager.get_all_positions(), 10):
+                    await manager._apply_refresh(position.wallet, position.coin, None)
+
+            prices = {
+                coin: price * (1 + rng.choice([rng.gauss(0, 0.004), 0.0, 0.05, -0.05]))
+                for coin, price in prices.items()
+            }
+            tick = dict(prices)
+            if step % 15 == 0:
+                del tick[rng.choice(COINS)]  # Coin without a tick this round
+
+            before = {(p.wallet, p.coin): p.refresh_tier for p in manager.get_all_positions()}
+            expected = _expected_tiers(manager, dict(manager._prices, **tick))
+
+            alerts = manager.update_prices(tick)
+            prices = dict(manager._prices)
+
+            actual = {(p.wallet, p.coin): p.refresh_tier for p in manager.get_all_positions()}
+            assert actual == expected
+            assert sorted((a.wallet, a.coin, a.old_tier.value, a.new_tier.value) for a in alerts) == sorted(
+                (key[0], key[1], before[key].value, tier.value)
+                for key, tier in expected.items() if tier != before[key]
+            )
+            for tier in RefreshTier:
+                assert manager._by_tier[tier] == {key for key, t in actual.items() if t == tier}
+
+    asyncio.run(run())
+
+
+@pytest.mark.parametrize('threshold', [0.005, 0.02, 0.05, 1.0])
+def test_coin_proximity_matches_full_scan(threshold):
+    """Prefix-sum aggregates equal a scan of all the coin's positions."""
+    async def run():
+        rng = random.Random(11)
+        prices = {'BTC': 50000.0, 'ETH': 3000.0, 'SOL': 150.0}
+        manager = PositionStateManager('/nonexistent')
+        manager.update_prices(prices)
+        await _populate(manager, rng, 400, prices)
+        manager.update_prices({'ETH': 2950.0})
+
+        for coin in COINS:
+            price = manager._prices[coin]
+            proximity = manager.get_coin_proximity(coin, threshold)
+            reference = _reference_proximity(manager, coin, price, threshold)
+            if reference['LONG'][0] + reference['SHORT'][0] == 0:
+                assert proximity is None
+                continue
+
+            long_ref, short_ref = reference['LONG'], reference['SHORT']
+            assert proximity.current_price == price
+            assert proximity.long_positions_count == long_ref[0]
+            assert proximity.short_positions_count == short_ref[0]
+            assert proximity.long_closest_liquidation == long_ref[4]
+            assert proximity.short_closest_liquidation == short_ref[4]
+            assert proximity.long_positions_size == pytest.approx(long_ref[1])
+            assert proximity.long_positions_value == pytest.approx(long_ref[2])
+            assert proximity.long_avg_distance_pct == pytest.approx(long_ref[3], abs=1e-9)
+            assert proximity.short_positions_size == pytest.approx(short_ref[1])
+            assert proximity.short_positions_value == pytest.approx(short_ref[2])
+            assert proximity.short_avg_distance_pct == pytest.approx(short_ref[3], abs=1e-9)
+            assert proximity.total_positions_at_risk == long_ref[0] + short_ref[0]
+
+    asyncio.run(run())
+
+
+def test_closed_and_replaced_positions_leave_index():
+    """Closing or flipping a position updates the coin's sorted sides."""
+    async def run():
+        manager = PositionStateManager('/nonexistent')
+        manager.update_prices({'BTC': 100.0})
+        await manager._update_cache_from_data(
+            '0xa', 'BTC', {'size': 1.0, 'entry': 100.0, 'liq': 99.0, 'margin': 10.0})
+        proximity = manager.get_coin_proximity('BTC')
+        assert proximity.long_positions_count == 1
+        assert manager.get_proximity('0xa', 'BTC') == pytest.approx(0.01)
+
+        # Flip to a short far from liquidation
+        await manager._update_cache_from_data(
+            '0xa', 'BTC', {'size': -1.0, 'entry': 100.0, 'liq': 150.0, 'margin': 10.0})
+        assert manager.get_coin_proximity('BTC') is None
+
+        await manager._apply_refresh('0xa', 'BTC', None)
+        assert 'BTC' not in manager._liq_index
+        assert manager.update_prices({'BTC': 120.0}) == []
+
+    asyncio.run(run())
+
+
+def test_position_dict_proximity_at_latest_price():
+    """proximity_pct is recomputed for positions not re-evaluated by a tick."""
+    async def run():
+        rng = random.Random(11)
+        prices = {'BTC': 50000.0, 'ETH': 3000.0, 'SOL': 150.0}
+        manager = PositionStateManager('/nonexistent')
+        manager.update_prices(prices)
+        await _populate(manager, rng, 200, prices)
+
+        manager.update_prices(prices)  # Evaluates the newly indexed positions
+
+        # Small move: most positions cross no tier boundary and keep last_proximity
+        manager.update_prices({coin: price * 1.001 for coin, price in prices.items()})
+
+        lagging = 0
+        for position in manager.get_all_positions():
+            if position.liquidation_price <= 0:
+                continue
+            price = manager._prices[position.coin]
+            expected = position.calculate_proximity(price) * 100
+            lagging += position.last_proximity * 100 != pytest.approx(expected)
+            assert manager.position_to_dict(position)['proximity_pct'] == pytest.approx(expected)
+        assert lagging > 0
+
+    asyncio.run(run())
@@ -0,0 +1,300 @@
+"""
+Unit tests for E5 batched order submission.
+
+Tests against a local stub exchange server:
+- Orders and cancels issued within the batch window share one action
+- Per-order errors inside a batch reject only that order
+- Entry + stop submitted as one grouped action, stop tracked and cancelled by cloid
+- Posted payload shape; precomputed EIP-712 signing matches typed-data signing
+"""
+
+import asyncio
+import contextlib
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from runtime.exchange.types import OrderType, OrderSide, OrderStatus, OrderRequest, OrderFill, FillType
+from runtime.exchange.order_executor import (
+    OrderExecutor,
+    ExecutorConfig,
+    StopOrderState,
+    EIP712_DOMAIN,
+    AGENT_TYPES,
+)
+
+
+@contextlib.asynccontextmanager
+async def stub_exchange():
+    """Local /exchange endpoint; orders sized "9.99" are rejected.
+
+    Trigger (stop) orders are reported with a status string and no oid,
+    as the exchange does for normalTpsl children.
+    """
+    actions = []
+    next_oid = [1000]
+
+    async def exchange(request):
+        payload = await request.json()
+        action = payload["action"]
+        actions.append(payload)
+        await asyncio.sleep(0.01)
+
+        if action["type"] == "order":
+            statuses = []
+            for order in action["orders"]:
+                if float(order["s"]) == 9.99:
+                    statuses.append({"error": "Insufficient margin"})
+                elif "trigger" in order["t"]:
+                    statuses.append("waitingForTrigger")
+                else:
+                    next_oid[0] += 1
+                    statuses.append({"resting": {"oid": next_oid[0]}})
+        else:
+            statuses = ["success" for _ in action["cancels"]]
+
+        return web.json_response({
+            "status": "ok",
+            "response": {"type": action["type"], "data": {"statuses": statuses}},
+        })
+
+    app = web.Application()
+    app.router.add_post('/exchange', exchange)
+    server = TestServer(app)
+    await server.start_server()
+    try:
+        yield str(server.make_url('')).rstrip('/'), actions
+    finally:
+        await server.close()
+
+
+def _order(size=1.0, client_order_id=None):
+    return OrderRequest(
+        symbol="BTC",
+        side=OrderSide.BUY,
+        order_type=OrderType.LIMIT,
+        size=size,
+        price=50000.0,
+        client_order_id=client_order_id,
+    )
+
+
+class TestBatchedSubmission:
+    """Tests for coalescing orders and cancels."""
+
+    @pytest.mark.asyncio
+    async def test_orders_within_window_share_one_action(self):
+        async with stub_exchange() as (url, actions):
+            executor = OrderExecutor(ExecutorConfig(api_url=url, batch_window_ms=5.0))
+            try:
+                responses = await asyncio.gather(*(
+                    executor.submit_order(_order(client_order_id=f"c{i}")) for i in range(8)
+                ))
+            finally:
+                await executor.close()
+
+        assert len(actions) == 1
+        assert len(actions[0]["action"]["orders"]) == 8
+        assert all(r.success for r in responses)
+        assert [r.client_order_id for r in responses] == [f"c{i}" for i in range(8)]
+        assert len({r.order_id for r in responses}) == 8
+        assert set(executor.get_pending_orders()) == {r.order_id for r in responses}
+
+    @pytest.mark.asyncio
+    async def test_error_rejects_only_that_order(self):
+        async with stub_exchange() as (url, actions):
+            executor = OrderExecutor(ExecutorConfig(api_url=url, batch_window_ms=5.0))
+            try:
+                ok, bad, ok2 = await asyncio.gather(
+                    executor.submit_order(_order()),
+                    executor.submit_order(_order(size=9.99)),
+                    executor.submit_order(_order()),
+                )
+            finally:
+                await executor.close()
+
+        assert len(actions) == 1
+        assert ok.success and ok2.success
+        assert not bad.success
+        assert bad.status == OrderStatus.REJECTED
+        assert "Insufficient margin" in bad.error_message
+        assert executor.get_metrics().rejected_orders == 1
+
+    @pytest.mark.asyncio
+    async def test_orders_and_cancels_batched_separately(self):
+        async with stub_exchange() as (url, actions):
+            executor = OrderExecutor(ExecutorConfig(api_url=url, batch_window_ms=5.0))
+            try:
+                results = await asyncio.gather(
+                    executor.submit_order(_order()),
+                    executor.cancel_order("11", "BTC"),
+                    executor.submit_order(_order()),
+                    executor.cancel_order("12", "ETH"),
+                )
+            finally:
+                await executor.close()
+
+        assert sorted(a["action"]["type"] for a in actions) == ["cancel", "order"]
+        cancel = next(a for a in actions if a["action"]["type"] == "cancel")
+        assert [c["o"] for c in cancel["action"]["cancels"]] == [11, 12]
+        assert results[1] is True and results[3] is True
+
+    @pytest.mark.asyncio
+    async def test_max_batch_size_flushes_early(self):
+        async with stub_exchange() as (url, actions):
+            executor = OrderExecutor(ExecutorConfig(api_url=url, batch_window_ms=50.0, max_batch_size=3))
+            try:
+                await asyncio.gather(*(executor.submit_order(_order()) for _ in range(7)))
+            finally:
+                await executor.close()
+
+        assert [len(a["action"]["orders"]) for a in actions] == [3, 3, 1]
+        nonces = [a["nonce"] for a in actions]
+        assert len(set(nonces)) == len(nonces)
+
+    @pytest.mark.asyncio
+    async def test_batching_disabled_by_default(self):
+        async with stub_exchange() as (url, actions):
+            executor = OrderExecutor(ExecutorConfig(api_url=url))
+            try:
+                responses = await asyncio.gather(*(executor.submit_order(_order()) for _ in range(3)))
+            finally:
+                await executor.close()
+
+        assert len(actions) == 3
+        assert all(r.success for r in responses)
+
+
+class TestGroupedStop:
+    """Tests for entry + stop in one action."""
+
+    @pytest.mark.asyncio
+    async def test_entry_and_stop_in_one_action(self):
+        async with stub_exchange() as (url, actions):
+            executor = OrderExecutor(ExecutorConfig(api_url=url))
+            try:
+                entry, stop = await executor.submit_order_with_stop(
+                    _order(client_order_id="entry1"),
+                    {"stop_price": 49000.0, "symbol": "BTC", "side": "SELL", "size": 1.0},
+                )
+            finally:
+                await executor.close()
+
+        assert len(actions) == 1
+        action = actions[0]["action"]
+        assert action["grouping"] == "normalTpsl"
+        assert action["orders"][1]["r"] is True
+        assert action["orders"][1]["t"]["trigger"]["tpsl"] == "sl"
+
+        assert entry.success and stop.success
+        assert stop.order_id == action["orders"][1]["c"]
+        status = executor.get_stop_order_status(entry.order_id)
+        assert status.state == StopOrderState.PLACED
+        assert executor.get_stop_order_id(entry.order_id) == stop.order_id
+
+        # Stop already on the exchange: nothing to place after the fill
+        fill = OrderFill(
+            order_id=entry.order_id, fill_id="f1", symbol="BTC", side=OrderSide.BUY,
+            price=50000.0, size=1.0, fill_type=FillType.TAKER, fee=0.0,
+            timestamp_ns=executor._now_ns(),
+        )
+        assert executor.handle_fill(fill) is False
+
+    @pytest.mark.asyncio
+    async def test_rejected_stop_falls_back_to_post_fill_placement(self):
+        async with stub_exchange() as (url, actions):
+            executor = OrderExecutor(ExecutorConfig(api_url=url))
+            try:
+                entry, stop = await executor.submit_order_with_stop(
+                    _order(),
+                    {"stop_price": 49000.0, "symbol": "BTC", "side": "SELL", "size": 9.99},
+                )
+            finally:
+                await executor.close()
+
+        assert entry.success
+        assert not stop.success
+        assert entry.order_id in executor._pending_stop_placements
+
+    @pytest.mark.asyncio
+    async def test_cancel_placed_stop_by_cloid(self):
+        async with stub_exchange() as (url, actions):
+            executor = OrderExecutor(ExecutorConfig(api_url=url))
+            try:
+                entry, stop = await executor.submit_order_with_stop(
+                    _order(client_order_id="entry2"),
+                    {"stop_price": 49000.0, "symbol": "BTC", "side": "SELL", "size": 1.0},
+                )
+                cancelled = await executor.cancel_order(executor.get_stop_order_id(entry.order_id), "BTC")
+            finally:
+                await executor.close()
+
+        assert cancelled is True
+        cancel = actions[-1]["action"]
+        assert cancel["type"] == "cancelByCloid"
+        assert cancel["cancels"] == [{"asset": actions[0]["action"]["orders"][1]["a"], "cloid": stop.order_id}]
+
+    @pytest.mark.asyncio
+    async def test_invalid_stop_rejects_before_sending(self):
+        async with stub_exchange() as (url, actions):
+            executor = OrderExecutor(ExecutorConfig(api_url=url))
+            try:
+                entry, stop = await executor.submit_order_with_stop(
+                    _order(),
+                    {"stop_price": 0.0, "symbol": "BTC", "side": "SELL", "size": 1.0},
+                )
+            finally:
+                await executor.close()
+
+        assert actions == []
+        assert entry.status == OrderStatus.REJECTED
+        assert entry.error_message.startswith("Stop:")
+        assert stop is None
+
+
+class TestSigning:
+    """Posted payloads and EIP-712 signing."""
+
+    @pytest.mark.asyncio
+    async def test_posted_payload_without_key_is_unsigned(self):
+        async with stub_exchange() as (url, actions):
+            executor = OrderExecutor(ExecutorConfig(api_url=url))
+            try:
+                await executor.submit_order(_order())
+                await executor.submit_order(_order())
+            finally:
+                await executor.close()
+
+        assert [sorted(a) for a in actions] == [["action", "nonce"], ["action", "nonce"]]
+        assert actions[0]["nonce"] < actions[1]["nonce"]
+        order = actions[0]["action"]["orders"][0]
+        assert list(order) == ["a", "b", "p", "s", "r", "t"]
+        assert order["b"] is True and order["t"] == {"limit": {"tif": "Gtc"}}
+
+    def test_payload_unchanged_when_signing_unavailable(self, monkeypatch):
+        import runtime.exchange.order_executor as order_executor
+        monkeypatch.setattr(order_executor, "HAS_ETH_ACCOUNT", False)
+        executor = OrderExecutor(private_key="0x" + "11" * 32, wallet_address="0x" + "22" * 20)
+        payload = executor._build_order_payload(_order())
+
+        assert executor._sign_payload(dict(payload)) == payload
+
+    def test_signature_matches_typed_data(self):
+        eth_account = pytest.importorskip("eth_account")
+        key = "0x" + "11" * 32
+        executor = OrderExecutor(private_key=key, wallet_address="0x" + "22" * 20)
+        payload = executor._build_order_payload(_order())
+
+        signed = executor._sign_payload(dict(payload))
+
+        import json
+        expected = eth_account.Account.from_key(key).sign_typed_data(
+            domain_data=EIP712_DOMAIN,
+            message_types={"Agent": AGENT_TYPES["Agent"]},
+            message_data={
+                "action": json.dumps(payload["action"], separators=(',', ':')),
+                "nonce": payload["nonce"],
+            },
+        )
+        assert signed["signature"] == {"r": hex(expected.r), "s": hex(expected.s), "v": expected.v}
@@ -0,0 +1,276 @@
+"""
+Unit tests for the wallet polling engine.
+
+Tests:
+- Token bucket rate limiting
+- Priority order and deadline-miss metrics
+- Concurrent polling against a local mock HTTP server
+- One default engine shared by all pollers of an event loop
+"""
+
+import asyncio
+import contextlib
+import os
+import tempfile
+import time
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from runtime.hyperliquid.client import HyperliquidClient, ClientConfig
+from runtime.hyperliquid.hl_data_store import HLDataStore
+from runtime.hyperliquid.indexer.batch_poller import BatchPositionPoller
+from runtime.hyperliquid.indexer.coordinator import IndexerConfig, IndexerCoordinator
+from runtime.hyperliquid.poll_engine import (
+    API_WEIGHT_PER_MINUTE, PollEngine, PollEngineConfig, TokenBucket, get_shared_engine
+)
+from runtime.hyperliquid.tiered_poller import TieredPoller
+from runtime.logging.execution_db import ResearchDatabase
+
+
+LATENCY = 0.05
+
+
+@contextlib.asynccontextmanager
+async def mock_info_server(latency=LATENCY):
+    """Local /info endpoint answering clearinghouseState after a delay."""
+    counters = {'requests': 0, 'in_flight': 0, 'max_in_flight': 0, 'users': []}
+
+    async def info(request):
+        body = await request.json()
+        counters['requests'] += 1
+        counters['users'].append(body['user'])
+        counters['in_flight'] += 1
+        counters['max_in_flight'] = max(counters['max_in_flight'], counters['in_flight'])
+        try:
+            await asyncio.sleep(latency)
+        finally:
+            counters['in_flight'] -= 1
+        return web.json_response({
+            'assetPositions': [{'position': {
+                'coin': 'BTC', 'szi': '2.0', 'entryPx': '50000.0',
+                'liquidationPx': '45000.0', 'positionValue': '100000.0',
+                'marginUsed': '10000.0', 'unrealizedPnl': '0.0',
+                'leverage': {'type': 'cross', 'value': 10},
+            }}],
+            'crossMarginSummary': {'accountValue': '20000.0', 'totalMarginUsed': '10000.0'},
+            'user': body['user'],
+        })
+
+    app = web.Application()
+    app.router.add_post('/info', info)
+    server = TestServer(app)
+    await server.start_server()
+    try:
+        yield str(server.make_url('')), counters
+    finally:
+        await server.close()
+
+
+class TestTokenBucket:
+    """Test weighted token bucket."""
+
+    def test_burst_then_refill(self):
+        now = [0.0]
+        bucket = TokenBucket(600.0, capacity=4.0, clock=lambda: now[0])  # 10/s
+
+        assert bucket.try_acquire(2.0)
+        assert bucket.try_acquire(2.0)
+        assert not bucket.try_acquire(2.0)
+
+        now[0] = 0.2  # +2 tokens
+        assert bucket.try_acquire(2.0)
+        assert not bucket.try_acquire(1.0)
+
+    def test_capacity_caps_refill(self):
+        now = [0.0]
+        bucket = TokenBucket(600.0, capacity=4.0, clock=lambda: now[0])
+        now[0] = 100.0
+        assert bucket.available == 4.0
+
+    @pytest.mark.asyncio
+    async def test_acquire_waits_for_budget(self):
+        bucket = TokenBucket(6000.0, capacity=5.0)  # 100/s
+
+        start = time.monotonic()
+        for _ in range(25):
+            await bucket.acquire(1.0)
+
+        # 5 burst + 20 refilled at 100/s
+        assert time.monotonic() - start >= 0.19
+
+
+class TestPollEngine:
+    """Test scheduling order and metrics."""
+
+    @pytest.mark.asyncio
+    async def test_priority_order(self):
+        engine = PollEngine(PollEngineConfig(weight_per_minute=1e6, max_concurrency=1))
+        distances = {'a': 50.0, 'b': 2.0, 'c': 100.0, 'd': 7.5}
+        order = []
+
+        async def poll(job):
+            order.append(job.key)
+
+        await engine.run(engine.make_jobs(distances, tier=2, priority=distances.get), poll)
+
+        assert order == ['b', 'd', 'a', 'c']
+
+    @pytest.mark.asyncio
+    async def test_errors_and_deadline_misses_per_tier(self):
+        engine = PollEngine(PollEngineConfig(weight_per_minute=1e6, max_concurrency=1))
+
+        async def poll(job):
+            await asyncio.sleep(0.03)
+            if job.key == 'bad':
+                raise RuntimeError("boom")
+            return job.key
+
+        jobs = engine.make_jobs(['w1', 'w2', 'bad', 'w3'], tier=2, deadline=time.time() + 0.045)
+        results = await engine.run(jobs, poll)
+
+        assert results['w1'] == 'w1'
+        assert isinstance(results['bad'], RuntimeError)
+        metrics = engine.get_metrics()[2]
+        assert metrics['polls'] == 4
+        assert metrics['errors'] == 1
+        assert metrics['deadline_misses'] == 3
+        assert metrics['max_lateness_ms'] > 0
+
+    @pytest.mark.asyncio
+    async def test_concurrent_polls_over_http(self):
+        async with mock_info_server() as (url, counters):
+            client = HyperliquidClient(ClientConfig(api_url=url, max_connections=20))
+            await client.start()
+            try:
+                engine = PollEngine(PollEngineConfig(weight_per_minute=1e6, max_concurrency=20))
+                wallets = [f"0x{i:040x}" for i in range(60)]
+
+                results = await engine.run(
+                    engine.make_jobs(wallets, tier=2),
+                    lambda job: client.get_clearinghouse_state(job.key)
+                )
+            finally:
+                await client.stop()
+
+        assert counters['requests'] == 60
+        assert all(results[w].address == w for w in wallets)
+        assert 1 < counters['max_in_flight'] <= 20
+
+    @pytest.mark.asyncio
+    async def test_rate_budget_bounds_concurrent_polls(self):
+        async with mock_info_server(latency=0.0) as (url, counters):
+            client = HyperliquidClient(ClientConfig(api_url=url))
+            await client.start()
+            try:
+                # 20 weight/s, weight 2 per poll: 10 burst polls then 10/s
+                engine = PollEngine(PollEngineConfig(
+                    weight_per_minute=1200.0, burst_weight=20.0, max_concurrency=16
+                ))
+                start = time.monotonic()
+                await engine.run(
+                    engine.make_jobs([f"0x{i:040x}" for i in range(14)], tier=1),
+                    lambda job: client.get_clearinghouse_state(job.key)
+                )
+                elapsed = time.monotonic() - start
+            finally:
+                await client.stop()
+
+        assert counters['requests'] == 14
+        assert elapsed >= 0.35
+
+
+class TestTieredPollerEngine:
+    """Test tier polls through the engine."""
+
+    @pytest.mark.asyncio
+    async def test_tier_poll_is_concurrent_and_prioritized(self):
+        fd, path = tempfile.mkstemp(suffix='.db')
+        os.close(fd)
+        db = ResearchDatabase(path)
+        try:
+            async with mock_info_server() as (url, counters):
+                client = HyperliquidClient(ClientConfig(api_url=url))
+                await client.start()
+                try:
+                    poller = TieredPoller(
+                        _DictClient(client), HLDataStore(db),
+                        engine=PollEngine(PollEngineConfig(weight_per_minute=1e6, max_concurrency=10))
+                    )
+                    wallets = [f"0x{i:040x}" for i in range(30)]
+                    for wallet in wallets:
+                        poller.add_wallet(wallet, tier=2)
+                    # Known to be close to liquidation from an earlier cycle
+                    urgent = wallets[-3:]
+                    for wallet in urgent:
+                        poller._wallets[wallet].min_liq_distance_pct = 1.0
+
+                    stats = await poller.run_tier2_poll()
+                finally:
+                    await client.stop()
+
+            assert stats.wallets_polled == 30
+            assert stats.api_errors == 0
+            assert counters['max_in_flight'] > 1
+            # Closest to liquidation start within the first max_concurrency polls
+            assert set(urgent) <= set(counters['users'][:10])
+            # mark 50000, liq 45000 -> 10% from liquidation
+            assert poller._poll_priority(wallets[0]) == pytest.approx(10.0)
+            assert poller.get_status()['engine'][2]['polls'] == 30
+        finally:
+            db.close()
+            os.unlink(path)
+
+
+class TestSharedEngine:
+    """Pollers without an injected engine share one rate budget."""
+
+    @pytest.mark.asyncio
+    async def test_default_engine_shared_across_pollers(self):
+        tiered = TieredPoller(client=None, data_store=None)
+        batch = BatchPositionPoller(client=None, store=None)
+
+        assert tiered.engine is batch.engine is get_shared_engine()
+
+    @pytest.mark.asyncio
+    async def test_injected_engine_used(self):
+        engine = PollEngine()
+        tiered = TieredPoller(client=None, data_store=None, engine=engine)
+        batch = BatchPositionPoller(client=None, store=None, engine=engine)
+
+        assert tiered.engine is batch.engine is engine
+        assert engine is not get_shared_engine()
+
+    @pytest.mark.asyncio
+    async def test_indexer_engine_within_api_budget(self):
+        # Default 1000 req/min at weight 2 exceeds the API budget: shared engine
+        engine = IndexerCoordinator(client=None)._build_poll_engine()
+        assert engine is get_shared_engine()
+        assert engine.config.weight_per_minute <= API_WEIGHT_PER_MINUTE
+
+        # A lower configured budget gets its own engine at that budget
+        engine = IndexerCoordinator(
+            client=None, config=IndexerConfig(max_requests_per_minute=300)
+        )._build_poll_engine()
+        assert engine is not get_shared_engine()
+        assert engine.config.weight_per_minute == pytest.approx(600.0)
+
+
+class _DictClient:
+    """Adapts WalletState to the dict positions TieredPoller consumes."""
+
+    def __init__(self, client):
+        self._client = client
+
+    async def get_clearinghouse_state(self, wallet):
+        state = await self._client.get_clearinghouse_state(wallet)
+        if state is None:
+            return None
+        return _RawState([p.raw_position for p in state.positions.values()])
+
+
+class _RawState:
+    def __init__(self, positions):
+        self.positions = positions
+        self.cross_margin_summary = None
@@ -0,0 +1,174 @@
+"""
+Unit tests for the WebSocket topic hub.
+
+Tests:
+- Per-key coalescing and bounded-topic eviction
+- Snapshot-on-subscribe and consecutive delta versions
+- Dropping failed and slow clients; slow clients do not delay others
+- Topics given as a single name
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from ui.backend.topic_hub import TopicHub, TopicState
+
+
+class FakeWebSocket:
+    """Records sent frames; optionally fails or stalls on send."""
+
+    def __init__(self, fail=False, delay=0.0):
+        self.messages = []
+        self.fail = fail
+        self.delay = delay
+
+    async def send_text(self, text):
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("connection closed")
+        self.messages.append(json.loads(text))
+
+
+class TestTopicState:
+    """Tests for keyed topic state."""
+
+    def test_coalesces_updates_per_key(self):
+        state = TopicState('prices')
+        state.update('BTC', {'price': 1})
+        state.update('BTC', {'price': 2})
+        state.update('ETH', {'price': 3})
+
+        delta = state.take_delta()
+        assert delta['version'] == 1
+        assert delta['upsert'] == {'BTC': {'price': 2}, 'ETH': {'price': 3}}
+        assert delta['remove'] == []
+        assert state.take_delta() is None
+
+    def test_unchanged_value_sends_nothing(self):
+        state = TopicState('prices')
+        state.update('BTC', {'price': 1})
+        state.take_delta()
+        state.update('BTC', {'price': 1})
+        assert state.take_delta() is None
+
+    def test_remove(self):
+        state = TopicState('events')
+        state.update('a', 1)
+        state.take_delta()
+        state.remove('a')
+        state.remove('missing')
+        assert state.take_delta()['remove'] == ['a']
+        assert state.snapshot()['items'] == {}
+
+    def test_bounded_topic_evicts_least_recently_updated(self):
+        state = TopicState('events', max_items=2)
+        state.update('a', 1)
+        state.update('b', 1)
+        state.take_delta()
+
+        state.update('a', 2)
+        state.update('c', 1)
+
+        delta = state.take_delta()
+        assert delta['upsert'] == {'a': 2, 'c': 1}
+        assert delta['remove'] == ['b']
+        assert state.snapshot()['items'] == {'a': 2, 'c': 1}
+
+
+class TestTopicHub:
+    """Tests for subscriptions and flushing."""
+
+    @pytest.mark.asyncio
+    async def test_snapshot_on_subscribe_then_deltas(self):
+        hub = TopicHub({'prices': None, 'events': 10})
+        hub.topic('prices').update('BTC', {'price': 1})
+        await hub.flush()
+
+        ws = FakeWebSocket()
+        await hub.handle_message(ws, {'action': 'subscribe', 'topics': ['prices', 'unknown']})
+        assert ws.messages == [
+            {'type': 'snapshot', 'topic': 'prices', 'version': 1, 'items': {'BTC': {'price': 1}}}
+        ]
+
+        hub.topic('prices').update('BTC', {'price': 2})
+        hub.topic('prices').update('BTC', {'price': 3})
+        hub.topic('events').update('e1', {'id': 1})  # Not subscribed
+        assert await hub.flush() == 1
+        hub.topic('prices').update('ETH', {'price': 4})
+        await hub.flush()
+
+        deltas = ws.messages[1:]
+        assert [d['version'] for d in deltas] == [2, 3]
+        assert deltas[0]['upsert'] == {'BTC': {'price': 3}}
+        assert deltas[1]['upsert'] == {'ETH': {'price': 4}}
+        assert all(d['topic'] == 'prices' for d in deltas)
+
+    @pytest.mark.asyncio
+    async def test_subscribe_all_and_unsubscribe(self):
+        hub = TopicHub({'prices': None, 'events': None})
+        ws = FakeWebSocket()
+        await hub.handle_message(ws, {'action': 'subscribe'})
+        assert [m['topic'] for m in ws.messages] == ['prices', 'events']
+
+        await hub.handle_message(ws, {'action': 'unsubscribe', 'topics': ['prices']})
+        hub.topic('prices').update('BTC', 1)
+        hub.topic('events').update('e1', 1)
+        await hub.flush()
+        assert [m['topic'] for m in ws.messages[2:]] == ['events']
+        assert not hub.has_subscribers('prices')
+
+    @pytest.mark.asyncio
+    async def test_failed_and_slow_clients_dropped(self):
+        hub = TopicHub({'prices': None}, send_timeout=0.05)
+        good = FakeWebSocket()
+        broken = FakeWebSocket()
+        slow = FakeWebSocket()
+        for ws in (good, broken, slow):
+            await hub.subscribe(ws, ['prices'])
+
+        broken.fail = True
+        slow.delay = 0.5
+        hub.topic('prices').update('BTC', 1)
+        assert await hub.flush() == 1
+
+        hub.topic('prices').update('BTC', 2)
+        await hub.flush()
+        assert [m['version'] for m in good.messages] == [0, 1, 2]
+        assert len(slow.messages) == 1  # Snapshot only
+        assert hub.has_subscribers('prices')
+
+        good.fail = True
+        hub.topic('prices').update('BTC', 3)
+        await hub.flush()
+        assert not hub.has_subscribers('prices')
+
+    @pytest.mark.asyncio
+    async def test_slow_clients_sent_concurrently(self):
+        hub = TopicHub({'prices': None, 'events': None}, send_timeout=0.5)
+        clients = [FakeWebSocket() for _ in range(5)]
+        for ws in clients:
+            await hub.subscribe(ws, ['prices', 'events'])
+            ws.delay = 0.05
+
+        hub.topic('prices').update('BTC', 1)
+        hub.topic('events').update('e1', 1)
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        assert await hub.flush() == 10
+        assert loop.time() - started < 0.3  # Not 5 clients x 2 sends x 0.05s
+        assert [m['topic'] for m in clients[0].messages[2:]] == ['prices', 'events']
+
+    @pytest.mark.asyncio
+    async def test_single_topic_name_and_invalid_topics(self):
+        hub = TopicHub({'prices': None, 'events': None})
+        ws = FakeWebSocket()
+        await hub.handle_message(ws, {'action': 'subscribe', 'topics': 'prices'})
+        assert [m['topic'] for m in ws.messages] == ['prices']
+
+        await hub.handle_message(ws, {'action': 'subscribe', 'topics': 5})
+        await hub.handle_message(ws, {'action': 'unsubscribe', 'topics': {'prices': 1}})
+        assert len(ws.messages) == 1
+        assert hub.has_subscribers('prices')
@@ -0,0 +1,163 @@
+"""
+Unit tests for the array-backed market position book of the WS tracker.
+
+Tests:
+- Vectorized danger levels equal TrackedPosition.check_danger
+- Price ticks signal, track danger and remove breached positions exactly
+  like scanning every position object
+- Mapping bookkeeping (replace, swap-delete) and lazy object views
+"""
+
+import asyncio
+import copy
+import random
+
+import pytest
+
+from runtime.hyperliquid.shared_state import reset_shared_state
+from runtime.hyperliquid.ws_position_book import MarketPositionBook
+from runtime.hyperliquid.ws_position_tracker import TrackedPosition, WSPositionTracker
+
+
+def _position(rng, wallet, coin, price):
+    side = rng.choice(['LONG', 'SHORT'])
+    distance = rng.choice([rng.uniform(0.001, 0.03), rng.uniform(0.03, 0.3)])
+    liq = price * (1 - distance if side == 'LONG' else 1 + distance)
+    if rng.random() < 0.05:
+        liq = 0.0
+    size = rng.uniform(0.001, 50)
+    return TrackedPosition(
+        wallet=wallet, coin=coin, side=side, size=size, entry_price=price,
+        liq_price=liq, notional=size * price, leverage=10.0, current_price=price,
+    )
+
+
+def _reference_tick(positions, danger, price, signals, removed):
+    """The per-object scan the book replaces (wallet -> position of one coin)."""
+    for wallet, pos in list(positions.items()):
+        level = pos.check_danger(price)
+        key = f"{wallet}:{pos.coin}"
+        pos.current_price = price
+        pos.notional = pos.size * price
+        if pos.liq_price > 0:
+            if pos.side == 'LONG':
+                pos.distance_pct = ((price - pos.liq_price) / price) * 100
+            else:
+                pos.distance_pct = ((pos.liq_price - price) / price) * 100
+        if pos.distance_pct <= 0:
+            del positions[wallet]
+            danger.pop(key, None)
+            removed.append(key)
+            continue
+        if level > 0:
+            pos.in_danger_zone = True
+            was_in_danger = key in danger
+            danger[key] = pos
+            if (not was_in_danger or level > 1) and pos.notional >= 1000:
+                signals.append((key, level, pos.distance_pct))
+        else:
+            pos.in_danger_zone = False
+            danger.pop(key, None)
+
+
+def _state(pos):
+    return (pos.current_price, pos.notional, pos.distance_pct, pos.in_danger_zone)
+
+
+def test_levels_match_check_danger():
+    rng = random.Random(3)
+    book = MarketPositionBook()
+    positions = [_position(rng, f"w{i}", 'BTC', 100.0) for i in range(500)]
+    for pos in positions:
+        book[pos.wallet] = pos
+
+    for price in [rng.uniform(60, 140) for _ in range(50)] + [pos.liq_price for pos in positions[:20]]:
+        book.scan(price)
+        assert [book.danger_level(pos.wallet) for pos in positions] == [
+            pos.check_danger(price) for pos in positions
+        ]
+
+
+def test_price_ticks_match_object_scan():
+    """Signals, danger set, removals and object fields match a full scan."""
+    reset_shared_state()
+    rng = random.Random(5)
+    signals = []
+    tracker = WSPositionTracker(on_signal=lambda s: signals.append(
+        (f"{s.wallet}:{s.coin}", s.danger_level, s.distance_pct)))
+    prices = {'BTC': 50000.0, 'ETH': 3000.0}
+
+    reference = {coin: {} for coin in prices}
+    for i in range(400):
+        coin = rng.choice(list(prices))
+        pos = _position(rng, f"0x{i:04x}", coin, prices[coin])
+        tracker._wallet_positions[pos.wallet][coin] = pos
+        tracker._market_positions[coin][pos.wallet] = pos
+        reference[coin][pos.wallet] = copy.deepcopy(pos)
+    ref_danger, ref_removed = {}, []
+    last_scanned = {}
+
+    for step in range(150):
+        prices = {coin: price * (1 + rng.gauss(0, 0.004)) for coin, price in prices.items()}
+        signals.clear()
+        ref_signals = []
+
+        asyncio.run(tracker._handle_price_update({'mids': {c: str(p) for c, p in prices.items()}}))
+
+        for coin, price in prices.items():
+            # Same parse and 0.01% move threshold as the tracker
+            price = float(str(price))
+            old = last_scanned.get(coin, 0)
+            last_scanned[coin] = price
+            if old == 0 or abs(price - old) / old >= 0.0001:
+                _reference_tick(reference[coin], ref_danger, price, ref_signals, ref_removed)
+
+        assert sorted(signals) == sorted(ref_signals)
+        assert set(tracker.danger_positions) == set(ref_danger)
+        assert set(tracker._liquidated_positions) == set(ref_removed)
+        for coin in prices:
+            book = tracker.positions_by_market[coin]
+            assert set(book) == set(reference[coin])
+            for wallet, pos in book.items():
+                assert _state(pos) == _state(reference[coin][wallet])
+
+        if step % 30 == 29:
+            # Re-read positions between ticks (replaces the objects)
+            for coin, book in tracker.positions_by_market.items():
+                for wallet in rng.sample(list(book), min(5, len(book))):
+                    pos = _position(rng, wallet, coin, prices[coin])
+                    book[wallet] = pos
+                    tracker._wallet_positions[wallet][coin] = pos
+                    reference[coin][wallet] = copy.deepcopy(pos)
+
+    assert ref_removed, "walk should breach some positions"
+    reset_shared_state()
+
+
+def test_replace_and_delete_keep_slots_consistent():
+    rng = random.Random(9)
+    book = MarketPositionBook()
+    expected = {}
+    for i in range(100):
+        pos = _position(rng, f"w{i}", 'SOL', 150.0)
+        book[pos.wallet] = pos
+        expected[pos.wallet] = pos
+    for wallet in rng.sample(list(expected), 60):
+        del book[wallet]
+        del expected[wallet]
+    for wallet in rng.sample(list(expected), 10):
+        pos = _position(rng, wallet, 'SOL', 150.0)
+        book[wallet] = pos
+        expected[wallet] = pos
+
+    assert len(book) == len(expected)
+    assert dict(book.items()) == expected
+    book.scan(147.0)
+    for wallet, pos in expected.items():
+        assert book.danger_level(wallet) == pos.check_danger(147.0)
+
+    # Objects are only brought up to date when read through the mapping
+    pos = next(iter(expected.values()))
+    assert pos.current_price == 150.0
+    assert book[pos.wallet].current_price == 147.0
+    assert pos.notional == pytest.approx(pos.size * 147.0)
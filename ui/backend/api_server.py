@@ -7,7 +7,7 @@ Read-only interface for live monitoring and replay.
 Authority: Observability UI Specification
 """
 
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, Query, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 from pathlib import Path
 import json
@@ -289,100 +289,183 @@ def read_collector_stats() -> Dict:
     except Exception as e:
         return {"stats_unavailable": True, "reason": str(e)}
 
-# Track last processed event to avoid reprocessing
-last_processed_event_id = None
+# Append-only event store: the processor tails it, endpoints read the cache
+sys.path.insert(0, str(Path(__file__).parent))
+from event_store import SegmentedEventStore, RecentEventsCache, to_json_records
+from topic_hub import TopicHub
+
+market_event_store = SegmentedEventStore(MARKET_EVENTS_DIR)
+RECENT_EVENTS_PER_KEY = 1000  # Max `limit` of the market event endpoints
+recent_market_events = RecentEventsCache(max_per_key=RECENT_EVENTS_PER_KEY)
+
+# Rows fed to the detectors between event-loop yields (bounds a catch-up read)
+EVENT_BATCH_CHUNK_ROWS = 10_000
+
+# Server push (/ws/events): per-topic state, deltas at most STREAM_MAX_RATE_HZ
+STREAM_MAX_RATE_HZ = 4.0
+MARKET_EVENTS_TOPIC_SIZE = 100
+PEAK_PRESSURE_TOPIC_SIZE = 50
+GHOST_EXECUTIONS_TOPIC_SIZE = 100
+
+topic_hub = TopicHub(
+    {
+        "prices": None,
+        "market_events": MARKET_EVENTS_TOPIC_SIZE,
+        "peak_pressure": PEAK_PRESSURE_TOPIC_SIZE,
+        "market_stats": None,
+        "ghost_executions": GHOST_EXECUTIONS_TOPIC_SIZE,
+    },
+    max_rate_hz=STREAM_MAX_RATE_HZ
+)
+
+
+def feed_detectors(batch: pd.DataFrame):
+    """Feed a batch of market events to the per-symbol detectors.
+
+    Iterates column arrays (not rows) to keep per-event overhead low.
+    """
+    n = len(batch)
+    missing = [None] * n
+    columns = [
+        batch[name].tolist() if name in batch.columns else missing
+        for name in ("type", "timestamp", "symbol", "price", "quantity", "side", "raw")
+    ]
+
+    for event_type, timestamp, symbol, price, quantity, side, raw in zip(*columns):
+        # CRITICAL: Route to per-symbol detector (prevents mixing)
+        # Returns None if symbol not in TOP_10_SYMBOLS
+        detector = get_detector(symbol)
+        if not detector:
+            continue  # DROP non-TOP_10 symbols
+
+        if event_type == "TRADE":
+            detector.process_trade(
+                timestamp=timestamp,
+                symbol=symbol,
+                price=price,
+                quantity=quantity,
+                side=side
+            )
+
+        elif event_type == "LIQUIDATION":
+            detector.process_liquidation(
+                timestamp=timestamp,
+                symbol=symbol,
+                price=price,
+                quantity=quantity,
+                side=side
+            )
+
+        elif event_type == "KLINE":
+            # Extract kline data from raw JSON
+            kline = json.loads(raw)["k"]
+            detector.process_kline(
+                timestamp=timestamp,
+                symbol=symbol,
+                open_price=float(kline["o"]),
+                high=float(kline["h"]),
+                low=float(kline["l"]),
+                close=float(kline["c"])
+            )
+
+        elif event_type == "OPEN_INTEREST":
+            detector.process_oi(
+                symbol=symbol,
+                oi=quantity,  # Stored as quantity
+                timestamp=timestamp
+            )
+
+
+def publish_market_events(records: List[Dict]):
+    """Update the prices and market_events topics from new event records."""
+    prices = topic_hub.topic("prices")
+    for record in records:
+        if record.get("type") == "TRADE" and record.get("price") is not None:
+            prices.update(record["symbol"], {
+                "price": record["price"],
+                "timestamp": record["timestamp"]
+            })
+
+    # Older records would be evicted from the bounded topic anyway
+    events = topic_hub.topic("market_events")
+    for record in records[-MARKET_EVENTS_TOPIC_SIZE:]:
+        event_id = record.get("event_id")
+        key = str(event_id) if event_id is not None else f"{record.get('symbol')}:{record.get('timestamp')}"
+        events.update(key, record)
+
 
 async def process_market_events_background():
     """
-    Background task: Read all market events and feed to Peak Pressure detector.
-    
-    Processes trades, liquidations, klines, OI from parquet.
-    Runs continuously, processing only new events since last check.
+    Background task: Tail market events and feed to Peak Pressure detector.
+
+    Processes trades, liquidations, klines, OI. Each check reads only events
+    appended since the previous one, feeds them to the detectors and indexes
+    them in the recent-events cache. A large batch (the first read of a
+    day's file) is fed in chunks, yielding to the event loop between them.
     """
-    global last_processed_event_id
-    
-    events_file = MARKET_EVENTS_DIR / "market_events.parquet"
-    
+    tail = market_event_store.tail()
+
     while True:
         try:
-            if events_file.exists():
-                df = pd.read_parquet(events_file)
-                
-                if len(df) > 0:
-                    # Process only new events
-                    if last_processed_event_id is not None:
-                        try:
-                            last_idx = df[df["event_id"] == last_processed_event_id].index[0]
-                            df = df.iloc[last_idx + 1:]
-                        except (IndexError, KeyError):
-                            # Last ID not found, process all
-                            pass
-                    
-                    # Feed each event to correct detector by symbol
-                    for _, event in df.iterrows():
-                        event_type = event["type"]
-                        timestamp = event["timestamp"]
-                        symbol = event["symbol"]
-                        
-                        # CRITICAL: Route to per-symbol detector (prevents mixing)
-                        # Returns None if symbol not in TOP_10_SYMBOLS
-                        detector = get_detector(symbol)
-                        if not detector:
-                            continue  # DROP non-TOP_10 symbols
-                        
-                        if event_type == "TRADE":
-                            detector.process_trade(
-                                timestamp=timestamp,
-                                symbol=symbol,
-                                price=event["price"],
-                                quantity=event["quantity"],
-                                side=event["side"]
-                            )
-                        
-                        elif event_type == "LIQUIDATION":
-                            detector.process_liquidation(
-                                timestamp=timestamp,
-                                symbol=symbol,
-                                price=event["price"],
-                                quantity=event["quantity"],
-                                side=event["side"]
-                            )
-                        
-                        elif event_type == "KLINE":
-                            # Extract kline data from raw JSON
-                            raw = json.loads(event["raw"])
-                            kline = raw["k"]
-                            detector.process_kline(
-                                timestamp=timestamp,
-                                symbol=symbol,
-                                open_price=float(kline["o"]),
-                                high=float(kline["h"]),
-                                low=float(kline["l"]),
-                                close=float(kline["c"])
-                            )
-                        
-                        elif event_type == "OPEN_INTEREST":
-                            detector.process_oi(
-                                symbol=symbol,
-                                oi=event["quantity"],  # Stored as quantity
-                                timestamp=timestamp
-                            )
-                    
-                    # Update last processed
-                    if len(df) > 0:
-                        last_processed_event_id = df.iloc[-1]["event_id"]
-            
+            batch = tail.read_new()
+            if len(batch) > 0:
+                for start in range(0, len(batch), EVENT_BATCH_CHUNK_ROWS):
+                    feed_detectors(batch.iloc[start:start + EVENT_BATCH_CHUNK_ROWS])
+                    await asyncio.sleep(0)
+                publish_market_events(recent_market_events.add(batch))
+
             await asyncio.sleep(0.5)  # Check for new events every 500ms
-            
+
         except Exception as e:
             print(f"[PEAK PRESSURE] Error in event processor: {e}")
             await asyncio.sleep(1)
 
+async def publish_topics_background():
+    """
+    Background task: Refresh derived topics and push deltas to subscribers.
+
+    Runs every topic_hub.interval seconds. Market stats and ghost executions
+    are only recomputed while someone subscribes (a new subscriber's
+    snapshot may lag by one interval).
+    """
+    ghost_stat = None
+
+    while True:
+        try:
+            # Promoted events (oldest first so the bounded topic keeps the newest)
+            peak_pressure = topic_hub.topic("peak_pressure")
+            events = await get_peak_pressure_events(limit=PEAK_PRESSURE_TOPIC_SIZE)
+            for event in reversed(events):
+                peak_pressure.update(f"{event.get('symbol')}:{event['timestamp']}", event)
+
+            if topic_hub.has_subscribers("market_stats"):
+                topic_hub.topic("market_stats").update("stats", await get_market_stats())
+
+            # Ghost executions: re-read the metrics file only when it changed
+            if topic_hub.has_subscribers("ghost_executions") and METRICS_FILE.exists():
+                st = METRICS_FILE.stat()
+                if (st.st_mtime_ns, st.st_size) != ghost_stat:
+                    df = pd.read_parquet(METRICS_FILE).tail(GHOST_EXECUTIONS_TOPIC_SIZE)
+                    ghost_stat = (st.st_mtime_ns, st.st_size)
+                    ghost_executions = topic_hub.topic("ghost_executions")
+                    for row, record in zip(df.index.tolist(), to_json_records(df)):
+                        ghost_executions.update(str(row), record)
+
+            await topic_hub.flush()
+
+        except Exception as e:
+            print(f"[TOPIC HUB] Error in publisher: {e}")
+
+        await asyncio.sleep(topic_hub.interval)
+
+
 @app.on_event("startup")
 async def startup_event():
     """Start background Peak Pressure processor on API startup."""
     asyncio.create_task(process_market_events_background())
     print("[PEAK PRESSURE] Background processor started")
+    asyncio.create_task(publish_topics_background())
+    print(f"[TOPIC HUB] Publisher started ({STREAM_MAX_RATE_HZ:g} Hz max)")
 
 
 def read_parquet_with_retry(filepath: Path, retries: int = 3) -> pd.DataFrame:
@@ -410,34 +493,20 @@ def read_parquet_with_retry(filepath: Path, retries: int = 3) -> pd.DataFrame:
 async def get_market_events(
     event_type: Optional[str] = None,
     symbol: Optional[str] = None,
-    limit: int = 100
+    limit: int = Query(100, ge=0, le=RECENT_EVENTS_PER_KEY)
 ):
-    """Get normalized market events (unified schema)."""
-    events_file = MARKET_EVENTS_DIR / "market_events.parquet"
-    
-    df = read_parquet_with_retry(events_file)
-    if len(df) == 0:
-        return []
-    
-    # Apply filters
-    if event_type:
-        df = df[df["type"] == event_type]
-    if symbol:
-        df = df[df["symbol"] == symbol]
-    
-    df = df.tail(limit)
-    
-    # Sanitize non-JSON-compliant values (NaN, inf, -inf)
-    df = df.replace([np.inf, -np.inf], np.nan)  # Convert inf to NaN
-    df = df.astype(object).where(pd.notnull(df), None)  # Convert NaN to None
-    
-    return df.to_dict(orient="records")
+    """Get normalized market events (unified schema).
+
+    Served from the recent-events cache, so `limit` is capped at
+    RECENT_EVENTS_PER_KEY events per type/symbol.
+    """
+    return recent_market_events.query(event_type=event_type, symbol=symbol, limit=limit)
 
 
 @app.get("/api/market/trades")
 async def get_trades(
     symbol: Optional[str] = None,
-    limit: int = 100
+    limit: int = Query(100, ge=0, le=RECENT_EVENTS_PER_KEY)
 ):
     """Get trade events (filtered from unified schema)."""
     return await get_market_events(event_type="TRADE", symbol=symbol, limit=limit)
@@ -446,7 +515,7 @@ async def get_trades(
 @app.get("/api/market/liquidations")
 async def get_liquidations(
     symbol: Optional[str] = None,
-    limit: int = 100
+    limit: int = Query(100, ge=0, le=RECENT_EVENTS_PER_KEY)
 ):
     """Get liquidation events (filtered from unified schema)."""
     return await get_market_events(event_type="LIQUIDATION", symbol=symbol, limit=limit)
@@ -735,14 +804,26 @@ async def get_stream_health():
 
 @app.websocket("/ws/events")
 async def websocket_events(websocket: WebSocket):
-    """WebSocket endpoint for live system event streaming."""
+    """WebSocket endpoint for live system event streaming.
+
+    Clients may also subscribe to server-push topics (see topic_hub):
+    {"action": "subscribe", "topics": [...]} returns a snapshot per topic,
+    followed by coalesced deltas.
+    """
     await manager.connect(websocket)
     
     try:
         while True:
-            await asyncio.sleep(1)
+            text = await websocket.receive_text()
+            try:
+                message = json.loads(text)
+            except ValueError:
+                continue  # Ignore malformed client messages
+            if isinstance(message, dict):
+                await topic_hub.handle_message(websocket, message)
     except WebSocketDisconnect:
         manager.disconnect(websocket)
+        topic_hub.unsubscribe(websocket)
 
 
 @app.websocket("/ws/market_events")
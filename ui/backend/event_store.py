@@ -0,0 +1,307 @@
+"""
+Segmented Market Event Store
+
+Append-only storage for normalized market events, read incrementally.
+
+Layout:
+    <root>/manifest.json              Segment list (rewritten atomically)
+    <root>/segments/seg-00000001.parquet
+    <root>/segments/seg-00000002.parquet
+    ...
+
+Segments are immutable once listed in the manifest, so a reader that
+remembers how many segments it has consumed reads only the segments
+appended since, as column batches. While no manifest exists the tail
+falls back to the monolithic market_events.parquet. It is only opened when
+its size or mtime changes; with pyarrow only the row groups from the last
+returned row onwards are read (the footer gives row-group sizes), and the
+last returned event_id is checked at its old position. A rewritten file
+(event_id moved) is read in full and resumed after that event_id.
+
+Limitation: a writer that rewrites the legacy file as a single row group
+still costs a full read per change; writers should call append() instead.
+
+RecentEventsCache keeps the most recent events per type, per symbol and per
+(type, symbol), so query endpoints never touch the files.
+"""
+
+from collections import deque
+from pathlib import Path
+from typing import Deque, Dict, List, Optional, Sequence, Tuple
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow.parquet as pq
+except ImportError:
+    pq = None
+
+
+MANIFEST_FILE = "manifest.json"
+SEGMENTS_DIR = "segments"
+LEGACY_EVENTS_FILE = "market_events.parquet"
+
+
+# ==============================================================================
+# Segmented Store
+# ==============================================================================
+
+class SegmentedEventStore:
+    """
+    Append-only segmented event store with a JSON manifest.
+
+    Writers call append() once per flush; each call seals one segment.
+    Readers use tail() cursors.
+    """
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self._manifest_path = self.root / MANIFEST_FILE
+        self._manifest_cache: Optional[Tuple[int, List[Dict]]] = None  # (mtime_ns, segments)
+
+    def has_manifest(self) -> bool:
+        return self._manifest_path.exists()
+
+    def segments(self) -> List[Dict]:
+        """Sealed segments in append order (manifest re-read only on change)."""
+        try:
+            mtime_ns = self._manifest_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return []
+        if self._manifest_cache is None or self._manifest_cache[0] != mtime_ns:
+            with open(self._manifest_path, 'r') as f:
+                segments = json.load(f)["segments"]
+            self._manifest_cache = (mtime_ns, segments)
+        return self._manifest_cache[1]
+
+    def append(self, df: pd.DataFrame) -> Optional[str]:
+        """
+        Seal df as a new segment and publish it in the manifest.
+
+        The segment file is complete before the manifest lists it; the
+        manifest is replaced atomically, so readers never see partial data.
+
+        Returns:
+            Segment name, or None if df is empty
+        """
+        if len(df) == 0:
+            return None
+
+        segments = list(self.segments())
+        seq = segments[-1]["seq"] + 1 if segments else 1
+        name = f"seg-{seq:08d}.parquet"
+
+        segment_dir = self.root / SEGMENTS_DIR
+        segment_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = segment_dir / (name + ".tmp")
+        df.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, segment_dir / name)
+
+        entry = {"seq": seq, "name": name, "rows": int(len(df))}
+        if "timestamp" in df.columns:
+            entry["min_ts"] = float(df["timestamp"].min())
+            entry["max_ts"] = float(df["timestamp"].max())
+        segments.append(entry)
+
+        tmp_manifest = self.root / (MANIFEST_FILE + ".tmp")
+        with open(tmp_manifest, 'w') as f:
+            json.dump({"segments": segments}, f)
+        os.replace(tmp_manifest, self._manifest_path)
+        self._manifest_cache = None
+        return name
+
+    def read_segment(self, name: str, columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        return pd.read_parquet(self.root / SEGMENTS_DIR / name, columns=columns)
+
+    def tail(self, columns: Optional[Sequence[str]] = None) -> "EventTail":
+        """Cursor positioned at the start of the store."""
+        return EventTail(self, columns=columns)
+
+
+class EventTail:
+    """
+    Tail cursor over a SegmentedEventStore (or the legacy single file).
+
+    read_new() returns only rows not returned before, as one DataFrame
+    (empty if nothing new).
+    """
+
+    def __init__(self, store: SegmentedEventStore, columns: Optional[Sequence[str]] = None):
+        self._store = store
+        self._columns = list(columns) if columns else None
+        self._segments_read = 0
+
+        # Legacy single-file state
+        self._legacy_path = store.root / LEGACY_EVENTS_FILE
+        self._legacy_stat: Optional[Tuple[int, int]] = None
+        self._legacy_rows = 0  # Rows of the legacy file already returned
+        self._legacy_last_id = None
+
+    def read_new(self) -> pd.DataFrame:
+        if self._store.has_manifest():
+            return self._read_segments()
+        return self._read_legacy()
+
+    def _read_segments(self) -> pd.DataFrame:
+        segments = self._store.segments()
+        new = segments[self._segments_read:]
+        if not new:
+            return pd.DataFrame()
+        frames = [self._store.read_segment(s["name"], self._columns) for s in new]
+        self._segments_read = len(segments)
+        return frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
+
+    def _read_legacy(self) -> pd.DataFrame:
+        try:
+            st = self._legacy_path.stat()
+        except FileNotFoundError:
+            return pd.DataFrame()
+
+        stat_key = (st.st_mtime_ns, st.st_size)
+        if stat_key == self._legacy_stat:
+            return pd.DataFrame()  # Unchanged since last read
+
+        if pq is None or self._legacy_rows == 0:
+            df = self._read_legacy_full()
+        else:
+            df = self._read_legacy_row_groups()
+        self._legacy_stat = stat_key
+        return df
+
+    def _read_legacy_full(self) -> pd.DataFrame:
+        """Read the whole file; return rows after the last returned event_id."""
+        df = pd.read_parquet(self._legacy_path, columns=self._columns)
+        self._legacy_rows = len(df)
+        if len(df) == 0 or "event_id" not in df.columns:
+            return df
+
+        if self._legacy_last_id is not None:
+            seen = np.flatnonzero(df["event_id"].to_numpy() == self._legacy_last_id)
+            if seen.size:
+                df = df.iloc[seen[-1] + 1:]
+            # Last ID not found (file rotated): return all
+        if len(df) > 0:
+            self._legacy_last_id = df["event_id"].iat[-1]
+        return df.reset_index(drop=True)
+
+    def _read_legacy_row_groups(self) -> pd.DataFrame:
+        """Read only the row groups from the last returned row onwards."""
+        parquet_file = pq.ParquetFile(self._legacy_path)
+        metadata = parquet_file.metadata
+        total = metadata.num_rows
+        if total < self._legacy_rows:
+            return self._read_legacy_full()  # Truncated/rotated
+
+        # First row group containing the last returned row
+        last_row = self._legacy_rows - 1
+        group_start = 0
+        group = 0
+        while group < metadata.num_row_groups:
+            group_rows = metadata.row_group(group).num_rows
+            if group_start + group_rows > last_row:
+                break
+            group_start += group_rows
+            group += 1
+
+        df = parquet_file.read_row_groups(
+            list(range(group, metadata.num_row_groups)), columns=self._columns
+        ).to_pandas()
+
+        if "event_id" in df.columns:
+            if df["event_id"].iat[last_row - group_start] != self._legacy_last_id:
+                return self._read_legacy_full()  # Rewritten: rows moved
+        new = df.iloc[last_row - group_start + 1:].reset_index(drop=True)
+        self._legacy_rows = total
+        if len(new) > 0 and "event_id" in new.columns:
+            self._legacy_last_id = new["event_id"].iat[-1]
+        return new
+
+
+# ==============================================================================
+# Recent Events Cache
+# ==============================================================================
+
+def to_json_records(df: pd.DataFrame) -> List[Dict]:
+    """Rows as dicts with NaN/inf replaced by None (JSON-compliant)."""
+    df = df.replace([np.inf, -np.inf], np.nan)
+    df = df.astype(object).where(pd.notnull(df), None)
+    return df.to_dict(orient="records")
+
+
+class RecentEventsCache:
+    """
+    Most recent events, indexed by type, symbol and (type, symbol).
+
+    Each index keeps up to max_per_key events, oldest first.
+    """
+
+    def __init__(self, max_per_key: int = 1000):
+        self._max = max_per_key
+        self._all: Deque[Dict] = deque(maxlen=max_per_key)
+        self._by_key: Dict[tuple, Deque[Dict]] = {}
+
+    def _index(self, key: tuple) -> Deque[Dict]:
+        index = self._by_key.get(key)
+        if index is None:
+            index = self._by_key[key] = deque(maxlen=self._max)
+        return index
+
+    def _retained(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Rows of df that survive in at least one index, in file order.
+
+        A row among the last max_per_key of its type (or symbol) is also
+        among the last max_per_key of its (type, symbol), so the last rows
+        per (type, symbol) plus the last rows overall cover every index.
+        """
+        if len(df) <= self._max:
+            return df
+        keep = np.zeros(len(df), dtype=bool)
+        keep[-self._max:] = True
+        keys = [column for column in ("type", "symbol") if column in df.columns]
+        if keys:
+            positions = pd.RangeIndex(len(df))
+            grouped = df[keys].set_axis(positions).groupby(keys, dropna=False, sort=False)
+            keep[grouped.tail(self._max).index.to_numpy()] = True
+        return df.iloc[np.flatnonzero(keep)]
+
+    def add(self, df: pd.DataFrame) -> List[Dict]:
+        """Index a batch of events. Returns the indexed records.
+
+        Only rows that stay in an index are converted, so a large catch-up
+        batch costs at most max_per_key records per (type, symbol).
+        """
+        if len(df) == 0:
+            return []
+        records = to_json_records(self._retained(df))
+        for record in records:
+            event_type = record.get("type")
+            symbol = record.get("symbol")
+            self._all.append(record)
+            self._index(("type", event_type)).append(record)
+            self._index(("symbol", symbol)).append(record)
+            self._index(("type_symbol", event_type, symbol)).append(record)
+        return records
+
+    def query(
+        self,
+        event_type: Optional[str] = None,
+        symbol: Optional[str] = None,
+        limit: int = 100
+    ) -> List[Dict]:
+        """Last `limit` matching events, oldest first."""
+        if event_type and symbol:
+            index = self._by_key.get(("type_symbol", event_type, symbol))
+        elif event_type:
+            index = self._by_key.get(("type", event_type))
+        elif symbol:
+            index = self._by_key.get(("symbol", symbol))
+        else:
+            index = self._all
+        if not index or limit <= 0:
+            return []
+        if limit >= len(index):
+            return list(index)
+        return list(index)[-limit:]
@@ -0,0 +1,213 @@
+"""
+Topic Hub for WebSocket Server Push
+
+Keeps per-topic state on the server and pushes coalesced deltas to
+subscribed WebSocket clients at a bounded rate, so operator browsers do not
+poll REST endpoints.
+
+Protocol (JSON text frames):
+    client -> {"action": "subscribe", "topics": ["prices", ...]}
+    server -> {"type": "snapshot", "topic": t, "version": v, "items": {key: value}}
+    server -> {"type": "delta", "topic": t, "version": v, "upsert": {key: value}, "remove": [key]}
+    client -> {"action": "unsubscribe", "topics": [...]}
+
+A topic is a keyed map. Updates between two flushes are coalesced per key
+(only the latest value is sent, unchanged values are not sent). Delta
+versions are consecutive per topic; a client seeing a gap re-subscribes to
+get a fresh snapshot. Each delta is serialized once and shared by all
+subscribers.
+"""
+
+import asyncio
+import json
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+
+_REMOVED = object()
+
+
+class TopicState:
+    """
+    Keyed state of one topic plus the changes not yet pushed.
+
+    max_items bounds append-like topics (least recently changed keys
+    evicted first).
+    """
+
+    def __init__(self, name: str, max_items: Optional[int] = None):
+        self.name = name
+        self.version = 0
+        self._max_items = max_items
+        self._items: "OrderedDict[str, Any]" = OrderedDict()
+        self._pending: Dict[str, Any] = {}
+
+    def update(self, key: str, value: Any):
+        """Set key to value (no-op if unchanged)."""
+        if key in self._items and self._items[key] == value:
+            return
+        self._items[key] = value
+        self._items.move_to_end(key)  # Recently updated keys are evicted last
+        self._pending[key] = value
+        if self._max_items is not None:
+            while len(self._items) > self._max_items:
+                oldest, _ = self._items.popitem(last=False)
+                self._pending[oldest] = _REMOVED
+
+    def remove(self, key: str):
+        if self._items.pop(key, _REMOVED) is not _REMOVED:
+            self._pending[key] = _REMOVED
+
+    def snapshot(self) -> dict:
+        return {
+            "type": "snapshot",
+            "topic": self.name,
+            "version": self.version,
+            "items": dict(self._items)
+        }
+
+    def take_delta(self) -> Optional[dict]:
+        """Coalesced changes since the last call (None if nothing changed)."""
+        if not self._pending:
+            return None
+        pending, self._pending = self._pending, {}
+        self.version += 1
+        return {
+            "type": "delta",
+            "topic": self.name,
+            "version": self.version,
+            "upsert": {k: v for k, v in pending.items() if v is not _REMOVED},
+            "remove": [k for k, v in pending.items() if v is _REMOVED]
+        }
+
+
+class TopicHub:
+    """
+    Subscription registry and rate-limited delta publisher.
+
+    Producers call topic(name).update(...) at any rate; the owner calls
+    flush() every `interval` seconds, so each topic pushes at most
+    max_rate_hz deltas per second.
+    """
+
+    def __init__(
+        self,
+        topics: Dict[str, Optional[int]],
+        max_rate_hz: float = 4.0,
+        send_timeout: float = 2.0
+    ):
+        """
+        Args:
+            topics: Topic name -> max_items (None = unbounded)
+            max_rate_hz: Maximum flushes per second
+            send_timeout: Clients slower than this are dropped
+        """
+        self._topics = {name: TopicState(name, max_items) for name, max_items in topics.items()}
+        self._subscribers: Dict[str, Set[Any]] = {name: set() for name in topics}
+        self._interval = 1.0 / max_rate_hz
+        self._send_timeout = send_timeout
+        self._lock = asyncio.Lock()
+
+    @property
+    def interval(self) -> float:
+        return self._interval
+
+    @property
+    def topic_names(self) -> List[str]:
+        return list(self._topics)
+
+    def topic(self, name: str) -> TopicState:
+        return self._topics[name]
+
+    def has_subscribers(self, name: str) -> bool:
+        return bool(self._subscribers[name])
+
+    async def subscribe(self, websocket, topics: Iterable[str]) -> List[str]:
+        """
+        Send a snapshot of each topic, then start pushing its deltas.
+
+        Snapshot and registration happen under the flush lock, so the
+        client receives every delta after its snapshot version.
+
+        Returns:
+            Topics subscribed (unknown names ignored)
+        """
+        subscribed = []
+        async with self._lock:
+            for name in topics:
+                state = self._topics.get(name)
+                if state is None:
+                    continue
+                if not await self._send(websocket, [json.dumps(state.snapshot())]):
+                    break
+                self._subscribers[name].add(websocket)
+                subscribed.append(name)
+        return subscribed
+
+    def unsubscribe(self, websocket, topics: Optional[Iterable[str]] = None):
+        """Stop pushing topics (default: all) to websocket."""
+        for name in (self._topics if topics is None else topics):
+            if name in self._subscribers:
+                self._subscribers[name].discard(websocket)
+
+    async def handle_message(self, websocket, message: dict):
+        """Apply a client subscribe/unsubscribe request.
+
+        "topics" is a list of names or a single name; other types are ignored.
+        """
+        action = message.get("action")
+        topics = message.get("topics") or self.topic_names
+        if isinstance(topics, str):
+            topics = [topics]
+        elif not isinstance(topics, list):
+            return
+        if action == "subscribe":
+            await self.subscribe(websocket, topics)
+        elif action == "unsubscribe":
+            self.unsubscribe(websocket, topics)
+
+    async def flush(self) -> int:
+        """
+        Push pending deltas of every topic to its subscribers.
+
+        Topics without subscribers still advance (their state stays current
+        for the next snapshot). Clients are sent to concurrently, each
+        receiving its deltas in topic order, so a slow client delays a flush
+        by at most send_timeout.
+
+        Returns:
+            Number of messages sent
+        """
+        async with self._lock:
+            outbox: Dict[Any, List[str]] = {}
+            for name, state in self._topics.items():
+                delta = state.take_delta()
+                if delta is None or not self._subscribers[name]:
+                    continue
+                text = json.dumps(delta)
+                for websocket in self._subscribers[name]:
+                    outbox.setdefault(websocket, []).append(text)
+
+            clients = list(outbox.items())
+            results = await asyncio.gather(*(
+                self._send(websocket, texts) for websocket, texts in clients
+            ))
+            sent = 0
+            for (websocket, texts), ok in zip(clients, results):
+                if ok:
+                    sent += len(texts)
+                else:
+                    self.unsubscribe(websocket)
+        return sent
+
+    async def _send(self, websocket, texts: List[str]) -> bool:
+        """Send texts in order within one send_timeout (False on failure)."""
+        async def send_all():
+            for text in texts:
+                await websocket.send_text(text)
+
+        try:
+            await asyncio.wait_for(send_all(), self._send_timeout)
+            return True
+        except Exception:
+            return False